@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import datetime
+import ipaddress
+import json
+import ssl
+import statistics
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socket import socket
+from typing import Any, Callable
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from django.core.management.base import BaseCommand
+from google import genai
+from google.genai import types
+
+from apps.chatbot.models.chatbot_sessions import ChatModel
+from apps.chatbot.services.gemini_client_registry import GeminiClientRegistry
+
+"""
+Gemini Client 재사용 벤치마크 (로컬 HTTPS 스텁 서버)
+
+fresh: 요청마다 genai.Client 생성 (기존 동작, 매번 TCP 연결 + TLS 핸드셰이크)
+pooled: GeminiClientRegistry 로 Client 재사용 (keep-alive 커넥션 재사용)
+
+스텁 서버는 streamGenerateContent SSE 응답을 흉내내고, 새로 맺어진 연결 수를 셉니다.
+--handshake-delay-ms 로 새 연결마다 네트워크 RTT 비용을 흉내낼 수 있습니다.
+"""
+
+_SSE_CHUNK = {"candidates": [{"content": {"role": "model", "parts": [{"text": "pong "}]}}]}
+
+
+def _write_self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "cert.pem", directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+class _StubGeminiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        chunks = getattr(self.server, "chunks", 3)
+        body = "".join(f"data: {json.dumps(_SSE_CHUNK)}\r\n\r\n" for _ in range(chunks)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return None
+
+
+class _StubGeminiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, ssl_context: ssl.SSLContext, handshake_delay: float, chunks: int) -> None:
+        super().__init__(("127.0.0.1", 0), _StubGeminiHandler)
+        self.socket = ssl_context.wrap_socket(self.socket, server_side=True)
+        self.handshake_delay = handshake_delay
+        self.chunks = chunks
+        self.connections = 0
+
+    # 새 연결(TCP + TLS 핸드셰이크)마다 호출됨
+    def get_request(self) -> tuple[socket, Any]:
+        request = super().get_request()
+        self.connections += 1
+        if self.handshake_delay:
+            time.sleep(self.handshake_delay)
+        return request
+
+
+class Command(BaseCommand):
+    help = "로컬 HTTPS 스텁 서버로 Gemini Client 재사용 전/후의 첫 chunk 도착 시간(TTFC)을 비교합니다."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--requests", type=int, default=50, help="모드별 순차 요청 수")
+        parser.add_argument("--chunks", type=int, default=3, help="응답 하나당 SSE chunk 수")
+        parser.add_argument("--handshake-delay-ms", type=float, default=0.0, help="새 연결마다 추가할 지연(ms)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cert_path, key_path = _write_self_signed_cert(Path(tmp))
+            server_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            server_ctx.load_cert_chain(cert_path, key_path)
+            client_ctx = ssl.create_default_context(cafile=str(cert_path))
+
+            server = _StubGeminiServer(server_ctx, options["handshake_delay_ms"] / 1000, options["chunks"])
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+
+            def create_client() -> genai.Client:
+                return genai.Client(
+                    api_key="benchmark",
+                    http_options=types.HttpOptions(
+                        base_url=f"https://127.0.0.1:{server.server_port}",
+                        client_args={"verify": client_ctx},
+                    ),
+                )
+
+            registry = GeminiClientRegistry()
+            try:
+                for label, get_client in (
+                    ("fresh", create_client),
+                    ("pooled", lambda: registry.get(ChatModel.GEMINI, create_client)),
+                ):
+                    server.connections = 0
+                    ttfc = self._measure(get_client, options["requests"], close_each=label == "fresh")
+                    self.stdout.write(
+                        f"[{label}] requests={len(ttfc)} connections={server.connections} "
+                        f"ttfc avg={statistics.mean(ttfc):.2f}ms p50={statistics.median(ttfc):.2f}ms "
+                        f"max={max(ttfc):.2f}ms"
+                    )
+            finally:
+                registry.close()
+                server.shutdown()
+                server.server_close()
+
+    def _measure(self, get_client: Callable[[], genai.Client], requests: int, *, close_each: bool) -> list[float]:
+        ttfc: list[float] = []
+        for _ in range(requests):
+            started_at = time.perf_counter()
+            client = get_client()
+            stream = client.models.generate_content_stream(model=ChatModel.GEMINI, contents="ping")
+            next(iter(stream))
+            ttfc.append((time.perf_counter() - started_at) * 1000)
+            for _chunk in stream:
+                pass
+            if close_each:
+                client.close()
+        return ttfc
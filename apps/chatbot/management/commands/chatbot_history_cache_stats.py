@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.chatbot.services.chat_history_cache import chat_history_cache
+
+
+class Command(BaseCommand):
+    help = "챗봇 대화 이력 Redis 캐시의 hit/miss 카운터와 hit rate 를 출력합니다."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        stats = chat_history_cache.stats()
+        total = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / total * 100 if total else 0.0
+        self.stdout.write(f"hits={stats['hits']} misses={stats['misses']} hit_rate={hit_rate:.1f}%")
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import statistics
+import time
+from datetime import date
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.serializers.completion_serializers import CompletionSerializer
+from apps.chatbot.views.mixins import ChatbotKeysetPagination
+from apps.qna.models import Question, QuestionCategory
+from apps.user.models import User
+
+"""
+챗봇 대화 내역 페이지 조회 벤치마크 (keyset vs OFFSET)
+
+긴 세션(기본 10만 메세지)을 만들고, 여러 깊이(depth)의 페이지를 조회하는 시간을 비교합니다.
+    keyset: ChatbotKeysetPagination ((created_at, id) 경계 조건 + LIMIT, 인덱스 range scan)
+    offset: 같은 정렬에 OFFSET depth LIMIT page_size (깊어질수록 건너뛸 행을 모두 읽음)
+
+모든 데이터는 하나의 트랜잭션 안에서 만들고 끝나면 롤백합니다. (--session-id 로 기존 세션 사용 가능)
+"""
+
+DEFAULT_DEPTHS = "0,1000,10000,50000,99000"
+
+
+def _median_ms(func: Callable[[], Any], repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "긴 챗봇 세션에서 깊이별 대화 내역 페이지 조회 시간을 keyset 페이지네이션과 OFFSET 방식으로 비교합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--messages", type=int, default=100_000, help="생성할 메세지 수")
+        parser.add_argument("--page-size", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=20, help="깊이별 반복 횟수 (중앙값 출력)")
+        parser.add_argument("--depths", default=DEFAULT_DEPTHS, help="조회할 페이지 시작 위치 (쉼표 구분)")
+        parser.add_argument("--session-id", type=int, default=None, help="메세지를 새로 만들지 않고 기존 세션 사용")
+        parser.add_argument("--explain", action="store_true", help="가장 깊은 keyset 조회의 실행 계획 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            with transaction.atomic():
+                if options["session_id"]:
+                    session = ChatbotSession.objects.get(id=options["session_id"])
+                else:
+                    session = self._create_session(options["messages"])
+                self._run(session, options)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _create_session(self, messages: int) -> ChatbotSession:
+        user = User.objects.create_user(
+            email="chatbot-pagination-benchmark@example.com",
+            password="benchmark",
+            name="benchmark",
+            nickname="pagination-benchmark",
+            birthday=date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="benchmark")
+        question = Question.objects.create(author=user, category=category, title="benchmark", content="benchmark")
+        session = ChatbotSession.objects.create(
+            user=user, question=question, title="benchmark", using_model=ChatModel.GEMINI
+        )
+
+        started = time.perf_counter()
+        roles = (UserRole.USER, UserRole.ASSISTANT)
+        ChatbotCompletion.objects.bulk_create(
+            (ChatbotCompletion(session=session, message=f"message {i}", role=roles[i % 2]) for i in range(messages)),
+            batch_size=5000,
+        )
+        self.stdout.write(f"created {messages} messages in {time.perf_counter() - started:.1f}s")
+        return session
+
+    def _run(self, session: ChatbotSession, options: dict[str, Any]) -> None:
+        page_size = options["page_size"]
+        fields = CompletionSerializer.Meta.fields
+        queryset = ChatbotCompletion.objects.filter(session=session).only(*fields)
+        ordered = queryset.order_by(*ChatbotKeysetPagination.ordering)
+        total = queryset.count()
+        factory = APIRequestFactory()
+
+        self.stdout.write(f"session={session.id} messages={total} page_size={page_size}")
+        self.stdout.write(f"{'depth':>8}{'keyset_ms':>12}{'offset_ms':>12}")
+        deepest_request: Request | None = None
+        for depth in (int(value) for value in options["depths"].split(",")):
+            if depth >= total:
+                continue
+
+            # depth 위치 바로 앞 메세지를 경계로 하는 커서 (depth=0 이면 첫 페이지)
+            url = "/"
+            if depth > 0:
+                encoder = ChatbotKeysetPagination()
+                encoder.base_url = url
+                url = encoder._encode_position(ordered[depth - 1], reverse=False)
+            request = Request(factory.get(url, {"page_size": page_size}))
+            deepest_request = request
+
+            def keyset() -> None:
+                paginator = ChatbotKeysetPagination()
+                CompletionSerializer(paginator.paginate_queryset(queryset, request), many=True).data
+
+            def offset() -> None:
+                CompletionSerializer(list(ordered[depth : depth + page_size]), many=True).data
+
+            self.stdout.write(
+                f"{depth:>8}{_median_ms(keyset, options['repeat']):>12.2f}{_median_ms(offset, options['repeat']):>12.2f}"
+            )
+
+        if options["explain"] and deepest_request is not None:
+            paginator = ChatbotKeysetPagination()
+            cursor = paginator.decode_cursor(deepest_request)
+            self.stdout.write(paginator.keyset_queryset(queryset, cursor)[: page_size + 1].explain())
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import glob
+import math
+import os
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.chatbot.services.turn_metrics import parse_turn_log_line
+
+"""
+챗봇 턴 지연 시간 로그(chatbot.turn) 집계 → 구간별 p50 / p95 / p99 출력
+
+기본 입력: logs/chatbot_metrics.log (+ 로테이션된 .1 ~ .N 파일)
+"""
+
+METRIC_FIELDS = ("history_ms", "queue_ms", "ttfb_ms", "stream_ms", "save_ms", "total_ms", "tokens_per_sec", "chunks")
+PERCENTILES = (50, 95, 99)
+
+
+# nearest-rank 방식 백분위수
+def percentile(sorted_values: list[float], pct: int) -> float:
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Command(BaseCommand):
+    help = "챗봇 턴 지연 시간 로그를 읽어 구간별(이력 조회, 슬롯 대기, TTFB, 스트림, 저장) p50/p95/p99 를 출력합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="로그 파일 경로 (기본: logs/chatbot_metrics.log 와 로테이션 파일)",
+        )
+        parser.add_argument("--provider", default=None, help="특정 provider 만 집계 (gemini, openai, fake)")
+        parser.add_argument("--include-cached", action="store_true", help="프롬프트 캐시 hit 턴도 집계에 포함")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        paths = options["paths"] or sorted(glob.glob(os.path.join(settings.BASE_DIR, "logs", "chatbot_metrics.log*")))
+        if not paths:
+            raise CommandError("집계할 로그 파일이 없습니다.")
+
+        turns = []
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    fields = parse_turn_log_line(line)
+                    if fields is None:
+                        continue
+                    if options["provider"] and fields.get("provider") != options["provider"]:
+                        continue
+                    if fields.get("cached") and not options["include_cached"]:
+                        continue
+                    turns.append(fields)
+
+        if not turns:
+            self.stdout.write("집계할 턴 로그가 없습니다.")
+            return
+
+        incomplete = sum(1 for turn in turns if not turn.get("is_complete"))
+        self.stdout.write(f"turns={len(turns)} incomplete={incomplete}")
+        self.stdout.write(f"{'metric':<16}{'count':>8}" + "".join(f"{f'p{pct}':>12}" for pct in PERCENTILES))
+        for name in METRIC_FIELDS:
+            values = sorted(float(turn[name]) for turn in turns if turn.get(name) is not None)
+            if not values:
+                continue
+            row = "".join(f"{percentile(values, pct):>12.1f}" for pct in PERCENTILES)
+            self.stdout.write(f"{name:<16}{len(values):>8}{row}")
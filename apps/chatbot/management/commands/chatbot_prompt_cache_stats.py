@@ -0,0 +1,17 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.chatbot.services.prompt_cache import prompt_response_cache
+
+
+class Command(BaseCommand):
+    help = "챗봇 질문별 첫 턴 프롬프트 캐시의 hit/miss 카운터, hit rate, 저장 개수를 출력합니다."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        stats = prompt_response_cache.stats()
+        total = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / total * 100 if total else 0.0
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} hit_rate={hit_rate:.1f}% entries={stats['entries']}"
+        )
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import patch
+
+from django.core.management.base import BaseCommand
+from google.genai import types
+
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services import completion_response_service
+from apps.chatbot.services.completion_response_service import GeminiStreamingService
+
+"""
+챗봇 SSE 스트리밍 부하 테스트 (스텁 Gemini 클라이언트)
+
+동기 경로: gunicorn sync worker 수만큼의 스레드 풀에서 generate_streaming_response 소비
+비동기 경로: 하나의 이벤트 루프에서 generate_streaming_response_async 동시 소비
+
+실제 Gemini API / DB 는 호출하지 않습니다. (대화 이력 조회, 대화 턴 저장은 스텁 처리)
+재연결 버퍼(StreamEventBuffer)와 동시 요청 제한의 전역 in-flight 카운트는 실제 Redis 에 기록하므로
+Redis 가 필요하고, 결과에는 chunk 당 Redis 쓰기 비용이 포함됩니다. (운영 Redis 가 아닌 로컬 / 스테이징에서 실행)
+"""
+
+
+@dataclass
+class _StubChunk:
+    text: str
+
+
+# chunk 사이에 delay 를 두고 응답하는 Gemini 클라이언트 스텁 (동기 / client.aio 비동기 모두 제공)
+class _StubModels:
+    def __init__(self, chunks: int, delay: float) -> None:
+        self.chunks = chunks
+        self.delay = delay
+
+    def generate_content_stream(self, **kwargs: Any) -> Iterator[_StubChunk]:
+        for i in range(self.chunks):
+            time.sleep(self.delay)
+            yield _StubChunk(text=f"chunk-{i} ")
+
+
+class _StubAsyncModels(_StubModels):
+    async def generate_content_stream(self, **kwargs: Any) -> AsyncIterator[_StubChunk]:  # type: ignore[override]
+        return self._stream()
+
+    async def _stream(self) -> AsyncIterator[_StubChunk]:
+        for i in range(self.chunks):
+            await asyncio.sleep(self.delay)
+            yield _StubChunk(text=f"chunk-{i} ")
+
+
+class _StubAsyncClient:
+    def __init__(self, chunks: int, delay: float) -> None:
+        self.models = _StubAsyncModels(chunks, delay)
+
+
+class StubGeminiClient:
+    def __init__(self, chunks: int, delay: float) -> None:
+        self.models = _StubModels(chunks, delay)
+        self.aio = _StubAsyncClient(chunks, delay)
+
+
+@dataclass
+class LoadTestResult:
+    label: str
+    streams: int
+    elapsed: float = 0.0
+    peak_concurrency: int = 0
+    first_chunk_latencies: list[float] = field(default_factory=list)
+    _open_streams: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def stream_opened(self, started_at: float) -> None:
+        with self._lock:
+            self._open_streams += 1
+            self.peak_concurrency = max(self.peak_concurrency, self._open_streams)
+            self.first_chunk_latencies.append(time.perf_counter() - started_at)
+
+    def stream_closed(self) -> None:
+        with self._lock:
+            self._open_streams -= 1
+
+    def percentile(self, pct: float) -> float:
+        if not self.first_chunk_latencies:
+            return 0.0
+        ordered = sorted(self.first_chunk_latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = "스텁 Gemini 클라이언트로 챗봇 SSE 스트리밍의 동기(WSGI)/비동기(ASGI) 동시 처리량을 비교합니다."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("--streams", type=int, default=200, help="동시에 요청되는 스트림 수")
+        parser.add_argument("--workers", type=int, default=3, help="동기 경로의 sync worker 수 (gunicorn --workers)")
+        parser.add_argument("--chunks", type=int, default=20, help="스트림 하나당 chunk 수")
+        parser.add_argument("--chunk-delay", type=float, default=0.05, help="chunk 사이 지연(초)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        streams: int = options["streams"]
+        workers: int = options["workers"]
+        stub_client = StubGeminiClient(options["chunks"], options["chunk_delay"])
+        session = ChatbotSession(using_model=ChatModel.GEMINI)
+        contents = [types.Content(role="user", parts=[types.Part.from_text(text="load test")])]
+
+        with (
+            patch.object(GeminiStreamingService, "_get_client", return_value=stub_client),
+            patch.object(GeminiStreamingService, "_build_contents", return_value=contents),
+            patch.object(completion_response_service, "save_turn", return_value=[]),
+        ):
+            sync_result = self._run_sync(session, streams, workers)
+            async_result = asyncio.run(self._run_async(session, streams))
+
+        for result in (sync_result, async_result):
+            self.stdout.write(
+                f"[{result.label}] streams={result.streams} elapsed={result.elapsed:.2f}s "
+                f"throughput={result.streams / result.elapsed:.1f} streams/s "
+                f"peak_concurrency={result.peak_concurrency} "
+                f"first_chunk p50={result.percentile(50) * 1000:.0f}ms p99={result.percentile(99) * 1000:.0f}ms"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"비동기 경로 동시 처리량: 동기 대비 {sync_result.elapsed / async_result.elapsed:.1f}배")
+        )
+
+    def _run_sync(self, session: ChatbotSession, streams: int, workers: int) -> LoadTestResult:
+        result = LoadTestResult(label=f"sync x{workers} workers", streams=streams)
+        started_at = time.perf_counter()
+
+        def consume() -> None:
+            service = GeminiStreamingService(session)
+            opened = False
+            for _ in service.generate_streaming_response("load test"):
+                if not opened:
+                    result.stream_opened(started_at)
+                    opened = True
+            result.stream_closed()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(consume) for _ in range(streams)]:
+                future.result()
+
+        result.elapsed = time.perf_counter() - started_at
+        return result
+
+    async def _run_async(self, session: ChatbotSession, streams: int) -> LoadTestResult:
+        result = LoadTestResult(label="async x1 event loop", streams=streams)
+        started_at = time.perf_counter()
+
+        async def consume() -> None:
+            service = GeminiStreamingService(session)
+            opened = False
+            async for _ in service.generate_streaming_response_async("load test"):
+                if not opened:
+                    result.stream_opened(started_at)
+                    opened = True
+            result.stream_closed()
+
+        await asyncio.gather(*(consume() for _ in range(streams)))
+
+        result.elapsed = time.perf_counter() - started_at
+        return result
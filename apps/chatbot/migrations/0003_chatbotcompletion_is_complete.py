@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0002_chatbotsession_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chatbotcompletion",
+            name="is_complete",
+            field=models.BooleanField(default=True),
+        ),
+    ]
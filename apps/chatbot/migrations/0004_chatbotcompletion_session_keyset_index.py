@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0003_chatbotcompletion_is_complete"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatbotcompletion",
+            index=models.Index(fields=["session", "created_at", "id"], name="chatbot_comp_session_keyset"),
+        ),
+    ]
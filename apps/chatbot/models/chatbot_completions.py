@@ -13,6 +13,12 @@ class ChatbotCompletion(TimeStampedModel):
     session = models.ForeignKey("ChatbotSession", on_delete=models.CASCADE, related_name="messages")
     message = models.TextField()
     role = models.CharField(choices=UserRole.choices, max_length=9)
+    # 스트리밍 도중 에러/연결 종료로 중간까지만 저장된 AI 메세지면 False
+    is_complete = models.BooleanField(default=True)
 
     class Meta:
         db_table = "chatbot_completions"
+        # 대화 내역 keyset 페이지네이션 (session 필터 + created_at, id 정렬/경계 조건)
+        indexes = [
+            models.Index(fields=["session", "created_at", "id"], name="chatbot_comp_session_keyset"),
+        ]
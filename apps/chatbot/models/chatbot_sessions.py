@@ -14,6 +14,9 @@ class ChatbotSession(TimeStampedModel):
     question = models.ForeignKey("qna.Question", on_delete=models.CASCADE)
     title = models.CharField(max_length=30)
     using_model = models.CharField(choices=ChatModel.choices, max_length=20)
+    # 히스토리 윈도우 밖으로 밀려난 대화의 누적 요약 / 요약에 반영된 마지막 메세지 id (keyset 커서)
+    summary = models.TextField(blank=True, default="")
+    summarized_message_id = models.BigIntegerField(default=0)
 
     class Meta:
         db_table = "chatbot_sessions"
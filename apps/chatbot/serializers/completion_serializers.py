@@ -7,7 +7,7 @@ from apps.chatbot.models.chatbot_completions import ChatbotCompletion
 class CompletionSerializer(serializers.ModelSerializer[ChatbotCompletion]):
     class Meta:
         model = ChatbotCompletion
-        fields = ["id", "session", "message", "role", "created_at", "updated_at"]
+        fields = ["id", "session", "message", "role", "is_complete", "created_at", "updated_at"]
         read_only_fields = fields
 
 
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+from typing import Any, TypedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django_redis import get_redis_connection  # type: ignore
+from redis.exceptions import WatchError
+
+from apps.chatbot.models.chatbot_completions import ChatbotCompletion
+from apps.chatbot.models.chatbot_sessions import ChatbotSession
+
+"""
+세션별 대화 이력 Redis 캐시 (write-through)
+
+ChatHistoryCache: 요약에 아직 반영되지 않은 최신 메세지 목록을 세션 단위로 캐시
+    get: 캐시 조회 (요약 커서가 다르면 stale 로 보고 miss 처리) + hit/miss 카운트
+    set: DB 조회 결과 / 윈도우 갱신 결과 저장
+    append, extend: 메세지 저장 시 캐시 뒤에 추가 (캐시가 있을 때만, 최대 길이 초과 시 무효화)
+    invalidate: 메세지/세션 삭제 시 캐시 삭제
+    stats: hit/miss 카운터 조회
+
+Redis (키 이름은 cache KEY_PREFIX 와 동일하게)
+    chatbot:history:{session_id}:cursor: 캐시를 채울 때의 요약 커서 (summarized_message_id) → 이 키가 있어야 캐시 hit
+    chatbot:history:{session_id}:messages: 메세지 리스트 (JSON, RPUSH 로 뒤에 추가)
+- 추가는 읽고-고쳐-쓰기 없이 RPUSH → 동시에 저장된 턴끼리 서로 덮어쓰지 않음
+- 추가 도중 set / invalidate 가 일어나면 (cursor 키 WATCH) 추가하지 않고 캐시 삭제 → 무효화된 이력이 되살아나지 않음
+- DB 에서 다시 채운 캐시에 같은 메세지가 한 번 더 추가되면 조회 시 id 로 걸러냄
+"""
+
+
+class CachedMessage(TypedDict):
+    id: int
+    role: str
+    message: str
+
+
+class ChatHistoryCache:
+    HITS_KEY = "chatbot:history:stats:hits"
+    MISSES_KEY = "chatbot:history:stats:misses"
+
+    def __init__(self, cache_alias: str = "default") -> None:
+        self.cache_alias = cache_alias
+
+    def _cache(self) -> Any:
+        return caches[self.cache_alias]
+
+    def _redis(self) -> Any:
+        return get_redis_connection(self.cache_alias)
+
+    def _keys(self, session_id: int) -> tuple[str, str]:
+        cache = self._cache()
+        return (
+            cache.make_key(f"chatbot:history:{session_id}:cursor"),
+            cache.make_key(f"chatbot:history:{session_id}:messages"),
+        )
+
+    @staticmethod
+    def _to_entry(completion: ChatbotCompletion) -> str:
+        entry: CachedMessage = {"id": completion.id, "role": completion.role, "message": completion.message}
+        return json.dumps(entry, ensure_ascii=False)
+
+    def _incr(self, key: str) -> None:
+        cache = self._cache()
+        if not cache.add(key, 1, None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, None)
+
+    def get(self, session: ChatbotSession) -> list[ChatbotCompletion] | None:
+        cursor_key, messages_key = self._keys(session.id)
+        pipeline = self._redis().pipeline(transaction=True)
+        pipeline.get(cursor_key)
+        pipeline.lrange(messages_key, 0, -1)
+        cursor, raw_entries = pipeline.execute()
+        if cursor is None or int(cursor) != session.summarized_message_id:
+            self._incr(self.MISSES_KEY)
+            return None
+
+        self._incr(self.HITS_KEY)
+        completions: list[ChatbotCompletion] = []
+        for raw in raw_entries:
+            entry: CachedMessage = json.loads(raw)
+            # 이미 담긴 메세지가 다시 추가된 경우 (id 는 세션 안에서 증가)
+            if completions and entry["id"] <= completions[-1].id:
+                continue
+            completions.append(
+                ChatbotCompletion(id=entry["id"], session=session, role=entry["role"], message=entry["message"])
+            )
+        return completions
+
+    def set(self, session: ChatbotSession, completions: list[ChatbotCompletion]) -> None:
+        cursor_key, messages_key = self._keys(session.id)
+        ttl = settings.CHATBOT_HISTORY_CACHE_TTL
+        pipeline = self._redis().pipeline(transaction=True)
+        pipeline.delete(messages_key)
+        if completions:
+            pipeline.rpush(messages_key, *(self._to_entry(completion) for completion in completions))
+            pipeline.expire(messages_key, ttl)
+        pipeline.set(cursor_key, session.summarized_message_id, ex=ttl)
+        pipeline.execute()
+
+    def append(self, completion: ChatbotCompletion) -> None:
+        self.extend([completion])
+
+    # 캐시가 없으면 만들지 않음 (다음 조회 때 DB 에서 윈도우 단위로 채움)
+    def extend(self, completions: list[ChatbotCompletion]) -> None:
+        if not completions:
+            return
+
+        session_id = completions[0].session_id
+        cursor_key, messages_key = self._keys(session_id)
+        ttl = settings.CHATBOT_HISTORY_CACHE_TTL
+        try:
+            with self._redis().pipeline(transaction=True) as pipeline:
+                pipeline.watch(cursor_key)
+                if not pipeline.exists(cursor_key):
+                    return
+                pipeline.multi()
+                pipeline.rpush(messages_key, *(self._to_entry(completion) for completion in completions))
+                pipeline.expire(messages_key, ttl)
+                pipeline.expire(cursor_key, ttl)
+                length = pipeline.execute()[0]
+        except WatchError:
+            # 추가하는 사이 다른 요청이 캐시를 다시 채웠거나 무효화함
+            self.invalidate(session_id)
+            return
+
+        if length > settings.CHATBOT_HISTORY_CACHE_MAX_LENGTH:
+            self.invalidate(session_id)
+
+    def invalidate(self, session_id: int) -> None:
+        self._redis().delete(*self._keys(session_id))
+
+    def stats(self) -> dict[str, int]:
+        counts = self._cache().get_many([self.HITS_KEY, self.MISSES_KEY])
+        return {"hits": int(counts.get(self.HITS_KEY, 0)), "misses": int(counts.get(self.MISSES_KEY, 0))}
+
+
+chat_history_cache = ChatHistoryCache()
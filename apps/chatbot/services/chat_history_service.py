@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import math
+
+from django.conf import settings
+from google.genai import types
+
+from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
+from apps.chatbot.models.chatbot_sessions import ChatbotSession
+from apps.chatbot.services.chat_history_cache import chat_history_cache
+
+"""
+대화 이력 윈도우 빌더 (메세지 수 / 토큰 예산 제한 + 누적 요약)
+
+ChatHistoryBuilder: 최신 N개 메세지만 조회해서 Gemini contents 생성
+    build: [누적 요약] + 최신 메세지 윈도우 → contents (Redis 캐시 우선, miss 시 DB)
+    _apply_budget: 메세지 수 / 토큰 예산만큼 최신 메세지만 남기기
+    _fetch_window: (캐시 miss) 최신 메세지 N개 조회 후 예산 적용
+    _fetch_overflow: (캐시 miss) 윈도우 밖으로 밀려난 메세지를 keyset(id > summarized_message_id) 조회
+    _fold: 밀려난 메세지를 요약에 누적 (요약 커서 compare-and-set, 실패 시 세션 다시 읽기)
+Functions:
+    estimate_tokens: 글자 수 기반 토큰 수 추정
+    fold_summary: 기존 요약 + 새 메세지 → 길이 제한된 누적 요약
+"""
+
+# 한글 기준 대략 2글자 ≒ 1토큰 으로 추정 (API 호출 없이 예산 계산용)
+CHARS_PER_TOKEN = 2
+# 요약에 누적할 때 메세지 하나당 최대 글자 수
+SUMMARY_LINE_MAX_CHARS = 200
+SUMMARY_PREFIX = "[이전 대화 요약]\n"
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+# 기존 요약 뒤에 새 메세지를 한 줄씩 이어 붙이고, 최대 길이를 넘으면 오래된 줄부터 버림
+def fold_summary(summary: str, completions: list[ChatbotCompletion], *, max_chars: int) -> str:
+    lines = [line for line in summary.splitlines() if line]
+    for completion in completions:
+        speaker = "AI" if completion.role == UserRole.ASSISTANT else "사용자"
+        text = " ".join(completion.message.split())[:SUMMARY_LINE_MAX_CHARS]
+        lines.append(f"{speaker}: {text}")
+
+    while lines and len("\n".join(lines)) > max_chars:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+def _to_content(completion: ChatbotCompletion) -> types.Content:
+    role = "model" if completion.role == UserRole.ASSISTANT else "user"
+    return types.Content(role=role, parts=[types.Part.from_text(text=completion.message)])
+
+
+class ChatHistoryBuilder:
+    def __init__(
+        self,
+        session: ChatbotSession,
+        *,
+        max_messages: int | None = None,
+        max_tokens: int | None = None,
+        summary_max_chars: int | None = None,
+    ) -> None:
+        self.session = session
+        self.max_messages = max_messages or settings.CHATBOT_HISTORY_MAX_MESSAGES
+        self.max_tokens = max_tokens or settings.CHATBOT_HISTORY_MAX_TOKENS
+        self.summary_max_chars = summary_max_chars or settings.CHATBOT_SUMMARY_MAX_CHARS
+
+    def build(self) -> list[types.Content]:
+        cached = chat_history_cache.get(self.session)
+        if cached is None:
+            window = self._fetch_window()
+            overflow = self._fetch_overflow(window_start_id=window[0].id) if window else []
+        else:
+            window = self._apply_budget(cached)
+            overflow = cached[: len(cached) - len(window)]
+
+        folded = self._fold(overflow) if overflow else True
+        if not folded:
+            # 다른 요청이 먼저 요약을 옮김 → 그 요약에 이미 들어간 메세지는 윈도우에서 제외 (캐시는 그쪽에서 채움)
+            window = [completion for completion in window if completion.id > self.session.summarized_message_id]
+        elif cached is None or overflow:
+            chat_history_cache.set(self.session, window)
+
+        contents: list[types.Content] = []
+        if self.session.summary:
+            contents.append(
+                types.Content(role="user", parts=[types.Part.from_text(text=SUMMARY_PREFIX + self.session.summary)])
+            )
+        # 응답 없이 끊긴 턴(빈 AI 메세지)은 contents 에서 제외
+        contents.extend(_to_content(completion) for completion in window if completion.message)
+        return contents
+
+    # 시간순 메세지 목록에서 최신 N개 + 토큰 예산 안에 들어오는 만큼만 남김
+    def _apply_budget(self, completions: list[ChatbotCompletion]) -> list[ChatbotCompletion]:
+        window: list[ChatbotCompletion] = []
+        used_tokens = 0
+        for completion in reversed(completions[-self.max_messages :]):
+            used_tokens += estimate_tokens(completion.message)
+            if window and used_tokens > self.max_tokens:
+                break
+            window.append(completion)
+        window.reverse()
+        return window
+
+    # (캐시 miss) 최신 메세지 N개만 조회 (session, created_at, id 역순) → 토큰 예산 적용
+    def _fetch_window(self) -> list[ChatbotCompletion]:
+        latest = list(
+            self.session.messages.filter(id__gt=self.session.summarized_message_id)
+            .only("id", "session_id", "role", "message")
+            .order_by("-created_at", "-id")[: self.max_messages]
+        )
+        latest.reverse()
+        return self._apply_budget(latest)
+
+    # (캐시 miss) 아직 요약되지 않았고(id > summarized_message_id) 윈도우 밖으로 밀려난 메세지 조회
+    def _fetch_overflow(self, *, window_start_id: int) -> list[ChatbotCompletion]:
+        return list(
+            self.session.messages.filter(
+                id__gt=self.session.summarized_message_id,
+                id__lt=window_start_id,
+            )
+            .only("id", "session_id", "role", "message")
+            .order_by("id")
+        )
+
+    # 밀려난 메세지를 요약에 누적하고 요약 커서 이동
+    # 커서가 읽은 값 그대로일 때만 반영 (compare-and-set) → 같은 세션의 동시 요청이 요약을 덮어쓰거나 두 번 누적하지 않음
+    # 다른 요청이 먼저 옮겼으면 세션의 요약 / 커서를 다시 읽고 False 반환
+    def _fold(self, overflow: list[ChatbotCompletion]) -> bool:
+        summary = fold_summary(self.session.summary, overflow, max_chars=self.summary_max_chars)
+        updated = ChatbotSession.objects.filter(
+            pk=self.session.pk, summarized_message_id=self.session.summarized_message_id
+        ).update(summary=summary, summarized_message_id=overflow[-1].id)
+        if not updated:
+            self.session.refresh_from_db(fields=["summary", "summarized_message_id"])
+            return False
+
+        self.session.summary = summary
+        self.session.summarized_message_id = overflow[-1].id
+        return True
@@ -1,109 +1,210 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import math
 import os
-from collections.abc import Iterator
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections, transaction
 from google import genai
 from google.genai import types
 
 from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
-from apps.chatbot.models.chatbot_sessions import ChatbotSession
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services.chat_history_cache import chat_history_cache
+from apps.chatbot.services.chat_history_service import ChatHistoryBuilder
+from apps.chatbot.services.concurrency_limiter import LimiterTicket, get_limiter
+from apps.chatbot.services.gemini_client_registry import gemini_client_registry
+from apps.chatbot.services.prompt_cache import prompt_response_cache
+from apps.chatbot.services.stream_buffer import (
+    StreamEventBuffer,
+    StreamMeta,
+    StreamStatus,
+)
+from apps.chatbot.services.turn_metrics import TurnMetrics
+from apps.core.exceptions.exception_messages import EMS
+from apps.core.exceptions.exceptions import ServiceUnavailableException
 
 logger = logging.getLogger(__name__)
 
+# 요청과 분리된 생성 task 참조 보관 (응답 제너레이터가 먼저 정리돼도 GC 되지 않도록)
+_background_tasks: set[asyncio.Task[bool]] = set()
+
+# (WSGI) 클라이언트 연결 종료 후 남은 생성을 받는 스레드 (gunicorn 워커가 생성이 끝날 때까지 붙잡히지 않도록)
+_drain_executor = ThreadPoolExecutor(
+    max_workers=settings.CHATBOT_STREAM_DRAIN_WORKERS, thread_name_prefix="chatbot-stream-drain"
+)
+
 """
-Gemini API SSE 스트리밍 서비스
+LLM SSE 스트리밍 서비스
 
 SSEEncoder: SSE 포맷 인코딩
+ChatStreamingService: provider 공통 스트리밍 처리 (대화 이력 / 버퍼 / 저장 / 동시 요청 제한)
 GeminiStreamingService: Gemini API 스트리밍 처리
 Functions:
-    user_message_save: 사용자 메시지 DB 저장
-    ai_message_save: AI 메시지 DB 저장
+    save_turn: 대화 한 턴(사용자 + AI 메시지) 일괄 저장 (bulk_create 1회)
+    run_in_drain_thread: (WSGI) 연결 종료 후 남은 생성을 백그라운드 스레드에서 실행 (끝나면 스레드의 DB 연결 정리)
+    replay_streaming_response: (재연결) 버퍼의 놓친 chunk 만 재전송, 대기하지 않음 → 생성 중이면 retry 후 종료 (WSGI)
+    replay_streaming_response_async: (재연결) 위와 동일 (ASGI)
     create_streaming_response: StreamingHttpResponse 생성
 """
 
 """
 SSEEncoder: SSE 포맷 인코딩
-    encode: SSE 포맷 인코딩
+    encode: SSE 포맷 인코딩 (event_id 가 있으면 id 필드 포함 → 재연결 시 Last-Event-ID 로 전달됨)
     json: SSE JSON 메시지 생성 (content/done/error)
 """
 
 
 class SSEEncoder:
     @staticmethod
-    def encode(data: str) -> str:
-        return f"data: {data}\n\n"
+    def encode(data: str, *, event_id: str | None = None) -> str:
+        if event_id is None:
+            return f"data: {data}\n\n"
+        return f"id: {event_id}\ndata: {data}\n\n"
 
     @staticmethod
-    def json(content: str, *, done: bool = False, error: bool = False) -> str:
+    def json(content: str, *, done: bool = False, error: bool = False, event_id: str | None = None) -> str:
         if done:
             return SSEEncoder.encode("[DONE]")
         if error:
             return SSEEncoder.encode("[ERROR]")
-        return SSEEncoder.encode(json.dumps({"content": content}, ensure_ascii=False))
+        return SSEEncoder.encode(json.dumps({"content": content}, ensure_ascii=False), event_id=event_id)
+
+
+# 대화 한 턴 일괄 저장 (스트림 종료 후 사용자 + AI 메세지를 트랜잭션 안에서 bulk_create 1회로 저장)
+# 스트리밍 도중 에러/연결 종료 시에도 호출 → 중간까지 받은 AI 메세지를 is_complete=False 로 저장
+def save_turn(
+    *, session: ChatbotSession, user_message: str, ai_message: str, is_complete: bool = True
+) -> list[ChatbotCompletion]:
+    with transaction.atomic():
+        completions = ChatbotCompletion.objects.bulk_create(
+            [
+                ChatbotCompletion(session=session, message=user_message, role=UserRole.USER),
+                ChatbotCompletion(
+                    session=session,
+                    message=ai_message,
+                    role=UserRole.ASSISTANT,
+                    is_complete=is_complete,
+                ),
+            ]
+        )
+    chat_history_cache.extend(completions)
+    return completions
+
+
+def run_in_drain_thread(task: Callable[[], None]) -> None:
+    def run() -> None:
+        try:
+            task()
+        finally:
+            connections.close_all()
+
+    _drain_executor.submit(run)
+
+
+async def _aiter_chunks(chunks: list[str]) -> AsyncIterator[str]:
+    for chunk in chunks:
+        yield chunk
+
+
+# 재연결 종료 판단: 생성 완료 + 모든 chunk 전송 → [DONE] / 에러·버퍼 만료·대기 시간 초과 → [ERROR], [DONE]
+def _replay_end_frames(meta: StreamMeta | None, after_seq: int, deadline: float) -> list[str] | None:
+    if meta is not None and meta["status"] == StreamStatus.DONE and after_seq >= meta["last_seq"]:
+        return [SSEEncoder.json("", done=True)]
+    if meta is None or meta["status"] == StreamStatus.ERROR or time.monotonic() >= deadline:
+        return [SSEEncoder.json("", error=True), SSEEncoder.json("", done=True)]
+    return None
+
+
+# (WSGI) 재연결(Last-Event-ID): 지금까지 버퍼에 쌓인 놓친 chunk 만 재전송 (모델 재호출 X)
+# 폴링으로 워커를 붙잡지 않도록 생성이 아직 진행 중이면 retry 만 알리고 종료 → 클라이언트가 마지막 id 로 다시 재연결
+# ASGI 처럼 진행 중인 생성을 한 응답으로 이어서 흘려주지는 않음
+def replay_streaming_response(stream: StreamEventBuffer, after_seq: int) -> Generator[str, None, None]:
+    events, meta = stream.read_after(after_seq)
+    for seq, text in events:
+        after_seq = seq
+        yield SSEEncoder.json(text, event_id=stream.event_id(seq))
 
+    end_frames = _replay_end_frames(meta, after_seq, deadline=math.inf)
+    if end_frames is not None:
+        yield from end_frames
+        return
+    yield f"retry: {settings.CHATBOT_STREAM_REPLAY_RETRY_MS}\n\n"
 
-# 유저 메세지 DB 저장
-def user_message_save(*, session: ChatbotSession, message: str) -> ChatbotCompletion:
-    return ChatbotCompletion.objects.create(
-        session=session,
-        message=message,
-        role=UserRole.USER,
-    )
 
+# (ASGI) 재연결(Last-Event-ID): 놓친 chunk 재전송 후, 생성이 끝날 때까지 버퍼를 폴링하며 이어받기 (모델 재호출 X)
+async def replay_streaming_response_async(stream: StreamEventBuffer, after_seq: int) -> AsyncGenerator[str, None]:
+    deadline = time.monotonic() + settings.CHATBOT_STREAM_REPLAY_TIMEOUT
+    while True:
+        events, meta = await sync_to_async(stream.read_after, thread_sensitive=False)(after_seq)
+        for seq, text in events:
+            after_seq = seq
+            yield SSEEncoder.json(text, event_id=stream.event_id(seq))
 
-# ai 메세지 DB 저장
-def ai_message_save(*, session: ChatbotSession, message: str) -> ChatbotCompletion:
-    return ChatbotCompletion.objects.create(
-        session=session,
-        message=message,
-        role=UserRole.ASSISTANT,
-    )
+        end_frames = _replay_end_frames(meta, after_seq, deadline)
+        if end_frames is not None:
+            for frame in end_frames:
+                yield frame
+            return
+        await asyncio.sleep(settings.CHATBOT_STREAM_REPLAY_POLL_INTERVAL)
 
 
 """
-GeminiStreamingService: Gemini API 스트리밍 처리
-    _get_api_key: 환경변수에서 GEMINI_API_KEY 조회
-    _get_client: Gemini Client 인스턴스 생성
-    get_chat_history: 세션 대화 이력 → Gemini API 형식 변환
+ChatStreamingService: provider 공통 SSE 스트리밍 처리 (추상 클래스, provider 별 서비스는 텍스트 스트림만 구현)
+    provider_name: concurrency limiter 구분용 provider 이름
+    admit: provider 동시 요청 한도 확인 (초과 시 503) → 스트리밍 시작 전 view 에서 호출
+    release_unstarted: 스트림 제너레이터가 시작되지 않은 채 응답이 닫히면 admit 한 ticket 반납 (응답 close 시 호출)
+    get_chat_history: 세션 대화 이력(요약 + 최신 윈도우) → Gemini API 형식 변환
     _build_contents: 대화 이력 + 새 메시지 → contents 생성
-    _iter_gemini_text_stream: Gemini 스트리밍 텍스트 iterator
+    _iter_text_stream: provider 스트리밍 텍스트 iterator (provider 별 구현)
+    _iter_text_stream_async: provider 스트리밍 텍스트 async iterator (provider 별 구현)
+    _open_text_stream, _open_text_stream_async: 실행 슬롯 확보 후 provider 스트림 열기 (대기 시간 초과 시 에러)
+    _get_cached_answer: (opt-in) 첫 턴이면 질문별 프롬프트 캐시 조회 → hit 시 모델 호출 없이 재전송
+    _new_metrics: 턴 단위 지연 시간 계측 시작 (이력 조회 / 슬롯 대기 / TTFB / 스트림 / 저장 시간 → 구조화 로그 + Sentry)
+    _release_ticket: 실행 슬롯 / 전역 in-flight 반납 (ASGI 는 event loop 에서 호출 → asyncio.Semaphore 는 스레드 안전하지 않음)
+    _finish_turn: 스트림 종료 후 대화 한 턴 저장 + (첫 턴) 프롬프트 캐시 저장 + 스트림 버퍼 종료 기록 + 계측 종료 (DB / 캐시 작업만)
+    _drain: (WSGI) 클라이언트 연결 종료 후 남은 생성 결과를 버퍼에만 저장
+    _drain_and_finish: (WSGI) 백그라운드 스레드에서 _drain 후 슬롯 반납 + 한 턴 저장
+    _produce_async: (ASGI) 별도 task 에서 생성 → 버퍼 + queue 로 전달
+    generate_streaming_response: SSE 동기 제너레이터 (WSGI)
+    generate_streaming_response_async: SSE 비동기 제너레이터 (ASGI)
 """
 
 
-class GeminiStreamingService:
+class ChatStreamingService(ABC):
+    provider_name = ""
+
     def __init__(self, session: ChatbotSession) -> None:
         self.session = session
         self.model = session.using_model
+        self._ticket: LimiterTicket | None = None
+        self._stream_started = False
 
-    @staticmethod
-    def _get_api_key() -> str:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise RuntimeError("GEMINI_API_KEY not set")
-        return api_key
+    def admit(self) -> None:
+        self._ticket = get_limiter(self.provider_name).admit()
 
-    @staticmethod
-    def _get_client() -> genai.Client:
-        return genai.Client(api_key=GeminiStreamingService._get_api_key())
+    # 시작되지 않은 제너레이터는 close 해도 finally 가 실행되지 않으므로 (첫 chunk 전 연결 종료 등) 여기서 반납
+    # 시작된 스트림은 제너레이터(생성 task)가 반납하므로 건드리지 않음 → 실행 슬롯 획득 전이라 스레드에서 호출해도 안전
+    def release_unstarted(self) -> None:
+        if not self._stream_started:
+            self._release_ticket()
+
+    def _new_metrics(self) -> TurnMetrics:
+        return TurnMetrics(session_id=self.session.id, provider=self.provider_name, model=self.model)
 
-    # 세션 대화 이력 Gemini API 형식으로 변환
+    # 세션 대화 이력 Gemini API 형식으로 변환 (누적 요약 + 최신 메세지 윈도우)
     def get_chat_history(self) -> list[types.Content]:
-        completions = self.session.messages.all().order_by("created_at")
-        history = []
-
-        for completion in completions:
-            role = "model" if completion.role == UserRole.ASSISTANT else "user"
-            history.append(
-                types.Content(
-                    role=role,
-                    parts=[types.Part.from_text(text=completion.message)],
-                )
-            )
-        return history
+        return ChatHistoryBuilder(self.session).build()
 
     # (제너레이터에서 분리)
     def _build_contents(self, user_message: str) -> list[types.Content]:
@@ -116,9 +217,266 @@ class GeminiStreamingService:
         )
         return contents
 
+    @abstractmethod
+    def _iter_text_stream(self, contents: list[types.Content]) -> Iterator[str]: ...
+
+    @abstractmethod
+    def _iter_text_stream_async(self, contents: list[types.Content]) -> AsyncIterator[str]: ...
+
+    # admit 된 요청이면 프로세스 단위 실행 슬롯이 날 때까지 대기 (대기열)
+    def _open_text_stream(self, contents: list[types.Content]) -> Iterator[str]:
+        if self._ticket is not None and not self._ticket.acquire():
+            raise ServiceUnavailableException(EMS.E503_CHATBOT_BUSY)
+        return self._iter_text_stream(contents)
+
+    async def _open_text_stream_async(self, contents: list[types.Content]) -> AsyncIterator[str]:
+        if self._ticket is not None and not await self._ticket.acquire_async():
+            raise ServiceUnavailableException(EMS.E503_CHATBOT_BUSY)
+        return self._iter_text_stream_async(contents)
+
+    # (opt-in) 이전 대화가 없는 첫 턴만 질문별 캐시 대상 (contents = 새 메세지 1개)
+    # 반환: (캐시된 chunk 목록 또는 None, 이번 응답을 캐시에 저장할지 여부)
+    def _get_cached_answer(self, user_message: str, contents: list[types.Content]) -> tuple[list[str] | None, bool]:
+        if not settings.CHATBOT_PROMPT_CACHE_ENABLED or len(contents) != 1:
+            return None, False
+        try:
+            cached = prompt_response_cache.get(self.session.question_id, self.model, user_message)
+        except Exception as e:
+            logger.exception("Chatbot Prompt Cache Error: %s: %s", type(e).__name__, e)
+            return None, False
+        return cached, cached is None
+
+    def _release_ticket(self) -> None:
+        if self._ticket is not None:
+            self._ticket.release()
+
+    # 스트림이 끝난 뒤 사용자 메세지 + AI 응답을 한 번에 저장하고, 재연결 대기 중인 쪽에 종료 알림
+    # 스트림을 이미 내보낸 뒤라 저장 실패가 응답을 깨뜨리지 않도록 로그만 남김
+    def _finish_turn(
+        self,
+        user_message: str,
+        stream: StreamEventBuffer,
+        buffer: list[str],
+        *,
+        is_complete: bool,
+        metrics: TurnMetrics,
+        cache_answer: bool = False,
+    ) -> None:
+        try:
+            with metrics.span("save"):
+                save_turn(
+                    session=self.session,
+                    user_message=user_message,
+                    ai_message="".join(buffer),
+                    is_complete=is_complete,
+                )
+        except Exception as e:
+            logger.exception("Chatbot Turn Save Error: %s: %s", type(e).__name__, e)
+
+        if cache_answer and is_complete and buffer:
+            try:
+                prompt_response_cache.set(self.session.question_id, self.model, user_message, buffer)
+            except Exception as e:
+                logger.exception("Chatbot Prompt Cache Error: %s: %s", type(e).__name__, e)
+
+        try:
+            stream.finish(self.session.id, len(buffer), error=not is_complete)
+        except Exception as e:
+            logger.exception("Chatbot Stream Buffer Error: %s: %s", type(e).__name__, e)
+
+        metrics.finish(is_complete=is_complete)
+
+    # (WSGI) 클라이언트 연결이 끊긴 뒤에도 이미 시작된 생성은 끝까지 받아 버퍼에 쌓음 (재연결 시 이어받기)
+    def _drain(self, text_stream: Iterator[str], stream: StreamEventBuffer, buffer: list[str]) -> bool:
+        try:
+            for chunk_text in text_stream:
+                buffer.append(chunk_text)
+                stream.push(self.session.id, len(buffer), chunk_text)
+        except Exception as e:
+            logger.exception("Chatbot Streaming Error: %s: %s", type(e).__name__, e)
+            return False
+        return True
+
+    def _drain_and_finish(
+        self,
+        user_message: str,
+        text_stream: Iterator[str],
+        stream: StreamEventBuffer,
+        buffer: list[str],
+        *,
+        metrics: TurnMetrics,
+        cache_answer: bool,
+    ) -> None:
+        is_complete = False
+        try:
+            is_complete = self._drain(text_stream, stream, buffer)
+        finally:
+            self._release_ticket()
+            self._finish_turn(
+                user_message, stream, buffer, is_complete=is_complete, metrics=metrics, cache_answer=cache_answer
+            )
+
+    # 스트리밍 응답 생성 동기 제너레이터 (chunk 받는 즉시 id 붙여 yield + 버퍼 저장, 마지막에 한 턴 일괄 저장)
+    def generate_streaming_response(
+        self, user_message: str, stream: StreamEventBuffer | None = None
+    ) -> Generator[str, None, None]:
+        self._stream_started = True
+        stream = stream or StreamEventBuffer.create()
+        buffer: list[str] = []
+        is_complete = False
+        cache_answer = False
+        text_stream: Iterator[str] = iter(())
+        metrics = self._new_metrics()
+        handed_off = False
+        try:
+            stream.start(self.session.id)
+            with metrics.span("history"):
+                contents = self._build_contents(user_message)
+            cached, cache_answer = self._get_cached_answer(user_message, contents)
+            metrics.fields["cached"] = cached is not None
+            with metrics.span("queue"):
+                text_stream = iter(cached) if cached is not None else self._open_text_stream(contents)
+            text_stream = metrics.observe(text_stream)
+            for chunk_text in text_stream:
+                buffer.append(chunk_text)
+                stream.push(self.session.id, len(buffer), chunk_text)
+                yield SSEEncoder.json(chunk_text, event_id=stream.event_id(len(buffer)))
+            is_complete = True
+
+        except Exception as e:
+            logger.exception("Chatbot Streaming Error: %s: %s", type(e).__name__, e)
+            yield SSEEncoder.json("", error=True)
+
+        # 클라이언트 연결 종료(GeneratorExit): 남은 생성은 백그라운드 스레드에서 버퍼에만 쌓고 저장 (재연결 시 이어받기)
+        # 슬롯 반납 / 한 턴 저장도 그 스레드가 담당
+        except GeneratorExit:
+            run_in_drain_thread(
+                lambda: self._drain_and_finish(
+                    user_message, text_stream, stream, buffer, metrics=metrics, cache_answer=cache_answer
+                )
+            )
+            handed_off = True
+            raise
+
+        finally:
+            if not handed_off:
+                self._release_ticket()
+                self._finish_turn(
+                    user_message, stream, buffer, is_complete=is_complete, metrics=metrics, cache_answer=cache_answer
+                )
+
+        yield SSEEncoder.json("", done=True)
+
+    # (ASGI) 요청 task 와 분리된 생성 task: chunk 를 버퍼에 저장하고 queue 로 응답 제너레이터에 전달
+    # 클라이언트 연결이 끊겨 요청 task 가 취소되어도 생성 + 저장은 끝까지 진행 (재연결 시 이어받기)
+    async def _produce_async(
+        self,
+        user_message: str,
+        stream: StreamEventBuffer,
+        queue: asyncio.Queue[tuple[int, str] | None],
+    ) -> bool:
+        buffer: list[str] = []
+        is_complete = False
+        cache_answer = False
+        metrics = self._new_metrics()
+        try:
+            await sync_to_async(stream.start, thread_sensitive=False)(self.session.id)
+            with metrics.span("history"):
+                contents = await sync_to_async(self._build_contents)(user_message)
+            cached, cache_answer = await sync_to_async(self._get_cached_answer, thread_sensitive=False)(
+                user_message, contents
+            )
+            metrics.fields["cached"] = cached is not None
+            with metrics.span("queue"):
+                text_stream = (
+                    _aiter_chunks(cached) if cached is not None else await self._open_text_stream_async(contents)
+                )
+            async for chunk_text in metrics.observe_async(text_stream):
+                buffer.append(chunk_text)
+                await sync_to_async(stream.push, thread_sensitive=False)(self.session.id, len(buffer), chunk_text)
+                queue.put_nowait((len(buffer), chunk_text))
+            is_complete = True
+
+        except Exception as e:
+            logger.exception("Chatbot Streaming Error: %s: %s", type(e).__name__, e)
+
+        finally:
+            # 대기 중인 다음 스트림을 깨우는 asyncio.Semaphore 반납은 event loop 에서 (워커 스레드 X)
+            self._release_ticket()
+            await sync_to_async(self._finish_turn)(
+                user_message, stream, buffer, is_complete=is_complete, metrics=metrics, cache_answer=cache_answer
+            )
+            queue.put_nowait(None)
+        return is_complete
+
+    # 스트리밍 응답 생성 비동기 제너레이터 (ASGI 전용, 워커 스레드를 점유하지 않음)
+    # 생성은 _produce_async task 가 담당, 여기서는 queue 의 chunk 를 id 붙여 yield
+    async def generate_streaming_response_async(
+        self, user_message: str, stream: StreamEventBuffer | None = None
+    ) -> AsyncGenerator[str, None]:
+        self._stream_started = True
+        stream = stream or StreamEventBuffer.create()
+        queue: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue()
+        producer = asyncio.create_task(self._produce_async(user_message, stream, queue))
+        _background_tasks.add(producer)
+        producer.add_done_callback(_background_tasks.discard)
+        try:
+            while (event := await queue.get()) is not None:
+                seq, chunk_text = event
+                yield SSEEncoder.json(chunk_text, event_id=stream.event_id(seq))
+
+        # 클라이언트 연결 종료(GeneratorExit, CancelledError) 시 생성 task 는 취소하지 않고 끝날 때까지 대기
+        finally:
+            is_complete = await asyncio.shield(producer)
+
+        if not is_complete:
+            yield SSEEncoder.json("", error=True)
+        yield SSEEncoder.json("", done=True)
+
+
+"""
+GeminiStreamingService(ChatStreamingService): Gemini API 스트리밍
+    _get_api_key: 환경변수에서 GEMINI_API_KEY 조회
+    _create_client: Gemini Client 인스턴스 생성 (keep-alive 커넥션 풀 설정)
+    _get_client: 프로세스 공유 Gemini Client 조회 (gemini_client_registry)
+    _iter_text_stream: Gemini 스트리밍 텍스트 iterator
+    _iter_text_stream_async: Gemini 비동기 클라이언트(client.aio) 스트리밍 텍스트 async iterator
+"""
+
+
+class GeminiStreamingService(ChatStreamingService):
+    provider_name = "gemini"
+
+    @staticmethod
+    def _get_api_key() -> str:
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise RuntimeError("GEMINI_API_KEY not set")
+        return api_key
+
+    @staticmethod
+    def _create_client() -> genai.Client:
+        limits = httpx.Limits(
+            max_connections=settings.GEMINI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.GEMINI_HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=settings.GEMINI_HTTP_KEEPALIVE_EXPIRY,
+        )
+        return genai.Client(
+            api_key=GeminiStreamingService._get_api_key(),
+            http_options=types.HttpOptions(
+                client_args={"limits": limits},
+                async_client_args={"limits": limits},
+            ),
+        )
+
+    # 프로세스 단위로 캐시된 Client 재사용 (요청마다 새 커넥션 / TLS 핸드셰이크 X)
+    @staticmethod
+    def _get_client(model: str = ChatModel.GEMINI) -> genai.Client:
+        return gemini_client_registry.get(model, GeminiStreamingService._create_client)
+
     # (제너레이터에서 분리) Gemini Streaming 결과: 텍스트 chunk만 뽑아 동기 iterator로 제공
-    def _iter_gemini_text_stream(self, contents: list[types.Content]) -> Iterator[str]:
-        client = self._get_client()
+    def _iter_text_stream(self, contents: list[types.Content]) -> Iterator[str]:
+        client = self._get_client(self.model)
         api_contents = cast(Any, contents)  # 타입 넓혀서 전달
 
         for chunk in client.models.generate_content_stream(
@@ -129,22 +487,16 @@ class GeminiStreamingService:
             if text:
                 yield text
 
-    # 스트리밍 응답 생성 동기 제너레이터 (chunk 받는 즉시 yield, 전체 응답 buffer 모으고 마지막에 DB 저장)
-    def generate_streaming_response(self, user_message: str) -> Iterator[str]:
-        buffer: list[str] = []
-        try:
-            contents = self._build_contents(user_message)
-            for chunk_text in self._iter_gemini_text_stream(contents):
-                buffer.append(chunk_text)
-                yield SSEEncoder.json(chunk_text)
-
-            full_response = "".join(buffer)
-            if full_response:
-                ai_message_save(session=self.session, message=full_response)
-
-            yield SSEEncoder.json("", done=True)
+    # (ASGI) Gemini 비동기 클라이언트 Streaming 결과: 텍스트 chunk만 뽑아 async iterator로 제공
+    async def _iter_text_stream_async(self, contents: list[types.Content]) -> AsyncIterator[str]:
+        client = self._get_client(self.model)
+        api_contents = cast(Any, contents)  # 타입 넓혀서 전달
 
-        except Exception as e:
-            logger.exception("Gemini Streaming Error: %s: %s", type(e).__name__, e)
-            yield SSEEncoder.json("", error=True)
-            yield SSEEncoder.json("", done=True)
+        stream = await client.aio.models.generate_content_stream(
+            model=self.model,
+            contents=api_contents,
+        )
+        async for chunk in stream:
+            text = getattr(chunk, "text", None)
+            if text:
+                yield text
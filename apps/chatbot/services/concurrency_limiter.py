@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+import weakref
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django_redis import get_redis_connection  # type: ignore
+
+from apps.core.exceptions.exception_messages import EMS
+from apps.core.exceptions.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+"""
+LLM provider 별 동시 요청 제한
+
+ProviderConcurrencyLimiter: provider 하나의 동시 스트림 수 제한
+    admit: 요청 접수 (프로세스 내 대기열 / Redis 전역 in-flight 한도 초과 시 즉시 503)
+    stats: 프로세스 내 in-flight 수 + 전역 in-flight 수
+LimiterTicket: 접수된 요청 하나
+    acquire, acquire_async: 프로세스 단위 세마포어로 실행 슬롯 대기 (최대 queue_timeout 초)
+    release: 슬롯 / 전역 in-flight 반납 (여러 번 호출해도 한 번만 반납)
+get_limiter: provider 이름별 limiter 조회 (settings 값으로 lazy 생성)
+
+- 프로세스 내: max_concurrency 개까지 실행, max_queue_depth 개까지 대기, 그 이상은 거절
+- 전역: Redis sorted set(score = 접수 시각)으로 in-flight 를 세고 global_cap 초과 시 거절
+  (반납 없이 죽은 워커의 항목은 slot_ttl 이 지나면 자동 정리)
+"""
+
+
+class LimiterTicket:
+    def __init__(self, limiter: ProviderConcurrencyLimiter) -> None:
+        self.limiter = limiter
+        self.ticket_id = uuid.uuid4().hex
+        self._acquired: threading.BoundedSemaphore | asyncio.Semaphore | None = None
+        self._released = False
+
+    def acquire(self) -> bool:
+        semaphore = self.limiter._semaphore
+        if not semaphore.acquire(timeout=self.limiter.queue_timeout):
+            return False
+        self._acquired = semaphore
+        return True
+
+    async def acquire_async(self) -> bool:
+        semaphore = self.limiter._async_semaphore()
+        # 빈 슬롯이 있으면 바로 획득 (wait_for 는 timeout=0 이면 대기 없이 실패)
+        if not semaphore.locked():
+            await semaphore.acquire()
+            self._acquired = semaphore
+            return True
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.limiter.queue_timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._acquired = semaphore
+        return True
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        if self._acquired is not None:
+            self._acquired.release()
+        self.limiter._release(self)
+
+
+class ProviderConcurrencyLimiter:
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrency: int,
+        max_queue_depth: int,
+        global_cap: int,
+        queue_timeout: float,
+        slot_ttl: int,
+        cache_alias: str = "default",
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.global_cap = global_cap
+        self.queue_timeout = queue_timeout
+        self.slot_ttl = slot_ttl
+        self.cache_alias = cache_alias
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._async_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        # 반납되지 않고 버려진 ticket(스트림이 시작되지 않은 응답 등)은 GC 시 자동으로 빠짐
+        self._tickets: weakref.WeakSet[LimiterTicket] = weakref.WeakSet()
+
+    # asyncio.Semaphore 는 event loop 에 묶이므로 loop 별로 분리
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._async_semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._async_semaphores[loop] = semaphore
+            return semaphore
+
+    def _redis_key(self) -> str:
+        return caches[self.cache_alias].make_key(f"chatbot:provider:{self.name}:inflight")
+
+    def _redis(self) -> Any:
+        return get_redis_connection(self.cache_alias)
+
+    def admit(self) -> LimiterTicket:
+        ticket = LimiterTicket(self)
+        with self._lock:
+            if len(self._tickets) >= self.max_concurrency + self.max_queue_depth:
+                raise ServiceUnavailableException(EMS.E503_CHATBOT_BUSY)
+            self._tickets.add(ticket)
+
+        if not self._admit_global(ticket):
+            with self._lock:
+                self._tickets.discard(ticket)
+            raise ServiceUnavailableException(EMS.E503_CHATBOT_BUSY)
+        return ticket
+
+    # Redis 장애 시에는 프로세스 내 제한만 적용 (fail open)
+    def _admit_global(self, ticket: LimiterTicket) -> bool:
+        key = self._redis_key()
+        now = time.time()
+        try:
+            pipeline = self._redis().pipeline()
+            pipeline.zremrangebyscore(key, "-inf", now - self.slot_ttl)
+            pipeline.zadd(key, {ticket.ticket_id: now})
+            pipeline.zcard(key)
+            pipeline.expire(key, self.slot_ttl)
+            in_flight = pipeline.execute()[2]
+            if in_flight > self.global_cap:
+                self._redis().zrem(key, ticket.ticket_id)
+                return False
+        except Exception as e:
+            logger.warning("Chatbot Limiter Redis Error (%s): %s: %s", self.name, type(e).__name__, e)
+        return True
+
+    def _release(self, ticket: LimiterTicket) -> None:
+        with self._lock:
+            self._tickets.discard(ticket)
+        try:
+            self._redis().zrem(self._redis_key(), ticket.ticket_id)
+        except Exception as e:
+            logger.warning("Chatbot Limiter Redis Error (%s): %s: %s", self.name, type(e).__name__, e)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "local_in_flight": len(self._tickets),
+            "global_in_flight": int(self._redis().zcard(self._redis_key())),
+        }
+
+
+_limiters: dict[str, ProviderConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str) -> ProviderConcurrencyLimiter:
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = ProviderConcurrencyLimiter(
+                name,
+                max_concurrency=settings.CHATBOT_PROVIDER_MAX_CONCURRENCY,
+                max_queue_depth=settings.CHATBOT_PROVIDER_MAX_QUEUE_DEPTH,
+                global_cap=settings.CHATBOT_PROVIDER_GLOBAL_CAP,
+                queue_timeout=settings.CHATBOT_PROVIDER_QUEUE_TIMEOUT,
+                slot_ttl=settings.CHATBOT_PROVIDER_SLOT_TTL,
+            )
+            _limiters[name] = limiter
+        return limiter
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+
+from django.conf import settings
+from google.genai import types
+
+from apps.chatbot.services.completion_response_service import ChatStreamingService
+
+"""
+부하 테스트용 가짜 provider (CHATBOT_FAKE_PROVIDER=true 일 때 모든 세션에 사용)
+
+FakeStreamingService(ChatStreamingService): 모델 호출 없이 고정 chunk 를 일정 간격으로 스트리밍
+    _iter_text_stream: time.sleep 간격으로 chunk yield
+    _iter_text_stream_async: asyncio.sleep 간격으로 chunk yield
+"""
+
+
+class FakeStreamingService(ChatStreamingService):
+    provider_name = "fake"
+
+    @staticmethod
+    def _chunks() -> list[str]:
+        return [f"chunk-{i} " for i in range(settings.CHATBOT_FAKE_PROVIDER_CHUNKS)]
+
+    def _iter_text_stream(self, contents: list[types.Content]) -> Iterator[str]:
+        for chunk_text in self._chunks():
+            time.sleep(settings.CHATBOT_FAKE_PROVIDER_CHUNK_DELAY)
+            yield chunk_text
+
+    async def _iter_text_stream_async(self, contents: list[types.Content]) -> AsyncIterator[str]:
+        for chunk_text in self._chunks():
+            await asyncio.sleep(settings.CHATBOT_FAKE_PROVIDER_CHUNK_DELAY)
+            yield chunk_text
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from collections.abc import Callable
+
+from google import genai
+
+logger = logging.getLogger(__name__)
+
+"""
+프로세스 단위 Gemini Client 레지스트리 (커넥션 풀 / TLS 세션 재사용)
+
+GeminiClientRegistry: model 별로 genai.Client 를 lazy 생성 후 재사용
+    get: (model, 실행 중인 event loop) 키로 Client 조회, 없으면 factory 로 생성
+    close: 모든 Client 의 커넥션 정리 (워커 종료 시 atexit 로 호출)
+
+- 동기 경로(WSGI 스레드)는 프로세스 전체에서 model 당 하나의 Client 를 공유 (httpx.Client 는 thread-safe)
+- httpx.AsyncClient 커넥션은 생성된 event loop 에 묶이므로, 비동기 경로는 event loop 별로 Client 를 분리
+- fork 이후(gunicorn 워커)에는 부모 프로세스의 커넥션을 재사용하지 않도록 pid 가 바뀌면 캐시를 비움
+"""
+
+_ClientKey = tuple[str, asyncio.AbstractEventLoop | None]
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class GeminiClientRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._clients: dict[_ClientKey, genai.Client] = {}
+
+    def get(self, model: str, factory: Callable[[], genai.Client]) -> genai.Client:
+        key: _ClientKey = (model, _running_loop())
+        client = self._clients.get(key)
+        if client is not None and self._pid == os.getpid():
+            return client
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._clients = {}
+                self._pid = os.getpid()
+
+            client = self._clients.get(key)
+            if client is None:
+                # 닫힌 event loop 에 묶인 Client 정리
+                self._clients = {k: c for k, c in self._clients.items() if k[1] is None or not k[1].is_closed()}
+                client = factory()
+                self._clients[key] = client
+            return client
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._clients = self._clients, {}
+
+        for (model, loop), client in clients.items():
+            try:
+                client.close()
+                if loop is not None and not loop.is_closed() and not loop.is_running():
+                    loop.run_until_complete(client.aio.aclose())
+            except Exception as e:
+                logger.warning("Gemini Client close failed (%s): %s: %s", model, type(e).__name__, e)
+
+
+gemini_client_registry = GeminiClientRegistry()
+atexit.register(gemini_client_registry.close)
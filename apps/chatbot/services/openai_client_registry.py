@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from collections.abc import Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+"""
+프로세스 단위 OpenAI httpx Client 레지스트리 (커넥션 풀 / TLS 세션 재사용)
+
+OpenAIClientRegistry: httpx Client 를 lazy 생성 후 재사용
+    get_sync: 프로세스 공유 httpx.Client 조회, 없으면 factory 로 생성
+    get_async: 실행 중인 event loop 별 httpx.AsyncClient 조회, 없으면 factory 로 생성
+    close: 모든 Client 의 커넥션 정리 (워커 종료 시 atexit 로 호출)
+
+- httpx.AsyncClient 커넥션은 생성된 event loop 에 묶이므로 event loop 별로 분리 (gemini_client_registry 와 같은 방식)
+- 닫힌 event loop 에 묶인 Client 는 다음 조회 때 정리
+- fork 이후(gunicorn 워커)에는 부모 프로세스의 커넥션을 재사용하지 않도록 pid 가 바뀌면 캐시를 비움
+"""
+
+
+class OpenAIClientRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._sync_client: httpx.Client | None = None
+        self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def _reset_after_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._sync_client = None
+            self._async_clients = {}
+            self._pid = os.getpid()
+
+    def get_sync(self, factory: Callable[[], httpx.Client]) -> httpx.Client:
+        client = self._sync_client
+        if client is not None and self._pid == os.getpid():
+            return client
+
+        with self._lock:
+            self._reset_after_fork()
+            if self._sync_client is None:
+                self._sync_client = factory()
+            return self._sync_client
+
+    def get_async(self, factory: Callable[[], httpx.AsyncClient]) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is not None and self._pid == os.getpid():
+            return client
+
+        with self._lock:
+            self._reset_after_fork()
+            client = self._async_clients.get(loop)
+            if client is None:
+                # 닫힌 event loop 에 묶인 Client 정리 (소켓은 loop 와 함께 이미 닫힘)
+                self._async_clients = {k: c for k, c in self._async_clients.items() if not k.is_closed()}
+                client = factory()
+                self._async_clients[loop] = client
+            return client
+
+    def close(self) -> None:
+        with self._lock:
+            sync_client, self._sync_client = self._sync_client, None
+            async_clients, self._async_clients = self._async_clients, {}
+
+        try:
+            if sync_client is not None:
+                sync_client.close()
+        except Exception as e:
+            logger.warning("OpenAI Client close failed: %s: %s", type(e).__name__, e)
+
+        for loop, client in async_clients.items():
+            try:
+                if not loop.is_closed() and not loop.is_running():
+                    loop.run_until_complete(client.aclose())
+            except Exception as e:
+                logger.warning("OpenAI AsyncClient close failed: %s: %s", type(e).__name__, e)
+
+
+openai_client_registry = OpenAIClientRegistry()
+atexit.register(openai_client_registry.close)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import Any
+
+import httpx
+from django.conf import settings
+from google.genai import types
+
+from apps.chatbot.services.completion_response_service import ChatStreamingService
+from apps.chatbot.services.openai_client_registry import openai_client_registry
+
+"""
+OpenAI Chat Completions API SSE 스트리밍 서비스 (httpx 직접 호출)
+
+OpenAIStreamingService(ChatStreamingService): OpenAI API 스트리밍
+    _get_api_key: 환경변수에서 OPENAI_API_KEY 조회
+    _get_client: 프로세스 공유 httpx.Client 조회 (openai_client_registry, keep-alive 커넥션 재사용)
+    _get_async_client: event loop 별 공유 httpx.AsyncClient 조회 (openai_client_registry)
+    _request_body: 대화 이력(Gemini 형식 contents) → chat completions 요청 body
+    _iter_text_stream: OpenAI 스트리밍 텍스트 iterator
+    _iter_text_stream_async: OpenAI 스트리밍 텍스트 async iterator (httpx.AsyncClient)
+_parse_sse_line: "data: {...}" 한 줄 → delta 텍스트 (없으면 None)
+"""
+
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+
+
+def _parse_sse_line(line: str) -> str | None:
+    if not line.startswith("data:"):
+        return None
+    data = line.removeprefix("data:").strip()
+    if not data or data == "[DONE]":
+        return None
+    choices = json.loads(data).get("choices") or []
+    if not choices:
+        return None
+    text: str | None = (choices[0].get("delta") or {}).get("content")
+    return text or None
+
+
+class OpenAIStreamingService(ChatStreamingService):
+    provider_name = "openai"
+
+    @staticmethod
+    def _get_api_key() -> str:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise RuntimeError("OPENAI_API_KEY not set")
+        return api_key
+
+    @staticmethod
+    def _get_client() -> httpx.Client:
+        return openai_client_registry.get_sync(lambda: httpx.Client(timeout=settings.OPENAI_HTTP_TIMEOUT))
+
+    @staticmethod
+    def _get_async_client() -> httpx.AsyncClient:
+        return openai_client_registry.get_async(lambda: httpx.AsyncClient(timeout=settings.OPENAI_HTTP_TIMEOUT))
+
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self._get_api_key()}"}
+
+    # ChatModel 값("openai-o4-mini") → API 모델명("o4-mini"), Gemini 의 model 역할 → assistant
+    def _request_body(self, contents: list[types.Content]) -> dict[str, Any]:
+        messages = [
+            {
+                "role": "assistant" if content.role == "model" else "user",
+                "content": "".join(part.text or "" for part in content.parts or []),
+            }
+            for content in contents
+        ]
+        return {"model": self.model.removeprefix("openai-"), "messages": messages, "stream": True}
+
+    @staticmethod
+    def _iter_lines_text(lines: Iterable[str]) -> Iterator[str]:
+        for line in lines:
+            text = _parse_sse_line(line)
+            if text:
+                yield text
+
+    def _iter_text_stream(self, contents: list[types.Content]) -> Iterator[str]:
+        with self._get_client().stream(
+            "POST", OPENAI_CHAT_COMPLETIONS_URL, headers=self._headers(), json=self._request_body(contents)
+        ) as response:
+            response.raise_for_status()
+            yield from self._iter_lines_text(response.iter_lines())
+
+    async def _iter_text_stream_async(self, contents: list[types.Content]) -> AsyncIterator[str]:
+        async with self._get_async_client().stream(
+            "POST", OPENAI_CHAT_COMPLETIONS_URL, headers=self._headers(), json=self._request_body(contents)
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                text = _parse_sse_line(line)
+                if text:
+                    yield text
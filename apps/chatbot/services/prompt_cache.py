@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+import unicodedata
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django_redis import get_redis_connection  # type: ignore
+
+"""
+질문(Question)별 첫 턴 프롬프트/응답 캐시 (opt-in: CHATBOT_PROMPT_CACHE_ENABLED)
+
+같은 질문에 대해 여러 수강생이 거의 같은 문장으로 첫 질문을 하는 경우,
+완성된 첫 응답(chunk 목록)을 (question_id, model, 정규화된 프롬프트 해시) 키로 저장해 모델 호출 없이 재전송
+
+normalize_prompt: 유니코드 정규화(NFKC) + 대소문자 / 공백 / 끝 문장부호 차이 제거
+PromptResponseCache:
+    get: 캐시 조회 (hit 시 TTL 연장 + LRU 순서 갱신) + hit/miss 카운트
+    set: 응답 저장 + 최대 개수 초과 시 가장 오래 사용되지 않은 응답부터 삭제 (LRU)
+    stats: hit/miss 카운터 + 현재 저장 개수
+"""
+
+_TRAILING_PUNCTUATION_RE = re.compile(r"[\s?!.~。？！]+$")
+
+
+def normalize_prompt(prompt: str) -> str:
+    normalized = " ".join(unicodedata.normalize("NFKC", prompt).casefold().split())
+    return _TRAILING_PUNCTUATION_RE.sub("", normalized)
+
+
+class PromptResponseCache:
+    LRU_KEY = "chatbot:prompt:lru"
+    HITS_KEY = "chatbot:prompt:stats:hits"
+    MISSES_KEY = "chatbot:prompt:stats:misses"
+
+    def __init__(self, cache_alias: str = "default") -> None:
+        self.cache_alias = cache_alias
+
+    def _cache(self) -> Any:
+        return caches[self.cache_alias]
+
+    # LRU 순서는 redis sorted set(score = 마지막 사용 시각)으로 관리 → 키 이름은 cache KEY_PREFIX 와 동일하게
+    def _redis(self) -> Any:
+        return get_redis_connection(self.cache_alias)
+
+    @staticmethod
+    def _key(question_id: int, model: str, prompt: str) -> str:
+        digest = hashlib.sha256(normalize_prompt(prompt).encode()).hexdigest()
+        return f"chatbot:prompt:{question_id}:{model}:{digest}"
+
+    def _incr(self, key: str) -> None:
+        cache = self._cache()
+        if not cache.add(key, 1, None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, None)
+
+    def _touch_lru(self, key: str) -> None:
+        cache = self._cache()
+        self._redis().zadd(cache.make_key(self.LRU_KEY), {cache.make_key(key): time.time()})
+
+    def get(self, question_id: int, model: str, prompt: str) -> list[str] | None:
+        cache = self._cache()
+        key = self._key(question_id, model, prompt)
+        chunks: list[str] | None = cache.get(key)
+        if chunks is None:
+            self._incr(self.MISSES_KEY)
+            return None
+
+        self._incr(self.HITS_KEY)
+        cache.touch(key, settings.CHATBOT_PROMPT_CACHE_TTL)
+        self._touch_lru(key)
+        return chunks
+
+    def set(self, question_id: int, model: str, prompt: str, chunks: list[str]) -> None:
+        cache = self._cache()
+        key = self._key(question_id, model, prompt)
+        cache.set(key, chunks, settings.CHATBOT_PROMPT_CACHE_TTL)
+        self._touch_lru(key)
+        self._evict()
+
+    # TTL 로 이미 만료된 항목을 정리한 뒤, 최대 개수를 넘는 만큼 오래 사용되지 않은 응답부터 삭제
+    def _evict(self) -> None:
+        redis = self._redis()
+        lru_key = self._cache().make_key(self.LRU_KEY)
+        redis.zremrangebyscore(lru_key, "-inf", time.time() - settings.CHATBOT_PROMPT_CACHE_TTL)
+
+        overflow = redis.zcard(lru_key) - settings.CHATBOT_PROMPT_CACHE_MAX_ENTRIES
+        if overflow <= 0:
+            return
+        evicted = redis.zrange(lru_key, 0, overflow - 1)
+        redis.delete(*evicted)
+        redis.zrem(lru_key, *evicted)
+
+    def stats(self) -> dict[str, int]:
+        counts = self._cache().get_many([self.HITS_KEY, self.MISSES_KEY])
+        return {
+            "hits": int(counts.get(self.HITS_KEY, 0)),
+            "misses": int(counts.get(self.MISSES_KEY, 0)),
+            "entries": int(self._redis().zcard(self._cache().make_key(self.LRU_KEY))),
+        }
+
+
+prompt_response_cache = PromptResponseCache()
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from django.conf import settings
+
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services.completion_response_service import (
+    ChatStreamingService,
+    GeminiStreamingService,
+)
+from apps.chatbot.services.fake_streaming_service import FakeStreamingService
+from apps.chatbot.services.openai_streaming_service import OpenAIStreamingService
+
+"""
+세션 모델(using_model) → 스트리밍 서비스(provider) 매핑
+
+get_streaming_service: 세션에 맞는 provider 서비스 생성 (CHATBOT_FAKE_PROVIDER 면 가짜 provider)
+"""
+
+STREAMING_SERVICES: dict[str, type[ChatStreamingService]] = {
+    ChatModel.GEMINI: GeminiStreamingService,
+    ChatModel.OPENAI: OpenAIStreamingService,
+}
+
+
+def get_streaming_service(session: ChatbotSession) -> ChatStreamingService:
+    if settings.CHATBOT_FAKE_PROVIDER:
+        return FakeStreamingService(session)
+    service_class = STREAMING_SERVICES.get(session.using_model, GeminiStreamingService)
+    return service_class(session)
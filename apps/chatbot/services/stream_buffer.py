@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import re
+import uuid
+from typing import Any, TypedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+"""
+재연결(Last-Event-ID) 가능한 SSE 스트림 이벤트 버퍼 (Redis)
+
+StreamEventBuffer: 스트림 하나의 chunk 를 순번(seq) 단위로 짧은 TTL 동안 보관
+    create: 새 스트림 버퍼 생성 (stream_id 발급)
+    from_last_event_id: Last-Event-ID("{stream_id}:{seq}") → (버퍼, seq) / 형식이 다르면 None
+    start, push, finish: (생성 중인 쪽) 시작 / chunk 추가 / 종료 상태 기록
+    get_meta: 스트림 메타(session_id, last_seq, status) 조회
+    read_after: (재연결한 쪽) seq 이후 chunk + 현재 상태 조회
+    event_id: SSE id 필드 값 생성
+"""
+
+_LAST_EVENT_ID_RE = re.compile(r"^(?P<stream_id>[0-9a-f]{32}):(?P<seq>\d+)$")
+
+
+class StreamStatus:
+    RUNNING = "running"
+    DONE = "done"
+    ERROR = "error"
+
+
+class StreamMeta(TypedDict):
+    session_id: int
+    last_seq: int
+    status: str
+
+
+class StreamEventBuffer:
+    def __init__(self, stream_id: str, cache_alias: str = "default") -> None:
+        self.stream_id = stream_id
+        self.cache_alias = cache_alias
+
+    @classmethod
+    def create(cls) -> StreamEventBuffer:
+        return cls(uuid.uuid4().hex)
+
+    @classmethod
+    def from_last_event_id(cls, last_event_id: str | None) -> tuple[StreamEventBuffer, int] | None:
+        match = _LAST_EVENT_ID_RE.match((last_event_id or "").strip())
+        if match is None:
+            return None
+        return cls(match["stream_id"]), int(match["seq"])
+
+    def _cache(self) -> Any:
+        return caches[self.cache_alias]
+
+    def _meta_key(self) -> str:
+        return f"chatbot:stream:{self.stream_id}:meta"
+
+    def _event_key(self, seq: int) -> str:
+        return f"chatbot:stream:{self.stream_id}:{seq}"
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.stream_id}:{seq}"
+
+    def start(self, session_id: int) -> None:
+        meta: StreamMeta = {"session_id": session_id, "last_seq": 0, "status": StreamStatus.RUNNING}
+        self._cache().set(self._meta_key(), meta, settings.CHATBOT_STREAM_BUFFER_TTL)
+
+    # chunk 와 메타(last_seq)를 한 번에 저장 (set_many → redis pipeline 1회)
+    def push(self, session_id: int, seq: int, text: str) -> None:
+        meta: StreamMeta = {"session_id": session_id, "last_seq": seq, "status": StreamStatus.RUNNING}
+        self._cache().set_many(
+            {self._event_key(seq): text, self._meta_key(): meta},
+            settings.CHATBOT_STREAM_BUFFER_TTL,
+        )
+
+    def finish(self, session_id: int, last_seq: int, *, error: bool = False) -> None:
+        meta: StreamMeta = {
+            "session_id": session_id,
+            "last_seq": last_seq,
+            "status": StreamStatus.ERROR if error else StreamStatus.DONE,
+        }
+        self._cache().set(self._meta_key(), meta, settings.CHATBOT_STREAM_BUFFER_TTL)
+
+    def get_meta(self) -> StreamMeta | None:
+        meta: StreamMeta | None = self._cache().get(self._meta_key())
+        return meta
+
+    # 메타를 먼저 읽고 last_seq 까지의 chunk 조회 (push 가 chunk → 메타 순서라 빠지는 chunk 없음)
+    def read_after(self, seq: int) -> tuple[list[tuple[int, str]], StreamMeta | None]:
+        meta = self.get_meta()
+        if meta is None or meta["last_seq"] <= seq:
+            return [], meta
+        keys = [self._event_key(i) for i in range(seq + 1, meta["last_seq"] + 1)]
+        return self._collect(seq, self._cache().get_many(keys)), meta
+
+    # 만료 등으로 중간 chunk 가 비면 거기서 멈춤 (순서가 뒤섞인 재전송 방지)
+    def _collect(self, seq: int, found: dict[str, str]) -> list[tuple[int, str]]:
+        events: list[tuple[int, str]] = []
+        next_seq = seq + 1
+        while (text := found.get(self._event_key(next_seq))) is not None:
+            events.append((next_seq, text))
+            next_seq += 1
+        return events
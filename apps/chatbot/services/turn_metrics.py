@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import sentry_sdk
+
+from apps.chatbot.services.chat_history_service import CHARS_PER_TOKEN
+
+logger = logging.getLogger("apps.chatbot.metrics")
+
+"""
+챗봇 대화 턴 단위 지연 시간 계측 (구조화 로그 + Sentry span)
+
+TurnMetrics: 턴 하나의 구간별 소요 시간 / 스트림 통계 수집
+    span: 구간(history, queue, save 등) 소요 시간 측정 + Sentry 하위 span 기록
+    observe, observe_async: 텍스트 스트림을 감싸 첫 chunk 까지의 시간(TTFB), 스트림 시간, chunk 수, 바이트 수 기록
+    finish: 토큰/초 계산 → Sentry transaction 종료 + "chatbot.turn {json}" 한 줄 로그
+parse_turn_log_line: 로그 한 줄 → 턴 필드 dict (chatbot.turn 로그가 아니면 None)
+
+로그 필드 (ms 단위): history_ms, queue_ms, ttfb_ms, stream_ms, save_ms, total_ms
+                     + chunks, bytes, tokens_per_sec, is_complete, cached
+"""
+
+LOG_MARKER = "chatbot.turn "
+
+
+def parse_turn_log_line(line: str) -> dict[str, Any] | None:
+    _, marker, payload = line.partition(LOG_MARKER)
+    if not marker:
+        return None
+    try:
+        fields: dict[str, Any] = json.loads(payload)
+    except ValueError:
+        return None
+    return fields
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+class TurnMetrics:
+    def __init__(self, *, session_id: int, provider: str, model: str) -> None:
+        self._started = time.perf_counter()
+        self._chars = 0
+        self.fields: dict[str, Any] = {
+            "session_id": session_id,
+            "provider": provider,
+            "model": model,
+            "chunks": 0,
+            "bytes": 0,
+            "cached": False,
+        }
+        # 스트리밍은 view 가 응답을 반환한 뒤에 진행되므로 요청 transaction 과 별도로 턴 단위 transaction 생성
+        self._transaction = sentry_sdk.start_transaction(op="chatbot.turn", name=f"chatbot.turn.{provider}")
+        self._transaction.set_tag("chatbot.provider", provider)
+        self._transaction.set_tag("chatbot.model", model)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        with self._transaction.start_child(op=f"chatbot.{name}"):
+            try:
+                yield
+            finally:
+                self.fields[f"{name}_ms"] = _elapsed_ms(started)
+
+    def _chunk(self, text: str) -> None:
+        if self.fields["chunks"] == 0:
+            self.fields["ttfb_ms"] = _elapsed_ms(self._started)
+        self.fields["chunks"] += 1
+        self.fields["bytes"] += len(text.encode())
+        self._chars += len(text)
+
+    # yield 사이에 열려 있는 span 이라 현재 span 으로 지정하지 않고 직접 finish
+    def observe(self, text_stream: Iterator[str]) -> Iterator[str]:
+        started = time.perf_counter()
+        span = self._transaction.start_child(op="chatbot.stream")
+        try:
+            for text in text_stream:
+                self._chunk(text)
+                yield text
+        finally:
+            self.fields["stream_ms"] = _elapsed_ms(started)
+            span.finish()
+
+    async def observe_async(self, text_stream: AsyncIterator[str]) -> AsyncIterator[str]:
+        started = time.perf_counter()
+        span = self._transaction.start_child(op="chatbot.stream")
+        try:
+            async for text in text_stream:
+                self._chunk(text)
+                yield text
+        finally:
+            self.fields["stream_ms"] = _elapsed_ms(started)
+            span.finish()
+
+    def finish(self, *, is_complete: bool) -> None:
+        self.fields["is_complete"] = is_complete
+        self.fields["total_ms"] = _elapsed_ms(self._started)
+        stream_seconds = self.fields.get("stream_ms", 0) / 1000
+        tokens = math.ceil(self._chars / CHARS_PER_TOKEN)
+        self.fields["tokens_per_sec"] = round(tokens / stream_seconds, 1) if stream_seconds else 0.0
+
+        for name in ("ttfb_ms", "stream_ms", "total_ms"):
+            if name in self.fields:
+                self._transaction.set_measurement(name, self.fields[name], "millisecond")
+        self._transaction.set_measurement("chunks", self.fields["chunks"])
+        self._transaction.set_measurement("tokens_per_sec", self.fields["tokens_per_sec"])
+        self._transaction.set_status("ok" if is_complete else "internal_error")
+        self._transaction.finish()
+
+        logger.info("%s%s", LOG_MARKER, json.dumps(self.fields, ensure_ascii=False))
@@ -2,9 +2,9 @@ import datetime
 from typing import Any
 
 from django.urls import reverse
-from rest_framework.test import APITestCase
 
 from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
 from apps.qna.models.question import Question, QuestionCategory
 from apps.user.models.user import User
 
@@ -24,7 +24,7 @@ delete_response
 """
 
 
-class CompletionAPITestBase(APITestCase):
+class CompletionAPITestBase(IsolatedRedisTestClient):
     user: User
     other_user: User
     password: str
@@ -78,6 +78,7 @@ class CompletionAPITestBase(APITestCase):
         )
 
     def setUp(self) -> None:
+        super().setUp()
         self.client.force_authenticate(self.user)
 
     def get_url(self, session_id: int) -> str:
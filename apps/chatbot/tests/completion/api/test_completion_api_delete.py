@@ -15,6 +15,9 @@ test_completion_delete_204
 test_completion_delete_session_preserve
     메세지 삭제 후 세션 유지
 
+test_completion_delete_resets_summary
+    메세지 삭제 시 누적 요약도 초기화
+
 test_completion_delete_401_unauthenticated
     미인증 시 401
 
@@ -54,6 +57,18 @@ class CompletionDeleteAPITest(CompletionAPITestBase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(self.session.messages.count(), 0)
 
+    def test_completion_delete_resets_summary(self) -> None:
+        self.session.summary = "사용자: 삭제될 대화"
+        self.session.summarized_message_id = 1
+        self.session.save(update_fields=["summary", "summarized_message_id"])
+
+        response = self.delete_response(self.session.id)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.summary, "")
+        self.assertEqual(self.session.summarized_message_id, 0)
+
     def test_completion_delete_401_unauthenticated(self) -> None:
         self.client.force_authenticate(user=None)
         response = self.delete_response(self.session.id)
@@ -1,3 +1,7 @@
+import base64
+from typing import Any
+
+from django.utils import timezone
 from rest_framework import status
 
 from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
@@ -15,6 +19,12 @@ test_completion_list_200
 test_completion_list_pagination
     페이지네이션 응답 구조 확인
     
+test_completion_list_keyset_walk_with_same_created_at
+    created_at 이 같은 메세지도 id 순으로 빠짐/중복 없이 앞뒤 페이지 이동
+
+test_completion_list_invalid_cursor_404
+    잘못된 커서 값이면 404 반환
+
 test_completion_list_response_fields
     응답 필드 구조 확인
     
@@ -74,6 +84,37 @@ class CompletionListAPITest(CompletionAPITestBase):
         self.assertIn("previous", response.data)
         self.assertIn("results", response.data)
 
+    def test_completion_list_keyset_walk_with_same_created_at(self) -> None:
+        ChatbotCompletion.objects.bulk_create(
+            [ChatbotCompletion(session=self.session, message=f"턴 {i}", role=UserRole.USER) for i in range(5)]
+        )
+        ChatbotCompletion.objects.filter(session=self.session).update(created_at=timezone.now())
+        expected = list(
+            ChatbotCompletion.objects.filter(session=self.session).order_by("-id").values_list("id", flat=True)
+        )
+
+        seen: list[int] = []
+        pages: list[dict[str, Any]] = []
+        url: str | None = f"{self.get_url(self.session.id)}?page_size=3"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data)
+            seen.extend(message["id"] for message in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(seen, expected)
+        self.assertIsNone(pages[0]["previous"])
+
+        # 마지막 페이지에서 previous 로 돌아가면 직전 페이지와 같은 결과
+        response = self.client.get(pages[-1]["previous"])
+        self.assertEqual(response.data["results"], pages[-2]["results"])
+
+    def test_completion_list_invalid_cursor_404(self) -> None:
+        cursor = base64.b64encode(b"p=not-a-position").decode()
+        response = self.get_response(self.session.id, data={"cursor": cursor})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_completion_list_response_fields(self) -> None:
         response = self.get_response(self.session.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -4,15 +4,33 @@ from rest_framework import status
 
 from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
 from apps.chatbot.services.completion_response_service import GeminiStreamingService
+from apps.chatbot.services.concurrency_limiter import ProviderConcurrencyLimiter
+from apps.chatbot.services.stream_buffer import StreamEventBuffer
 from apps.chatbot.tests.completion.api.test_completion_api_base import (
     CompletionAPITestBase,
 )
+from apps.core.exceptions.exception_messages import EMS
 
 """
 /sessions/{session_id}/completions/
 POST 테스트: AI 응답 생성(+SSE 스트리밍)을 포함한 채팅 메세지 보내기 기능
 base에 있는 추상화 메서드: post_response 사용!
 
+test_completion_create_200_stream_error_saves_incomplete
+    스트리밍 에러 시 사용자 메세지 + 미완료(is_complete=False) AI 메세지 저장
+
+test_completion_create_resume_with_last_event_id
+    Last-Event-ID 재연결 시 모델 재호출 없이 놓친 chunk 만 재전송
+
+test_completion_create_resume_ignores_other_session_stream
+    타인 세션 스트림 id 로는 이어받지 않음
+
+test_completion_create_503_provider_busy
+    provider 동시 요청 + 대기열 한도 초과 시 스트리밍 시작 전 503 반환
+
+test_completion_create_unstarted_stream_releases_ticket
+    스트리밍이 시작되기 전에 응답이 닫혀도(첫 chunk 전 연결 종료) 동시 요청 ticket 반납
+
 test_completion_create_400_missing_message
     메세지 필드 누락 시 400 반환
 
@@ -34,7 +52,7 @@ test_completion_create_404_other_session
 # POST 테스트
 class CompletionCreateAPITest(CompletionAPITestBase):
 
-    @patch.object(GeminiStreamingService, "_iter_gemini_text_stream")
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
     def test_completion_create_200(self, mock_stream: MagicMock) -> None:
         mock_stream.return_value = iter(["Greetings", "World"])
         response = self.post_response(self.session.id, "Hello World")
@@ -66,6 +84,79 @@ class CompletionCreateAPITest(CompletionAPITestBase):
         self.assertIsNotNone(ai_message)
         self.assertEqual(ai_message.message, "GreetingsWorld")
 
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_completion_create_200_stream_error_saves_incomplete(self, mock_stream: MagicMock) -> None:
+        mock_stream.side_effect = RuntimeError("boom")
+        response = self.post_response(self.session.id, "Hello World")
+
+        with self.assertLogs("apps.chatbot.services.completion_response_service", level="ERROR"):
+            content = b"".join(response.streaming_content).decode("utf-8")
+        self.assertIn("[ERROR]", content)
+
+        # 사용자 메세지 + 미완료 AI 메세지가 함께 저장
+        messages = list(ChatbotCompletion.objects.filter(session=self.session).order_by("id"))
+        self.assertEqual([m.role for m in messages], [UserRole.USER, UserRole.ASSISTANT])
+        self.assertFalse(messages[1].is_complete)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_completion_create_resume_with_last_event_id(self, mock_stream: MagicMock) -> None:
+        mock_stream.return_value = iter(["Greetings", "World"])
+        response = self.post_response(self.session.id, "Hello World")
+        stream_id = response["X-Chatbot-Stream-Id"]
+        b"".join(response.streaming_content)
+
+        # 첫 chunk 만 받고 끊긴 클라이언트의 재연결 → 모델 재호출 없이 나머지만 재전송
+        resumed = self.post_response(self.session.id, "Hello World", HTTP_LAST_EVENT_ID=f"{stream_id}:1")
+        content = b"".join(resumed.streaming_content).decode("utf-8")
+
+        self.assertEqual(resumed.status_code, status.HTTP_200_OK)
+        self.assertEqual(content, f'id: {stream_id}:2\ndata: {{"content": "World"}}\n\ndata: [DONE]\n\n')
+        self.assertEqual(mock_stream.call_count, 1)
+        self.assertEqual(ChatbotCompletion.objects.filter(session=self.session).count(), 2)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_completion_create_resume_ignores_other_session_stream(self, mock_stream: MagicMock) -> None:
+        stream = StreamEventBuffer.create()
+        stream.start(self.other_session.id)
+        mock_stream.return_value = iter(["New"])
+
+        response = self.post_response(self.session.id, "Hello World", HTTP_LAST_EVENT_ID=stream.event_id(0))
+        content = b"".join(response.streaming_content).decode("utf-8")
+
+        # 타인 세션 스트림은 이어받지 않고 새로 생성
+        self.assertIn('"content": "New"', content)
+        self.assertNotEqual(response["X-Chatbot-Stream-Id"], stream.stream_id)
+
+    def test_completion_create_503_provider_busy(self) -> None:
+        limiter = ProviderConcurrencyLimiter(
+            "gemini", max_concurrency=1, max_queue_depth=0, global_cap=10, queue_timeout=0, slot_ttl=60
+        )
+        ticket = limiter.admit()
+        with patch("apps.chatbot.services.completion_response_service.get_limiter", return_value=limiter):
+            response = self.post_response(self.session.id, "Hello")
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.data, EMS.E503_CHATBOT_BUSY)
+        self.assertFalse(ChatbotCompletion.objects.filter(session=self.session).exists())
+        ticket.release()
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_completion_create_unstarted_stream_releases_ticket(self, mock_stream: MagicMock) -> None:
+        limiter = ProviderConcurrencyLimiter(
+            "gemini", max_concurrency=1, max_queue_depth=0, global_cap=10, queue_timeout=0, slot_ttl=60
+        )
+        with patch("apps.chatbot.services.completion_response_service.get_limiter", return_value=limiter):
+            response = self.post_response(self.session.id, "Hello")
+            self.assertEqual(limiter.stats()["local_in_flight"], 1)
+
+            # 제너레이터를 한 번도 돌리지 않고 닫힘
+            response.close()
+
+            self.assertEqual(len(limiter._tickets), 0)
+            self.assertEqual(limiter.stats()["global_in_flight"], 0)
+            self.assertEqual(self.post_response(self.session.id, "Hello").status_code, status.HTTP_200_OK)
+        mock_stream.assert_not_called()
+
     def test_completion_create_400_missing_message(self) -> None:
         response = self.post_response(self.session.id, message=None)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
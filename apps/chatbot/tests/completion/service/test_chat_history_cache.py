@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+from unittest.mock import patch
+
+from django.test import override_settings
+from redis.client import Pipeline
+
+from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services.chat_history_cache import chat_history_cache
+from apps.chatbot.services.completion_response_service import save_turn
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.qna.models import Question, QuestionCategory
+from apps.user.models import User
+
+"""
+chat_history_cache 테스트
+
+get: 캐시 없으면 miss / 요약 커서 다르면 miss / hit 시 메세지 복원
+append, extend: 캐시 있을 때만 추가, 최대 길이 초과 시 무효화
+    무효화 / 다시 채운 뒤의 추가는 이력을 되살리지 않음, 중복 추가된 메세지는 조회 시 제외
+invalidate: 캐시 삭제
+stats: hit/miss 카운터
+"""
+
+
+class ChatHistoryCacheTests(IsolatedRedisTestClient):
+    session: ChatbotSession
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        user = User.objects.create_user(
+            email="cache@example.com",
+            password="00000000",
+            name="cacheuser",
+            nickname="cacheuser",
+            birthday=date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="test_category")
+        question = Question.objects.create(author=user, category=category, title="질문", content="내용")
+        cls.session = ChatbotSession.objects.create(
+            user=user,
+            question=question,
+            title="캐시 세션",
+            using_model=ChatModel.GEMINI,
+        )
+
+    def test_get_miss_then_hit(self) -> None:
+        self.assertIsNone(chat_history_cache.get(self.session))
+
+        completion = ChatbotCompletion.objects.create(session=self.session, message="hi", role=UserRole.USER)
+        chat_history_cache.set(self.session, [completion])
+        cached = chat_history_cache.get(self.session)
+
+        assert cached is not None  # mypy용
+        self.assertEqual([(c.id, c.role, c.message) for c in cached], [(completion.id, completion.role, "hi")])
+        self.assertEqual(chat_history_cache.stats(), {"hits": 1, "misses": 1})
+
+    def test_get_miss_when_summary_cursor_changed(self) -> None:
+        chat_history_cache.set(self.session, [])
+        self.session.summarized_message_id = 999
+        self.assertIsNone(chat_history_cache.get(self.session))
+
+    def test_append_only_when_cached(self) -> None:
+        chat_history_cache.append(
+            ChatbotCompletion.objects.create(session=self.session, message="not cached", role=UserRole.USER)
+        )
+        self.assertIsNone(chat_history_cache.get(self.session))
+
+        chat_history_cache.set(self.session, [])
+        chat_history_cache.append(
+            ChatbotCompletion.objects.create(session=self.session, message="cached", role=UserRole.ASSISTANT)
+        )
+        cached = chat_history_cache.get(self.session)
+
+        assert cached is not None  # mypy용
+        self.assertEqual([c.message for c in cached], ["cached"])
+
+    def test_extend_with_saved_turn(self) -> None:
+        chat_history_cache.set(self.session, [])
+        save_turn(session=self.session, user_message="질문", ai_message="답변")
+        cached = chat_history_cache.get(self.session)
+
+        assert cached is not None  # mypy용
+        self.assertEqual([c.message for c in cached], ["질문", "답변"])
+
+    @override_settings(CHATBOT_HISTORY_CACHE_MAX_LENGTH=1)
+    def test_append_over_max_length_invalidates(self) -> None:
+        chat_history_cache.set(self.session, [])
+        save_turn(session=self.session, user_message="1", ai_message="2")
+        self.assertIsNone(chat_history_cache.get(self.session))
+
+    def test_invalidate(self) -> None:
+        chat_history_cache.set(self.session, [ChatbotCompletion(id=1, role="user", message="x")])
+        chat_history_cache.invalidate(self.session.id)
+        self.assertIsNone(chat_history_cache.get(self.session))
+
+    def test_extend_after_invalidate_does_not_resurrect(self) -> None:
+        chat_history_cache.set(self.session, [])
+        chat_history_cache.invalidate(self.session.id)
+        save_turn(session=self.session, user_message="질문", ai_message="답변")
+
+        self.assertIsNone(chat_history_cache.get(self.session))
+        self.assertFalse(chat_history_cache._redis().exists(*chat_history_cache._keys(self.session.id)))
+
+    def test_extend_racing_with_set_invalidates(self) -> None:
+        chat_history_cache.set(self.session, [])
+        completion = ChatbotCompletion.objects.create(session=self.session, message="hi", role=UserRole.USER)
+        original_multi = Pipeline.multi
+
+        # WATCH 이후 다른 요청이 캐시를 다시 채움
+        def refill_then_multi(pipeline: Pipeline, *args: Any) -> None:
+            chat_history_cache.set(self.session, [completion])
+            original_multi(pipeline)
+
+        with patch.object(Pipeline, "multi", autospec=True, side_effect=refill_then_multi):
+            chat_history_cache.append(completion)
+
+        self.assertIsNone(chat_history_cache.get(self.session))
+
+    def test_duplicate_entries_are_skipped(self) -> None:
+        completions = save_turn(session=self.session, user_message="질문", ai_message="답변")
+        # DB 에서 채운 캐시에 같은 턴이 한 번 더 추가된 경우
+        chat_history_cache.set(self.session, completions)
+        chat_history_cache.extend(completions)
+        cached = chat_history_cache.get(self.session)
+
+        assert cached is not None  # mypy용
+        self.assertEqual([c.message for c in cached], ["질문", "답변"])
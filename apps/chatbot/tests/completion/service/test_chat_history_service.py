@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from datetime import date
+
+from rest_framework.test import APITestCase
+
+from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services.chat_history_cache import chat_history_cache
+from apps.chatbot.services.chat_history_service import (
+    SUMMARY_PREFIX,
+    ChatHistoryBuilder,
+    estimate_tokens,
+    fold_summary,
+)
+from apps.chatbot.services.completion_response_service import save_turn
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.qna.models import Question, QuestionCategory
+from apps.user.models import User
+
+"""
+chat_history_service 테스트
+
+ChatHistoryBuilder: 최신 N개 윈도우 / 토큰 예산 / 밀려난 메세지 요약 누적 (증분) / 캐시 hit 시 DB 조회 X
+    동시 요청이 먼저 요약을 옮긴 경우 덮어쓰지 않고 그 요약을 사용
+fold_summary: 요약 최대 길이 유지
+"""
+
+
+class ChatHistoryBuilderTests(IsolatedRedisTestClient):
+    session: ChatbotSession
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        user = User.objects.create_user(
+            email="history@example.com",
+            password="00000000",
+            name="historyuser",
+            nickname="historyuser",
+            birthday=date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="test_category")
+        question = Question.objects.create(author=user, category=category, title="질문", content="내용")
+        cls.session = ChatbotSession.objects.create(
+            user=user,
+            question=question,
+            title="히스토리 세션",
+            using_model=ChatModel.GEMINI,
+        )
+
+    # 실제 저장 경로(save_turn)로 사용자 / AI 메세지 쌍 생성 → 대화 이력 캐시에도 반영
+    def _create_messages(self, count: int, start: int = 0) -> None:
+        for i in range(start, start + count, 2):
+            save_turn(session=self.session, user_message=f"msg-{i}", ai_message=f"msg-{i + 1}")
+
+    def _texts(self, builder: ChatHistoryBuilder) -> list[str]:
+        return [content.parts[0].text or "" for content in builder.build() if content.parts]
+
+    def test_build_empty_session(self) -> None:
+        self.assertEqual(ChatHistoryBuilder(self.session).build(), [])
+
+    def test_build_within_window_has_no_summary(self) -> None:
+        self._create_messages(4)
+        texts = self._texts(ChatHistoryBuilder(self.session, max_messages=10))
+
+        self.assertEqual(texts, ["msg-0", "msg-1", "msg-2", "msg-3"])
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.summary, "")
+        self.assertEqual(self.session.summarized_message_id, 0)
+
+    def test_build_folds_overflow_into_summary(self) -> None:
+        self._create_messages(6)
+        contents = ChatHistoryBuilder(self.session, max_messages=4).build()
+
+        self.assertEqual(len(contents), 5)  # 요약 1 + 윈도우 4
+        assert contents[0].parts is not None  # mypy용
+        self.assertEqual(contents[0].parts[0].text, SUMMARY_PREFIX + "사용자: msg-0\nAI: msg-1")
+        self.assertEqual(contents[1].role, "user")
+        self.assertEqual(contents[2].role, "model")
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.summary, "사용자: msg-0\nAI: msg-1")
+        self.assertEqual(
+            self.session.summarized_message_id,
+            ChatbotCompletion.objects.get(session=self.session, message="msg-1").id,
+        )
+
+    def test_build_updates_summary_incrementally(self) -> None:
+        self._create_messages(6)
+        ChatHistoryBuilder(self.session, max_messages=4).build()
+        self._create_messages(2, start=6)
+
+        texts = self._texts(ChatHistoryBuilder(self.session, max_messages=4))
+
+        self.assertEqual(texts[0], SUMMARY_PREFIX + "사용자: msg-0\nAI: msg-1\n사용자: msg-2\nAI: msg-3")
+        self.assertEqual(texts[1:], ["msg-4", "msg-5", "msg-6", "msg-7"])
+
+    def test_build_respects_token_budget(self) -> None:
+        save_turn(session=self.session, user_message="a" * 100, ai_message="b" * 10)
+
+        texts = self._texts(ChatHistoryBuilder(self.session, max_messages=10, max_tokens=estimate_tokens("b" * 10)))
+
+        self.assertEqual(texts[-1], "b" * 10)
+        self.assertTrue(texts[0].startswith(SUMMARY_PREFIX))
+
+    def test_build_cache_miss_query_count_is_flat(self) -> None:
+        self._create_messages(50)
+        ChatHistoryBuilder(self.session, max_messages=4).build()
+        self._create_messages(2, start=50)
+        chat_history_cache.invalidate(self.session.id)
+
+        # 윈도우 조회 + 밀려난 메세지 조회 + 요약 update
+        with self.assertNumQueries(3):
+            ChatHistoryBuilder(self.session, max_messages=4).build()
+
+    def test_build_cache_hit_reads_no_rows(self) -> None:
+        self._create_messages(50)
+        ChatHistoryBuilder(self.session, max_messages=4).build()
+        self._create_messages(2, start=50)
+
+        # 캐시 hit → 요약 update 만 실행
+        with self.assertNumQueries(1):
+            texts = self._texts(ChatHistoryBuilder(self.session, max_messages=4))
+        self.assertEqual(texts[1:], ["msg-48", "msg-49", "msg-50", "msg-51"])
+
+        # 밀려난 메세지가 없으면 쿼리 없음
+        with self.assertNumQueries(0):
+            ChatHistoryBuilder(self.session, max_messages=4).build()
+
+    def test_build_ignores_cache_with_stale_summary_cursor(self) -> None:
+        self._create_messages(6)
+        ChatHistoryBuilder(self.session, max_messages=4).build()
+        ChatbotSession.objects.filter(pk=self.session.pk).update(summary="", summarized_message_id=0)
+        self.session.refresh_from_db()
+
+        texts = self._texts(ChatHistoryBuilder(self.session, max_messages=10))
+        self.assertEqual(texts, [f"msg-{i}" for i in range(6)])
+
+    def test_build_does_not_overwrite_concurrent_fold(self) -> None:
+        self._create_messages(6)
+        stale = ChatbotSession.objects.get(pk=self.session.pk)
+        ChatHistoryBuilder(self.session, max_messages=4).build()
+        self._create_messages(2, start=6)
+
+        # 요약 이동 전에 세션을 읽은 요청 → 커서가 달라 반영하지 않고 최신 요약 사용
+        texts = self._texts(ChatHistoryBuilder(stale, max_messages=2))
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.summary, "사용자: msg-0\nAI: msg-1")
+        self.assertEqual(texts[0], SUMMARY_PREFIX + self.session.summary)
+        self.assertEqual(texts[1:], ["msg-6", "msg-7"])
+
+
+class FoldSummaryTests(APITestCase):
+    def test_fold_summary_drops_oldest_lines_over_max_chars(self) -> None:
+        completions = [
+            ChatbotCompletion(message="first", role=UserRole.USER),
+            ChatbotCompletion(message="second", role=UserRole.ASSISTANT),
+        ]
+        summary = fold_summary("사용자: old", completions, max_chars=len("사용자: first\nAI: second"))
+        self.assertEqual(summary, "사용자: first\nAI: second")
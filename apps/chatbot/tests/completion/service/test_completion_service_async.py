@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import date
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from google.genai import types
+
+from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services.completion_response_service import (
+    GeminiStreamingService,
+    SSEEncoder,
+)
+from apps.chatbot.services.concurrency_limiter import ProviderConcurrencyLimiter
+from apps.chatbot.services.stream_buffer import StreamEventBuffer
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.qna.models import Question, QuestionCategory
+from apps.user.models import User
+
+"""
+completion_response_service 비동기(ASGI) 경로 테스트
+
+_iter_text_stream_async: client.aio 스트리밍 텍스트만 yield
+generate_streaming_response_async: chunk yield + 마지막에 한 턴 일괄 저장 / 에러 시 미완료 저장 + [ERROR], [DONE]
+    실행 슬롯은 event loop 에서 반납 → 대기 중인 다음 스트림이 바로 실행
+"""
+
+
+async def _async_iter(items: list[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+class AsyncCompletionResponseServiceTests(IsolatedRedisTestClient):
+    session: ChatbotSession
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        user = User.objects.create_user(
+            email="async@example.com",
+            password="00000000",
+            name="asyncuser",
+            nickname="asyncuser",
+            birthday=date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="test_category")
+        question = Question.objects.create(
+            author=user,
+            category=category,
+            title="비동기 테스트 질문",
+            content="비동기 테스트용 질문입니다.",
+        )
+        cls.session = ChatbotSession.objects.create(
+            user=user,
+            question=question,
+            title="비동기 세션",
+            using_model=ChatModel.GEMINI,
+        )
+
+    @patch.object(GeminiStreamingService, "_get_client")
+    async def test_iter_text_stream_async_yields_only_text(self, mock_get_client: MagicMock) -> None:
+        chunks = [MagicMock(text="Hello "), MagicMock(text=None), MagicMock(text="World")]
+
+        async def generate_content_stream(**kwargs: Any) -> AsyncIterator[Any]:
+            return _async_iter(chunks)
+
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content_stream = generate_content_stream
+        mock_get_client.return_value = mock_client
+
+        contents = [types.Content(role="user", parts=[types.Part.from_text(text="ping")])]
+        service = GeminiStreamingService(self.session)
+        out = [text async for text in service._iter_text_stream_async(contents)]
+        self.assertEqual(out, ["Hello ", "World"])
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream_async")
+    async def test_generate_streaming_response_async_saves_full_message(self, mock_iter: MagicMock) -> None:
+        mock_iter.return_value = _async_iter(["Hello ", "World"])
+
+        service = GeminiStreamingService(self.session)
+        stream = StreamEventBuffer.create()
+        out = [chunk async for chunk in service.generate_streaming_response_async(user_message="테스트", stream=stream)]
+        self.assertEqual(
+            out,
+            [
+                SSEEncoder.json("Hello ", event_id=stream.event_id(1)),
+                SSEEncoder.json("World", event_id=stream.event_id(2)),
+                "data: [DONE]\n\n",
+            ],
+        )
+
+        saved = [c async for c in ChatbotCompletion.objects.filter(session=self.session).order_by("id")]
+        self.assertEqual(
+            [(c.role, c.message) for c in saved], [(UserRole.USER, "테스트"), (UserRole.ASSISTANT, "Hello World")]
+        )
+        self.assertTrue(saved[1].is_complete)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream_async")
+    async def test_generate_streaming_response_async_error(self, mock_iter: MagicMock) -> None:
+        mock_iter.side_effect = RuntimeError("boom")
+
+        service = GeminiStreamingService(self.session)
+        with self.assertLogs("apps.chatbot.services.completion_response_service", level="ERROR"):
+            out = [chunk async for chunk in service.generate_streaming_response_async(user_message="테스트")]
+        self.assertEqual(out, ["data: [ERROR]\n\n", "data: [DONE]\n\n"])
+
+        # 사용자 메세지만 남지 않도록 빈 AI 메세지를 미완료로 함께 저장
+        self.assertTrue(await ChatbotCompletion.objects.filter(session=self.session, role=UserRole.USER).aexists())
+        saved = await ChatbotCompletion.objects.aget(session=self.session, role=UserRole.ASSISTANT)
+        self.assertEqual(saved.message, "")
+        self.assertFalse(saved.is_complete)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream_async")
+    async def test_generate_streaming_response_async_client_disconnect(self, mock_iter: MagicMock) -> None:
+        mock_iter.return_value = _async_iter(["Hello ", "World"])
+
+        stream = StreamEventBuffer.create()
+        response = GeminiStreamingService(self.session).generate_streaming_response_async("테스트", stream)
+        await anext(response)
+        await response.aclose()  # 클라이언트 연결 종료
+
+        # 생성 task 는 끝까지 진행 → 완료된 응답으로 저장
+        saved = await ChatbotCompletion.objects.aget(session=self.session, role=UserRole.ASSISTANT)
+        self.assertEqual(saved.message, "Hello World")
+        self.assertTrue(saved.is_complete)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream_async")
+    async def test_generate_streaming_response_async_request_cancelled(self, mock_iter: MagicMock) -> None:
+        resume = asyncio.Event()
+
+        async def slow_stream() -> AsyncIterator[str]:
+            yield "Hello "
+            await resume.wait()
+            yield "World"
+
+        mock_iter.return_value = slow_stream()
+        stream = StreamEventBuffer.create()
+        first_chunk = asyncio.Event()
+
+        async def consume() -> None:
+            async for _chunk in GeminiStreamingService(self.session).generate_streaming_response_async(
+                "테스트", stream
+            ):
+                first_chunk.set()
+
+        # ASGI 핸들러가 연결 종료 시 요청 task 를 취소하는 상황
+        request_task = asyncio.create_task(consume())
+        await first_chunk.wait()
+        request_task.cancel()
+        resume.set()
+        with self.assertRaises(asyncio.CancelledError):
+            await request_task
+
+        events, meta = stream.read_after(0)
+        self.assertEqual(events, [(1, "Hello "), (2, "World")])
+        assert meta is not None  # mypy용
+        self.assertEqual(meta["status"], "done")
+        saved = await ChatbotCompletion.objects.aget(session=self.session, role=UserRole.ASSISTANT)
+        self.assertTrue(saved.is_complete)
+
+    async def test_waiting_stream_is_admitted_when_running_stream_finishes(self) -> None:
+        limiter = ProviderConcurrencyLimiter(
+            "test-async", max_concurrency=1, max_queue_depth=1, global_cap=10, queue_timeout=30, slot_ttl=60
+        )
+        resume = asyncio.Event()
+
+        async def first_stream() -> AsyncIterator[str]:
+            yield "first"
+            await resume.wait()
+
+        streams = iter([first_stream(), _async_iter(["second"])])
+        with (
+            patch("apps.chatbot.services.completion_response_service.get_limiter", return_value=limiter),
+            patch.object(GeminiStreamingService, "_iter_text_stream_async", side_effect=lambda contents: next(streams)),
+        ):
+            running, waiting = GeminiStreamingService(self.session), GeminiStreamingService(self.session)
+            running.admit()
+            waiting.admit()
+
+            first = running.generate_streaming_response_async("첫 번째")
+            await anext(first)
+            second_task = asyncio.create_task(_collect(waiting.generate_streaming_response_async("두 번째")))
+            await asyncio.sleep(0.05)
+            self.assertFalse(second_task.done())  # 실행 슬롯 대기 중
+
+            resume.set()
+            await _collect(first)
+            # queue_timeout(30초) 전에 바로 실행
+            second = await asyncio.wait_for(second_task, timeout=5)
+
+        self.assertIn("second", second[0])
+        self.assertEqual(limiter.stats()["local_in_flight"], 0)
+
+
+async def _collect(response: AsyncIterator[str]) -> list[str]:
+    return [chunk async for chunk in response]
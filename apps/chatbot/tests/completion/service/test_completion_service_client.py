@@ -1,16 +1,31 @@
+import asyncio
 import unittest
 from unittest.mock import MagicMock, patch
 
 from apps.chatbot.services.completion_response_service import GeminiStreamingService
+from apps.chatbot.services.gemini_client_registry import GeminiClientRegistry
 
 """
 GeminiStreamingService._get_client 함수 테스트
 API KEY 설정되어 있으면 정상 반환
 API KEY 설정X → RuntimeError 발생
+두 번째 호출부터는 생성 없이 같은 Client 재사용 (model 별로 분리)
+
+GeminiClientRegistry 테스트
+event loop 별 Client 분리 / fork(pid 변경) 후 재생성 / close 시 커넥션 정리
 """
 
 
 class TestGetClient(unittest.TestCase):
+    def setUp(self) -> None:
+        # 테스트 간 캐시된 Client 공유 방지
+        patcher_registry = patch(
+            "apps.chatbot.services.completion_response_service.gemini_client_registry",
+            GeminiClientRegistry(),
+        )
+        patcher_registry.start()
+        self.addCleanup(patcher_registry.stop)
+
     def test_get_client_success(self) -> None:
         mock_client_instance = MagicMock()
 
@@ -30,7 +45,8 @@ class TestGetClient(unittest.TestCase):
             result = GeminiStreamingService._get_client()
 
             mocked_get_api_key.assert_called_once()
-            mocked_client_class.assert_called_once_with(api_key="test-api-key")
+            mocked_client_class.assert_called_once()
+            self.assertEqual(mocked_client_class.call_args.kwargs["api_key"], "test-api-key")
             self.assertIs(result, mock_client_instance)
         finally:
             patcher_client_class.stop()
@@ -49,3 +65,50 @@ class TestGetClient(unittest.TestCase):
                 GeminiStreamingService._get_client()
         finally:
             patcher_get_api_key.stop()
+
+    @patch.object(GeminiStreamingService, "_create_client")
+    def test_get_client_reuses_client_per_model(self, mock_create_client: MagicMock) -> None:
+        mock_create_client.side_effect = lambda: MagicMock()
+
+        first = GeminiStreamingService._get_client("gemini-2.5-flash")
+        second = GeminiStreamingService._get_client("gemini-2.5-flash")
+        other_model = GeminiStreamingService._get_client("other-model")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other_model)
+        self.assertEqual(mock_create_client.call_count, 2)
+
+
+class TestGeminiClientRegistry(unittest.TestCase):
+    def test_get_separates_clients_per_event_loop(self) -> None:
+        registry = GeminiClientRegistry()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        async def get_client() -> MagicMock:
+            return registry.get("model", factory)  # type: ignore[return-value]
+
+        sync_client = registry.get("model", factory)
+        loop_client = asyncio.run(get_client())
+
+        self.assertIsNot(sync_client, loop_client)
+        self.assertIs(registry.get("model", factory), sync_client)
+
+    def test_get_recreates_client_after_fork(self) -> None:
+        registry = GeminiClientRegistry()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        parent_client = registry.get("model", factory)
+
+        with patch("apps.chatbot.services.gemini_client_registry.os.getpid", return_value=-1):
+            child_client = registry.get("model", factory)
+
+        self.assertIsNot(parent_client, child_client)
+
+    def test_close_closes_all_clients(self) -> None:
+        registry = GeminiClientRegistry()
+        client = MagicMock()
+        registry.get("model", lambda: client)
+
+        registry.close()
+
+        client.close.assert_called_once()
+        self.assertIsNot(registry.get("model", MagicMock()), client)
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from datetime import date
 from unittest.mock import MagicMock, patch
 
 from google.genai import types
-from rest_framework.test import APITestCase
 
 from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
 from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
 from apps.chatbot.services.completion_response_service import (
     GeminiStreamingService,
     SSEEncoder,
-    ai_message_save,
-    user_message_save,
+    save_turn,
 )
+from apps.chatbot.services.stream_buffer import StreamEventBuffer
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
 from apps.qna.models import Question, QuestionCategory
 from apps.user.models import User
 
@@ -22,11 +23,11 @@ completion_response_service 테스트
 
 SSEEncoder: SSE 인코딩 테스트
 GeminiStreamingService: 스트리밍 서비스 테스트
-Functions: user_message_save, ai_message_save, create_streaming_response
+Functions: save_turn, create_streaming_response
 """
 
 
-class CompletionResponseServiceTests(APITestCase):
+class CompletionResponseServiceTests(IsolatedRedisTestClient):
     user: User
     password: str
     question_category: QuestionCategory
@@ -67,6 +68,7 @@ class CompletionResponseServiceTests(APITestCase):
 
     # 테스트 간 간섭 방지용. 같은 세션 completion 초기화.
     def setUp(self) -> None:
+        super().setUp()
         ChatbotCompletion.objects.filter(session=self.session).delete()
 
     # Server-Sent Event 체크
@@ -74,6 +76,10 @@ class CompletionResponseServiceTests(APITestCase):
         self.assertEqual(SSEEncoder.encode("hello"), "data: hello\n\n")
         self.assertEqual(SSEEncoder.encode(""), "data: \n\n")
 
+    def test_sse_encode_with_event_id(self) -> None:
+        self.assertEqual(SSEEncoder.encode("hello", event_id="abc:1"), "id: abc:1\ndata: hello\n\n")
+        self.assertEqual(SSEEncoder.json("", done=True, event_id="abc:2"), "data: [DONE]\n\n")
+
     def test_sse_json(self) -> None:
         # 일반 content
         self.assertEqual(SSEEncoder.json("테스트"), 'data: {"content": "테스트"}\n\n')
@@ -85,19 +91,6 @@ class CompletionResponseServiceTests(APITestCase):
         # ensure_ascii=False 기대
         self.assertNotIn("\\u", SSEEncoder.json("한글"))
 
-    # DB 저장 확인
-    def test_user_message_save(self) -> None:
-        c = user_message_save(session=self.session, message="hi")
-        self.assertEqual(c.session_id, self.session.id)
-        self.assertEqual(c.role, UserRole.USER)
-        self.assertEqual(c.message, "hi")
-
-    def test_ai_message_save(self) -> None:
-        c = ai_message_save(session=self.session, message="hello")
-        self.assertEqual(c.session_id, self.session.id)
-        self.assertEqual(c.role, UserRole.ASSISTANT)
-        self.assertEqual(c.message, "hello")
-
     # 컨텐츠 확인
     def test_get_chat_history_empty(self) -> None:
         service = GeminiStreamingService(self.session)
@@ -123,7 +116,7 @@ class CompletionResponseServiceTests(APITestCase):
         self.assertEqual(parts[0].text, "새 메시지")
 
     @patch.object(GeminiStreamingService, "_get_client")
-    def test_iter_gemini_text_stream_yields_only_text(self, mock_get_client: MagicMock) -> None:
+    def test_iter_text_stream_yields_only_text(self, mock_get_client: MagicMock) -> None:
         # chunk.text가 None이면 필터링되어야 함
         mock_chunk1 = MagicMock(text="Hello ")
         mock_chunk2 = MagicMock(text=None)
@@ -138,17 +131,18 @@ class CompletionResponseServiceTests(APITestCase):
         ]
 
         service = GeminiStreamingService(self.session)
-        out = list(service._iter_gemini_text_stream(contents=contents))
+        out = list(service._iter_text_stream(contents=contents))
         self.assertEqual(out, ["Hello ", "World"])
 
-    @patch.object(GeminiStreamingService, "_iter_gemini_text_stream")
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
     def test_generate_streaming_response_success_saves_full_message(self, mock_iter: MagicMock) -> None:
         mock_iter.return_value = iter(["Hello ", "World"])
 
         service = GeminiStreamingService(self.session)
-        out = list(service.generate_streaming_response(user_message="테스트"))
-        self.assertEqual(out[0], SSEEncoder.json("Hello "))
-        self.assertEqual(out[1], SSEEncoder.json("World"))
+        stream = StreamEventBuffer.create()
+        out = list(service.generate_streaming_response(user_message="테스트", stream=stream))
+        self.assertEqual(out[0], SSEEncoder.json("Hello ", event_id=stream.event_id(1)))
+        self.assertEqual(out[1], SSEEncoder.json("World", event_id=stream.event_id(2)))
         self.assertEqual(out[-1], "data: [DONE]\n\n")
 
         saved = ChatbotCompletion.objects.filter(session=self.session, role=UserRole.ASSISTANT).first()
@@ -156,15 +150,103 @@ class CompletionResponseServiceTests(APITestCase):
         assert saved is not None  # mypy용
         self.assertEqual(saved.message, "Hello World")
 
-    @patch.object(GeminiStreamingService, "_iter_gemini_text_stream")
-    def test_generate_streaming_response_empty_does_not_save(self, mock_iter: MagicMock) -> None:
+    def test_save_turn_saves_user_and_ai_message(self) -> None:
+        user, ai = save_turn(session=self.session, user_message="질문", ai_message="답변")
+
+        self.assertEqual((user.role, user.message), (UserRole.USER, "질문"))
+        self.assertEqual((ai.role, ai.message, ai.is_complete), (UserRole.ASSISTANT, "답변", True))
+        self.assertLess(user.id, ai.id)
+        self.assertEqual(ChatbotCompletion.objects.filter(session=self.session).count(), 2)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_generate_streaming_response_saves_turn_once(self, mock_iter: MagicMock) -> None:
+        mock_iter.return_value = iter(["Hello ", "World"])
+
+        service = GeminiStreamingService(self.session)
+        with patch(
+            "apps.chatbot.services.completion_response_service.save_turn",
+            wraps=save_turn,
+        ) as mock_save_turn:
+            list(service.generate_streaming_response(user_message="테스트"))
+
+        mock_save_turn.assert_called_once_with(
+            session=self.session, user_message="테스트", ai_message="Hello World", is_complete=True
+        )
+        user = ChatbotCompletion.objects.get(session=self.session, role=UserRole.USER)
+        self.assertEqual(user.message, "테스트")
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_generate_streaming_response_empty_saves_empty_ai_message(self, mock_iter: MagicMock) -> None:
         mock_iter.return_value = iter([])
 
         service = GeminiStreamingService(self.session)
         out = list(service.generate_streaming_response(user_message="테스트"))
         self.assertEqual(out, ["data: [DONE]\n\n"])
 
+        ai = ChatbotCompletion.objects.get(session=self.session, role=UserRole.ASSISTANT)
+        self.assertEqual(ai.message, "")
+        self.assertTrue(ai.is_complete)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_generate_streaming_response_error_saves_incomplete_message(self, mock_iter: MagicMock) -> None:
+        def broken_stream(contents: list[types.Content]) -> Iterator[str]:
+            yield "Hello "
+            raise RuntimeError("boom")
+
+        mock_iter.side_effect = broken_stream
+
+        service = GeminiStreamingService(self.session)
+        stream = StreamEventBuffer.create()
+        with self.assertLogs("apps.chatbot.services.completion_response_service", level="ERROR"):
+            out = list(service.generate_streaming_response(user_message="테스트", stream=stream))
         self.assertEqual(
-            ChatbotCompletion.objects.filter(session=self.session, role=UserRole.ASSISTANT).count(),
-            0,
+            out, [SSEEncoder.json("Hello ", event_id=stream.event_id(1)), "data: [ERROR]\n\n", "data: [DONE]\n\n"]
         )
+        self.assertEqual(stream.get_meta(), {"session_id": self.session.id, "last_seq": 1, "status": "error"})
+
+        self.assertTrue(ChatbotCompletion.objects.filter(session=self.session, role=UserRole.USER).exists())
+        ai = ChatbotCompletion.objects.get(session=self.session, role=UserRole.ASSISTANT)
+        self.assertEqual(ai.message, "Hello ")
+        self.assertFalse(ai.is_complete)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_generate_streaming_response_client_disconnect_keeps_generating(self, mock_iter: MagicMock) -> None:
+        mock_iter.return_value = iter(["Hello ", "World"])
+
+        stream = StreamEventBuffer.create()
+        response = GeminiStreamingService(self.session).generate_streaming_response(
+            user_message="테스트", stream=stream
+        )
+        next(response)
+        drain_tasks: list[Callable[[], None]] = []
+        with patch(
+            "apps.chatbot.services.completion_response_service.run_in_drain_thread", side_effect=drain_tasks.append
+        ):
+            response.close()  # 클라이언트 연결 종료
+
+        # 요청 워커는 바로 반환, 남은 생성은 백그라운드 스레드 작업으로 넘김
+        self.assertEqual(stream.read_after(1)[0], [])
+        self.assertFalse(ChatbotCompletion.objects.filter(session=self.session).exists())
+        drain_tasks[0]()
+
+        # 남은 chunk 는 버퍼에 쌓이고 완료된 응답으로 저장 (재연결 시 이어받기)
+        events, meta = stream.read_after(1)
+        self.assertEqual(events, [(2, "World")])
+        assert meta is not None  # mypy용
+        self.assertEqual(meta["status"], "done")
+        ai = ChatbotCompletion.objects.get(session=self.session, role=UserRole.ASSISTANT)
+        self.assertEqual(ai.message, "Hello World")
+        self.assertTrue(ai.is_complete)
+
+    @patch("apps.chatbot.services.completion_response_service.save_turn", side_effect=RuntimeError("db down"))
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_generate_streaming_response_save_error_still_done(
+        self, mock_iter: MagicMock, mock_save_turn: MagicMock
+    ) -> None:
+        mock_iter.return_value = iter(["Hello"])
+
+        service = GeminiStreamingService(self.session)
+        stream = StreamEventBuffer.create()
+        with self.assertLogs("apps.chatbot.services.completion_response_service", level="ERROR"):
+            out = list(service.generate_streaming_response(user_message="테스트", stream=stream))
+        self.assertEqual(out, [SSEEncoder.json("Hello", event_id=stream.event_id(1)), "data: [DONE]\n\n"])
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from apps.chatbot.services.concurrency_limiter import ProviderConcurrencyLimiter
+from apps.core.exceptions.exceptions import ServiceUnavailableException
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+
+"""
+concurrency_limiter 테스트
+
+admit: 실행 + 대기열 한도 초과 시 503 / 전역(Redis) 한도 초과 시 503 / release 후 다시 접수 가능
+acquire(_async): 실행 슬롯이 없으면 queue_timeout 후 실패
+release: 여러 번 호출해도 한 번만 반납
+"""
+
+
+class ProviderConcurrencyLimiterTests(IsolatedRedisTestClient):
+    def _limiter(self, max_queue_depth: int = 1, global_cap: int = 10) -> ProviderConcurrencyLimiter:
+        return ProviderConcurrencyLimiter(
+            "test",
+            max_concurrency=1,
+            max_queue_depth=max_queue_depth,
+            global_cap=global_cap,
+            queue_timeout=0,
+            slot_ttl=60,
+        )
+
+    def test_admit_rejects_when_queue_is_full(self) -> None:
+        limiter = self._limiter()
+        first, second = limiter.admit(), limiter.admit()
+
+        with self.assertRaises(ServiceUnavailableException):
+            limiter.admit()
+
+        first.release()
+        third = limiter.admit()
+        self.assertEqual(limiter.stats(), {"local_in_flight": 2, "global_in_flight": 2})
+        second.release()
+        third.release()
+        self.assertEqual(limiter.stats(), {"local_in_flight": 0, "global_in_flight": 0})
+
+    def test_admit_rejects_over_global_cap(self) -> None:
+        # 다른 워커 프로세스의 limiter 와 Redis in-flight 를 공유
+        other_worker = self._limiter(max_queue_depth=10, global_cap=2)
+        limiter = self._limiter(max_queue_depth=10, global_cap=2)
+        other_worker.admit()
+        limiter.admit()
+
+        with self.assertRaises(ServiceUnavailableException):
+            limiter.admit()
+        self.assertEqual(limiter.stats()["global_in_flight"], 2)
+
+    def test_acquire_times_out_without_free_slot(self) -> None:
+        limiter = self._limiter()
+        running, waiting = limiter.admit(), limiter.admit()
+
+        self.assertTrue(running.acquire())
+        self.assertFalse(waiting.acquire())
+
+        running.release()
+        running.release()  # 중복 반납 무시
+        self.assertTrue(waiting.acquire())
+        waiting.release()
+
+    async def test_acquire_async_times_out_without_free_slot(self) -> None:
+        limiter = self._limiter()
+        running, waiting = limiter.admit(), limiter.admit()
+
+        self.assertTrue(await running.acquire_async())
+        self.assertFalse(await waiting.acquire_async())
+        running.release()
+        self.assertTrue(await waiting.acquire_async())
+        waiting.release()
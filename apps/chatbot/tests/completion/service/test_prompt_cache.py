@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+
+from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services.completion_response_service import GeminiStreamingService
+from apps.chatbot.services.prompt_cache import normalize_prompt, prompt_response_cache
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.qna.models import Question, QuestionCategory
+from apps.user.models import User
+
+"""
+prompt_cache 테스트
+
+normalize_prompt: 대소문자 / 공백 / 끝 문장부호 차이 무시
+PromptResponseCache: 저장/조회 + hit/miss 카운트 / 최대 개수 초과 시 LRU 삭제
+GeminiStreamingService: (opt-in) 첫 턴 캐시 hit 시 모델 호출 X / 두 번째 턴부터는 캐시 사용 X
+"""
+
+
+class PromptResponseCacheTests(IsolatedRedisTestClient):
+    session: ChatbotSession
+    other_session: ChatbotSession
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        user = User.objects.create_user(
+            email="prompt@example.com",
+            password="00000000",
+            name="promptuser",
+            nickname="promptuser",
+            birthday=date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="test_category")
+        question = Question.objects.create(author=user, category=category, title="질문", content="내용")
+        cls.session = ChatbotSession.objects.create(
+            user=user, question=question, title="세션", using_model=ChatModel.GEMINI
+        )
+        cls.other_session = ChatbotSession.objects.create(
+            user=user, question=question, title="다른 세션", using_model=ChatModel.GEMINI
+        )
+
+    def test_normalize_prompt(self) -> None:
+        self.assertEqual(normalize_prompt("  Django ORM   이  뭔가요?? "), "django orm 이 뭔가요")
+        self.assertEqual(normalize_prompt("Ｄｊａｎｇｏ！"), "django")
+
+    def test_get_set_and_stats(self) -> None:
+        self.assertIsNone(prompt_response_cache.get(1, ChatModel.GEMINI, "질문"))
+
+        prompt_response_cache.set(1, ChatModel.GEMINI, "질문", ["답", "변"])
+
+        self.assertEqual(prompt_response_cache.get(1, ChatModel.GEMINI, " 질문? "), ["답", "변"])
+        self.assertIsNone(prompt_response_cache.get(2, ChatModel.GEMINI, "질문"))
+        self.assertEqual(prompt_response_cache.stats(), {"hits": 1, "misses": 2, "entries": 1})
+
+    @override_settings(CHATBOT_PROMPT_CACHE_MAX_ENTRIES=2)
+    def test_set_evicts_least_recently_used(self) -> None:
+        prompt_response_cache.set(1, ChatModel.GEMINI, "a", ["a"])
+        prompt_response_cache.set(1, ChatModel.GEMINI, "b", ["b"])
+        prompt_response_cache.get(1, ChatModel.GEMINI, "a")  # a 를 최근 사용으로 갱신
+        prompt_response_cache.set(1, ChatModel.GEMINI, "c", ["c"])
+
+        self.assertIsNotNone(prompt_response_cache.get(1, ChatModel.GEMINI, "a"))
+        self.assertIsNone(prompt_response_cache.get(1, ChatModel.GEMINI, "b"))
+        self.assertIsNotNone(prompt_response_cache.get(1, ChatModel.GEMINI, "c"))
+        self.assertEqual(prompt_response_cache.stats()["entries"], 2)
+
+    @override_settings(CHATBOT_PROMPT_CACHE_ENABLED=True)
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_first_turn_hit_skips_model_call(self, mock_iter: MagicMock) -> None:
+        mock_iter.return_value = iter(["Hello ", "World"])
+        list(GeminiStreamingService(self.session).generate_streaming_response("ORM 이 뭔가요?"))
+
+        # 같은 질문의 다른 세션 첫 턴 → 모델 호출 없이 재전송 + 대화 저장
+        out = list(GeminiStreamingService(self.other_session).generate_streaming_response("orm 이 뭔가요"))
+
+        self.assertEqual(mock_iter.call_count, 1)
+        self.assertIn('"content": "World"', out[1])
+        saved = ChatbotCompletion.objects.get(session=self.other_session, role=UserRole.ASSISTANT)
+        self.assertEqual(saved.message, "Hello World")
+
+    @override_settings(CHATBOT_PROMPT_CACHE_ENABLED=True)
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_follow_up_turn_is_not_cached(self, mock_iter: MagicMock) -> None:
+        mock_iter.side_effect = lambda contents: iter(["answer"])
+        service = GeminiStreamingService(self.session)
+        list(service.generate_streaming_response("첫 질문"))
+        list(service.generate_streaming_response("두 번째 질문"))
+        list(service.generate_streaming_response("두 번째 질문"))
+
+        self.assertEqual(mock_iter.call_count, 3)
+        self.assertEqual(prompt_response_cache.stats()["entries"], 1)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_disabled_by_default(self, mock_iter: MagicMock) -> None:
+        mock_iter.side_effect = lambda contents: iter(["answer"])
+        list(GeminiStreamingService(self.session).generate_streaming_response("질문"))
+        list(GeminiStreamingService(self.other_session).generate_streaming_response("질문"))
+
+        self.assertEqual(mock_iter.call_count, 2)
+        self.assertEqual(prompt_response_cache.stats(), {"hits": 0, "misses": 0, "entries": 0})
+
+    @override_settings(CHATBOT_PROMPT_CACHE_ENABLED=True)
+    @patch.object(GeminiStreamingService, "_iter_text_stream_async")
+    async def test_first_turn_hit_skips_model_call_async(self, mock_iter: MagicMock) -> None:
+        prompt_response_cache.set(self.session.question_id, ChatModel.GEMINI, "질문", ["cached"])
+
+        out = [chunk async for chunk in GeminiStreamingService(self.session).generate_streaming_response_async("질문")]
+
+        mock_iter.assert_not_called()
+        self.assertIn('"content": "cached"', out[0])
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+from google.genai import types
+
+from apps.chatbot.models.chatbot_completions import ChatbotCompletion, UserRole
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services.completion_response_service import (
+    ChatStreamingService,
+    GeminiStreamingService,
+)
+from apps.chatbot.services.fake_streaming_service import FakeStreamingService
+from apps.chatbot.services.openai_client_registry import OpenAIClientRegistry
+from apps.chatbot.services.openai_streaming_service import (
+    OpenAIStreamingService,
+    _parse_sse_line,
+)
+from apps.chatbot.services.provider_registry import get_streaming_service
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.qna.models import Question, QuestionCategory
+from apps.user.models import User
+
+"""
+provider_registry / provider 별 스트리밍 서비스 테스트
+
+get_streaming_service: 세션 모델별 provider 선택 / CHATBOT_FAKE_PROVIDER 면 가짜 provider
+ChatStreamingService: 텍스트 스트림을 구현하지 않은 provider 는 생성 불가 (추상 클래스)
+OpenAIStreamingService: contents → chat completions 요청 body / SSE data 줄 파싱
+FakeStreamingService: 모델 호출 없이 고정 chunk 스트리밍 + 대화 저장 (동기 / 비동기)
+OpenAIClientRegistry: event loop 별 AsyncClient 재사용 / 닫힌 loop 의 Client 정리 / fork 후 재생성 / close
+"""
+
+
+class ProviderRegistryTests(IsolatedRedisTestClient):
+    gemini_session: ChatbotSession
+    openai_session: ChatbotSession
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        user = User.objects.create_user(
+            email="provider@example.com",
+            password="00000000",
+            name="provideruser",
+            nickname="provideruser",
+            birthday=date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="test_category")
+        question = Question.objects.create(author=user, category=category, title="질문", content="내용")
+        cls.gemini_session = ChatbotSession.objects.create(
+            user=user, question=question, title="gemini", using_model=ChatModel.GEMINI
+        )
+        cls.openai_session = ChatbotSession.objects.create(
+            user=user, question=question, title="openai", using_model=ChatModel.OPENAI
+        )
+
+    def test_get_streaming_service_by_model(self) -> None:
+        self.assertIsInstance(get_streaming_service(self.gemini_session), GeminiStreamingService)
+        self.assertIsInstance(get_streaming_service(self.openai_session), OpenAIStreamingService)
+
+    def test_provider_without_text_stream_cannot_be_created(self) -> None:
+        class IncompleteStreamingService(ChatStreamingService):
+            provider_name = "incomplete"
+
+        with self.assertRaises(TypeError):
+            IncompleteStreamingService(self.gemini_session)  # type: ignore[abstract]
+
+    @override_settings(CHATBOT_FAKE_PROVIDER=True)
+    def test_get_streaming_service_fake_provider(self) -> None:
+        self.assertIsInstance(get_streaming_service(self.openai_session), FakeStreamingService)
+
+    def test_openai_request_body(self) -> None:
+        contents = [
+            types.Content(role="user", parts=[types.Part.from_text(text="안녕")]),
+            types.Content(role="model", parts=[types.Part.from_text(text="반가워요")]),
+            types.Content(role="user", parts=[types.Part.from_text(text="질문")]),
+        ]
+
+        body = OpenAIStreamingService(self.openai_session)._request_body(contents)
+
+        self.assertEqual(body["model"], "o4-mini")
+        self.assertTrue(body["stream"])
+        self.assertEqual(
+            body["messages"],
+            [
+                {"role": "user", "content": "안녕"},
+                {"role": "assistant", "content": "반가워요"},
+                {"role": "user", "content": "질문"},
+            ],
+        )
+
+    def test_openai_parse_sse_line(self) -> None:
+        chunk = {"choices": [{"delta": {"content": "Hello"}}]}
+
+        self.assertEqual(_parse_sse_line(f"data: {json.dumps(chunk)}"), "Hello")
+        self.assertIsNone(_parse_sse_line('data: {"choices": [{"delta": {"role": "assistant"}}]}'))
+        self.assertIsNone(_parse_sse_line("data: [DONE]"))
+        self.assertIsNone(_parse_sse_line(": keep-alive"))
+
+    @override_settings(CHATBOT_FAKE_PROVIDER_CHUNKS=3, CHATBOT_FAKE_PROVIDER_CHUNK_DELAY=0)
+    def test_fake_provider_streams_and_saves(self) -> None:
+        out = list(FakeStreamingService(self.gemini_session).generate_streaming_response("질문"))
+
+        self.assertEqual(len(out), 4)
+        self.assertEqual(out[-1], "data: [DONE]\n\n")
+        saved = ChatbotCompletion.objects.get(session=self.gemini_session, role=UserRole.ASSISTANT)
+        self.assertEqual(saved.message, "chunk-0 chunk-1 chunk-2 ")
+
+    @override_settings(CHATBOT_FAKE_PROVIDER_CHUNKS=2, CHATBOT_FAKE_PROVIDER_CHUNK_DELAY=0)
+    async def test_fake_provider_streams_async(self) -> None:
+        service = FakeStreamingService(self.gemini_session)
+        service.admit()
+
+        out = [chunk async for chunk in service.generate_streaming_response_async("질문")]
+
+        self.assertEqual(len(out), 3)
+        self.assertIn('"content": "chunk-1 "', out[1])
+
+
+class OpenAIClientRegistryTests(unittest.TestCase):
+    def test_get_async_reuses_client_within_event_loop(self) -> None:
+        registry = OpenAIClientRegistry()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        async def get_twice() -> tuple[object, object]:
+            return registry.get_async(factory), registry.get_async(factory)
+
+        first, second = asyncio.run(get_twice())
+        other_loop_client, _ = asyncio.run(get_twice())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other_loop_client)
+        # 닫힌 loop 의 Client 는 새 loop 에서 조회할 때 정리
+        self.assertEqual(len(registry._async_clients), 1)
+
+    def test_get_sync_recreates_client_after_fork(self) -> None:
+        registry = OpenAIClientRegistry()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        parent_client = registry.get_sync(factory)
+
+        self.assertIs(registry.get_sync(factory), parent_client)
+        with patch("apps.chatbot.services.openai_client_registry.os.getpid", return_value=-1):
+            self.assertIsNot(registry.get_sync(factory), parent_client)
+
+    def test_close_closes_clients(self) -> None:
+        registry = OpenAIClientRegistry()
+        sync_client = MagicMock()
+        registry.get_sync(lambda: sync_client)
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def get_async() -> MagicMock:
+            return registry.get_async(MagicMock)  # type: ignore[return-value]
+
+        async_client = loop.run_until_complete(get_async())
+        async_client.aclose = MagicMock(side_effect=lambda: asyncio.sleep(0))
+
+        registry.close()
+
+        sync_client.close.assert_called_once()
+        async_client.aclose.assert_called_once()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from django.test import override_settings
+
+from apps.chatbot.services.completion_response_service import (
+    SSEEncoder,
+    replay_streaming_response,
+    replay_streaming_response_async,
+)
+from apps.chatbot.services.stream_buffer import StreamEventBuffer
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+
+"""
+stream_buffer / 재연결(Last-Event-ID) 재전송 테스트
+
+StreamEventBuffer: Last-Event-ID 파싱 / seq 이후 chunk 조회 / 중간 chunk 만료 시 거기서 멈춤
+replay_streaming_response(_async): 놓친 chunk 만 재전송 + [DONE] / 에러·만료 시 [ERROR], [DONE] / (WSGI) 생성 중이면 retry 후 종료 / (ASGI) 대기 시간 초과
+"""
+
+SESSION_ID = 1
+
+
+class StreamEventBufferTests(IsolatedRedisTestClient):
+    def _pushed(self, *texts: str, finished: bool = True) -> StreamEventBuffer:
+        stream = StreamEventBuffer.create()
+        stream.start(SESSION_ID)
+        for seq, text in enumerate(texts, start=1):
+            stream.push(SESSION_ID, seq, text)
+        if finished:
+            stream.finish(SESSION_ID, len(texts))
+        return stream
+
+    def test_from_last_event_id(self) -> None:
+        stream = StreamEventBuffer.create()
+        resumed = StreamEventBuffer.from_last_event_id(stream.event_id(3))
+
+        assert resumed is not None  # mypy용
+        self.assertEqual((resumed[0].stream_id, resumed[1]), (stream.stream_id, 3))
+        self.assertIsNone(StreamEventBuffer.from_last_event_id(None))
+        self.assertIsNone(StreamEventBuffer.from_last_event_id("not-an-id"))
+
+    def test_read_after(self) -> None:
+        stream = self._pushed("a", "b", "c")
+
+        events, meta = stream.read_after(1)
+        self.assertEqual(events, [(2, "b"), (3, "c")])
+        self.assertEqual(meta, {"session_id": SESSION_ID, "last_seq": 3, "status": "done"})
+        self.assertEqual(stream.read_after(3)[0], [])
+
+    def test_read_after_stops_at_missing_chunk(self) -> None:
+        stream = self._pushed("a", "b", "c")
+        stream._cache().delete(stream._event_key(2))
+
+        self.assertEqual(stream.read_after(0)[0], [(1, "a")])
+
+    def test_replay_sends_only_missed_chunks(self) -> None:
+        stream = self._pushed("a", "b", "c")
+
+        out = list(replay_streaming_response(stream, after_seq=1))
+        self.assertEqual(
+            out,
+            [
+                SSEEncoder.json("b", event_id=stream.event_id(2)),
+                SSEEncoder.json("c", event_id=stream.event_id(3)),
+                "data: [DONE]\n\n",
+            ],
+        )
+
+    def test_replay_error_stream(self) -> None:
+        stream = self._pushed("a", finished=False)
+        stream.finish(SESSION_ID, 1, error=True)
+
+        out = list(replay_streaming_response(stream, after_seq=1))
+        self.assertEqual(out, ["data: [ERROR]\n\n", "data: [DONE]\n\n"])
+
+    def test_replay_expired_stream(self) -> None:
+        out = list(replay_streaming_response(StreamEventBuffer.create(), after_seq=0))
+        self.assertEqual(out, ["data: [ERROR]\n\n", "data: [DONE]\n\n"])
+
+    @override_settings(CHATBOT_STREAM_REPLAY_RETRY_MS=1000)
+    def test_replay_running_stream_does_not_wait(self) -> None:
+        stream = self._pushed("a", finished=False)
+
+        # (WSGI) 생성 중이면 대기하지 않고 retry 후 종료 → 마지막 id 로 다시 재연결
+        out = list(replay_streaming_response(stream, after_seq=0))
+        self.assertEqual(out, [SSEEncoder.json("a", event_id=stream.event_id(1)), "retry: 1000\n\n"])
+
+    @override_settings(CHATBOT_STREAM_REPLAY_TIMEOUT=0)
+    async def test_replay_async_gives_up_after_timeout(self) -> None:
+        stream = self._pushed("a", finished=False)
+
+        out = [frame async for frame in replay_streaming_response_async(stream, after_seq=0)]
+        self.assertEqual(
+            out,
+            [SSEEncoder.json("a", event_id=stream.event_id(1)), "data: [ERROR]\n\n", "data: [DONE]\n\n"],
+        )
+
+    async def test_replay_async(self) -> None:
+        stream = self._pushed("a", "b")
+
+        out = [frame async for frame in replay_streaming_response_async(stream, after_seq=1)]
+        self.assertEqual(out, [SSEEncoder.json("b", event_id=stream.event_id(2)), "data: [DONE]\n\n"])
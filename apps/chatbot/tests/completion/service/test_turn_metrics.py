@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from datetime import date
+from io import StringIO
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+
+from apps.chatbot.models.chatbot_sessions import ChatbotSession, ChatModel
+from apps.chatbot.services.completion_response_service import GeminiStreamingService
+from apps.chatbot.services.turn_metrics import parse_turn_log_line
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.qna.models import Question, QuestionCategory
+from apps.user.models import User
+
+"""
+turn_metrics / chatbot_latency_report 테스트
+
+generate_streaming_response(_async): 턴 종료 시 구간별 시간 + chunk / bytes 를 chatbot.turn 로그 한 줄로 기록
+chatbot_latency_report: 로그 파일에서 p50 / p95 / p99 집계
+"""
+
+
+class TurnMetricsTests(IsolatedRedisTestClient):
+    session: ChatbotSession
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        user = User.objects.create_user(
+            email="metrics@example.com",
+            password="00000000",
+            name="metricsuser",
+            nickname="metricsuser",
+            birthday=date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="test_category")
+        question = Question.objects.create(author=user, category=category, title="질문", content="내용")
+        cls.session = ChatbotSession.objects.create(
+            user=user, question=question, title="세션", using_model=ChatModel.GEMINI
+        )
+
+    def _turn_fields(self, output: list[str]) -> dict[str, Any]:
+        self.assertEqual(len(output), 1)
+        fields = parse_turn_log_line(output[0])
+        assert fields is not None  # mypy용
+        return fields
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream")
+    def test_sync_turn_logs_metrics(self, mock_iter: MagicMock) -> None:
+        mock_iter.return_value = iter(["안녕", "하세요"])
+
+        with self.assertLogs("apps.chatbot.metrics", level="INFO") as logs:
+            list(GeminiStreamingService(self.session).generate_streaming_response("질문"))
+
+        fields = self._turn_fields(logs.output)
+        self.assertEqual(fields["provider"], "gemini")
+        self.assertEqual((fields["chunks"], fields["bytes"]), (2, len("안녕하세요".encode())))
+        self.assertTrue(fields["is_complete"])
+        for name in ("history_ms", "queue_ms", "ttfb_ms", "stream_ms", "save_ms", "total_ms", "tokens_per_sec"):
+            self.assertIn(name, fields)
+
+    @patch.object(GeminiStreamingService, "_iter_text_stream_async")
+    async def test_async_turn_logs_incomplete(self, mock_iter: MagicMock) -> None:
+        async def broken_stream(contents: object) -> AsyncIterator[str]:
+            yield "부분"
+            raise RuntimeError("boom")
+
+        mock_iter.side_effect = broken_stream
+
+        with self.assertLogs("apps.chatbot.metrics", level="INFO") as logs:
+            [chunk async for chunk in GeminiStreamingService(self.session).generate_streaming_response_async("질문")]
+
+        fields = self._turn_fields(logs.output)
+        self.assertFalse(fields["is_complete"])
+        self.assertEqual(fields["chunks"], 1)
+
+    def test_latency_report_command(self) -> None:
+        lines = [
+            f'INFO 2026-01-01 metrics 1 1 chatbot.turn {{"provider": "gemini", "ttfb_ms": {ms}, "is_complete": true}}\n'
+            for ms in range(1, 101)
+        ]
+        lines.append('INFO 2026-01-01 metrics 1 1 chatbot.turn {"provider": "openai", "ttfb_ms": 999}\n')
+        lines.append("INFO 2026-01-01 basehttp 1 1 unrelated line\n")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chatbot_metrics.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            out = StringIO()
+            call_command("chatbot_latency_report", path, provider="gemini", stdout=out)
+
+        report = out.getvalue()
+        self.assertIn("turns=100 incomplete=0", report)
+        self.assertRegex(report, r"ttfb_ms\s+100\s+50\.0\s+95\.0\s+99\.0")
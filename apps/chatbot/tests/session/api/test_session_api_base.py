@@ -2,8 +2,8 @@ import datetime
 from typing import Any
 
 from django.urls import reverse
-from rest_framework.test import APITestCase
 
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
 from apps.qna.models import QuestionCategory
 from apps.qna.models.question.question_base import Question
 from apps.user.models import User
@@ -25,7 +25,7 @@ Session API 테스트용 공통 설정
 """
 
 
-class SessionAPITestBase(APITestCase):
+class SessionAPITestBase(IsolatedRedisTestClient):
     user: "User"
     other_user: "User"
     password: str
@@ -80,6 +80,7 @@ class SessionAPITestBase(APITestCase):
 
     # 초기화 메서드. user를 인증 상태로(로그인 필요없게)
     def setUp(self) -> None:
+        super().setUp()
         self.client.force_authenticate(self.user)
 
     def get_list_create_url(self) -> str:
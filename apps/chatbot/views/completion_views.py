@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable
 from typing import Any
 
 from django.http import StreamingHttpResponse
@@ -13,38 +13,53 @@ from drf_spectacular.utils import (
 )
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.chatbot.models.chatbot_sessions import ChatbotSession
 from apps.chatbot.serializers.completion_serializers import (
     CompletionCreateSerializer,
     CompletionSerializer,
 )
+from apps.chatbot.services.chat_history_cache import chat_history_cache
 from apps.chatbot.services.completion_response_service import (
-    GeminiStreamingService,
-    user_message_save,
+    replay_streaming_response,
+    replay_streaming_response_async,
 )
-from apps.chatbot.views.mixins import ChatbotCompletionMixin, ChatbotCursorPagination
+from apps.chatbot.services.provider_registry import get_streaming_service
+from apps.chatbot.services.stream_buffer import StreamEventBuffer
+from apps.chatbot.views.mixins import ChatbotCompletionMixin, ChatbotKeysetPagination
 from apps.core.exceptions.exception_messages import EMS
+from apps.core.utils.sse import ServerSentEventRenderer, is_asgi_request
 
 
-class ServerSentEventRenderer(BaseRenderer):
-    media_type = "text/event-stream"
-    format = "txt"
-    charset = "utf-8"
+# 재연결 요청(Last-Event-ID)이 같은 세션의 살아있는 스트림을 가리키면 (버퍼, 마지막으로 받은 seq) 반환
+def get_resumable_stream(request: Request, session: ChatbotSession) -> tuple[StreamEventBuffer, int] | None:
+    resumed = StreamEventBuffer.from_last_event_id(request.headers.get("Last-Event-ID"))
+    if resumed is None:
+        return None
+    meta = resumed[0].get_meta()
+    if meta is None or meta["session_id"] != session.id:
+        return None
+    return resumed
 
-    def render(
-        self, data: Any, accepted_media_type: str | None = None, renderer_context: Mapping[str, Any] | None = None
-    ) -> bytes:
-        if data is None:
-            return b""
-        if isinstance(data, bytes):
-            return data
-        if isinstance(data, str):
-            return data.encode(self.charset)
-        return str(data).encode(self.charset)
+
+def sse_response(
+    streaming_content: Any, stream: StreamEventBuffer, on_close: Callable[[], None] | None = None
+) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(
+        streaming_content=streaming_content,
+        content_type="text/event-stream; charset=utf-8",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    response["X-Chatbot-Stream-Id"] = stream.stream_id
+    if on_close is not None:
+        # WSGI / ASGI 핸들러 모두 응답 전송이 끝나거나 연결이 끊기면 response.close() 호출
+        response._resource_closers.append(on_close)  # type: ignore[attr-defined]
+    return response
 
 
 """
@@ -60,7 +75,7 @@ generate_streaming_response: SSE 스트리밍 제너레이터 (chunk yield + DB
 
 class CompletionAPIView(APIView, ChatbotCompletionMixin):
     permission_classes = [IsAuthenticated]
-    pagination_class = ChatbotCursorPagination
+    pagination_class = ChatbotKeysetPagination
     serializer_class = CompletionSerializer
 
     # 메세지 목록 조회
@@ -69,6 +84,7 @@ class CompletionAPIView(APIView, ChatbotCompletionMixin):
         summary="챗봇 대화 내역 조회 API",
         description="특정 세션의 대화 내역을 조회하는 API입니다.\n"
         "- 커서 기반 페이지네이션을 지원하며, 최신 메세지가 먼저 반환됩니다.\n"
+        "- 커서는 (created_at, id) 기준이라 대화가 길어져도 페이지 조회 속도가 일정합니다.\n"
         "- 본인의 세션만 조회 가능합니다.",
         parameters=[
             OpenApiParameter(
@@ -121,12 +137,14 @@ class CompletionAPIView(APIView, ChatbotCompletionMixin):
                             "id": 501,
                             "message": "Django ORM 최적화 방법 알려줘",
                             "role": "user",
+                            "is_complete": True,
                             "created_at": "2025-01-15T14:30:00+09:00",
                         },
                         {
                             "id": 502,
                             "message": "Django ORM 최적화 방법은 다음과 같습니다...",
                             "role": "assistant",
+                            "is_complete": True,
                             "created_at": "2025-01-15T14:30:05+09:00",
                         },
                     ],
@@ -141,7 +159,7 @@ class CompletionAPIView(APIView, ChatbotCompletionMixin):
     def get(self, request: Request, session_id: int) -> Response:
         session = self.get_session(session_id)
         paginator = self.pagination_class()
-        queryset = self.get_completion_queryset(session)
+        queryset = self.get_completion_list_queryset(session, self.serializer_class.Meta.fields)
 
         page = paginator.paginate_queryset(queryset=queryset, request=request)  # 현재 페이지 데이터만 반환
         serializer = self.serializer_class(page, many=True)
@@ -187,6 +205,9 @@ class CompletionAPIView(APIView, ChatbotCompletionMixin):
     def delete(self, request: Request, session_id: int) -> Response:
         session = self.get_session(session_id)
         session.messages.all().delete()  # 세션 모든 메세지 삭제
+        # 삭제된 대화가 누적 요약으로 남지 않도록 요약도 초기화
+        ChatbotSession.objects.filter(pk=session.pk).update(summary="", summarized_message_id=0)
+        chat_history_cache.invalidate(session.id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -201,16 +222,25 @@ class CompletionCreateAPIView(APIView, ChatbotCompletionMixin):
         summary="AI 챗봇 응답 생성 API (with Streaming)",
         description="AI 챗봇과 사용자의 메세지를 생성/저장하는 API\n\n"
         "처리 흐름: \n"
-        "- 사용자 메세지 DB 저장 \n"
-        "- 세션에 설정된 AI 모델로 응답 생성 (SSE 스트리밍) * 현재 GEMINI만 연동\n"
-        "- AI 응답 DB 저장\n"
+        "- 세션에 설정된 AI 모델(provider)로 응답 생성 (SSE 스트리밍)\n"
+        "- provider 별 동시 요청 한도 초과 시 즉시 503 (대기열이 가득 찬 경우)\n"
+        "- ASGI로 서빙되는 경우 비동기 제너레이터로 스트리밍 (워커 점유 X)\n"
+        "- (opt-in) 같은 질문(Question)에 대한 첫 턴은 캐시된 응답을 모델 호출 없이 재전송\n"
+        "- 스트림 종료 후 사용자 메세지 + AI 응답을 한 번에 DB 저장\n"
+        "- 에러 발생 시 중간까지 받은 AI 응답을 is_complete=false 로 저장\n"
+        "- 각 chunk 에 id(`{stream_id}:{순번}`) 부여, 응답 헤더 X-Chatbot-Stream-Id 로 stream_id 전달\n\n"
+        "재연결 (Last-Event-ID): \n"
+        "- 연결이 끊겨도 생성은 서버에서 끝까지 진행되고 chunk 는 짧은 시간 동안 버퍼에 보관 \n"
+        "- 마지막으로 받은 id 를 Last-Event-ID 헤더로 보내면 놓친 chunk 부터 이어서 전송 (모델 재호출 X) \n"
+        "- 버퍼가 만료된 경우 새 요청으로 처리\n"
         "- 스트리밍 완료 시 [DONE] 전송\n\n"
         "SSE 응답 형식: \n"
-        "- 정상 chunk: data: {'context': '텍스트'} \n"
+        "- 정상 chunk: id: {stream_id}:{순번} data: {'context': '텍스트'} \n"
         "- 완료: data: [DONE] \n"
         "- 에러: data: [ERROR] \n\n"
         "지원 모델: \n"
-        "- gemini-2.5-flash (기본) \n\n"
+        "- gemini-2.5-flash (기본) \n"
+        "- openai-o4-mini \n\n"
         " 주의사항: \n"
         "- 빈 문자열 메세지는 허용되지 않음 \n"
         "- 본인의 세션에만 메세지 보낼 수 있음 \n"
@@ -223,6 +253,13 @@ class CompletionCreateAPIView(APIView, ChatbotCompletionMixin):
                 location="path",
                 description="세션 PK ID",
             ),
+            OpenApiParameter(
+                name="Last-Event-ID",
+                type=OpenApiTypes.STR,
+                location="header",
+                description="재연결 시 마지막으로 받은 SSE id (`{stream_id}:{순번}`)",
+                required=False,
+            ),
         ],
         responses={
             200: OpenApiResponse(
@@ -233,9 +270,9 @@ class CompletionCreateAPIView(APIView, ChatbotCompletionMixin):
                         name="스트리밍 응답 - 정상",
                         summary="AI가 정상적으로 응답을 생성하는 경우",
                         value=(
-                            'data: {"content": "안녕하세요}\n\n'
-                            'data: {"content": "! Django ORM"}\n\n'
-                            'data: {"content": " 최적화 방법을 알려드릴게요."}\n\n'
+                            'id: 3f2b9c0d4e5f40718293a4b5c6d7e8f9:1\ndata: {"content": "안녕하세요}\n\n'
+                            'id: 3f2b9c0d4e5f40718293a4b5c6d7e8f9:2\ndata: {"content": "! Django ORM"}\n\n'
+                            'id: 3f2b9c0d4e5f40718293a4b5c6d7e8f9:3\ndata: {"content": " 최적화 방법을 알려드릴게요."}\n\n'
                             "data: [DONE]\n\n"
                         ),
                     ),
@@ -286,6 +323,16 @@ class CompletionCreateAPIView(APIView, ChatbotCompletionMixin):
                     ),
                 ],
             ),
+            503: OpenApiResponse(
+                description="Service Unavailable - AI 응답 요청 대기열 초과",
+                examples=[
+                    OpenApiExample(
+                        name="동시 요청 한도 초과",
+                        summary="provider 별 동시 요청 + 대기열 한도를 넘은 경우",
+                        value=EMS.E503_CHATBOT_BUSY,
+                    ),
+                ],
+            ),
         },
         examples=[
             OpenApiExample(
@@ -314,22 +361,39 @@ class CompletionCreateAPIView(APIView, ChatbotCompletionMixin):
     def post(self, request: Request, session_id: int) -> StreamingHttpResponse:
         session = self.get_session(session_id)  # 세션 조회(권한 검증 포함)
 
+        # 재연결: 진행 중이거나 막 끝난 스트림이면 모델을 다시 호출하지 않고 버퍼에서 이어받기
+        resumed = get_resumable_stream(request, session)
+        if resumed is not None:
+            stream, after_seq = resumed
+            return sse_response(
+                (
+                    replay_streaming_response_async(stream, after_seq)
+                    if is_asgi_request(request)
+                    else replay_streaming_response(stream, after_seq)
+                ),
+                stream,
+            )
+
         # 요청 데이터 검증
         serializer = CompletionCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user_message = serializer.validated_data["message"]
 
-        # 사용자 메세지 저장 (service에서 호출해서)
-        user_message_save(
-            session=session,
-            message=user_message,
-        )
+        # 사용자 메세지는 스트림 종료 후 AI 응답과 함께 저장 (service 에서 처리)
 
-        service = GeminiStreamingService(session)
-        response = StreamingHttpResponse(
-            streaming_content=service.generate_streaming_response(user_message),
-            content_type="text/event-stream; charset=utf-8",
-        )
-        response["Cache-Control"] = "no-cache"
-        response["X-Accel-Buffering"] = "no"
-        return response
+        # provider 동시 요청 한도 확인 (대기열까지 가득 차면 스트리밍 시작 전에 503)
+        service = get_streaming_service(session)
+        service.admit()
+        # 스트리밍이 시작되기 전에 실패하거나 응답이 닫혀도 (첫 chunk 전 연결 종료 등) ticket 반납
+        try:
+            stream = StreamEventBuffer.create()
+            # ASGI: async 제너레이터 → 이벤트 루프에서 스트리밍 / WSGI: 기존 동기 제너레이터
+            streaming_content = (
+                service.generate_streaming_response_async(user_message, stream)
+                if is_asgi_request(request)
+                else service.generate_streaming_response(user_message, stream)
+            )
+            return sse_response(streaming_content, stream, on_close=service.release_unstarted)
+        except Exception:
+            service.release_unstarted()
+            raise
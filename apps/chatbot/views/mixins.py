@@ -1,6 +1,12 @@
-from django.db.models import QuerySet
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
 from rest_framework.exceptions import NotAuthenticated, NotFound
-from rest_framework.pagination import CursorPagination
+from rest_framework.pagination import Cursor, CursorPagination
 from rest_framework.request import Request
 
 from apps.chatbot.models.chatbot_completions import ChatbotCompletion
@@ -11,6 +17,7 @@ from apps.user.models import User
 """
 Chatbot Views Mixins
     ChatbotCursorPagination: 커서 기반 페이지네이션 (page_size=10, ordering=-created_at)
+    ChatbotKeysetPagination: (created_at, id) keyset 커서 페이지네이션 (대화 내역 조회용)
     ChatbotSessionMixin: 세션 공통 로직
     ChatbotCompletionMixin(ChatbotSessionMixin): 메시지 공통 로직
 """
@@ -28,6 +35,81 @@ class ChatbotCursorPagination(CursorPagination):
     ordering = "-created_at"
 
 
+"""
+ChatbotKeysetPagination: (created_at, id) keyset 커서 페이지네이션
+    - 커서 = 페이지 경계 메세지의 (created_at, id) → WHERE (created_at, id) < 경계 + LIMIT 로 조회
+    - created_at 이 같은 메세지(한 턴의 user/assistant 를 bulk_create)는 id 로 순서 결정
+      (DRF CursorPagination 은 첫 번째 ordering 필드만 위치로 쓰고 동률은 OFFSET 으로 건너뜀)
+    - (session, created_at, id) 인덱스를 그대로 타므로 대화가 길어져도 페이지 조회 비용 일정
+"""
+
+
+class ChatbotKeysetPagination(CursorPagination):
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 10
+    max_page_size = 50
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset: QuerySet[Any], request: Request, view: Any = None) -> list[Any] | None:
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        self.page_size = page_size
+
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        results = list(self.keyset_queryset(queryset, self.cursor)[: page_size + 1])
+        has_more = len(results) > page_size
+        self.page = results[:page_size]
+        if reverse:
+            self.page.reverse()
+
+        # 앞 방향으로 이동해 온 페이지면 뒤 페이지가 있고, 뒤 방향이면 앞 페이지가 있음
+        has_cursor = self.cursor is not None
+        self.has_next = has_more if not reverse else has_cursor
+        self.has_previous = has_more if reverse else has_cursor
+        return self.page
+
+    # 커서 경계 이후 행만 남기고 커서 방향으로 정렬 (LIMIT 은 호출하는 쪽에서)
+    def keyset_queryset(self, queryset: QuerySet[Any], cursor: Cursor | None) -> QuerySet[Any]:
+        reverse = cursor is not None and cursor.reverse
+        if cursor is not None and cursor.position is not None:
+            created_at, pk = self._decode_position(str(cursor.position))
+            if reverse:
+                queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+            else:
+                queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+        return queryset.order_by(*(("created_at", "id") if reverse else self.ordering))
+
+    def _decode_position(self, position: str) -> tuple[datetime, int]:
+        created_at_raw, _, pk_raw = position.rpartition("|")
+        try:
+            created_at = parse_datetime(created_at_raw)
+        except ValueError:
+            created_at = None
+        if created_at is None or not pk_raw.isdigit():
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, int(pk_raw)
+
+    def _encode_position(self, instance: Any, *, reverse: bool) -> str:
+        position = f"{instance.created_at.isoformat()}|{instance.pk}"
+        # DRF 스텁은 position 을 int 로 선언하지만 실제로는 문자열 그대로 querystring 에 인코딩됨
+        return self.encode_cursor(Cursor(offset=0, reverse=reverse, position=position))  # type: ignore[arg-type]
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self._encode_position(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+        return self._encode_position(self.page[0], reverse=True)
+
+
 """
 ChatbotSessionMixin: 세션 공통 로직. 모두 상속
     get_user          - 인증된 사용자 반환 (미인증 시 401)
@@ -58,9 +140,13 @@ class ChatbotSessionMixin:
 """
 ChatbotCompletionMixin(ChatbotSessionMixin): 메시지 공통 로직
     get_completion_queryset - 세션의 모든 메시지 QuerySet
+    get_completion_list_queryset - 대화 내역 조회용 QuerySet (응답 serializer 가 쓰는 컬럼만 SELECT)
 """
 
 
 class ChatbotCompletionMixin(ChatbotSessionMixin):
     def get_completion_queryset(self, session: ChatbotSession) -> QuerySet[ChatbotCompletion]:
         return session.messages.all()
+
+    def get_completion_list_queryset(self, session: ChatbotSession, fields: list[str]) -> QuerySet[ChatbotCompletion]:
+        return self.get_completion_queryset(session).only(*fields)
@@ -15,6 +15,7 @@ from apps.chatbot.serializers.session_serializers import (
     SessionCreateSerializer,
     SessionSerializer,
 )
+from apps.chatbot.services.chat_history_cache import chat_history_cache
 from apps.chatbot.views.mixins import ChatbotCursorPagination, ChatbotSessionMixin
 from apps.core.exceptions.exception_messages import EMS
 
@@ -256,4 +257,5 @@ class SessionDeleteView(APIView, ChatbotSessionMixin):
     def delete(self, request: Request, session_id: int) -> Response:
         session = self.get_session(session_id)
         session.delete()
+        chat_history_cache.invalidate(session_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,7 +1,7 @@
 import logging
 from typing import Any, Type
 
-from django.db.models import Count, F, Q, QuerySet
+from django.db.models import Count, Q, QuerySet
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import serializers
@@ -19,6 +19,11 @@ from apps.community.serializers.post_serializers import (
     PostDetailSerializer,
     PostListSerializer,
 )
+from apps.core.utils.view_counter import (
+    apply_pending_views,
+    record_view,
+    viewer_from_request,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +93,13 @@ class PostListCreateAPIView(ListCreateAPIView[Post]):
         ordering = self.ALLOWED_ORDERING_PARAMS.get(sort, "-created_at")
         return queryset.order_by(ordering)
 
+    def paginate_queryset(self, queryset: QuerySet[Post, Any]) -> list[Any] | None:
+        page = super().paginate_queryset(queryset)
+        # 조회수는 Redis 에 쌓인 반영 대기분까지 포함 (상세 조회와 같은 값)
+        if page is not None:
+            apply_pending_views(Post, page)
+        return page
+
     def get_serializer_class(self) -> Type[serializers.ModelSerializer[Post]]:
         if self.request.method == "POST":
             return PostCreateUpdateSerializer
@@ -118,15 +130,11 @@ class PostDetailAPIView(RetrieveUpdateDestroyAPIView[Post]):
         return PostDetailSerializer
 
     def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        pk = self.kwargs[self.lookup_url_kwarg]
-        qs = Post.objects.filter(id=pk)
-        try:
-            qs.update(view_count=F("view_count") + 1)
-        except Exception as e:
-            logger.error(f"게시글 조회수 업데이트 실패. post_id - {pk}: {str(e)}")
-            pass
-
-        serializer = self.get_serializer(qs.first())
+        post = self.get_object()
+        # 조회수는 Redis 에만 기록 (DB 반영은 beat 작업), 응답에는 반영 대기분까지 포함
+        post.view_count += record_view(Post, post.id, viewer=viewer_from_request(request))
+
+        serializer = self.get_serializer(post)
         return Response(serializer.data)
 
 
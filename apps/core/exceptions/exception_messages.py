@@ -21,6 +21,7 @@ class ErrorMessages:
     - E409: Conflict (데이터 충돌)
     - E410: Gone (만료됨)
     - E423: Locked (잠김)
+    - E503: Service Unavailable (일시적 과부하)
     """
 
     # --- 400 Bad Request ---
@@ -107,5 +108,8 @@ class ErrorMessages:
         "error_detail": "서버 내부 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
     }
 
+    # --- 503 Service Unavailable ---
+    E503_CHATBOT_BUSY: Final[ErrorDetail] = {"error_detail": "AI 응답 요청이 많습니다. 잠시 후 다시 시도해주세요."}
+
 
 EMS = ErrorMessages
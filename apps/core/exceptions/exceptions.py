@@ -21,3 +21,13 @@ class GoneException(APIException):
     status_code = status.HTTP_410_GONE
     default_detail = "요청한 리소스가 만료되었습니다."
     default_code = "gone"
+
+
+class ServiceUnavailableException(APIException):
+    """
+    503 Service Unavailable: 외부 서비스(LLM provider 등) 동시 요청 한도 초과로 잠시 처리할 수 없음
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "잠시 후 다시 시도해주세요."
+    default_code = "service_unavailable"
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from celery import shared_task  # type: ignore
+
+from apps.core.utils.view_counter import flush_all_view_counts
+
+"""
+공통 Celery 작업
+
+flush_view_counts: (beat) Redis 에 누적된 조회수를 DB 에 일괄 반영
+"""
+
+
+@shared_task  # type: ignore[untyped-decorator]
+def flush_view_counts() -> int:
+    return flush_all_view_counts()
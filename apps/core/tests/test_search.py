@@ -0,0 +1,36 @@
+from datetime import date
+
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.test import TestCase
+
+from apps.core.utils.search import trigram_search_q
+from apps.user.models import User
+
+
+class TestTrigramSearch(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        User.objects.create_user(
+            email="trgm@test.com", password="pw", name="김서준", nickname="Django_Fan", birthday=date(2000, 1, 1)
+        )
+
+    def test_fallback_matches_like_icontains(self) -> None:
+        qs = User.objects.filter(trigram_search_q("django_", "nickname", "name"))
+        self.assertEqual(qs.count(), 1)
+
+        self.assertTrue(User.objects.filter(trigram_search_q("서준", "nickname", "name")).exists())
+        self.assertFalse(User.objects.filter(trigram_search_q("django%", "nickname")).exists())
+
+    def test_postgresql_uses_plain_column_ilike(self) -> None:
+        # 연결하지 않고 SQL 만 생성
+        pg = DatabaseWrapper(
+            {**connection.settings_dict, "ENGINE": "django.db.backends.postgresql", "NAME": "x"}, alias="pg"
+        )
+        qs = User.objects.filter(trigram_search_q("a_b", "nickname"))
+
+        sql, params = qs.query.get_compiler(connection=pg).as_sql()
+
+        self.assertIn('WHERE "users"."nickname" ILIKE %s', sql)
+        self.assertNotIn("UPPER", sql)
+        self.assertEqual(params, ("%a\\_b%",))
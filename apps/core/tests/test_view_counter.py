@@ -0,0 +1,108 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.urls import reverse
+
+from apps.community.models.post import Post
+from apps.community.models.post_category import PostCategory
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.core.utils.view_counter import (
+    flush_all_view_counts,
+    flush_view_counts,
+    get_pending_views,
+    record_view,
+)
+from apps.qna.models import Question, QuestionCategory
+from apps.user.models import User
+
+
+@override_settings(VIEW_COUNT_BUFFERED=True)
+class TestViewCounter(IsolatedRedisTestClient):
+    def setUp(self) -> None:
+        super().setUp()
+        self.author = author = User.objects.create_user(
+            email="views@test.com", password="pw", name="조회", nickname="조회닉", birthday=date(2000, 1, 1)
+        )
+        category = QuestionCategory.objects.create(name="백엔드")
+        self.question = Question.objects.create(author=author, category=category, title="Q", content="C")
+        self.other = Question.objects.create(author=author, category=category, title="Q2", content="C2")
+
+    def test_record_view_writes_only_redis(self) -> None:
+        with self.assertNumQueries(0):
+            self.assertEqual(record_view(Question, self.question.id), 1)
+            self.assertEqual(record_view(Question, self.question.id), 2)
+
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.view_count, 0)
+        self.assertEqual(get_pending_views(Question, [self.question.id, self.other.id]), {self.question.id: 2})
+
+    @override_settings(VIEW_COUNT_DEDUP_SECONDS=60)
+    def test_dedup_per_viewer(self) -> None:
+        record_view(Question, self.question.id, viewer="u1")
+        self.assertEqual(record_view(Question, self.question.id, viewer="u1"), 1)
+        self.assertEqual(record_view(Question, self.question.id, viewer="ip127.0.0.1"), 2)
+
+    def test_flush_applies_deltas_in_batches(self) -> None:
+        for _ in range(3):
+            record_view(Question, self.question.id)
+        record_view(Question, self.other.id)
+
+        self.assertEqual(flush_view_counts(Question, batch_size=1), 2)
+
+        self.assertEqual(Question.objects.get(pk=self.question.id).view_count, 3)
+        self.assertEqual(Question.objects.get(pk=self.other.id).view_count, 1)
+        self.assertEqual(get_pending_views(Question, [self.question.id]), {})
+        self.assertEqual(flush_all_view_counts(), 0)
+
+    def test_failed_flush_is_retried(self) -> None:
+        record_view(Question, self.question.id)
+
+        with patch.object(Question._default_manager, "filter", side_effect=RuntimeError("db down")):
+            with self.assertRaises(RuntimeError):
+                flush_view_counts(Question)
+
+        # 반영 못 한 스냅샷도 조회에 포함되고, 새 조회는 별도로 누적
+        self.assertEqual(record_view(Question, self.question.id), 2)
+
+        flush_view_counts(Question)
+        self.assertEqual(Question.objects.get(pk=self.question.id).view_count, 1)
+        flush_view_counts(Question)
+        self.assertEqual(Question.objects.get(pk=self.question.id).view_count, 2)
+
+    def test_redis_failure_falls_back_to_db(self) -> None:
+        with patch("apps.core.utils.view_counter._redis", side_effect=ConnectionError("redis down")):
+            self.assertEqual(record_view(Question, self.question.id), 1)
+
+        self.assertEqual(Question.objects.get(pk=self.question.id).view_count, 1)
+
+    @override_settings(VIEW_COUNT_BUFFERED=False)
+    def test_unbuffered_writes_db_directly(self) -> None:
+        url = reverse("question_detail", kwargs={"question_id": self.question.id})
+
+        self.assertEqual(self.client.get(url).data["view_count"], 1)
+        self.assertEqual(self.client.get(url).data["view_count"], 2)
+        self.assertEqual(Question.objects.get(pk=self.question.id).view_count, 2)
+        self.assertEqual(get_pending_views(Question, [self.question.id]), {})
+        self.assertEqual(flush_all_view_counts(), 0)
+
+    def test_question_detail_includes_pending_views(self) -> None:
+        url = reverse("question_detail", kwargs={"question_id": self.question.id})
+
+        self.assertEqual(self.client.get(url).data["view_count"], 1)
+        self.assertEqual(self.client.get(url).data["view_count"], 2)
+        self.assertEqual(Question.objects.get(pk=self.question.id).view_count, 0)
+
+    def test_list_views_include_pending_views(self) -> None:
+        post = Post.objects.create(
+            author=self.author, category=PostCategory.objects.create(name="자유"), title="P", content="C"
+        )
+        record_view(Question, self.question.id)
+        record_view(Question, self.question.id)
+        record_view(Post, post.id)
+
+        questions = self.client.get(reverse("questions")).data["results"]
+        posts = self.client.get(reverse("post-list-create")).data["results"]
+
+        self.assertEqual({q["id"]: q["view_count"] for q in questions}, {self.question.id: 2, self.other.id: 0})
+        self.assertEqual(posts[0]["view_count"], 1)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import CharField, Q, TextField
+from django.db.models.lookups import IContains
+from django.db.models.sql.compiler import SQLCompiler
+
+"""
+관리자 검색용 부분 일치 검색 (pg_trgm GIN 인덱스 사용)
+
+TrigramIContains (__trgm_icontains):
+    PostgreSQL: "컬럼 ILIKE '%검색어%'" → gin_trgm_ops 인덱스(컬럼 그대로)로 Bitmap Index Scan
+        (기본 icontains 는 UPPER(컬럼::text) LIKE UPPER(...) 라서 컬럼 인덱스를 사용하지 못함)
+        검색어가 3글자 미만이면 trigram 을 만들 수 없어 인덱스 대신 Seq Scan
+    그 외(SQLite 테스트): icontains 와 동일
+trigram_search_q: 여러 필드에 대한 __trgm_icontains OR 조건
+"""
+
+
+@CharField.register_lookup
+@TextField.register_lookup
+class TrigramIContains(IContains):
+    lookup_name = "trgm_icontains"
+
+    def as_sql(self, compiler: SQLCompiler, connection: BaseDatabaseWrapper) -> tuple[str, Any]:
+        return IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+    def as_postgresql(self, compiler: SQLCompiler, connection: BaseDatabaseWrapper) -> tuple[str, Any]:
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", (*lhs_params, *rhs_params)
+
+
+def trigram_search_q(keyword: str, *fields: str) -> Q:
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__trgm_icontains": keyword})
+    return condition
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from django.core.handlers.asgi import ASGIRequest
+from rest_framework.renderers import BaseRenderer
+from rest_framework.request import Request
+
+
+class ServerSentEventRenderer(BaseRenderer):
+    media_type = "text/event-stream"
+    format = "txt"
+    charset = "utf-8"
+
+    def render(
+        self, data: Any, accepted_media_type: str | None = None, renderer_context: Mapping[str, Any] | None = None
+    ) -> bytes:
+        if data is None:
+            return b""
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, str):
+            return data.encode(self.charset)
+        return str(data).encode(self.charset)
+
+
+# ASGI(uvicorn worker)로 서빙되는 요청인지 확인 → async 제너레이터로 스트리밍
+def is_asgi_request(request: Request) -> bool:
+    return isinstance(request._request, ASGIRequest)
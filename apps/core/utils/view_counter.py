@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Model, Value, When
+from django_redis import get_redis_connection  # type: ignore
+from rest_framework.request import Request
+
+logger = logging.getLogger(__name__)
+
+"""
+조회수 버퍼링 (Redis 누적 + 주기적 DB 일괄 반영)
+
+Redis (model 은 "qna.question" 같은 label)
+    views:{model}:pending: 해시 (pk → 아직 DB 에 반영되지 않은 조회수)
+    views:{model}:flushing: 반영 중인 스냅샷 (pending 을 RENAME, 반영 실패 시 다음 주기에 재시도)
+    views:{model}:seen:{pk}:{viewer}: 중복 조회 방지 (VIEW_COUNT_DEDUP_SECONDS 동안 같은 사용자 / IP 는 1번만)
+
+viewer_from_request: 로그인 사용자 id → 없으면 IP
+record_view: 조회수 +1 을 Redis 에만 기록하고 반영 대기 중인 조회수(이번 조회 포함)를 반환 (요청 경로에서 DB 쓰기 없음)
+    - VIEW_COUNT_BUFFERED 가 꺼져 있거나(기본값, flush 할 celery beat 가 없는 환경) Redis 장애 시에는 DB 행에 바로 반영
+get_pending_views: 여러 행의 반영 대기 조회수 (목록 등에서 DB 값에 더해서 사용, 버퍼링이 꺼져 있으면 조회 X)
+apply_pending_views: 목록 페이지의 객체 view_count 에 반영 대기 조회수를 더함 (Redis 왕복 1번)
+flush_view_counts: (beat) 스냅샷을 batch 단위 UPDATE ... CASE 로 DB 에 더하고 삭제
+"""
+
+VIEW_COUNT_FIELD = "view_count"
+
+
+def _redis() -> Any:
+    return get_redis_connection("default")
+
+
+def _label(model: type[Model]) -> str:
+    return model._meta.label_lower
+
+
+def _pending_key(model: type[Model]) -> str:
+    return str(cache.make_key(f"views:{_label(model)}:pending"))
+
+
+def _flushing_key(model: type[Model]) -> str:
+    return str(cache.make_key(f"views:{_label(model)}:flushing"))
+
+
+def _seen_key(model: type[Model], pk: int, viewer: str) -> str:
+    return str(cache.make_key(f"views:{_label(model)}:seen:{pk}:{viewer}"))
+
+
+def _lock_key(model: type[Model]) -> str:
+    return str(cache.make_key(f"views:{_label(model)}:flush_lock"))
+
+
+def viewer_from_request(request: Request) -> str | None:
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"u{user.pk}"
+    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if forwarded_for:
+        return f"ip{forwarded_for.split(',')[0].strip()}"
+    remote_addr = request.META.get("REMOTE_ADDR")
+    return f"ip{remote_addr}" if remote_addr else None
+
+
+def record_view(model: type[Model], pk: int, *, viewer: str | None = None) -> int:
+    if not settings.VIEW_COUNT_BUFFERED:
+        model._default_manager.filter(pk=pk).update(**{VIEW_COUNT_FIELD: F(VIEW_COUNT_FIELD) + 1})
+        return 1
+
+    try:
+        redis = _redis()
+        counted = True
+        dedup_seconds = settings.VIEW_COUNT_DEDUP_SECONDS
+        if dedup_seconds > 0 and viewer:
+            counted = bool(redis.set(_seen_key(model, pk, viewer), 1, nx=True, ex=dedup_seconds))
+
+        pipeline = redis.pipeline(transaction=False)
+        if counted:
+            pipeline.hincrby(_pending_key(model), str(pk), 1)
+        else:
+            pipeline.hget(_pending_key(model), str(pk))
+        pipeline.hget(_flushing_key(model), str(pk))
+        pending, flushing = pipeline.execute()
+        return int(pending or 0) + int(flushing or 0)
+    except Exception as e:
+        logger.warning(f"View Counter Redis Error: {type(e).__name__}: {e}")
+
+    model._default_manager.filter(pk=pk).update(**{VIEW_COUNT_FIELD: F(VIEW_COUNT_FIELD) + 1})
+    return 1
+
+
+def get_pending_views(model: type[Model], pks: list[int]) -> dict[int, int]:
+    if not pks or not settings.VIEW_COUNT_BUFFERED:
+        return {}
+    fields = [str(pk) for pk in pks]
+    try:
+        pipeline = _redis().pipeline(transaction=False)
+        pipeline.hmget(_pending_key(model), fields)
+        pipeline.hmget(_flushing_key(model), fields)
+        pending, flushing = pipeline.execute()
+    except Exception as e:
+        logger.warning(f"View Counter Redis Error: {type(e).__name__}: {e}")
+        return {}
+    return {pk: int(p or 0) + int(f or 0) for pk, p, f in zip(pks, pending, flushing) if p or f}
+
+
+def apply_pending_views(model: type[Model], objects: Iterable[Model]) -> None:
+    objects = list(objects)
+    pending = get_pending_views(model, [obj.pk for obj in objects])
+    for obj in objects:
+        if obj.pk in pending:
+            setattr(obj, VIEW_COUNT_FIELD, getattr(obj, VIEW_COUNT_FIELD) + pending[obj.pk])
+
+
+def flush_view_counts(model: type[Model], batch_size: int | None = None) -> int:
+    batch_size = batch_size or settings.VIEW_COUNT_FLUSH_BATCH
+    redis = _redis()
+    # beat 작업이 겹쳐도 같은 스냅샷을 두 번 더하지 않도록
+    if not redis.set(_lock_key(model), 1, nx=True, ex=300):
+        return 0
+    try:
+        flushing_key = _flushing_key(model)
+        # 이전 주기에 반영하지 못한 스냅샷이 있으면 그것부터 처리
+        if not redis.exists(flushing_key):
+            if not redis.exists(_pending_key(model)):
+                return 0
+            redis.rename(_pending_key(model), flushing_key)
+
+        deltas = [(int(pk), int(delta)) for pk, delta in redis.hgetall(flushing_key).items() if int(delta) > 0]
+        with transaction.atomic():
+            for start in range(0, len(deltas), batch_size):
+                batch = deltas[start : start + batch_size]
+                increment = Case(
+                    *(When(pk=pk, then=Value(delta)) for pk, delta in batch),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+                model._default_manager.filter(pk__in=[pk for pk, _ in batch]).update(
+                    **{VIEW_COUNT_FIELD: F(VIEW_COUNT_FIELD) + increment}
+                )
+        redis.delete(flushing_key)
+        return len(deltas)
+    finally:
+        redis.delete(_lock_key(model))
+
+
+def flush_all_view_counts() -> int:
+    return sum(flush_view_counts(apps.get_model(label)) for label in settings.VIEW_COUNTER_MODELS)
@@ -5,3 +5,8 @@ DEPLOYMENT_SORT_OPTIONS = {
     "AVG_SCORE": "avg_score",
 }
 DEFAULT_DEPLOYMENT_SORT = DEPLOYMENT_SORT_OPTIONS["CREATED_AT"]
+# DeploymentStats 컬럼으로 정렬하는 항목
+STATS_SORT_FIELDS = (DEPLOYMENT_SORT_OPTIONS["SUBMIT_COUNT"], DEPLOYMENT_SORT_OPTIONS["AVG_SCORE"])
+
+# exam submission
+MAX_SUBMISSION_COUNT = 2
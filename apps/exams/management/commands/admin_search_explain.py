@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import date, timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import Exam, ExamDeployment, ExamSubmission
+from apps.exams.services.admin.admin_deployment_service import list_admin_deployments
+from apps.exams.services.admin.admin_submission_service import (
+    AdminSubmissionListParams,
+    build_admin_submission_query,
+)
+from apps.user.models import User
+
+"""
+관리자 검색 pg_trgm 인덱스 실행 계획 비교 (PostgreSQL 전용)
+
+하나의 트랜잭션 안에서
+    1. 수강생 --users 명 + 1인 1제출, 쪽지시험 --exams 개 + 1개씩 배포를 생성하고 ANALYZE
+    2. trigram 인덱스를 DROP 한 상태로 응시 내역 검색(닉네임 / 이름) / 배포 검색(시험명) EXPLAIN ANALYZE → Seq Scan
+    3. 인덱스를 다시 만든 뒤 같은 쿼리 EXPLAIN ANALYZE → Bitmap Index Scan
+을 출력하고 전부 롤백합니다. (운영 데이터 / 인덱스는 변경되지 않음)
+"""
+
+TRGM_INDEXES = {
+    "users_nickname_trgm_idx": ("users", "nickname"),
+    "users_name_trgm_idx": ("users", "name"),
+    "exams_title_trgm_idx": ("exams", "title"),
+}
+
+_FAMILY_NAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+_GIVEN_SYLLABLES = "민서준지현우예은도하윤수아연호진영태성경희"
+_EXAM_WORDS = ["Python", "Django", "ORM", "SQL", "HTTP", "Git", "Docker", "Redis", "자료구조", "알고리즘", "네트워크"]
+
+
+class Command(BaseCommand):
+    help = "pg_trgm 인덱스 유무에 따른 관리자 검색 쿼리 실행 계획을 비교합니다. (PostgreSQL, 데이터는 롤백)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=200_000, help="생성할 수강생 / 제출 수")
+        parser.add_argument("--exams", type=int, default=50_000, help="생성할 쪽지시험 / 배포 수")
+        parser.add_argument("--keyword", default="김서준", help="응시 내역 검색어 (닉네임 / 이름)")
+        parser.add_argument("--exam-keyword", default="Docker Redis", help="배포 검색어 (시험명)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL 에서만 실행할 수 있습니다.")
+
+        with transaction.atomic():
+            self._seed(options["users"], options["exams"])
+            cursor = connection.cursor()
+
+            submissions = build_admin_submission_query(AdminSubmissionListParams(search_keyword=options["keyword"]))[
+                :10
+            ]
+            deployments = list_admin_deployments(search_keyword=options["exam_keyword"])[:10]
+
+            for index_name in TRGM_INDEXES:
+                cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+            cursor.execute("ANALYZE users, exams, exam_submissions, exam_deployments")
+            self._explain("before: 인덱스 없음", submissions, deployments)
+
+            for index_name, (table, column) in TRGM_INDEXES.items():
+                cursor.execute(f"CREATE INDEX {index_name} ON {table} USING gin ({column} gin_trgm_ops)")
+            cursor.execute("ANALYZE users, exams")
+            self._explain("after: pg_trgm GIN 인덱스", submissions, deployments)
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS("완료 (생성한 데이터 / 인덱스 변경은 롤백됨)"))
+
+    def _seed(self, users: int, exams: int) -> None:
+        run = uuid.uuid4().hex[:6]
+        rng = random.Random(0)
+        now = timezone.now()
+
+        course = Course.objects.create(name="bench", tag="BN", description="bench")
+        cohort = Cohort.objects.create(
+            course=course, number=1, max_student=1, start_date=date.today(), end_date=date.today()
+        )
+        subject = Subject.objects.create(course=course, title=f"bench-{run}", number_of_days=1, number_of_hours=1)
+
+        students = User.objects.bulk_create(
+            (
+                User(
+                    email=f"bench-{run}-{i}@example.com",
+                    name=rng.choice(_FAMILY_NAMES) + "".join(rng.choices(_GIVEN_SYLLABLES, k=2)),
+                    nickname=f"{run}{i:x}",
+                    phone_number="010-0000-0000",
+                    gender="M",
+                    birthday=date(2000, 1, 1),
+                    password="!",
+                )
+                for i in range(users)
+            ),
+            batch_size=5000,
+        )
+        bench_exams = Exam.objects.bulk_create(
+            (
+                Exam(subject=subject, title=f"{rng.choice(_EXAM_WORDS)} {rng.choice(_EXAM_WORDS)} {i}")
+                for i in range(exams)
+            ),
+            batch_size=5000,
+        )
+        deployments = ExamDeployment.objects.bulk_create(
+            (
+                ExamDeployment(
+                    exam=exam,
+                    cohort=cohort,
+                    duration_time=60,
+                    access_code=f"{i:06x}"[-6:],
+                    open_at=now,
+                    close_at=now + timedelta(hours=1),
+                    questions_snapshot=[],
+                )
+                for i, exam in enumerate(bench_exams)
+            ),
+            batch_size=5000,
+        )
+        ExamSubmission.objects.bulk_create(
+            (
+                ExamSubmission(
+                    submitter=student,
+                    deployment=deployments[i % len(deployments)],
+                    started_at=now,
+                    answers=[],
+                    score=rng.randint(0, 100),
+                    correct_answer_count=0,
+                )
+                for i, student in enumerate(students)
+            ),
+            batch_size=5000,
+        )
+        self.stdout.write(f"seeded users={users} submissions={users} exams={exams} deployments={exams}")
+
+    def _explain(self, label: str, *querysets: QuerySet[Any]) -> None:
+        self.stdout.write(self.style.MIGRATE_HEADING(f"== {label}"))
+        for qs in querysets:
+            plan = qs.explain(analyze=True)
+            scans = [
+                line.strip()
+                for line in plan.splitlines()
+                if "trgm_idx" in line
+                or ("Scan" in line and any(f"on {table} " in f"{line} " for table in ("users", "exams")))
+            ]
+            self.stdout.write(f"[{qs.model.__name__}] {plan.splitlines()[-1].strip()}")
+            for line in scans:
+                self.stdout.write(f"    {line}")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import resource
+import time
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+from typing import Any
+
+from channels.layers import get_channel_layer  # type: ignore
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.exams.models import ExamDeployment
+from apps.exams.models.exam_deployment import DeploymentStatus
+from apps.exams.services.student.exam_status_channel import (
+    status_group_name,
+    stream_exam_status,
+)
+
+"""
+시험 상태 푸시 채널 부하 테스트 (유휴 구독자 N 명)
+
+하나의 이벤트 루프에서 --subscribers 개의 stream_exam_status 를 동시에 열어 --idle 초 동안 대기시킨 뒤
+관리자 비활성화와 같은 force_submit 메세지를 그룹에 한 번 보내고 아래 항목을 출력합니다.
+    - 구독 완료까지 걸린 시간, 유휴 대기 중 프로세스 최대 RSS 증가량
+    - force_submit 을 받은 구독자 수와 전달 지연 p50 / p99
+    - 같은 인원이 --poll-interval 초마다 상태 API 를 호출했다면 발생했을 DB 조회 수 (스트림은 유휴 중 DB 조회 없음)
+
+저장되지 않은 배포 객체를 사용하므로 DB 는 사용하지 않습니다. (channel layer 는 설정값 사용, --in-memory 로 대체 가능)
+"""
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = "유휴 구독자 N 명이 시험 상태 스트림을 구독한 상태에서 force_submit 푸시 전달 시간을 측정합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--subscribers", type=int, default=1000, help="동시 구독자 수")
+        parser.add_argument("--idle", type=float, default=5.0, help="푸시 전 유휴 대기 시간(초)")
+        parser.add_argument("--poll-interval", type=float, default=3.0, help="비교용 폴링 주기(초)")
+        parser.add_argument("--in-memory", action="store_true", help="InMemoryChannelLayer 로 실행")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["in_memory"]:
+            with override_settings(CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}):
+                asyncio.run(self._run(options))
+        else:
+            asyncio.run(self._run(options))
+
+    async def _run(self, options: dict[str, Any]) -> None:
+        subscribers: int = options["subscribers"]
+        idle: float = options["idle"]
+        # 다른 실행과 그룹이 겹치지 않도록 임의 id 사용
+        deployment_id = random.randint(10**9, 2 * 10**9)
+
+        subscribed = 0
+        all_subscribed = asyncio.Event()
+        received_at: list[float] = []
+
+        async def subscribe() -> None:
+            nonlocal subscribed
+            deployment = ExamDeployment(
+                id=deployment_id,
+                status=DeploymentStatus.ACTIVATED,
+                open_at=timezone.now() - timedelta(minutes=1),
+                close_at=timezone.now() + timedelta(hours=1),
+            )
+            stream: AsyncGenerator[str, None] = stream_exam_status(deployment)
+            async for event in stream:
+                if event.startswith(":"):
+                    continue
+                payload = json.loads(event.split("data: ", 1)[1])
+                if not payload["force_submit"]:
+                    subscribed += 1
+                    if subscribed == subscribers:
+                        all_subscribed.set()
+                else:
+                    received_at.append(time.perf_counter())
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        tasks = [asyncio.ensure_future(subscribe()) for _ in range(subscribers)]
+        await all_subscribed.wait()
+        subscribe_elapsed = time.perf_counter() - started
+
+        await asyncio.sleep(idle)
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        channel_layer = get_channel_layer()
+        pushed_at = time.perf_counter()
+        await channel_layer.group_send(
+            status_group_name(deployment_id),
+            {
+                "type": "exam.status",
+                "payload": {"exam_status": DeploymentStatus.DEACTIVATED, "force_submit": True, "close_at": None},
+            },
+        )
+        await asyncio.wait(tasks, timeout=30)
+        for task in tasks:
+            task.cancel()
+
+        latencies = [(t - pushed_at) * 1000 for t in received_at]
+        polling_queries = int(subscribers * idle / options["poll_interval"])
+        self.stdout.write(
+            f"subscribers={subscribers} subscribed_in={subscribe_elapsed:.2f}s "
+            f"max_rss_delta={(rss_after - rss_before) / 1024:.1f}MB "
+            f"idle={idle:.0f}s (polling every {options['poll_interval']:.0f}s would be {polling_queries} DB queries)"
+        )
+        if latencies:
+            self.stdout.write(
+                f"force_submit received={len(latencies)}/{subscribers} "
+                f"latency p50={_percentile(latencies, 50):.1f}ms p99={_percentile(latencies, 99):.1f}ms"
+            )
+        style = self.style.SUCCESS if len(latencies) == subscribers else self.style.ERROR
+        self.stdout.write(style(f"전달 완료: {len(latencies)}/{subscribers}"))
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any
+from unittest.mock import patch
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections, connection
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import Exam, ExamDeployment, ExamSubmissionIntake
+from apps.exams.models.exam_question import QuestionType
+from apps.exams.services.student.exam_submit_queue_service import (
+    process_submission_intake,
+)
+from apps.user.models import User
+from apps.user.models.user import RoleChoices
+
+"""
+시험 종료 직전 제출 몰림 벤치마크 (동기 채점 vs 대기열 제출)
+
+--students 명이 동시에 제출했을 때 제출 API 응답 시간 p50 / p95 / p99 를 출력하고 --target-p99-ms 와 비교합니다.
+    sync: 요청 안에서 채점 + ExamSubmission 생성 (기존 방식)
+    queue: intake 저장 후 202 (채점 작업 등록은 가짜로 대체, 이후 워커 처리 시간은 따로 출력)
+
+요청 스레드가 각자 DB 연결을 사용하므로 fixture 는 커밋 후 실행하고, 끝나면 삭제합니다.
+(sqlite 는 동시 쓰기 시 잠금이 발생하므로 PostgreSQL 환경에서 실행)
+"""
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = "동시 제출 상황에서 동기 채점 / 대기열 제출 모드의 제출 API 응답 시간을 측정합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--students", type=int, default=300, help="동시에 제출할 수강생 수")
+        parser.add_argument("--questions", type=int, default=20, help="시험 문항 수")
+        parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 스레드 수")
+        parser.add_argument("--mode", choices=["sync", "queue"], default="queue")
+        parser.add_argument("--target-p99-ms", type=float, default=100.0, help="목표 p99 응답 시간 (ms)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            self.stderr.write(f"{connection.vendor} 에서는 동시 쓰기가 직렬화되어 결과가 운영 환경과 다릅니다.")
+        deployment, students = self._create_fixtures(options["students"], options["questions"])
+        try:
+            with override_settings(EXAM_SUBMISSION_QUEUE_ENABLED=options["mode"] == "queue"):
+                self._run(deployment, students, options)
+        finally:
+            # Exam.subject 등 PROTECT 관계가 있어 역순으로 삭제
+            exam = deployment.exam
+            deployment.delete()
+            exam.delete()
+            exam.subject.delete()
+            deployment.cohort.delete()
+            exam.subject.course.delete()
+            User.objects.filter(id__in=[s.id for s in students]).delete()
+
+    def _create_fixtures(self, student_count: int, question_count: int) -> tuple[ExamDeployment, list[User]]:
+        suffix = uuid.uuid4().hex[:8]
+        course = Course.objects.create(name=f"submit-burst-{suffix}")
+        cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=student_count,
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=1),
+        )
+        subject = Subject.objects.create(
+            course=course, title=f"submit-burst-{suffix}", number_of_days=1, number_of_hours=1
+        )
+        exam = Exam.objects.create(subject=subject, title=f"submit-burst-{suffix}")
+        deployment = ExamDeployment.objects.create(
+            exam=exam,
+            cohort=cohort,
+            open_at=timezone.now() - timedelta(minutes=30),
+            close_at=timezone.now() + timedelta(minutes=30),
+            duration_time=3600,
+            access_code=suffix,
+            questions_snapshot=[
+                {"id": i, "type": QuestionType.SINGLE_CHOICE, "answer": "A", "point": 5} for i in range(question_count)
+            ],
+        )
+        students = [
+            User.objects.create_user(
+                email=f"submit-burst-{suffix}-{i}@example.com",
+                password="benchmark",
+                name="benchmark",
+                nickname=f"b{suffix}{i}",
+                birthday=date(2000, 1, 1),
+                role=RoleChoices.ST,
+            )
+            for i in range(student_count)
+        ]
+        return deployment, students
+
+    def _run(self, deployment: ExamDeployment, students: list[User], options: dict[str, Any]) -> None:
+        url = reverse("exam_submit")
+        payload = {
+            "deployment": deployment.id,
+            "started_at": (timezone.now() - timedelta(minutes=10)).isoformat(),
+            "cheating_count": 0,
+            "answers": [{"question_id": q["id"], "submitted_answer": ["A"]} for q in deployment.questions_snapshot],
+        }
+
+        def submit(student: User) -> tuple[float, int]:
+            client = APIClient()
+            client.force_authenticate(user=student)
+            started = time.perf_counter()
+            response = client.post(url, data=payload, format="json")
+            elapsed = (time.perf_counter() - started) * 1000
+            close_old_connections()
+            return elapsed, response.status_code
+
+        # 대기열 모드: 브로커 대신 등록된 intake 수만 확인
+        with patch("apps.exams.tasks.grade_submission_intake.delay"):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+                results = list(pool.map(submit, students))
+            wall = time.perf_counter() - started
+
+        durations = [ms for ms, _ in results]
+        codes: dict[int, int] = {}
+        for _, code in results:
+            codes[code] = codes.get(code, 0) + 1
+
+        self.stdout.write(f"mode={options['mode']} students={len(students)} concurrency={options['concurrency']}")
+        self.stdout.write(f"status codes: {codes}  wall={wall:.2f}s  throughput={len(students) / wall:.1f} req/s")
+        self.stdout.write(f"{'':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'mean':>10}")
+        self.stdout.write(
+            f"{'ms':>8}{_percentile(durations, 50):>10.1f}{_percentile(durations, 95):>10.1f}"
+            f"{_percentile(durations, 99):>10.1f}{statistics.fmean(durations):>10.1f}"
+        )
+        p99 = _percentile(durations, 99)
+        verdict = "PASS" if p99 < options["target_p99_ms"] else "FAIL"
+        self.stdout.write(f"p99 {p99:.1f} ms / target {options['target_p99_ms']:.0f} ms: {verdict}")
+
+        if options["mode"] == "queue":
+            intake_ids = list(ExamSubmissionIntake.objects.filter(deployment=deployment).values_list("id", flat=True))
+            started = time.perf_counter()
+            for intake_id in intake_ids:
+                process_submission_intake(intake_id)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"worker drain: {len(intake_ids)} intakes in {elapsed:.2f}s (single worker)")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.exams.models import ExamDeployment
+from apps.exams.services.deployment_stats import rebuild_deployment_stats
+
+"""
+배포별 제출 통계(DeploymentStats) 재계산
+
+    python manage.py rebuild_deployment_stats            # 전체 배포
+    python manage.py rebuild_deployment_stats 3 7        # 지정한 배포만
+"""
+
+
+class Command(BaseCommand):
+    help = "제출 내역으로 배포별 통계(제출 수, 평균/최소/최대 점수, 점수 분포, 문항별 정답률)를 다시 계산합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("deployment_ids", nargs="*", type=int, help="재계산할 배포 id (없으면 전체)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        queryset = ExamDeployment.objects.order_by("id")
+        if options["deployment_ids"]:
+            queryset = queryset.filter(id__in=options["deployment_ids"])
+
+        count = 0
+        for deployment_id in queryset.values_list("id", flat=True).iterator():
+            stats = rebuild_deployment_stats(deployment_id)
+            count += 1
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"deployment={deployment_id} submit_count={stats.submit_count} avg_score={stats.avg_score:.1f}"
+                )
+        self.stdout.write(f"rebuilt stats for {count} deployments")
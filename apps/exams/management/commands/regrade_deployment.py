@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.exams.models import ExamDeployment
+from apps.exams.services.admin.admin_regrade_service import regrade_deployment
+
+"""
+배포 제출 내역 일괄 재채점
+
+    python manage.py regrade_deployment <deployment_id> --dry-run
+    python manage.py regrade_deployment <deployment_id> --workers 4
+    python manage.py regrade_deployment <deployment_id> --after-id 12000   # 실패한 실행 이어서 (로그의 after_id)
+"""
+
+
+class Command(BaseCommand):
+    help = "배포 스냅샷을 현재 문항 정답 기준으로 갱신하고 해당 배포의 제출 내역을 다시 채점합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("deployment_id", type=int)
+        parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 변경 내역만 출력")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 읽고 저장할 제출 내역 수")
+        parser.add_argument("--workers", type=int, default=1, help="채점 프로세스 수 (1 이면 현재 프로세스에서 채점)")
+        parser.add_argument("--samples", type=int, default=20, help="출력할 변경 내역 수")
+        parser.add_argument("--after-id", type=int, default=0, help="이 id 다음 제출 내역부터 재채점")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        deployment = ExamDeployment.objects.filter(id=options["deployment_id"]).first()
+        if deployment is None:
+            raise CommandError(f"deployment {options['deployment_id']} not found")
+
+        report = regrade_deployment(
+            deployment,
+            dry_run=options["dry_run"],
+            chunk_size=options["chunk_size"],
+            workers=options["workers"],
+            sample_limit=options["samples"],
+            after_id=options["after_id"],
+        )
+
+        self.stdout.write(
+            f"deployment={report.deployment_id} dry_run={report.dry_run} "
+            f"changed_questions={report.changed_question_ids}"
+        )
+        self.stdout.write(
+            f"scanned={report.scanned} changed={report.changed} "
+            f"score_delta={report.score_delta:+d} last_saved_id={report.last_saved_id} elapsed={report.elapsed_ms}ms"
+        )
+        for diff in report.samples:
+            self.stdout.write(
+                f"  submission={diff.submission_id} score {diff.score[0]}->{diff.score[1]} "
+                f"correct {diff.correct_answer_count[0]}->{diff.correct_answer_count[1]} "
+                f"flipped={diff.flipped_question_ids}"
+            )
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exams", "0003_alter_examquestion_explanation"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExamSubmissionIntake",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("started_at", models.DateTimeField()),
+                ("cheating_count", models.PositiveSmallIntegerField(default=0)),
+                ("answers", models.JSONField(help_text="채점 전 제출 답안 원본(JSON)")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "채점 대기"),
+                            ("graded", "채점 완료"),
+                            ("rejected", "제출 거부"),
+                            ("failed", "채점 실패"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("error", models.CharField(blank=True, default="", max_length=255)),
+                (
+                    "deployment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="submission_intakes",
+                        to="exams.examdeployment",
+                    ),
+                ),
+                (
+                    "submission",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="intake",
+                        to="exams.examsubmission",
+                    ),
+                ),
+                (
+                    "submitter",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exam_submission_intakes",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Exam Submission Intake",
+                "verbose_name_plural": "Exam Submission Intakes",
+                "db_table": "exam_submission_intakes",
+                "indexes": [models.Index(fields=["status", "updated_at"], name="exam_submis_status_d03cbb_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import apps.exams.models.deployment_stats
+
+
+def backfill_deployment_stats(apps, schema_editor):
+    # 기존 배포의 통계 행 생성 (services.deployment_stats.rebuild_deployment_stats 와 같은 계산)
+    ExamDeployment = apps.get_model("exams", "ExamDeployment")
+    ExamSubmission = apps.get_model("exams", "ExamSubmission")
+    DeploymentStats = apps.get_model("exams", "DeploymentStats")
+
+    for deployment_id in ExamDeployment.objects.values_list("id", flat=True).iterator():
+        histogram = [0] * 11
+        question_stats = {}
+        submitters = set()
+        scores = []
+        rows = ExamSubmission.objects.filter(deployment_id=deployment_id).values_list(
+            "submitter_id", "score", "answers"
+        )
+        for submitter_id, score, answers in rows.iterator(chunk_size=2000):
+            submitters.add(submitter_id)
+            scores.append(score)
+            histogram[min(score // 10, 10)] += 1
+            for answer in answers or []:
+                answered, correct = question_stats.get(str(answer["question_id"]), (0, 0))
+                question_stats[str(answer["question_id"])] = [
+                    answered + 1,
+                    correct + int(bool(answer.get("is_correct"))),
+                ]
+
+        DeploymentStats.objects.create(
+            deployment_id=deployment_id,
+            submit_count=len(scores),
+            submitter_count=len(submitters),
+            score_sum=sum(scores),
+            avg_score=sum(scores) / len(scores) if scores else 0.0,
+            min_score=min(scores, default=None),
+            max_score=max(scores, default=None),
+            score_histogram=histogram,
+            question_stats=question_stats,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exams", "0004_examsubmissionintake"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeploymentStats",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "deployment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="exams.examdeployment",
+                    ),
+                ),
+                ("submit_count", models.PositiveIntegerField(default=0)),
+                ("submitter_count", models.PositiveIntegerField(default=0)),
+                ("score_sum", models.PositiveBigIntegerField(default=0)),
+                ("avg_score", models.FloatField(default=0.0)),
+                ("min_score", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("max_score", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("score_histogram", models.JSONField(default=apps.exams.models.deployment_stats.empty_score_histogram)),
+                ("question_stats", models.JSONField(default=dict)),
+            ],
+            options={
+                "verbose_name": "Exam Deployment Stats",
+                "verbose_name_plural": "Exam Deployment Stats",
+                "db_table": "exam_deployment_stats",
+                "indexes": [
+                    models.Index(fields=["avg_score"], name="exam_deploy_avg_sco_83109a_idx"),
+                    models.Index(fields=["submit_count"], name="exam_deploy_submit__02a9fa_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_deployment_stats, migrations.RunPython.noop),
+    ]
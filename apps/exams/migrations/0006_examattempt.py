@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exams", "0005_deploymentstats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExamAttempt",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("started_at", models.DateTimeField()),
+                ("cheating_count", models.PositiveSmallIntegerField(default=0)),
+                ("answers", models.JSONField(default=dict, help_text="작성 중 답안(JSON)")),
+                ("version", models.PositiveIntegerField(default=0)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("in_progress", "응시 중"), ("submitted", "제출 완료")],
+                        default="in_progress",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "deployment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="attempts", to="exams.examdeployment"
+                    ),
+                ),
+                (
+                    "submission",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="attempt",
+                        to="exams.examsubmission",
+                    ),
+                ),
+                (
+                    "submitter",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exam_attempts",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Exam Attempt",
+                "verbose_name_plural": "Exam Attempts",
+                "db_table": "exam_attempts",
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("status", "in_progress")),
+                        fields=("deployment", "submitter"),
+                        name="uniq_exam_attempt_in_progress",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exams", "0007_exam_title_trgm_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examsubmissionintake",
+            name="attempt",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="submission_intakes",
+                to="exams.examattempt",
+            ),
+        ),
+        migrations.AddField(
+            model_name="examsubmissionintake",
+            name="attempt_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
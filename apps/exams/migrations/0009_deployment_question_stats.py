@@ -0,0 +1,135 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_score_buckets_and_question_stats(apps, schema_editor):
+    # 점수 구간 컬럼 / 문항 행을 제출 내역으로 채움 (JSON 컬럼은 beat 재계산 전이면 최신이 아닐 수 있음)
+    DeploymentStats = apps.get_model("exams", "DeploymentStats")
+    DeploymentQuestionStats = apps.get_model("exams", "DeploymentQuestionStats")
+    ExamSubmission = apps.get_model("exams", "ExamSubmission")
+
+    for stats in DeploymentStats.objects.iterator(chunk_size=500):
+        histogram = [0] * 11
+        questions = {}
+        rows = ExamSubmission.objects.filter(deployment_id=stats.deployment_id).values_list("score", "answers")
+        for score, answers in rows.iterator(chunk_size=2000):
+            histogram[min(score // 10, 10)] += 1
+            for answer in answers or []:
+                counts = questions.setdefault(answer["question_id"], [0, 0])
+                counts[0] += 1
+                counts[1] += int(bool(answer.get("is_correct")))
+
+        for index, count in enumerate(histogram):
+            setattr(stats, f"score_bucket_{index}", count)
+        stats.save(update_fields=[f"score_bucket_{index}" for index in range(11)])
+        DeploymentQuestionStats.objects.bulk_create(
+            DeploymentQuestionStats(
+                stats_id=stats.deployment_id,
+                question_id=question_id,
+                answered_count=answered,
+                correct_count=correct,
+            )
+            for question_id, (answered, correct) in questions.items()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exams", "0008_examsubmissionintake_attempt"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_0",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_1",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_2",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_3",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_4",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_5",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_6",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_7",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_8",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_9",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="deploymentstats",
+            name="score_bucket_10",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="DeploymentQuestionStats",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("question_id", models.PositiveIntegerField()),
+                ("answered_count", models.PositiveIntegerField(default=0)),
+                ("correct_count", models.PositiveIntegerField(default=0)),
+                (
+                    "stats",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="questions",
+                        to="exams.deploymentstats",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Exam Deployment Question Stats",
+                "verbose_name_plural": "Exam Deployment Question Stats",
+                "db_table": "exam_deployment_question_stats",
+                "ordering": ["question_id"],
+                "constraints": [
+                    models.UniqueConstraint(fields=("stats", "question_id"), name="uniq_deployment_question_stats")
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_score_buckets_and_question_stats, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="deploymentstats",
+            name="question_stats",
+        ),
+        migrations.RemoveField(
+            model_name="deploymentstats",
+            name="score_histogram",
+        ),
+    ]
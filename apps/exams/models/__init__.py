@@ -1,13 +1,28 @@
+from apps.exams.models.deployment_stats import (
+    DeploymentQuestionStats,
+    DeploymentStats,
+)
 from apps.exams.models.exam import Exam
+from apps.exams.models.exam_attempt import AttemptStatus, ExamAttempt
 from apps.exams.models.exam_deployment import DeploymentStatus, ExamDeployment
 from apps.exams.models.exam_question import ExamQuestion, QuestionType
 from apps.exams.models.exam_submission import ExamSubmission
+from apps.exams.models.exam_submission_intake import (
+    ExamSubmissionIntake,
+    SubmissionIntakeStatus,
+)
 
 __all__ = [
+    "DeploymentQuestionStats",
+    "DeploymentStats",
     "Exam",
+    "ExamAttempt",
+    "AttemptStatus",
     "ExamDeployment",
     "ExamQuestion",
     "ExamSubmission",
+    "ExamSubmissionIntake",
+    "SubmissionIntakeStatus",
     "DeploymentStatus",
     "QuestionType",
 ]
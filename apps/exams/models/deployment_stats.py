@@ -0,0 +1,125 @@
+from typing import Any
+
+from django.db import models
+
+from apps.core.models import TimeStampedModel
+
+# 점수 분포 구간 (10점 단위, 마지막 구간은 100점 이상)
+SCORE_HISTOGRAM_BUCKET = 10
+SCORE_HISTOGRAM_SIZE = 11
+
+
+# 마이그레이션 0005 (score_histogram JSON 컬럼 기본값) 에서 참조
+def empty_score_histogram() -> list[int]:
+    return [0] * SCORE_HISTOGRAM_SIZE
+
+
+def score_bucket_field(index: int) -> str:
+    return f"score_bucket_{index}"
+
+
+class DeploymentStats(TimeStampedModel):
+    """
+    배포별 제출 통계 (집계 결과 저장)
+    - 제출 생성 시 F() UPDATE 로 증분 갱신 (점수 분포 포함), 재채점 / 제출 삭제 시 재계산 (rebuild_deployment_stats 커맨드로도 재계산 가능)
+    - 문항별 통계는 DeploymentQuestionStats 행으로 저장
+    - 어드민 배포 목록 / 상세 조회에서 제출 내역 집계 JOIN 없이 사용
+    """
+
+    deployment = models.OneToOneField(
+        "exams.ExamDeployment",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+
+    # 제출 건수
+    submit_count = models.PositiveIntegerField(default=0)
+
+    # 제출한 수강생 수 (중복 제외)
+    submitter_count = models.PositiveIntegerField(default=0)
+
+    score_sum = models.PositiveBigIntegerField(default=0)
+
+    avg_score = models.FloatField(default=0.0)
+
+    min_score = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    max_score = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    # 10점 단위 구간별 제출 수 (score_bucket_0: 0~9, ..., score_bucket_9: 90~99, score_bucket_10: 100~)
+    # 구간마다 컬럼을 두어 제출 시 같은 UPDATE 안에서 F() + 1 로 갱신
+    score_bucket_0 = models.PositiveIntegerField(default=0)
+    score_bucket_1 = models.PositiveIntegerField(default=0)
+    score_bucket_2 = models.PositiveIntegerField(default=0)
+    score_bucket_3 = models.PositiveIntegerField(default=0)
+    score_bucket_4 = models.PositiveIntegerField(default=0)
+    score_bucket_5 = models.PositiveIntegerField(default=0)
+    score_bucket_6 = models.PositiveIntegerField(default=0)
+    score_bucket_7 = models.PositiveIntegerField(default=0)
+    score_bucket_8 = models.PositiveIntegerField(default=0)
+    score_bucket_9 = models.PositiveIntegerField(default=0)
+    score_bucket_10 = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "exam_deployment_stats"
+        verbose_name = "Exam Deployment Stats"
+        verbose_name_plural = "Exam Deployment Stats"
+        indexes = [
+            # 어드민 배포 목록 정렬
+            models.Index(fields=["avg_score"]),
+            models.Index(fields=["submit_count"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Stats for deployment {self.deployment_id} ({self.submit_count} submissions)"
+
+    # [0~9, 10~19, ..., 90~99, 100~]
+    @property
+    def score_histogram(self) -> list[int]:
+        return [getattr(self, score_bucket_field(index)) for index in range(SCORE_HISTOGRAM_SIZE)]
+
+    @property
+    def question_correct_rates(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "question_id": question.question_id,
+                "answered_count": question.answered_count,
+                "correct_count": question.correct_count,
+                "correct_rate": (
+                    round(question.correct_count / question.answered_count, 4) if question.answered_count else 0.0
+                ),
+            }
+            for question in self.questions.all()
+        ]
+
+
+class DeploymentQuestionStats(models.Model):
+    """
+    배포 문항별 응답 / 정답 수 (DeploymentStats 와 함께 제출 시 F() UPDATE 로 증분 갱신)
+    - question_id 는 배포 시점 문항 스냅샷(questions_snapshot)의 id
+    """
+
+    stats = models.ForeignKey(
+        DeploymentStats,
+        on_delete=models.CASCADE,
+        related_name="questions",
+    )
+
+    question_id = models.PositiveIntegerField()
+
+    answered_count = models.PositiveIntegerField(default=0)
+
+    correct_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "exam_deployment_question_stats"
+        verbose_name = "Exam Deployment Question Stats"
+        verbose_name_plural = "Exam Deployment Question Stats"
+        ordering = ["question_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["stats", "question_id"], name="uniq_deployment_question_stats"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Question {self.question_id} stats for deployment {self.stats_id}"
@@ -27,6 +27,7 @@ class Exam(TimeStampedModel):
 
     class Meta:
         db_table = "exams"
+        # title 의 pg_trgm GIN 인덱스는 마이그레이션(0007_exam_title_trgm_index)에서 PostgreSQL 에만 생성
         verbose_name = "Exam"
         verbose_name_plural = "Exams"
 
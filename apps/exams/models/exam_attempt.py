@@ -0,0 +1,70 @@
+from django.db import models
+
+from apps.core.models import TimeStampedModel
+
+
+class AttemptStatus(models.TextChoices):
+    IN_PROGRESS = "in_progress", "응시 중"
+    SUBMITTED = "submitted", "제출 완료"
+
+
+class ExamAttempt(TimeStampedModel):
+    """
+    응시 세션 (제출 전 작성 중인 답안 체크포인트)
+    - 참가 코드 검증 시 생성되어 started_at 을 서버에서 기록
+    - 작성 중 답안 / 부정행위 횟수는 Redis 에 누적되고, 주기적으로 이 행에 일괄 저장 (version 이 더 큰 경우만)
+    - 최종 제출 시 작성 중 답안으로 ExamSubmission 을 만들고 submitted 로 변경
+    """
+
+    submitter = models.ForeignKey(
+        "user.User",
+        on_delete=models.CASCADE,
+        related_name="exam_attempts",
+    )
+
+    deployment = models.ForeignKey(
+        "exams.ExamDeployment",
+        on_delete=models.CASCADE,
+        related_name="attempts",
+    )
+
+    started_at = models.DateTimeField()
+
+    cheating_count = models.PositiveSmallIntegerField(default=0)
+
+    # {question_id: submitted_answer}
+    answers = models.JSONField(default=dict, help_text="작성 중 답안(JSON)")
+
+    # Redis 에 적용된 patch 수 (체크포인트가 최신인지 비교)
+    version = models.PositiveIntegerField(default=0)
+
+    status = models.CharField(
+        max_length=16,
+        choices=AttemptStatus.choices,
+        default=AttemptStatus.IN_PROGRESS,
+    )
+
+    # 제출 완료 시 생성된 제출 내역
+    submission = models.OneToOneField(
+        "exams.ExamSubmission",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="attempt",
+    )
+
+    class Meta:
+        db_table = "exam_attempts"
+        verbose_name = "Exam Attempt"
+        verbose_name_plural = "Exam Attempts"
+        constraints = [
+            # 배포 / 수강생별 응시 중인 세션은 하나
+            models.UniqueConstraint(
+                fields=["deployment", "submitter"],
+                condition=models.Q(status="in_progress"),
+                name="uniq_exam_attempt_in_progress",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Attempt {self.pk} ({self.status}) by {self.submitter_id} on deployment {self.deployment_id}"
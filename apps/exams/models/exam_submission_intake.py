@@ -0,0 +1,77 @@
+from django.db import models
+
+from apps.core.models import TimeStampedModel
+
+
+class SubmissionIntakeStatus(models.TextChoices):
+    PENDING = "pending", "채점 대기"
+    GRADED = "graded", "채점 완료"
+    REJECTED = "rejected", "제출 거부"
+    FAILED = "failed", "채점 실패"
+
+
+class ExamSubmissionIntake(TimeStampedModel):
+    """
+    (대기열 제출 모드) 채점 전 원본 제출 답안
+    - 요청에서는 검증 후 이 행 하나만 저장하고, 채점 + ExamSubmission 생성은 Celery 워커에서 처리
+    - 프론트엔드는 status 를 폴링하다가 graded 가 되면 submission 결과 페이지로 이동
+    """
+
+    submitter = models.ForeignKey(
+        "user.User",
+        on_delete=models.CASCADE,
+        related_name="exam_submission_intakes",
+    )
+
+    deployment = models.ForeignKey(
+        "exams.ExamDeployment",
+        on_delete=models.CASCADE,
+        related_name="submission_intakes",
+    )
+
+    # 응시 세션에서 제출한 경우: 채점 완료 시 이 세션을 종료 (version 은 제출 시점의 Redis 상태 기준)
+    attempt = models.ForeignKey(
+        "exams.ExamAttempt",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="submission_intakes",
+    )
+
+    attempt_version = models.PositiveIntegerField(default=0)
+
+    started_at = models.DateTimeField()
+
+    cheating_count = models.PositiveSmallIntegerField(default=0)
+
+    answers = models.JSONField(help_text="채점 전 제출 답안 원본(JSON)")
+
+    status = models.CharField(
+        max_length=16,
+        choices=SubmissionIntakeStatus.choices,
+        default=SubmissionIntakeStatus.PENDING,
+    )
+
+    # 채점 완료 시 생성된 제출 내역
+    submission = models.OneToOneField(
+        "exams.ExamSubmission",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="intake",
+    )
+
+    # 거부/실패 사유
+    error = models.CharField(max_length=255, blank=True, default="")
+
+    class Meta:
+        db_table = "exam_submission_intakes"
+        verbose_name = "Exam Submission Intake"
+        verbose_name_plural = "Exam Submission Intakes"
+        indexes = [
+            # 유실된 대기열 메세지 재등록 (status=pending 이면서 오래 갱신되지 않은 행)
+            models.Index(fields=["status", "updated_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Intake {self.pk} ({self.status}) by {self.submitter_id} on deployment {self.deployment_id}"
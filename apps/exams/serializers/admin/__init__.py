@@ -1,9 +1,12 @@
 from apps.exams.serializers.admin.admin_deployment_serializer import (
     AdminDeploymentCreateResponseSerializer,
     AdminDeploymentDetailResponseSerializer,
+    AdminDeploymentItemAnalysisResponseSerializer,
     AdminDeploymentListResponseSerializer,
     AdminDeploymentPatchSerializer,
     AdminDeploymentPostSerializer,
+    AdminDeploymentRegradeResponseSerializer,
+    AdminDeploymentRegradeSerializer,
     AdminDeploymentStatusPatchSerializer,
     AdminDeploymentUpdateResponseSerializer,
     DeploymentListItemSerializer,
@@ -31,4 +34,7 @@ __all__ = [
     "AdminDeploymentDetailResponseSerializer",
     "AdminDeploymentUpdateResponseSerializer",
     "AdminDeploymentStatusPatchSerializer",
+    "AdminDeploymentRegradeSerializer",
+    "AdminDeploymentRegradeResponseSerializer",
+    "AdminDeploymentItemAnalysisResponseSerializer",
 ]
@@ -1,9 +1,10 @@
 from typing import Any, Dict, cast
 
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from apps.courses.models.cohorts_models import Cohort
-from apps.exams.models import Exam, ExamDeployment
+from apps.exams.models import DeploymentStats, Exam, ExamDeployment
 from apps.exams.models.exam_deployment import DeploymentStatus
 from apps.exams.services.admin.validators.deployment_validator import (
     DeploymentValidator,
@@ -205,14 +206,47 @@ class AdminDeploymentListResponseSerializer(serializers.Serializer[Any]):
     results = DeploymentListItemSerializer(many=True)
 
 
+class QuestionCorrectRateSerializer(serializers.Serializer[Any]):
+    question_id = serializers.IntegerField()
+    answered_count = serializers.IntegerField()
+    correct_count = serializers.IntegerField()
+    correct_rate = serializers.FloatField()
+
+
+class DeploymentStatsResponseSerializer(serializers.ModelSerializer[DeploymentStats]):
+    """
+    배포 제출 통계
+    - score_histogram: 10점 단위 구간별 제출 수 [0~9, 10~19, ..., 100~]
+    """
+
+    question_correct_rates = QuestionCorrectRateSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = DeploymentStats
+        fields = [
+            "submit_count",
+            "avg_score",
+            "min_score",
+            "max_score",
+            "score_histogram",
+            "question_correct_rates",
+        ]
+
+
 # 배포 디테일 응답
 class AdminDeploymentDetailResponseSerializer(DeploymentResponseSerializer):
     exam = ExamResponseSerializer()
     subject = SubjectResponseSerializer(source="exam.subject")
+    stats = serializers.SerializerMethodField()
 
     class Meta:
         model = ExamDeployment
-        fields = DeploymentResponseSerializer.Meta.fields + ["exam", "subject"]
+        fields = DeploymentResponseSerializer.Meta.fields + ["exam", "subject", "stats"]
+
+    @extend_schema_field(DeploymentStatsResponseSerializer(allow_null=True))
+    def get_stats(self, obj: ExamDeployment) -> dict[str, Any] | None:
+        stats = getattr(obj, "stats", None)
+        return DeploymentStatsResponseSerializer(stats).data if stats is not None else None
 
 
 # 배포 수정 응답
@@ -222,3 +256,66 @@ class AdminDeploymentUpdateResponseSerializer(serializers.Serializer[Any]):
     open_at = serializers.DateTimeField(format="%Y-%m-%d %H:%M:%S")
     close_at = serializers.DateTimeField(format="%Y-%m-%d %H:%M:%S")
     updated_at = serializers.DateTimeField(format="%Y-%m-%d %H:%M:%S")
+
+
+class AdminDeploymentRegradeSerializer(serializers.Serializer[Any]):
+    """
+    배포 재채점 요청 검증용 시리얼라이저
+    - dry_run: 저장하지 않고 변경 내역만 확인
+    """
+
+    dry_run = serializers.BooleanField(default=False)
+
+
+class AdminRegradeDiffSerializer(serializers.Serializer[Any]):
+    submission_id = serializers.IntegerField()
+    score = serializers.ListField(child=serializers.IntegerField())
+    correct_answer_count = serializers.ListField(child=serializers.IntegerField())
+    flipped_question_ids = serializers.ListField(child=serializers.IntegerField())
+
+
+class AdminDeploymentRegradeResponseSerializer(serializers.Serializer[Any]):
+    """
+    배포 재채점 결과 응답 시리얼라이저
+    - score / correct_answer_count: [이전 값, 재채점 값]
+    """
+
+    deployment_id = serializers.IntegerField()
+    dry_run = serializers.BooleanField()
+    changed_question_ids = serializers.ListField(child=serializers.IntegerField())
+    scanned = serializers.IntegerField()
+    changed = serializers.IntegerField()
+    score_delta = serializers.IntegerField()
+    elapsed_ms = serializers.IntegerField()
+    samples = AdminRegradeDiffSerializer(many=True)
+
+
+class ItemOptionCountSerializer(serializers.Serializer[Any]):
+    option = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class ItemAnalysisQuestionSerializer(serializers.Serializer[Any]):
+    question_id = serializers.IntegerField()
+    type = serializers.CharField(allow_null=True)
+    point = serializers.IntegerField(allow_null=True)
+    answered_count = serializers.IntegerField()
+    correct_count = serializers.IntegerField()
+    correct_rate = serializers.FloatField()
+    upper_correct_rate = serializers.FloatField()
+    lower_correct_rate = serializers.FloatField()
+    discrimination = serializers.FloatField()
+    option_counts = ItemOptionCountSerializer(many=True)
+
+
+class AdminDeploymentItemAnalysisResponseSerializer(serializers.Serializer[Any]):
+    """
+    배포 문항 분석 응답 시리얼라이저
+    - group_size: 상위 / 하위 27% 집단 인원
+    - discrimination: 상위 27% 정답률 - 하위 27% 정답률
+    """
+
+    deployment_id = serializers.IntegerField()
+    submit_count = serializers.IntegerField()
+    group_size = serializers.IntegerField()
+    questions = ItemAnalysisQuestionSerializer(many=True)
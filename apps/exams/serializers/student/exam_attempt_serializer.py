@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Any
+
+from rest_framework import serializers
+
+from apps.exams.serializers.student.exam_submit_serializer import AnswerSerializer
+
+
+class ExamAttemptPatchSerializer(serializers.Serializer[Any]):
+    """
+    응시 중 답안 자동 저장 요청 serializer (변경된 문항만 전송)
+    """
+
+    answers = AnswerSerializer(many=True, required=False, default=list)
+    cheating_count_delta = serializers.IntegerField(min_value=0, max_value=100, required=False, default=0)
+
+
+class ExamAttemptAnswerSerializer(serializers.Serializer[Any]):
+    question_id = serializers.IntegerField()
+    submitted_answer = serializers.ListField(child=serializers.CharField())
+
+
+class ExamAttemptSerializer(serializers.Serializer[Any]):
+    """
+    응시 중 세션 상태 응답 serializer
+    """
+
+    attempt_id = serializers.IntegerField()
+    started_at = serializers.DateTimeField()
+    cheating_count = serializers.IntegerField()
+    version = serializers.IntegerField()
+    answers = ExamAttemptAnswerSerializer(many=True, source="answer_list")
@@ -7,6 +7,7 @@ from django.utils import timezone
 from rest_framework import serializers
 
 from apps.exams.models.exam_submission import ExamSubmission
+from apps.exams.models.exam_submission_intake import ExamSubmissionIntake
 
 
 class AnswerSerializer(serializers.Serializer[Any]):
@@ -19,8 +20,8 @@ class ExamSubmissionCreateSerializer(serializers.ModelSerializer[ExamSubmission]
     수강생 쪽지시험 제출 요청용 serializer
     """
 
-    # 정답
-    answers = AnswerSerializer(many=True, write_only=True)
+    # 정답 (응시 세션이 있으면 마지막 변경분만 보내도 됨 → 작성 중 답안과 합쳐서 제출)
+    answers = AnswerSerializer(many=True, write_only=True, required=False)
 
     class Meta:
         model = ExamSubmission
@@ -31,6 +32,8 @@ class ExamSubmissionCreateSerializer(serializers.ModelSerializer[ExamSubmission]
             "cheating_count",
             "answers",
         ]
+        # 응시 세션이 있으면 서버에 기록된 값 사용
+        extra_kwargs = {"started_at": {"required": False}}
 
     def validate_started_at(self, value: datetime) -> datetime:
         now = timezone.now()
@@ -39,3 +42,22 @@ class ExamSubmissionCreateSerializer(serializers.ModelSerializer[ExamSubmission]
             raise serializers.ValidationError("시작시간은 현재 시간보다 빨라야합니다.")
 
         return value
+
+
+class ExamSubmissionIntakeSerializer(serializers.ModelSerializer[ExamSubmissionIntake]):
+    """
+    (대기열 제출 모드) 제출 접수 / 채점 상태 응답용 serializer
+    """
+
+    intake_id = serializers.IntegerField(source="id", read_only=True)
+    submission_id = serializers.IntegerField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = ExamSubmissionIntake
+        fields = [
+            "intake_id",
+            "status",
+            "submission_id",
+            "error",
+        ]
+        read_only_fields = fields
@@ -3,20 +3,29 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from django.db import transaction
-from django.db.models import Avg, Count, FloatField, QuerySet, Value
-from django.db.models.functions import Coalesce
+from django.db.models import Count, F, FloatField, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 from rest_framework.exceptions import NotFound
 
 from apps.core.utils.base62 import Base62
+from apps.core.utils.search import trigram_search_q
 from apps.courses.models import Cohort
-from apps.exams.constants import DEFAULT_DEPLOYMENT_SORT, DEPLOYMENT_SORT_OPTIONS
+from apps.exams.constants import (
+    DEFAULT_DEPLOYMENT_SORT,
+    DEPLOYMENT_SORT_OPTIONS,
+    STATS_SORT_FIELDS,
+)
 from apps.exams.exceptions import DeploymentConflictException
-from apps.exams.models import Exam, ExamDeployment
+from apps.exams.models import DeploymentStats, Exam, ExamDeployment, ExamQuestion
 from apps.exams.models.exam_deployment import DeploymentStatus
 from apps.exams.services.admin.validators.deployment_validator import (
     DeploymentValidator,
 )
+from apps.exams.services.grading_plan import invalidate_grading_plan
+from apps.exams.services.student.exam_paper_cache import invalidate_exam_paper
+from apps.exams.services.student.exam_status_channel import publish_exam_status
+from apps.user.models import CohortStudent
 
 
 # 시험 배포 목록 조회 -------------------------------------------------------
@@ -30,15 +39,12 @@ def list_admin_deployments(
     order: str = "desc",
 ) -> QuerySet[ExamDeployment]:
 
+    # 제출 수 / 평균 점수는 DeploymentStats 에서 조회 (제출 내역 집계 JOIN 없음)
     qs: QuerySet[ExamDeployment] = ExamDeployment.objects.select_related(
         "exam", "exam__subject", "cohort", "cohort__course"
     ).annotate(
-        submit_count=Count("submissions", distinct=True),
-        avg_score=Coalesce(
-            Avg("submissions__score"),
-            Value(0.0),
-            output_field=FloatField(),
-        ),
+        submit_count=Coalesce(F("stats__submit_count"), Value(0)),
+        avg_score=Coalesce(F("stats__avg_score"), Value(0.0), output_field=FloatField()),
     )
 
     # 기수 필터
@@ -51,9 +57,9 @@ def list_admin_deployments(
     if subject_id is not None:
         qs = qs.filter(exam__subject_id=subject_id)
 
-    # 검색 (시험명)
+    # 검색 (시험명, exams.title pg_trgm 인덱스 사용)
     if search_keyword:
-        qs = qs.filter(exam__title__icontains=search_keyword)
+        qs = qs.filter(trigram_search_q(search_keyword, "exam__title"))
 
     # 정렬(최신순, 응시횟수 많은 순, 평균 점수 높은 순)
     if sort not in DEPLOYMENT_SORT_OPTIONS.values():
@@ -61,6 +67,10 @@ def list_admin_deployments(
 
     prefix = "-" if order == "desc" else ""
 
+    # 통계 정렬은 인덱스가 있는 DeploymentStats 컬럼 기준
+    if sort in STATS_SORT_FIELDS:
+        sort = f"stats__{sort}"
+
     return qs.order_by(f"{prefix}{sort}")
 
 
@@ -73,11 +83,24 @@ def get_admin_deployment_detail(*, deployment_id: int) -> ExamDeployment:
                 "exam__subject",
                 "cohort",
                 "cohort__course",
+                "stats",
             )
+            .prefetch_related("stats__questions")
             .annotate(
-                submit_count=Count("submissions__submitter", distinct=True),
-                total_target_count=Count("cohort__cohortstudent", distinct=True),
+                submit_count=Coalesce(F("stats__submitter_count"), Value(0)),
+                # 기수 수강생 수는 상관 서브쿼리로 조회 (제출 내역과 곱해지는 JOIN 방지)
+                total_target_count=Coalesce(
+                    Subquery(
+                        CohortStudent.objects.filter(cohort_id=OuterRef("cohort_id"))
+                        .order_by()
+                        .values("cohort_id")
+                        .annotate(count=Count("id"))
+                        .values("count")
+                    ),
+                    Value(0),
+                ),
             )
+            .annotate(not_submitted_count=Greatest(F("total_target_count") - F("submit_count"), Value(0)))
             .get(pk=deployment_id)
         )
 
@@ -123,6 +146,7 @@ def create_deployment(
         status=DeploymentStatus.ACTIVATED,
         questions_snapshot=_build_questions_snapshot(exam),
     )
+    DeploymentStats.objects.create(deployment=deployment)
     return deployment
 
 
@@ -146,6 +170,9 @@ def update_deployment(*, deployment: ExamDeployment, data: Dict[str, Any]) -> Ex
         setattr(deployment, field, value)
 
     deployment.save(update_fields=list(data.keys()) + ["updated_at"])
+    transaction.on_commit(lambda: invalidate_grading_plan(deployment.id))
+    transaction.on_commit(lambda: invalidate_exam_paper(deployment.id))
+    transaction.on_commit(lambda: publish_exam_status(deployment))
     return deployment
 
 
@@ -165,6 +192,9 @@ def set_deployment_status(*, deployment: ExamDeployment, status: str) -> ExamDep
 
     deployment.status = status
     deployment.save(update_fields=["status", "close_at", "updated_at"])
+    transaction.on_commit(lambda: invalidate_grading_plan(deployment.id))
+    transaction.on_commit(lambda: invalidate_exam_paper(deployment.id))
+    transaction.on_commit(lambda: publish_exam_status(deployment))
     return deployment
 
 
@@ -178,17 +208,18 @@ def delete_deployment(*, deployment: ExamDeployment) -> None:
 # ExamQuestion 목록을 기반으로 배포용 문항 스냅샷 생성 --------------------------
 # 어드민용
 def _build_questions_snapshot(exam: Exam) -> list[dict[str, Any]]:
-    return [
-        {
-            "id": q.id,
-            "question": q.question,
-            "prompt": q.prompt,
-            "blank_count": q.blank_count,
-            "options": q.options,
-            "type": q.type,
-            "answer": q.answer,
-            "point": q.point,
-            "explanation": q.explanation,
-        }
-        for q in exam.questions.all()
-    ]
+    return [snapshot_question(q) for q in exam.questions.all()]
+
+
+def snapshot_question(q: ExamQuestion) -> dict[str, Any]:
+    return {
+        "id": q.id,
+        "question": q.question,
+        "prompt": q.prompt,
+        "blank_count": q.blank_count,
+        "options": q.options,
+        "type": q.type,
+        "answer": q.answer,
+        "point": q.point,
+        "explanation": q.explanation,
+    }
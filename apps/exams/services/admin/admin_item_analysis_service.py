@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.exams.models import ExamDeployment, ExamSubmission
+from apps.exams.models.exam_question import QuestionType
+
+logger = logging.getLogger(__name__)
+
+"""
+배포 문항 분석 (난이도 / 변별도 / 선택지 선택 비율)
+
+get_item_analysis: 캐시 조회 → 없으면 compute_item_analysis (배포 / 통계 updated_at 을 버전으로 사용, 새 제출이 들어오면 재계산)
+compute_item_analysis:
+    1. 제출 내역을 점수 내림차순으로 한 번 스트리밍 조회 → 문항별 응답 / 정답 / 선택지별 비트셋(int) 생성
+       (i 번째 비트 = 점수 순위 i 번째 제출)
+    2. 상위 27% / 하위 27% 는 순위 구간 마스크, 개수는 int.bit_count() 로 한 번에 계산
+    correct_rate: 전체 제출 중 정답 비율 (난이도)
+    discrimination: 상위 27% 정답률 - 하위 27% 정답률 (변별도)
+    option_counts: 선택형 문항의 선택지별 선택 횟수
+"""
+
+UPPER_LOWER_RATIO = 0.27
+_OPTION_QUESTION_TYPES = {QuestionType.SINGLE_CHOICE, QuestionType.MULTIPLE_CHOICE, QuestionType.OX}
+
+
+def _cache_key(deployment_id: int) -> str:
+    return f"exams:item_analysis:{deployment_id}"
+
+
+def _version(deployment: ExamDeployment) -> str:
+    stats = getattr(deployment, "stats", None)
+    stats_version = f"{stats.submit_count}:{stats.updated_at.isoformat()}" if stats is not None else ""
+    return f"{deployment.updated_at.isoformat()}|{stats_version}"
+
+
+def _rate(count: int, total: int) -> float:
+    return round(count / total, 4) if total else 0.0
+
+
+def compute_item_analysis(deployment: ExamDeployment) -> dict[str, Any]:
+    questions: list[dict[str, Any]] = deployment.questions_snapshot or []
+    question_ids = {q["id"] for q in questions}
+    option_question_ids = {q["id"] for q in questions if q.get("type") in _OPTION_QUESTION_TYPES}
+
+    answered_bits: dict[int, int] = dict.fromkeys(question_ids, 0)
+    correct_bits: dict[int, int] = dict.fromkeys(question_ids, 0)
+    option_bits: defaultdict[tuple[int, str], int] = defaultdict(int)
+
+    rows = (
+        ExamSubmission.objects.filter(deployment=deployment)
+        .order_by("-score", "id")
+        .values_list("answers", flat=True)
+        .iterator(chunk_size=2000)
+    )
+    total = 0
+    for answers in rows:
+        bit = 1 << total
+        total += 1
+        for answer in answers:
+            question_id = answer.get("question_id")
+            if question_id not in question_ids:
+                continue
+            answered_bits[question_id] |= bit
+            if answer.get("is_correct"):
+                correct_bits[question_id] |= bit
+            if question_id in option_question_ids:
+                for value in answer.get("submitted_answer") or []:
+                    option_bits[(question_id, str(value).strip())] |= bit
+
+    group_size = max(1, round(total * UPPER_LOWER_RATIO)) if total else 0
+    upper_mask = (1 << group_size) - 1
+    lower_mask = ((1 << total) - 1) ^ ((1 << (total - group_size)) - 1)
+
+    option_counts: defaultdict[int, dict[str, int]] = defaultdict(dict)
+    for (question_id, option), bits in option_bits.items():
+        option_counts[question_id][option] = bits.bit_count()
+
+    results = []
+    for q in questions:
+        question_id = q["id"]
+        correct = correct_bits[question_id]
+        upper_rate = _rate((correct & upper_mask).bit_count(), group_size)
+        lower_rate = _rate((correct & lower_mask).bit_count(), group_size)
+
+        counts = option_counts.get(question_id, {})
+        # 스냅샷 선택지 순서 유지, 선택지에 없는 답은 뒤에 추가
+        options = [str(o).strip() for o in q.get("options") or []] if question_id in option_question_ids else []
+        if q.get("type") == QuestionType.OX and not options:
+            options = ["O", "X"]
+        options += sorted(set(counts) - set(options))
+
+        results.append(
+            {
+                "question_id": question_id,
+                "type": q.get("type"),
+                "point": q.get("point"),
+                "answered_count": answered_bits[question_id].bit_count(),
+                "correct_count": correct.bit_count(),
+                "correct_rate": _rate(correct.bit_count(), total),
+                "upper_correct_rate": upper_rate,
+                "lower_correct_rate": lower_rate,
+                "discrimination": round(upper_rate - lower_rate, 4),
+                "option_counts": [{"option": option, "count": counts.get(option, 0)} for option in options],
+            }
+        )
+
+    return {
+        "deployment_id": deployment.id,
+        "submit_count": total,
+        "group_size": group_size,
+        "questions": results,
+    }
+
+
+def get_item_analysis(deployment: ExamDeployment) -> dict[str, Any]:
+    version = _version(deployment)
+    try:
+        cached: tuple[str, dict[str, Any]] | None = cache.get(_cache_key(deployment.id))
+    except Exception as e:
+        logger.warning("Item Analysis Cache Error: %s: %s", type(e).__name__, e)
+        cached = None
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    result = compute_item_analysis(deployment)
+    try:
+        cache.set(_cache_key(deployment.id), (version, result), settings.EXAM_ITEM_ANALYSIS_CACHE_TTL)
+    except Exception as e:
+        logger.warning("Item Analysis Cache Error: %s: %s", type(e).__name__, e)
+    return result
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from django.db import connection, transaction
+from django.db.models import Field
+from django.utils import timezone
+
+from apps.exams.models import ExamDeployment, ExamQuestion, ExamSubmission
+from apps.exams.services.admin.admin_deployment_service import snapshot_question
+from apps.exams.services.deployment_stats import rebuild_deployment_stats
+from apps.exams.services.grading_plan import (
+    GradingPlan,
+    compile_grading_plan,
+    grade_with_plan,
+    invalidate_grading_plan,
+)
+from apps.exams.services.student.exam_paper_cache import invalidate_exam_paper
+
+logger = logging.getLogger(__name__)
+
+"""
+정답 수정 후 배포(ExamDeployment) 제출 내역 일괄 재채점
+
+refresh_questions_snapshot: 배포 스냅샷의 문항을 현재 ExamQuestion 기준으로 갱신 (응시 당시 문항 구성은 유지)
+regrade_deployment: 제출 내역을 id 기준 chunk 로 읽어 재채점 → 변경된 행만 chunk 단위 일괄 UPDATE
+    - 전체 행을 메모리에 올리지 않음 (chunk_size 만큼만 조회)
+    - workers > 1 이면 chunk 를 나눠 프로세스 풀에서 채점 (채점 계획은 워커 시작 시 한 번만 전달)
+    - dry_run 이면 저장하지 않고 변경 내역(diff) 만 반환
+    - 중간에 실패해도 이미 저장된 chunk 가 있으면 통계(문항 분석 캐시 포함) 재계산
+    - 다시 실행해도 안전 (이미 재채점된 행은 변경 없음으로 건너뜀), after_id 로 last_saved_id 다음부터 이어서 실행 가능
+"""
+
+# (id, answers, score, correct_answer_count)
+_SubmissionRow = tuple[int, list[dict[str, Any]], int, int]
+
+
+@dataclass
+class RegradeDiff:
+    submission_id: int
+    score: tuple[int, int]
+    correct_answer_count: tuple[int, int]
+    flipped_question_ids: list[int]
+
+
+@dataclass
+class RegradeReport:
+    deployment_id: int
+    dry_run: bool
+    changed_question_ids: list[int] = field(default_factory=list)
+    scanned: int = 0
+    changed: int = 0
+    score_delta: int = 0
+    elapsed_ms: int = 0
+    # 저장이 끝난 마지막 제출 id (실패 시 after_id 로 이어서 실행)
+    last_saved_id: int = 0
+    samples: list[RegradeDiff] = field(default_factory=list)
+
+
+def refresh_questions_snapshot(deployment: ExamDeployment) -> list[dict[str, Any]]:
+    snapshot: list[dict[str, Any]] = deployment.questions_snapshot or []
+    questions = ExamQuestion.objects.in_bulk([q["id"] for q in snapshot])
+    # 삭제된 문항은 응시 당시 스냅샷 그대로 사용
+    return [snapshot_question(questions[q["id"]]) if q["id"] in questions else q for q in snapshot]
+
+
+def _regrade_rows(plan: GradingPlan, rows: list[_SubmissionRow]) -> list[tuple[_SubmissionRow, RegradeDiff]]:
+    results = []
+    for submission_id, answers, score, correct_count in rows:
+        previous = {a.get("question_id"): a.get("is_correct") for a in answers}
+        graded, new_score, new_correct = grade_with_plan(plan, [dict(a) for a in answers])
+        flipped = [a["question_id"] for a in graded if previous.get(a["question_id"]) != a["is_correct"]]
+        if not flipped and (new_score, new_correct) == (score, correct_count):
+            continue
+        results.append(
+            (
+                (submission_id, graded, new_score, new_correct),
+                RegradeDiff(submission_id, (score, new_score), (correct_count, new_correct), flipped),
+            )
+        )
+    return results
+
+
+# 프로세스 풀 워커 --------------------------------------------------------------
+_worker_plan: GradingPlan = {}
+
+
+def _init_worker(plan: GradingPlan) -> None:
+    global _worker_plan
+    _worker_plan = plan
+
+
+def _regrade_rows_in_worker(rows: list[_SubmissionRow]) -> list[tuple[_SubmissionRow, RegradeDiff]]:
+    return _regrade_rows(_worker_plan, rows)
+
+
+def _iter_submission_chunks(
+    deployment: ExamDeployment, chunk_size: int, after_id: int = 0
+) -> Iterator[list[_SubmissionRow]]:
+    # OFFSET 대신 id 경계로 다음 chunk 조회
+    last_id = after_id
+    queryset = ExamSubmission.objects.filter(deployment=deployment).order_by("id")
+    while True:
+        rows: list[_SubmissionRow] = list(
+            queryset.filter(id__gt=last_id).values_list("id", "answers", "score", "correct_answer_count")[:chunk_size]
+        )
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def _split(rows: list[_SubmissionRow], parts: int) -> list[list[_SubmissionRow]]:
+    size = -(-len(rows) // parts)
+    return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+
+_UPDATE_FIELDS = ("answers", "score", "correct_answer_count", "updated_at")
+
+
+def _save_chunk(results: list[tuple[_SubmissionRow, RegradeDiff]]) -> None:
+    # bulk_update 는 행마다 CASE WHEN 식을 만들어 1만 건 기준 20초 이상 걸림
+    # → 같은 UPDATE 문을 executemany 로 chunk 단위 실행 (값 변환은 각 필드의 get_db_prep_save 사용)
+    fields = [cast("Field[Any, Any]", ExamSubmission._meta.get_field(name)) for name in _UPDATE_FIELDS]
+    qn = connection.ops.quote_name
+    sql = "UPDATE {} SET {} WHERE {} = %s".format(
+        qn(ExamSubmission._meta.db_table),
+        ", ".join(f"{qn(f.column)} = %s" for f in fields),
+        qn("id"),
+    )
+    now = timezone.now()
+    params = [
+        [f.get_db_prep_save(value, connection) for f, value in zip(fields, (answers, score, correct, now))]
+        + [submission_id]
+        for (submission_id, answers, score, correct), _ in results
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+def regrade_deployment(
+    deployment: ExamDeployment,
+    *,
+    dry_run: bool = False,
+    chunk_size: int = 1000,
+    workers: int = 1,
+    sample_limit: int = 20,
+    after_id: int = 0,
+) -> RegradeReport:
+    started = time.perf_counter()
+    snapshot = refresh_questions_snapshot(deployment)
+    plan = compile_grading_plan(snapshot)
+    old_plan = compile_grading_plan(deployment.questions_snapshot or [])
+
+    report = RegradeReport(deployment_id=deployment.id, dry_run=dry_run)
+    report.changed_question_ids = [qid for qid, rule in plan.items() if old_plan.get(qid) != rule]
+
+    if not dry_run:
+        # 스냅샷을 먼저 갱신해서 재채점 도중 들어온 제출도 수정된 정답으로 채점
+        with transaction.atomic():
+            deployment.questions_snapshot = snapshot
+            deployment.save(update_fields=["questions_snapshot", "updated_at"])
+            transaction.on_commit(lambda: invalidate_grading_plan(deployment.id))
+            transaction.on_commit(lambda: invalidate_exam_paper(deployment.id))
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(plan,),
+        )
+    report.last_saved_id = after_id
+    try:
+        for rows in _iter_submission_chunks(deployment, chunk_size, after_id):
+            if pool is not None:
+                results = [r for part in pool.map(_regrade_rows_in_worker, _split(rows, workers)) for r in part]
+            else:
+                results = _regrade_rows(plan, rows)
+
+            report.scanned += len(rows)
+            report.changed += len(results)
+            for _, diff in results:
+                report.score_delta += diff.score[1] - diff.score[0]
+            room = sample_limit - len(report.samples)
+            report.samples.extend(diff for _, diff in results[: max(room, 0)])
+
+            if results and not dry_run:
+                with transaction.atomic():
+                    _save_chunk(results)
+            report.last_saved_id = rows[-1][0]
+    except Exception:
+        logger.exception(
+            "Regrade Failed: deployment_id=%s, resume with after_id=%s", deployment.id, report.last_saved_id
+        )
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        # 점수가 바뀌면 평균 / 최소 / 최대 / 분포는 증분 갱신이 불가하므로 재계산 (실패해도 저장된 chunk 반영)
+        # 문항 분석 캐시는 통계 행 updated_at 이 바뀌면서 함께 무효화
+        if report.changed and not dry_run:
+            rebuild_deployment_stats(deployment.id)
+
+    report.elapsed_ms = int((time.perf_counter() - started) * 1000)
+    return report
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal, cast
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.core.exceptions.exception_messages import EMS
+from apps.core.utils.export_stream import (
+    CSV_CONTENT_TYPE,
+    XLSX_CONTENT_TYPE,
+    stream_csv,
+    stream_xlsx,
+)
+from apps.exams.models import ExamDeployment, ExamSubmission
+from apps.exams.services.admin.admin_submission_service import (
+    AdminSubmissionListParams,
+    build_admin_submission_query,
+    parse_admin_submission_list_params,
+)
+
+"""
+쪽지시험 응시 내역 내보내기 (CSV / XLSX 스트리밍)
+
+parse_admin_submission_export_params: 목록 조회와 같은 필터 / 정렬 + file_format (기수 또는 시험 필터 필수)
+get_export_question_ids: 대상 배포들의 문항 스냅샷 순서대로 문항 id 합집합 (문항별 정답 여부 컬럼)
+iter_submission_export_rows: 헤더 → 응시 내역 행 (서버 사이드 커서로 chunk 단위 조회, 행 수와 무관하게 메모리 일정)
+build_submission_export: (content chunks, content_type, filename)
+"""
+
+ExportFormat = Literal["csv", "xlsx"]
+
+EXPORT_BASE_HEADER = [
+    "응시 ID",
+    "이름",
+    "닉네임",
+    "과정",
+    "기수",
+    "쪽지시험",
+    "과목",
+    "점수",
+    "정답 수",
+    "부정행위 횟수",
+    "응시 시작",
+    "제출 시각",
+]
+
+_EXPORT_FIELDS = (
+    "id",
+    "submitter__name",
+    "submitter__nickname",
+    "deployment__cohort__course__name",
+    "deployment__cohort__number",
+    "deployment__exam__title",
+    "deployment__exam__subject__title",
+    "score",
+    "correct_answer_count",
+    "cheating_count",
+    "started_at",
+    "created_at",
+    "answers",
+)
+
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@dataclass(frozen=True)
+class AdminSubmissionExportParams:
+    file_format: ExportFormat
+    filters: AdminSubmissionListParams
+
+
+def parse_admin_submission_export_params(qp: Mapping[str, str]) -> AdminSubmissionExportParams:
+    filters = parse_admin_submission_list_params(qp)
+    file_format = qp.get("file_format", "csv")
+
+    # 전체 내보내기 방지: 기수 또는 시험 단위로만 허용
+    if file_format not in ("csv", "xlsx") or (filters.cohort_id is None and filters.exam_id is None):
+        # "유효하지 않은 내보내기 요청입니다."
+        raise ValidationError(EMS.E400_INVALID_REQUEST("내보내기"))
+
+    return AdminSubmissionExportParams(file_format=cast(ExportFormat, file_format), filters=filters)
+
+
+def get_export_question_ids(qs: QuerySet[ExamSubmission]) -> list[int]:
+    deployment_ids = qs.order_by().values("deployment_id").distinct()
+    snapshots = (
+        ExamDeployment.objects.filter(id__in=deployment_ids)
+        .order_by("open_at", "id")
+        .values_list("questions_snapshot", flat=True)
+    )
+
+    question_ids: dict[int, None] = {}
+    for snapshot in snapshots:
+        for question in snapshot or []:
+            question_ids.setdefault(question["id"], None)
+    return list(question_ids)
+
+
+def _format_datetime(value: datetime | None) -> str:
+    return timezone.localtime(value).strftime(_DATETIME_FORMAT) if value else ""
+
+
+def iter_submission_export_rows(qs: QuerySet[ExamSubmission], question_ids: list[int]) -> Iterator[list[Any]]:
+    yield EXPORT_BASE_HEADER + [f"문항 {question_id}" for question_id in question_ids]
+
+    rows = qs.values_list(*_EXPORT_FIELDS).iterator(chunk_size=settings.EXAM_SUBMISSION_EXPORT_CHUNK_SIZE)
+    for *fields, started_at, finished_at, answers in rows:
+        # 문항별 정답 여부 (1 / 0, 응답하지 않은 문항은 빈 칸)
+        correct = {answer.get("question_id"): answer.get("is_correct") for answer in answers or []}
+        flags = [
+            None if correct.get(question_id) is None else int(bool(correct[question_id]))
+            for question_id in question_ids
+        ]
+        yield [*fields, _format_datetime(started_at), _format_datetime(finished_at), *flags]
+
+
+def build_submission_export(params: AdminSubmissionExportParams) -> tuple[Iterator[bytes], str, str]:
+    qs = build_admin_submission_query(params.filters)
+    # 헤더 컬럼은 첫 바이트 전에 정해야 하므로 배포 스냅샷만 먼저 조회 (제출 수와 무관)
+    rows = iter_submission_export_rows(qs, get_export_question_ids(qs))
+
+    scope = f"cohort{params.filters.cohort_id}" if params.filters.cohort_id is not None else ""
+    if params.filters.exam_id is not None:
+        scope = f"{scope}_exam{params.filters.exam_id}".lstrip("_")
+    filename = f"exam_submissions_{scope}_{timezone.localtime():%Y%m%d%H%M%S}.{params.file_format}"
+
+    if params.file_format == "xlsx":
+        return stream_xlsx(rows, sheet_name="응시 내역"), XLSX_CONTENT_TYPE, filename
+    return stream_csv(rows), CSV_CONTENT_TYPE, filename
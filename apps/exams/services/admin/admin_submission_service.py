@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal, Mapping, Optional, cast
 
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 from rest_framework.exceptions import NotFound, ValidationError
 
 from apps.core.exceptions.exception_messages import EMS
+from apps.core.utils.search import trigram_search_q
 from apps.exams.models import ExamSubmission
 
 Order = Literal["asc", "desc"]
@@ -91,7 +92,8 @@ def build_admin_submission_query(params: AdminSubmissionListParams) -> QuerySet[
 
     keyword = params.search_keyword.strip()
     if keyword:
-        qs = qs.filter(Q(submitter__nickname__icontains=keyword) | Q(submitter__name__icontains=keyword))
+        # users.nickname / users.name pg_trgm 인덱스 사용
+        qs = qs.filter(trigram_search_q(keyword, "submitter__nickname", "submitter__name"))
 
     sort_field = ALLOWED_SORTS[params.sort]
     prefix = "-" if params.order == "desc" else ""
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Case, Exists, F, FloatField, OuterRef, Value, When
+from django.db.models.functions import Cast, Coalesce, Greatest, Least, Now
+
+from apps.exams.models.deployment_stats import (
+    SCORE_HISTOGRAM_BUCKET,
+    SCORE_HISTOGRAM_SIZE,
+    DeploymentQuestionStats,
+    DeploymentStats,
+    score_bucket_field,
+)
+from apps.exams.models.exam_submission import ExamSubmission
+
+"""
+배포별 제출 통계 (DeploymentStats / DeploymentQuestionStats) 갱신
+
+apply_submission_to_stats: 제출 1건을 통계에 증분 반영 (create_exam_submission 트랜잭션 안에서 호출)
+    - 제출 수 / 점수 합계 / 평균 / 최소 / 최대 / 점수 구간은 통계 행 UPDATE 1번으로 반영 (행을 미리 잠그지 않음)
+    - 문항별 응답 / 정답 수는 문항 행 INSERT (없는 행만) + UPDATE 1번으로 반영
+rebuild_deployment_stats: 제출 내역 전체로 통계 재계산 (재채점 / 제출 삭제 / 커맨드)
+"""
+
+
+def _histogram_index(score: int) -> int:
+    return min(score // SCORE_HISTOGRAM_BUCKET, SCORE_HISTOGRAM_SIZE - 1)
+
+
+def _add_submission(
+    stats: DeploymentStats, questions: dict[int, list[int]], score: int, answers: Iterable[dict[str, Any]]
+) -> None:
+    stats.submit_count += 1
+    stats.score_sum += score
+    stats.avg_score = stats.score_sum / stats.submit_count
+    stats.min_score = score if stats.min_score is None else min(stats.min_score, score)
+    stats.max_score = score if stats.max_score is None else max(stats.max_score, score)
+    bucket = score_bucket_field(_histogram_index(score))
+    setattr(stats, bucket, getattr(stats, bucket) + 1)
+
+    for answer in answers:
+        counts = questions.setdefault(answer["question_id"], [0, 0])
+        counts[0] += 1
+        counts[1] += int(bool(answer.get("is_correct")))
+
+
+def _apply_question_stats(deployment_id: int, answers: Iterable[dict[str, Any]]) -> None:
+    answers = list(answers)
+    if not answers:
+        return
+    question_ids = [answer["question_id"] for answer in answers]
+    correct_ids = [answer["question_id"] for answer in answers if answer.get("is_correct")]
+
+    # 처음 응답된 문항 행만 생성 (이미 있으면 무시) → 동시 제출도 아래 UPDATE 에서 누적
+    DeploymentQuestionStats.objects.bulk_create(
+        [DeploymentQuestionStats(stats_id=deployment_id, question_id=question_id) for question_id in question_ids],
+        ignore_conflicts=True,
+    )
+    DeploymentQuestionStats.objects.filter(stats_id=deployment_id, question_id__in=question_ids).update(
+        answered_count=F("answered_count") + 1,
+        correct_count=F("correct_count") + Case(When(question_id__in=correct_ids, then=Value(1)), default=Value(0)),
+    )
+
+
+def apply_submission_to_stats(submission: ExamSubmission) -> None:
+    score = submission.score
+    bucket = score_bucket_field(_histogram_index(score))
+    previous_submission = ExamSubmission.objects.filter(
+        deployment_id=OuterRef("deployment_id"), submitter_id=submission.submitter_id
+    ).exclude(id=submission.id)
+    # SET 의 F() 는 갱신 전 값 → 같은 배포의 동시 제출도 UPDATE 순서대로 누적 (select_for_update 없음)
+    increment = {
+        "submit_count": F("submit_count") + 1,
+        "submitter_count": F("submitter_count") + Case(When(Exists(previous_submission), then=Value(0)), default=1),
+        "score_sum": F("score_sum") + score,
+        "avg_score": Cast(F("score_sum") + score, FloatField()) / (F("submit_count") + 1),
+        "min_score": Coalesce(Least(F("min_score"), Value(score)), Value(score)),
+        "max_score": Coalesce(Greatest(F("max_score"), Value(score)), Value(score)),
+        bucket: F(bucket) + 1,
+        "updated_at": Now(),
+    }
+    stats = DeploymentStats.objects.filter(deployment_id=submission.deployment_id)
+    if not stats.update(**increment):
+        DeploymentStats.objects.get_or_create(deployment_id=submission.deployment_id)
+        stats.update(**increment)
+
+    _apply_question_stats(submission.deployment_id, submission.answers)
+
+
+@transaction.atomic
+def rebuild_deployment_stats(deployment_id: int, chunk_size: int = 2000) -> DeploymentStats:
+    DeploymentStats.objects.get_or_create(deployment_id=deployment_id)
+    # 통계 행 잠금 → 재계산 중 들어온 제출의 증분 UPDATE 는 재계산 커밋 후에 반영
+    stats = DeploymentStats.objects.select_for_update().get(deployment_id=deployment_id)
+
+    stats.submit_count = 0
+    stats.score_sum = 0
+    stats.avg_score = 0.0
+    stats.min_score = None
+    stats.max_score = None
+    for index in range(SCORE_HISTOGRAM_SIZE):
+        setattr(stats, score_bucket_field(index), 0)
+    # {question_id: [응답 수, 정답 수]}
+    questions: dict[int, list[int]] = {}
+
+    submitters = set()
+    rows = (
+        ExamSubmission.objects.filter(deployment_id=deployment_id)
+        .values_list("submitter_id", "score", "answers")
+        .iterator(chunk_size=chunk_size)
+    )
+    for submitter_id, score, answers in rows:
+        submitters.add(submitter_id)
+        _add_submission(stats, questions, score, answers)
+    stats.submitter_count = len(submitters)
+    stats.save()
+
+    stats.questions.all().delete()
+    DeploymentQuestionStats.objects.bulk_create(
+        DeploymentQuestionStats(stats=stats, question_id=question_id, answered_count=answered, correct_count=correct)
+        for question_id, (answered, correct) in questions.items()
+    )
+    return stats
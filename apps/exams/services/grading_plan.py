@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.exams.models.exam_deployment import ExamDeployment
+from apps.exams.models.exam_question import QuestionType
+
+logger = logging.getLogger(__name__)
+
+"""
+배포(ExamDeployment)별 채점 계획 (questions_snapshot → 문항별 정답/배점/비교 방식을 한 번만 컴파일)
+
+GradingRule: 문항 하나의 채점 규칙 (유형, 정규화된 정답, 배점)
+    is_correct: 제출 답안 정규화 후 유형별 비교 1회
+compile_grading_plan: questions_snapshot → {question_id: GradingRule}
+grade_with_plan: 채점 계획으로 제출 답안 채점 (DB 접근 없음, 재채점 프로세스 풀에서도 사용)
+get_grading_plan: 프로세스 내 LRU → Redis → 컴파일 순으로 조회 (배포 updated_at 으로 버전 확인)
+invalidate_grading_plan: 배포 수정 / 상태 변경 시 캐시 삭제
+
+유형별 비교 (정답/제출 답안 모두 앞뒤 공백 제거, 주관식은 대소문자 / 연속 공백 / 유니코드 표기 차이 무시)
+    single_choice, ox: 선택 하나가 같은지
+    multiple_choice: 선택 집합이 같은지 (순서 무관)
+    ordering: 순서까지 같은지
+    short_answer: 정답 목록 중 하나와 같은지 (복수 정답 허용)
+    fill_blank: 빈칸별로 같은지 (빈칸 순서 유지)
+    (유형 정보가 없는 예전 스냅샷): 기존과 같이 선택 집합 비교
+"""
+
+
+def _normalize_choice(value: Any) -> str:
+    return str(value).strip()
+
+
+def _normalize_text(value: Any) -> str:
+    return " ".join(unicodedata.normalize("NFKC", str(value)).casefold().split())
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _single(values: list[Any], normalize: Callable[[Any], str]) -> str | None:
+    return normalize(values[0]) if len(values) == 1 else None
+
+
+# 유형별 정답 컴파일 (배포당 한 번) -------------------------------------------------
+def _compile_single_choice(answer: list[Any]) -> str | None:
+    return _single(answer, _normalize_choice)
+
+
+def _compile_ox(answer: list[Any]) -> str | None:
+    return _single(answer, _normalize_text)
+
+
+def _compile_choice_set(answer: list[Any]) -> frozenset[str]:
+    return frozenset(_normalize_choice(v) for v in answer)
+
+
+def _compile_choice_sequence(answer: list[Any]) -> tuple[str, ...]:
+    return tuple(_normalize_choice(v) for v in answer)
+
+
+def _compile_text_set(answer: list[Any]) -> frozenset[str]:
+    return frozenset(_normalize_text(v) for v in answer)
+
+
+def _compile_text_sequence(answer: list[Any]) -> tuple[str, ...]:
+    return tuple(_normalize_text(v) for v in answer)
+
+
+# 유형별 제출 답안 비교 (제출마다 문항당 한 번) -------------------------------------------
+def _compare_single_choice(expected: str | None, submitted: list[Any]) -> bool:
+    return expected is not None and _single(submitted, _normalize_choice) == expected
+
+
+def _compare_ox(expected: str | None, submitted: list[Any]) -> bool:
+    return expected is not None and _single(submitted, _normalize_text) == expected
+
+
+def _compare_choice_set(expected: frozenset[str], submitted: list[Any]) -> bool:
+    return _compile_choice_set(submitted) == expected
+
+
+def _compare_choice_sequence(expected: tuple[str, ...], submitted: list[Any]) -> bool:
+    return _compile_choice_sequence(submitted) == expected
+
+
+def _compare_short_answer(expected: frozenset[str], submitted: list[Any]) -> bool:
+    answer = _single(submitted, _normalize_text)
+    return answer is not None and answer in expected
+
+
+def _compare_text_sequence(expected: tuple[str, ...], submitted: list[Any]) -> bool:
+    return _compile_text_sequence(submitted) == expected
+
+
+_CompileFn = Callable[[list[Any]], Any]
+_CompareFn = Callable[[Any, list[Any]], bool]
+
+_COMPILERS: dict[str, _CompileFn] = {
+    QuestionType.SINGLE_CHOICE: _compile_single_choice,
+    QuestionType.OX: _compile_ox,
+    QuestionType.MULTIPLE_CHOICE: _compile_choice_set,
+    QuestionType.ORDERING: _compile_choice_sequence,
+    QuestionType.SHORT_ANSWER: _compile_text_set,
+    QuestionType.FILL_BLANK: _compile_text_sequence,
+}
+
+_COMPARATORS: dict[str, _CompareFn] = {
+    QuestionType.SINGLE_CHOICE: _compare_single_choice,
+    QuestionType.OX: _compare_ox,
+    QuestionType.MULTIPLE_CHOICE: _compare_choice_set,
+    QuestionType.ORDERING: _compare_choice_sequence,
+    QuestionType.SHORT_ANSWER: _compare_short_answer,
+    QuestionType.FILL_BLANK: _compare_text_sequence,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GradingRule:
+    question_type: str
+    answer: Any
+    point: int
+
+    def is_correct(self, submitted_answer: Any) -> bool:
+        submitted = _as_list(submitted_answer)
+        if not submitted:
+            return False
+        compare: _CompareFn = _COMPARATORS.get(self.question_type, _compare_choice_set)
+        return compare(self.answer, submitted)
+
+
+GradingPlan = dict[int, GradingRule]
+
+
+def compile_grading_plan(questions_snapshot: list[dict[str, Any]]) -> GradingPlan:
+    plan: GradingPlan = {}
+    for question in questions_snapshot or []:
+        question_type = question.get("type") or ""
+        compile_answer: _CompileFn = _COMPILERS.get(question_type, _compile_choice_set)
+        plan[int(question["id"])] = GradingRule(
+            question_type=question_type,
+            answer=compile_answer(_as_list(question.get("answer"))),
+            point=int(question.get("point") or 0),
+        )
+    return plan
+
+
+def grade_with_plan(
+    plan: GradingPlan,
+    submitted_answers: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], int, int]:
+    total_score = 0
+    correct_count = 0
+    graded_answers = []
+    for a in submitted_answers:
+        rule = plan.get(a["question_id"])
+        is_correct = rule is not None and rule.is_correct(a["submitted_answer"])
+        if rule is not None and is_correct:
+            total_score += rule.point
+            correct_count += 1
+        a.update({"is_correct": is_correct})
+        graded_answers.append(a)
+
+    return graded_answers, total_score, correct_count
+
+
+# 캐시 ---------------------------------------------------------------------
+_local_plans: OrderedDict[int, tuple[str, GradingPlan]] = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def _cache_key(deployment_id: int) -> str:
+    return f"exams:grading_plan:{deployment_id}"
+
+
+# 다른 워커에서 배포가 수정된 경우를 위해 updated_at 을 버전으로 같이 저장
+def _version(deployment: ExamDeployment) -> str:
+    return deployment.updated_at.isoformat() if deployment.updated_at else ""
+
+
+def _remember(deployment_id: int, version: str, plan: GradingPlan) -> None:
+    with _local_lock:
+        _local_plans[deployment_id] = (version, plan)
+        _local_plans.move_to_end(deployment_id)
+        while len(_local_plans) > settings.EXAM_GRADING_PLAN_LOCAL_MAX:
+            _local_plans.popitem(last=False)
+
+
+def get_grading_plan(deployment: ExamDeployment) -> GradingPlan:
+    version = _version(deployment)
+    local = _local_plans.get(deployment.id)
+    if local is not None and local[0] == version:
+        return local[1]
+
+    try:
+        cached: tuple[str, GradingPlan] | None = cache.get(_cache_key(deployment.id))
+    except Exception as e:
+        logger.warning("Grading Plan Cache Error: %s: %s", type(e).__name__, e)
+        cached = None
+    if cached is not None and cached[0] == version:
+        _remember(deployment.id, version, cached[1])
+        return cached[1]
+
+    plan = compile_grading_plan(deployment.questions_snapshot)
+    try:
+        cache.set(_cache_key(deployment.id), (version, plan), settings.EXAM_GRADING_PLAN_CACHE_TTL)
+    except Exception as e:
+        logger.warning("Grading Plan Cache Error: %s: %s", type(e).__name__, e)
+    _remember(deployment.id, version, plan)
+    return plan
+
+
+def invalidate_grading_plan(deployment_id: int) -> None:
+    with _local_lock:
+        _local_plans.pop(deployment_id, None)
+    try:
+        cache.delete(_cache_key(deployment_id))
+    except Exception as e:
+        logger.warning("Grading Plan Cache Error: %s: %s", type(e).__name__, e)
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django_redis import get_redis_connection  # type: ignore
+from rest_framework.exceptions import NotFound, ValidationError
+
+from apps.core.exceptions.exception_messages import EMS
+from apps.exams.models import AttemptStatus, ExamAttempt, ExamDeployment, ExamSubmission
+from apps.exams.services.grading_plan import get_grading_plan
+from apps.user.models import User
+
+logger = logging.getLogger(__name__)
+
+"""
+응시 세션(ExamAttempt) 자동 저장 (Redis 누적 + DB 일괄 체크포인트)
+
+Redis
+    exams:attempt:{attempt_id}: 해시 (started_at, cheating_count, version, a:{question_id} → 답안 JSON)
+    exams:attempt:current:{deployment_id}:{submitter_id}: 응시 중인 attempt_id
+    exams:attempt:dirty: DB 에 아직 저장되지 않은 attempt_id 집합
+
+start_exam_attempt: (참가 코드 검증 시) 응시 중인 세션 조회 / 생성 → started_at 서버 기록, Redis 상태 준비
+get_attempt_state: Redis → (없으면) DB 체크포인트 순으로 현재 상태 조회
+apply_attempt_patch: 변경된 답안 / 부정행위 증가분만 Redis 해시에 반영 (요청당 파이프라인 1회, DB 쓰기 없음)
+    - Redis 장애 시에만 DB 행에 바로 반영
+flush_attempt_checkpoints: (beat) dirty 집합을 batch 단위로 꺼내 DB 에 일괄 저장 (version 이 더 큰 경우만)
+resolve_submission_payload: 최종 제출 시 작성 중 답안 + 요청 답안(마지막 변경분)을 합쳐 제출 데이터 생성
+close_exam_attempt: 제출 완료 후 세션 종료 (체크포인트 저장 + Redis 상태 삭제)
+"""
+
+_ANSWER_PREFIX = "a:"
+
+
+@dataclass
+class AttemptState:
+    attempt_id: int
+    started_at: datetime
+    cheating_count: int = 0
+    version: int = 0
+    # {question_id(str): submitted_answer}
+    answers: dict[str, Any] = field(default_factory=dict)
+
+    def answer_list(self) -> list[dict[str, Any]]:
+        return [{"question_id": int(qid), "submitted_answer": value} for qid, value in self.answers.items()]
+
+
+def _redis() -> Any:
+    return get_redis_connection("default")
+
+
+def _state_key(attempt_id: int) -> str:
+    return str(cache.make_key(f"exams:attempt:{attempt_id}"))
+
+
+def _current_key(deployment_id: int, submitter_id: int) -> str:
+    return str(cache.make_key(f"exams:attempt:current:{deployment_id}:{submitter_id}"))
+
+
+def _dirty_key() -> str:
+    return str(cache.make_key("exams:attempt:dirty"))
+
+
+def _state_from_attempt(attempt: ExamAttempt) -> AttemptState:
+    return AttemptState(
+        attempt_id=attempt.id,
+        started_at=attempt.started_at,
+        cheating_count=attempt.cheating_count,
+        version=attempt.version,
+        answers=dict(attempt.answers or {}),
+    )
+
+
+def _state_from_hash(attempt_id: int, values: dict[bytes, bytes]) -> AttemptState | None:
+    fields = {k.decode(): v.decode() for k, v in values.items()}
+    started_at = parse_datetime(fields.get("started_at", ""))
+    if started_at is None:
+        return None
+    return AttemptState(
+        attempt_id=attempt_id,
+        started_at=started_at,
+        cheating_count=int(fields.get("cheating_count", 0)),
+        version=int(fields.get("version", 0)),
+        answers={k[len(_ANSWER_PREFIX) :]: json.loads(v) for k, v in fields.items() if k.startswith(_ANSWER_PREFIX)},
+    )
+
+
+# Redis 상태가 없을 때(만료 / 유실) DB 체크포인트로 복원 (이미 있는 필드는 덮어쓰지 않음)
+def _seed_state(pipeline: Any, attempt: ExamAttempt) -> None:
+    key = _state_key(attempt.id)
+    pipeline.hsetnx(key, "started_at", attempt.started_at.isoformat())
+    pipeline.hsetnx(key, "cheating_count", attempt.cheating_count)
+    pipeline.hsetnx(key, "version", attempt.version)
+    for qid, value in (attempt.answers or {}).items():
+        pipeline.hsetnx(key, f"{_ANSWER_PREFIX}{qid}", json.dumps(value, ensure_ascii=False))
+    pipeline.expire(key, settings.EXAM_ATTEMPT_TTL)
+    pipeline.set(_current_key(attempt.deployment_id, attempt.submitter_id), attempt.id, ex=settings.EXAM_ATTEMPT_TTL)
+
+
+def _in_progress_attempt(deployment_id: int, submitter_id: int) -> ExamAttempt | None:
+    return ExamAttempt.objects.filter(
+        deployment_id=deployment_id, submitter_id=submitter_id, status=AttemptStatus.IN_PROGRESS
+    ).first()
+
+
+def start_exam_attempt(*, deployment: ExamDeployment, submitter: User) -> ExamAttempt:
+    # 다시 검증해도 기존 세션을 이어서 사용 (started_at 유지)
+    attempt = _in_progress_attempt(deployment.id, submitter.id)
+    if attempt is None:
+        try:
+            with transaction.atomic():
+                attempt = ExamAttempt.objects.create(
+                    deployment=deployment, submitter=submitter, started_at=timezone.now()
+                )
+        except IntegrityError:
+            # 동시에 검증 요청이 들어온 경우 먼저 생성된 세션 사용
+            attempt = ExamAttempt.objects.get(
+                deployment=deployment, submitter=submitter, status=AttemptStatus.IN_PROGRESS
+            )
+
+    try:
+        pipeline = _redis().pipeline()
+        _seed_state(pipeline, attempt)
+        pipeline.execute()
+    except Exception as e:
+        logger.warning("Exam Attempt Redis Error: %s: %s", type(e).__name__, e)
+    return attempt
+
+
+def get_attempt_state(*, deployment_id: int, submitter_id: int) -> AttemptState | None:
+    try:
+        attempt_id = _redis().get(_current_key(deployment_id, submitter_id))
+        if attempt_id is not None:
+            state = _state_from_hash(int(attempt_id), _redis().hgetall(_state_key(int(attempt_id))))
+            if state is not None:
+                return state
+    except Exception as e:
+        logger.warning("Exam Attempt Redis Error: %s: %s", type(e).__name__, e)
+
+    attempt = _in_progress_attempt(deployment_id, submitter_id)
+    return _state_from_attempt(attempt) if attempt is not None else None
+
+
+def _validate_patch_answers(deployment: ExamDeployment, answers: list[dict[str, Any]]) -> None:
+    question_ids = get_grading_plan(deployment).keys()
+    unknown = sorted({a["question_id"] for a in answers} - question_ids)
+    if unknown:
+        raise ValidationError({"answers": f"시험에 없는 문항입니다: {unknown}"})
+
+
+def apply_attempt_patch(
+    *,
+    deployment: ExamDeployment,
+    submitter: User,
+    answers: list[dict[str, Any]],
+    cheating_count_delta: int = 0,
+) -> AttemptState:
+    _validate_patch_answers(deployment, answers)
+
+    try:
+        attempt_id = _redis().get(_current_key(deployment.id, submitter.id))
+    except Exception as e:
+        logger.warning("Exam Attempt Redis Error: %s: %s", type(e).__name__, e)
+        return _apply_patch_to_db(deployment, submitter, answers, cheating_count_delta)
+
+    if attempt_id is None:
+        # 포인터가 만료된 경우 DB 의 응시 중 세션으로 복원
+        attempt = _in_progress_attempt(deployment.id, submitter.id)
+        if attempt is None:
+            raise NotFound(detail=EMS.E404_NOT_FOUND("응시 정보")["error_detail"])
+        attempt_id = attempt.id
+        pipeline = _redis().pipeline()
+        _seed_state(pipeline, attempt)
+        pipeline.execute()
+
+    key = _state_key(int(attempt_id))
+    pipeline = _redis().pipeline()
+    mapping = {
+        f"{_ANSWER_PREFIX}{a['question_id']}": json.dumps(a["submitted_answer"], ensure_ascii=False) for a in answers
+    }
+    if mapping:
+        pipeline.hset(key, mapping=mapping)
+    if cheating_count_delta:
+        pipeline.hincrby(key, "cheating_count", cheating_count_delta)
+    pipeline.hincrby(key, "version", 1)
+    pipeline.expire(key, settings.EXAM_ATTEMPT_TTL)
+    pipeline.expire(_current_key(deployment.id, submitter.id), settings.EXAM_ATTEMPT_TTL)
+    pipeline.sadd(_dirty_key(), int(attempt_id))
+    pipeline.hgetall(key)
+    state = _state_from_hash(int(attempt_id), pipeline.execute()[-1])
+    if state is None:
+        # 해시만 유실된 경우: 방금 쓴 필드는 유지하고 나머지를 체크포인트로 채움 (version 은 체크포인트 이후로 이어서 증가)
+        attempt = ExamAttempt.objects.get(id=int(attempt_id))
+        pipeline = _redis().pipeline()
+        _seed_state(pipeline, attempt)
+        pipeline.hincrby(key, "version", attempt.version)
+        pipeline.hgetall(key)
+        state = _state_from_hash(attempt.id, pipeline.execute()[-1])
+    assert state is not None
+    return state
+
+
+def _apply_patch_to_db(
+    deployment: ExamDeployment,
+    submitter: User,
+    answers: list[dict[str, Any]],
+    cheating_count_delta: int,
+) -> AttemptState:
+    with transaction.atomic():
+        attempt = (
+            ExamAttempt.objects.select_for_update()
+            .filter(deployment=deployment, submitter=submitter, status=AttemptStatus.IN_PROGRESS)
+            .first()
+        )
+        if attempt is None:
+            raise NotFound(detail=EMS.E404_NOT_FOUND("응시 정보")["error_detail"])
+        attempt.answers = {**(attempt.answers or {}), **{str(a["question_id"]): a["submitted_answer"] for a in answers}}
+        attempt.cheating_count += cheating_count_delta
+        attempt.version += 1
+        attempt.save(update_fields=["answers", "cheating_count", "version", "updated_at"])
+    return _state_from_attempt(attempt)
+
+
+def flush_attempt_checkpoints(batch_size: int | None = None) -> int:
+    batch_size = batch_size or settings.EXAM_ATTEMPT_FLUSH_BATCH
+    flushed = 0
+    while True:
+        attempt_ids = [int(i) for i in _redis().spop(_dirty_key(), batch_size) or []]
+        if not attempt_ids:
+            return flushed
+
+        pipeline = _redis().pipeline()
+        for attempt_id in attempt_ids:
+            pipeline.hgetall(_state_key(attempt_id))
+        states = [
+            state
+            for attempt_id, values in zip(attempt_ids, pipeline.execute())
+            if (state := _state_from_hash(attempt_id, values)) is not None
+        ]
+
+        try:
+            flushed += _save_checkpoints(states)
+        except Exception:
+            # 저장 실패 시 다음 주기에 다시 시도
+            _redis().sadd(_dirty_key(), *attempt_ids)
+            raise
+
+
+def _save_checkpoints(states: list[AttemptState]) -> int:
+    if not states:
+        return 0
+    now = timezone.now()
+    with transaction.atomic():
+        attempts = ExamAttempt.objects.filter(
+            id__in=[s.attempt_id for s in states], status=AttemptStatus.IN_PROGRESS
+        ).only("id", "version")
+        versions = {attempt.id: attempt for attempt in attempts}
+        changed = []
+        for state in states:
+            attempt = versions.get(state.attempt_id)
+            # 이미 제출된 세션 / 더 최신 체크포인트는 건너뜀
+            if attempt is None or attempt.version >= state.version:
+                continue
+            attempt.answers = state.answers
+            attempt.cheating_count = state.cheating_count
+            attempt.version = state.version
+            attempt.updated_at = now
+            changed.append(attempt)
+        ExamAttempt.objects.bulk_update(changed, ["answers", "cheating_count", "version", "updated_at"])
+    return len(changed)
+
+
+def resolve_submission_payload(
+    *,
+    deployment: ExamDeployment,
+    submitter: User,
+    data: dict[str, Any],
+) -> tuple[AttemptState | None, dict[str, Any]]:
+    """
+    제출 데이터 생성
+    - 응시 중인 세션이 있으면: started_at 은 세션 기준, 답안은 작성 중 답안에 요청 답안(마지막 변경분)을 덮어씀
+    - 없으면: 요청 데이터 그대로 사용 (started_at, answers 필수)
+    """
+    state = get_attempt_state(deployment_id=deployment.id, submitter_id=submitter.id)
+    if state is None:
+        missing = {name: "이 필드는 필수 항목입니다." for name in ("started_at", "answers") if name not in data}
+        if missing:
+            raise ValidationError(missing)
+        return None, {
+            "deployment": deployment,
+            "started_at": data["started_at"],
+            "cheating_count": data.get("cheating_count", 0),
+            "answers": data["answers"],
+        }
+
+    merged = {**state.answers, **{str(a["question_id"]): a["submitted_answer"] for a in data.get("answers", [])}}
+    # 배포 문항 순서대로 정렬
+    answers = [
+        {"question_id": qid, "submitted_answer": merged[str(qid)]}
+        for qid in get_grading_plan(deployment)
+        if str(qid) in merged
+    ]
+    return state, {
+        "deployment": deployment,
+        "started_at": state.started_at,
+        "cheating_count": max(state.cheating_count, data.get("cheating_count", 0)),
+        "answers": answers,
+    }
+
+
+def close_exam_attempt(
+    *,
+    state: AttemptState,
+    submitter: User,
+    payload: dict[str, Any],
+    submission: ExamSubmission | None = None,
+) -> None:
+    ExamAttempt.objects.filter(id=state.attempt_id, status=AttemptStatus.IN_PROGRESS).update(
+        status=AttemptStatus.SUBMITTED,
+        answers={str(a["question_id"]): a["submitted_answer"] for a in payload["answers"]},
+        cheating_count=payload["cheating_count"],
+        version=state.version,
+        submission=submission,
+        updated_at=timezone.now(),
+    )
+    deployment: ExamDeployment = payload["deployment"]
+    try:
+        pipeline = _redis().pipeline()
+        pipeline.delete(_state_key(state.attempt_id))
+        pipeline.delete(_current_key(deployment.id, submitter.id))
+        pipeline.srem(_dirty_key(), state.attempt_id)
+        pipeline.execute()
+    except Exception as e:
+        logger.warning("Exam Attempt Redis Error: %s: %s", type(e).__name__, e)
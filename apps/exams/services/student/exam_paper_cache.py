@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+from apps.exams.models import ExamDeployment
+from apps.exams.serializers.student.exam_question_serializer import (
+    ExamQuestionSerializer,
+)
+
+logger = logging.getLogger(__name__)
+
+"""
+배포(ExamDeployment)별 수강생용 시험지 캐시
+
+render_exam_paper: questions_snapshot → 번호 부여 / answer_input 계산 / 정답·해설 제외 → JSON bytes
+get_exam_paper: 프로세스 내 LRU → Redis → 렌더링 순으로 조회 (배포 updated_at 으로 버전 확인)
+    - 조회 시 questions_snapshot 이 필요한 건 캐시가 없을 때뿐 (뷰는 스냅샷을 defer 해서 조회)
+build_exam_paper_body: 캐시된 문항 bytes 에 시험 정보 / 수강생별 필드(elapsed_time, cheating_count)만 붙여 응답 본문 생성
+invalidate_exam_paper: 배포 수정 / 상태 변경 / 재채점 시 캐시 삭제
+"""
+
+_renderer = JSONRenderer()
+
+_local_papers: OrderedDict[int, tuple[str, bytes]] = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def _cache_key(deployment_id: int) -> str:
+    return f"exams:exam_paper:{deployment_id}"
+
+
+def _version(deployment: ExamDeployment) -> str:
+    return deployment.updated_at.isoformat() if deployment.updated_at else ""
+
+
+def _remember(deployment_id: int, version: str, paper: bytes) -> None:
+    with _local_lock:
+        _local_papers[deployment_id] = (version, paper)
+        _local_papers.move_to_end(deployment_id)
+        while len(_local_papers) > settings.EXAM_PAPER_LOCAL_MAX:
+            _local_papers.popitem(last=False)
+
+
+def render_exam_paper(questions_snapshot: list[dict[str, Any]]) -> bytes:
+    # 스냅샷 원본은 수정하지 않음 (스냅샷 순서대로 1번부터 번호 부여)
+    questions = [{**question, "number": idx} for idx, question in enumerate(questions_snapshot or [], start=1)]
+    return bytes(_renderer.render(ExamQuestionSerializer(questions, many=True).data))
+
+
+def get_exam_paper(deployment: ExamDeployment) -> bytes:
+    version = _version(deployment)
+    local = _local_papers.get(deployment.id)
+    if local is not None and local[0] == version:
+        return local[1]
+
+    try:
+        cached: tuple[str, bytes] | None = cache.get(_cache_key(deployment.id))
+    except Exception as e:
+        logger.warning("Exam Paper Cache Error: %s: %s", type(e).__name__, e)
+        cached = None
+    if cached is not None and cached[0] == version:
+        _remember(deployment.id, version, cached[1])
+        return cached[1]
+
+    paper = render_exam_paper(deployment.questions_snapshot)
+    try:
+        cache.set(_cache_key(deployment.id), (version, paper), settings.EXAM_PAPER_CACHE_TTL)
+    except Exception as e:
+        logger.warning("Exam Paper Cache Error: %s: %s", type(e).__name__, e)
+    _remember(deployment.id, version, paper)
+    return paper
+
+
+def build_exam_paper_body(
+    *,
+    deployment: ExamDeployment,
+    paper: bytes,
+    elapsed_time: int,
+    cheating_count: int,
+) -> bytes:
+    header = _renderer.render(
+        {
+            "exam_id": deployment.exam_id,
+            "exam_name": deployment.exam.title,
+            "duration_time": deployment.duration_time,
+            "elapsed_time": elapsed_time,
+            "cheating_count": cheating_count,
+        }
+    )
+    # {"exam_id":...,"cheating_count":N} → {"exam_id":...,"cheating_count":N,"questions":[...]}
+    return bytes(header[:-1]) + b',"questions":' + paper + b"}"
+
+
+def invalidate_exam_paper(deployment_id: int) -> None:
+    with _local_lock:
+        _local_papers.pop(deployment_id, None)
+    try:
+        cache.delete(_cache_key(deployment_id))
+    except Exception as e:
+        logger.warning("Exam Paper Cache Error: %s: %s", type(e).__name__, e)
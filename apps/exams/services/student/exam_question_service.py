@@ -3,6 +3,7 @@ from django.utils import timezone
 from apps.core.exceptions.exception_messages import EMS
 from apps.core.exceptions.exceptions import GoneException, LockedException
 from apps.exams.models import ExamDeployment, ExamSubmission
+from apps.exams.services.student.exam_attempt_service import AttemptState
 
 
 def validate_exam_access(deployment: ExamDeployment, submission: ExamSubmission | None) -> None:
@@ -22,9 +23,10 @@ def validate_exam_access(deployment: ExamDeployment, submission: ExamSubmission
         raise GoneException(EMS.E410_ENDED("시험")["error_detail"])
 
 
-def calculate_elapsed_time(submission: ExamSubmission | None) -> int:
+def calculate_elapsed_time(submission: ExamSubmission | AttemptState | None) -> int:
     """
     경과 시간 계산 (초 단위)
+    - 제출 내역 또는 응시 세션(참가 코드 검증 시각)의 started_at 기준
     """
     if not submission or not submission.started_at:
         return 0
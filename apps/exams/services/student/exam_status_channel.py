@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncGenerator
+from datetime import datetime
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer  # type: ignore
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.exams.models import ExamDeployment
+from apps.exams.models.exam_deployment import DeploymentStatus
+from apps.exams.services.student.exam_status_service import get_student_exam_status
+
+logger = logging.getLogger(__name__)
+
+"""
+배포별 시험 상태 푸시 채널 (SSE + channel layer 그룹)
+
+status_group_name: 배포별 channel layer 그룹 이름
+encode_status_event: 상태 → SSE 이벤트 문자열 (retry 지정 시 재연결 대기 시간 포함)
+build_status_payload: 배포의 현재 상태 + close_at (구독 중인 스트림의 종료 타이머 기준)
+publish_exam_status: 배포 상태 변경 / 수정 시 그룹에 상태 전달 (관리자 서비스에서 on_commit 으로 호출)
+stream_exam_status: (ASGI) 상태 구독 async 제너레이터
+    1. 그룹 구독 → 배포 다시 조회 후 현재 상태 전송 → 이미 force_submit (또는 삭제된 배포) 이면 종료
+    2. 대기 (DB 조회 없음)
+        - 그룹 메세지 수신: 상태 전송, force_submit 이면 종료 / close_at 이 바뀌면 타이머 갱신
+        - close_at 도달 (서버 측 타이머): force_submit 전송 후 종료
+        - 일정 시간 동안 이벤트가 없으면 heartbeat 주석 전송 (프록시 idle timeout 방지)
+    3. 연결 종료 / 취소 시 그룹 구독 해제
+"""
+
+_STATUS_EVENT_TYPE = "exam.status"
+
+
+def status_group_name(deployment_id: int) -> str:
+    return f"exam_status.{deployment_id}"
+
+
+def encode_status_event(payload: dict[str, Any], *, retry_ms: int | None = None) -> str:
+    data = f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    return f"retry: {retry_ms}\n{data}" if retry_ms is not None else data
+
+
+def build_status_payload(deployment: ExamDeployment) -> dict[str, Any]:
+    payload = get_student_exam_status(deployment)
+    payload["close_at"] = deployment.close_at.isoformat() if deployment.close_at else None
+    return payload
+
+
+def publish_exam_status(deployment: ExamDeployment) -> None:
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    try:
+        async_to_sync(channel_layer.group_send)(
+            status_group_name(deployment.id),
+            {"type": _STATUS_EVENT_TYPE, "payload": build_status_payload(deployment)},
+        )
+    except Exception as e:
+        # 푸시 실패 시에도 구독 중인 스트림은 close_at 타이머로 종료됨
+        logger.warning("Exam Status Publish Error: %s: %s", type(e).__name__, e)
+
+
+def _seconds_until(close_at: datetime | None) -> float | None:
+    if close_at is None:
+        return None
+    return (close_at - timezone.now()).total_seconds()
+
+
+def _closed_payload(close_at: datetime | None) -> dict[str, Any]:
+    return {
+        "exam_status": DeploymentStatus.DEACTIVATED,
+        "force_submit": True,
+        "close_at": close_at.isoformat() if close_at else None,
+    }
+
+
+async def stream_exam_status(deployment: ExamDeployment) -> AsyncGenerator[str, None]:
+    channel_layer = get_channel_layer()
+    group = status_group_name(deployment.id)
+    channel: str = await channel_layer.new_channel()
+    await channel_layer.group_add(group, channel)
+
+    heartbeat = settings.EXAM_STATUS_STREAM_HEARTBEAT
+    # receive 를 timeout 으로 취소하면 수신 버퍼가 정리되므로, 수신 task 하나를 유지하면서 대기만 timeout 처리
+    receive_task: asyncio.Task[dict[str, Any]] | None = None
+    try:
+        # 구독 이후에 상태를 다시 조회 (조회 ~ 구독 사이에 발행된 변경도 놓치지 않음, 이후 변경은 그룹 메세지로 수신)
+        current = await ExamDeployment.objects.filter(id=deployment.id).afirst()
+        payload = build_status_payload(current) if current is not None else _closed_payload(timezone.now())
+        close_at: datetime | None = current.close_at if current is not None else None
+        yield encode_status_event(payload, retry_ms=settings.EXAM_STATUS_STREAM_RETRY_MS)
+        if payload["force_submit"]:
+            return
+
+        while True:
+            if receive_task is None:
+                receive_task = asyncio.ensure_future(channel_layer.receive(channel))
+
+            remaining = _seconds_until(close_at)
+            if remaining is not None and remaining <= 0:
+                yield encode_status_event(_closed_payload(close_at))
+                return
+
+            timeout = heartbeat if remaining is None else min(heartbeat, remaining)
+            done, _ = await asyncio.wait({receive_task}, timeout=timeout)
+            if not done:
+                if remaining is None or remaining > heartbeat:
+                    yield ": heartbeat\n\n"
+                continue
+
+            message = receive_task.result()
+            receive_task = None
+            if message.get("type") != _STATUS_EVENT_TYPE:
+                continue
+
+            payload = message["payload"]
+            yield encode_status_event(payload)
+            if payload["force_submit"]:
+                return
+            # 배포 수정으로 close_at 이 바뀐 경우 타이머 갱신
+            close_at = parse_datetime(payload["close_at"]) if payload.get("close_at") else None
+    finally:
+        if receive_task is not None:
+            receive_task.cancel()
+        try:
+            await channel_layer.group_discard(group, channel)
+        except Exception as e:
+            logger.warning("Exam Status Unsubscribe Error: %s: %s", type(e).__name__, e)
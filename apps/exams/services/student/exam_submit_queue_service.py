@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.exams.constants import MAX_SUBMISSION_COUNT
+from apps.exams.models.exam_deployment import ExamDeployment
+from apps.exams.models.exam_submission import ExamSubmission
+from apps.exams.models.exam_submission_intake import (
+    ExamSubmissionIntake,
+    SubmissionIntakeStatus,
+)
+from apps.exams.services.student.exam_attempt_service import (
+    AttemptState,
+    close_exam_attempt,
+)
+from apps.exams.services.student.exam_submit_service import create_exam_submission
+from apps.user.models import User
+
+logger = logging.getLogger(__name__)
+
+"""
+대기열 제출 모드 (EXAM_SUBMISSION_QUEUE_ENABLED)
+시험 종료 직전 제출이 몰릴 때, 요청에서는 검증 + 원본 답안 저장만 하고 채점은 Celery 워커에서 처리
+
+reserve_submission_attempt: Redis 카운터로 제출 횟수 선점 (카운터가 없으면 DB 제출 수 + 대기 중 intake 수로 초기화)
+release_submission_attempt: 거부 / 실패 시 선점한 횟수 반환
+enqueue_exam_submission: intake 행 저장 후 커밋되면 채점 작업 등록 (요청에서는 응시 세션을 종료하지 않음)
+process_submission_intake: (워커) intake 잠금 → DB 기준 제출 횟수 재검증 → 채점 + ExamSubmission 생성 → 응시 세션 종료
+requeue_stale_intakes: (beat) 일정 시간 이상 pending 인 intake 재등록 (브로커 메세지 유실 대비)
+"""
+
+
+def _count_key(deployment_id: int, submitter_id: int) -> str:
+    return f"exams:submit_count:{deployment_id}:{submitter_id}"
+
+
+def _db_attempt_count(*, deployment_id: int, submitter_id: int, exclude_intake_id: int | None = None) -> int:
+    submitted = ExamSubmission.objects.filter(deployment_id=deployment_id, submitter_id=submitter_id).count()
+    pending = ExamSubmissionIntake.objects.filter(
+        deployment_id=deployment_id,
+        submitter_id=submitter_id,
+        status=SubmissionIntakeStatus.PENDING,
+    )
+    if exclude_intake_id is not None:
+        pending = pending.exclude(id=exclude_intake_id)
+    return submitted + pending.count()
+
+
+def reserve_submission_attempt(*, deployment: ExamDeployment, submitter: User) -> None:
+    key = _count_key(deployment.id, submitter.id)
+    try:
+        if key not in cache:
+            cache.add(
+                key,
+                _db_attempt_count(deployment_id=deployment.id, submitter_id=submitter.id),
+                settings.EXAM_SUBMISSION_COUNT_TTL,
+            )
+        count = cache.incr(key)
+    except Exception as e:
+        # Redis 장애 시 DB 기준으로만 검증 (최종 검증은 워커에서 다시 수행)
+        logger.warning("Submission Count Cache Error: %s: %s", type(e).__name__, e)
+        if _db_attempt_count(deployment_id=deployment.id, submitter_id=submitter.id) >= MAX_SUBMISSION_COUNT:
+            raise ValidationError("시험은 2회까지 제출 가능합니다.")
+        return
+
+    if count > MAX_SUBMISSION_COUNT:
+        release_submission_attempt(deployment_id=deployment.id, submitter_id=submitter.id)
+        raise ValidationError("시험은 2회까지 제출 가능합니다.")
+
+
+def release_submission_attempt(*, deployment_id: int, submitter_id: int) -> None:
+    try:
+        cache.decr(_count_key(deployment_id, submitter_id))
+    except ValueError:
+        # 카운터가 만료된 경우: 다음 제출에서 DB 기준으로 다시 초기화
+        pass
+    except Exception as e:
+        logger.warning("Submission Count Cache Error: %s: %s", type(e).__name__, e)
+
+
+def _enqueue_grading(intake_id: int) -> None:
+    from apps.exams.tasks import grade_submission_intake
+
+    transaction.on_commit(lambda: grade_submission_intake.delay(intake_id))
+
+
+def enqueue_exam_submission(
+    *,
+    deployment: ExamDeployment,
+    submitter: User,
+    started_at: datetime,
+    cheating_count: int,
+    answers: list[dict[str, Any]],
+    attempt: AttemptState | None = None,
+) -> ExamSubmissionIntake:
+    reserve_submission_attempt(deployment=deployment, submitter=submitter)
+    try:
+        with transaction.atomic():
+            intake = ExamSubmissionIntake.objects.create(
+                submitter=submitter,
+                deployment=deployment,
+                attempt_id=attempt.attempt_id if attempt is not None else None,
+                attempt_version=attempt.version if attempt is not None else 0,
+                started_at=started_at,
+                cheating_count=cheating_count,
+                answers=answers,
+            )
+            _enqueue_grading(intake.id)
+    except Exception:
+        release_submission_attempt(deployment_id=deployment.id, submitter_id=submitter.id)
+        raise
+    return intake
+
+
+def _close_intake(intake: ExamSubmissionIntake, status: str, error: str) -> None:
+    intake.status = status
+    intake.error = error[:255]
+    intake.save(update_fields=["status", "error", "updated_at"])
+    release_submission_attempt(deployment_id=intake.deployment_id, submitter_id=intake.submitter_id)
+
+
+def process_submission_intake(intake_id: int) -> ExamSubmissionIntake | None:
+    with transaction.atomic():
+        intake = (
+            ExamSubmissionIntake.objects.select_for_update()
+            .select_related("deployment", "submitter")
+            .filter(id=intake_id)
+            .first()
+        )
+        # 이미 처리된 intake (중복 전달된 메세지) 는 무시
+        if intake is None or intake.status != SubmissionIntakeStatus.PENDING:
+            return intake
+
+        # 제출 횟수 최종 검증 (DB 기준, 현재 intake 제외)
+        attempts = _db_attempt_count(
+            deployment_id=intake.deployment_id,
+            submitter_id=intake.submitter_id,
+            exclude_intake_id=intake.id,
+        )
+        if attempts >= MAX_SUBMISSION_COUNT:
+            _close_intake(intake, SubmissionIntakeStatus.REJECTED, "시험은 2회까지 제출 가능합니다.")
+            return intake
+
+        submission = create_exam_submission(
+            deployment=intake.deployment,
+            submitter=intake.submitter,
+            started_at=intake.started_at,
+            cheating_count=intake.cheating_count,
+            answers=intake.answers,
+        )
+        intake.submission = submission
+        intake.status = SubmissionIntakeStatus.GRADED
+        intake.save(update_fields=["submission", "status", "updated_at"])
+
+        # 채점이 끝난 뒤에 응시 세션 종료 (채점 전 실패 / 거부 시 세션의 작성 중 답안 유지)
+        if intake.attempt_id is not None:
+            close_exam_attempt(
+                state=AttemptState(
+                    attempt_id=intake.attempt_id, started_at=intake.started_at, version=intake.attempt_version
+                ),
+                submitter=intake.submitter,
+                payload={
+                    "deployment": intake.deployment,
+                    "cheating_count": intake.cheating_count,
+                    "answers": intake.answers,
+                },
+                submission=submission,
+            )
+        return intake
+
+
+def mark_submission_intake_failed(intake_id: int, error: str) -> None:
+    with transaction.atomic():
+        intake = ExamSubmissionIntake.objects.select_for_update().filter(id=intake_id).first()
+        if intake is None or intake.status != SubmissionIntakeStatus.PENDING:
+            return
+        _close_intake(intake, SubmissionIntakeStatus.FAILED, error)
+
+
+def requeue_stale_intakes() -> int:
+    threshold = timezone.now() - timedelta(seconds=settings.EXAM_SUBMISSION_REQUEUE_AFTER)
+    intake_ids = list(
+        ExamSubmissionIntake.objects.filter(
+            status=SubmissionIntakeStatus.PENDING,
+            updated_at__lt=threshold,
+        ).values_list("id", flat=True)
+    )
+    if not intake_ids:
+        return 0
+
+    # 같은 intake 가 매 주기마다 다시 등록되지 않도록 updated_at 갱신
+    ExamSubmissionIntake.objects.filter(id__in=intake_ids).update(updated_at=timezone.now())
+    for intake_id in intake_ids:
+        _enqueue_grading(intake_id)
+    return len(intake_ids)
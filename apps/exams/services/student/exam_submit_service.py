@@ -7,8 +7,11 @@ from django.db import transaction
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from apps.exams.constants import MAX_SUBMISSION_COUNT
 from apps.exams.models.exam_deployment import ExamDeployment
 from apps.exams.models.exam_submission import ExamSubmission
+from apps.exams.services.deployment_stats import apply_submission_to_stats
+from apps.exams.services.grading_plan import get_grading_plan, grade_with_plan
 from apps.user.models import User
 
 
@@ -39,7 +42,7 @@ def validate_exam_submission_limit(
         submitter=submitter,
     ).count()
 
-    if existing_count >= 2:
+    if existing_count >= MAX_SUBMISSION_COUNT:
         raise ValidationError("시험은 2회까지 제출 가능합니다.")
 
 
@@ -52,34 +55,12 @@ def _snapshot_questions(deployment: ExamDeployment) -> list[dict[str, Any]]:
     return questions
 
 
+# 배포별로 컴파일/캐시된 채점 계획 사용 → 문항당 dict 조회 + 유형별 비교 1회
 def grade_answers(
     deployment: ExamDeployment,
     submitted_answers: list[dict[str, Any]],
 ) -> tuple[list[dict[str, Any]], int, int]:
-    simplified_question_snapshot = _simplify_question_snapshot(deployment)
-    total_score = 0
-    correct_count = 0
-    graded_answers = []
-    for a in submitted_answers:
-        question = simplified_question_snapshot[a["question_id"]]
-        is_correct = set(a["submitted_answer"]) == set(question["answer"])
-        if is_correct:
-            total_score += question["point"]
-            correct_count += 1
-        a.update({"is_correct": is_correct})
-        graded_answers.append(a)
-
-    return graded_answers, total_score, correct_count
-
-
-def _simplify_question_snapshot(deployment: ExamDeployment) -> dict[str, dict[str, Any]]:
-    return {
-        q["id"]: {
-            "answer": q["answer"],
-            "point": q["point"],
-        }
-        for q in deployment.questions_snapshot
-    }
+    return grade_with_plan(get_grading_plan(deployment), submitted_answers)
 
 
 @transaction.atomic
@@ -103,5 +84,7 @@ def create_exam_submission(
         score=total_score,
         correct_answer_count=correct_count,
     )
+    # 배포 통계 증분 반영
+    apply_submission_to_stats(submission)
 
     return submission
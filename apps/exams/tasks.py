@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import logging
+
+from celery import Task, shared_task  # type: ignore
+
+from apps.exams.services.student.exam_attempt_service import flush_attempt_checkpoints
+from apps.exams.services.student.exam_submit_queue_service import (
+    mark_submission_intake_failed,
+    process_submission_intake,
+    requeue_stale_intakes,
+)
+
+logger = logging.getLogger(__name__)
+
+"""
+쪽지시험 Celery 작업
+
+grade_submission_intake: 대기열 제출(intake) 채점 + ExamSubmission 생성 (실패 시 재시도, 최종 실패는 failed 처리)
+requeue_stale_submission_intakes: (beat) 오래 pending 상태인 intake 재등록
+flush_exam_attempts: (beat) Redis 에 누적된 응시 중 답안을 DB 체크포인트로 일괄 저장
+"""
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=5)  # type: ignore[untyped-decorator]
+def grade_submission_intake(self: Task, intake_id: int) -> None:
+    try:
+        process_submission_intake(intake_id)
+    except Exception as e:
+        if self.request.retries >= self.max_retries:
+            logger.exception("Submission Intake Grading Failed: intake_id=%s", intake_id)
+            mark_submission_intake_failed(intake_id, f"{type(e).__name__}: {e}")
+            return
+        raise self.retry(exc=e)
+
+
+@shared_task  # type: ignore[untyped-decorator]
+def requeue_stale_submission_intakes() -> int:
+    return requeue_stale_intakes()
+
+
+@shared_task  # type: ignore[untyped-decorator]
+def flush_exam_attempts() -> int:
+    return flush_attempt_checkpoints()
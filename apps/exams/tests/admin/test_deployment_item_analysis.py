@@ -0,0 +1,148 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import DeploymentStats, Exam, ExamDeployment
+from apps.exams.models.exam_question import QuestionType
+from apps.exams.services.admin import admin_item_analysis_service
+from apps.exams.services.admin.admin_item_analysis_service import (
+    compute_item_analysis,
+    get_item_analysis,
+)
+from apps.exams.services.student.exam_submit_service import create_exam_submission
+from apps.user.models.user import GenderChoices, RoleChoices, User
+
+"""
+배포 문항 분석 테스트
+
+compute_item_analysis: 정답률, 상위 / 하위 27% 정답률과 변별도, 선택지별 선택 횟수
+get_item_analysis: 새 제출 전까지 캐시 사용
+GET exams/deployments/<id>/item-analysis: 관리자만 가능
+"""
+
+
+class DeploymentItemAnalysisTests(IsolatedRedisTestClient):
+    admin_user: User
+    student: User
+    deployment: ExamDeployment
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin_user = User.objects.create_superuser(
+            name="admin",
+            password="password123",
+            email="item-admin@test.com",
+            phone_number="010-1234-1234",
+            gender=GenderChoices.MALE,
+            birthday=date(2000, 1, 1),
+        )
+        cls.student = User.objects.create_user(
+            email="item-student@test.com",
+            password="password123",
+            name="학생",
+            gender=GenderChoices.MALE,
+            birthday=date(2000, 1, 1),
+            role=RoleChoices.ST,
+        )
+        course = Course.objects.create(name="코스")
+        cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=20,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+        )
+        subject = Subject.objects.create(course=course, title="과목", number_of_days=1, number_of_hours=1)
+        exam = Exam.objects.create(subject=subject, title="쪽지시험")
+        cls.deployment = ExamDeployment.objects.create(
+            exam=exam,
+            cohort=cohort,
+            open_at=timezone.now() - timedelta(hours=2),
+            close_at=timezone.now() - timedelta(hours=1),
+            duration_time=600,
+            access_code="item",
+            questions_snapshot=[
+                {
+                    "id": 1,
+                    "type": QuestionType.SINGLE_CHOICE,
+                    "options": ["A", "B", "C", "D"],
+                    "answer": "A",
+                    "point": 60,
+                },
+                {"id": 2, "type": QuestionType.OX, "answer": "O", "point": 40},
+            ],
+        )
+        DeploymentStats.objects.create(deployment=cls.deployment)
+
+    def setUp(self) -> None:
+        super().setUp()
+        # 점수: 100, 60, 40, 0
+        for first, second in (("A", "O"), ("A", "X"), ("B", "O"), ("C", "X")):
+            self._submit(first, second)
+
+    def _submit(self, first: str, second: str) -> None:
+        create_exam_submission(
+            deployment=self.deployment,
+            submitter=self.student,
+            started_at=timezone.now(),
+            cheating_count=0,
+            answers=[
+                {"question_id": 1, "submitted_answer": [first]},
+                {"question_id": 2, "submitted_answer": [second]},
+            ],
+        )
+
+    def _deployment(self) -> ExamDeployment:
+        return ExamDeployment.objects.select_related("stats").get(id=self.deployment.id)
+
+    def test_item_statistics(self) -> None:
+        result = compute_item_analysis(self._deployment())
+
+        self.assertEqual((result["submit_count"], result["group_size"]), (4, 1))
+        single, ox = result["questions"]
+        self.assertEqual(
+            (single["correct_rate"], single["upper_correct_rate"], single["lower_correct_rate"]), (0.5, 1, 0)
+        )
+        self.assertEqual(single["discrimination"], 1.0)
+        self.assertEqual(
+            single["option_counts"],
+            [
+                {"option": "A", "count": 2},
+                {"option": "B", "count": 1},
+                {"option": "C", "count": 1},
+                {"option": "D", "count": 0},
+            ],
+        )
+        self.assertEqual(ox["option_counts"], [{"option": "O", "count": 2}, {"option": "X", "count": 2}])
+
+    def test_cached_until_next_submission(self) -> None:
+        with patch.object(
+            admin_item_analysis_service, "compute_item_analysis", wraps=compute_item_analysis
+        ) as mock_compute:
+            get_item_analysis(self._deployment())
+            get_item_analysis(self._deployment())
+            self.assertEqual(mock_compute.call_count, 1)
+
+            self._submit("A", "O")
+            self.assertEqual(get_item_analysis(self._deployment())["submit_count"], 5)
+            self.assertEqual(mock_compute.call_count, 2)
+
+    def test_item_analysis_api(self) -> None:
+        url = reverse("exam-deployment-item-analysis", kwargs={"deployment_id": self.deployment.id})
+
+        self.client.force_authenticate(user=self.student)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["questions"][1]["discrimination"], 1.0)
+
+        missing = reverse("exam-deployment-item-analysis", kwargs={"deployment_id": 0})
+        self.assertEqual(self.client.get(missing).status_code, status.HTTP_404_NOT_FOUND)
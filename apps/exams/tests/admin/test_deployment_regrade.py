@@ -0,0 +1,184 @@
+from datetime import date, timedelta
+from io import StringIO
+from typing import Any
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import (
+    DeploymentStats,
+    Exam,
+    ExamDeployment,
+    ExamQuestion,
+    ExamSubmission,
+)
+from apps.exams.models.exam_question import QuestionType
+from apps.exams.services.admin import admin_regrade_service
+from apps.exams.services.admin.admin_deployment_service import (
+    _build_questions_snapshot,
+)
+from apps.exams.services.admin.admin_regrade_service import regrade_deployment
+from apps.exams.services.student.exam_submit_service import create_exam_submission
+from apps.user.models.user import GenderChoices, RoleChoices, User
+
+"""
+배포 재채점 테스트
+
+정답 수정 후 regrade_deployment: dry_run 은 저장하지 않고 diff 만, 실제 실행은 스냅샷 + 제출 내역 갱신
+중간 실패: 저장된 chunk 까지 통계 재계산, after_id 로 이어서 실행
+프로세스 풀(workers > 1) 결과가 단일 프로세스와 같은지
+POST exams/deployments/<id>/regrade: 관리자만 가능
+"""
+
+
+class DeploymentRegradeTests(IsolatedRedisTestClient):
+    admin_user: User
+    student: User
+    deployment: ExamDeployment
+    question_single: ExamQuestion
+    question_ox: ExamQuestion
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin_user = User.objects.create_superuser(
+            name="admin",
+            password="password123",
+            email="regrade-admin@test.com",
+            phone_number="010-1234-1234",
+            gender=GenderChoices.MALE,
+            birthday=date(2000, 1, 1),
+        )
+        cls.student = User.objects.create_user(
+            email="regrade-student@test.com",
+            password="password123",
+            name="학생",
+            gender=GenderChoices.MALE,
+            birthday=date(2000, 1, 1),
+            role=RoleChoices.ST,
+        )
+        course = Course.objects.create(name="코스")
+        cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=20,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+        )
+        subject = Subject.objects.create(course=course, title="과목", number_of_days=1, number_of_hours=1)
+        exam = Exam.objects.create(subject=subject, title="쪽지시험")
+        cls.question_single = ExamQuestion.objects.create(
+            exam=exam, type=QuestionType.SINGLE_CHOICE, question="Q1", options=["A", "B"], answer="A", point=10
+        )
+        cls.question_ox = ExamQuestion.objects.create(
+            exam=exam, type=QuestionType.OX, question="Q2", answer="O", point=5
+        )
+        cls.deployment = ExamDeployment.objects.create(
+            exam=exam,
+            cohort=cohort,
+            open_at=timezone.now() - timedelta(hours=2),
+            close_at=timezone.now() - timedelta(hours=1),
+            duration_time=600,
+            access_code="regrade",
+            questions_snapshot=_build_questions_snapshot(exam),
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        # A / B 로 답한 제출 각각 2건 (OX 는 모두 정답)
+        for answer in ("A", "B", "A", "B"):
+            create_exam_submission(
+                deployment=self.deployment,
+                submitter=self.student,
+                started_at=timezone.now() - timedelta(hours=1),
+                cheating_count=0,
+                answers=[
+                    {"question_id": self.question_single.id, "submitted_answer": [answer]},
+                    {"question_id": self.question_ox.id, "submitted_answer": ["O"]},
+                ],
+            )
+        # 정답 수정: A → B
+        ExamQuestion.objects.filter(id=self.question_single.id).update(answer="B")
+
+    def _scores(self) -> list[int]:
+        return list(ExamSubmission.objects.order_by("id").values_list("score", flat=True))
+
+    def test_dry_run_reports_diff_without_saving(self) -> None:
+        report = regrade_deployment(self.deployment, dry_run=True)
+
+        self.assertEqual(report.changed_question_ids, [self.question_single.id])
+        self.assertEqual((report.scanned, report.changed, report.score_delta), (4, 4, 0))
+        self.assertEqual(report.samples[0].score, (15, 5))
+        self.assertEqual(report.samples[0].flipped_question_ids, [self.question_single.id])
+        self.assertEqual(self._scores(), [15, 5, 15, 5])
+        self.deployment.refresh_from_db()
+        self.assertEqual(self.deployment.questions_snapshot[0]["answer"], "A")
+
+    def test_regrade_updates_submissions_and_snapshot(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            report = regrade_deployment(self.deployment, chunk_size=3)
+
+        self.assertEqual(report.changed, 4)
+        self.assertEqual(self._scores(), [5, 15, 5, 15])
+        submission = ExamSubmission.objects.order_by("id")[1]
+        self.assertEqual(submission.correct_answer_count, 2)
+        self.assertTrue(all(a["is_correct"] for a in submission.answers))
+        self.deployment.refresh_from_db()
+        self.assertEqual(self.deployment.questions_snapshot[0]["answer"], "B")
+
+        # 다시 실행하면 변경 없음
+        self.assertEqual(regrade_deployment(self.deployment).changed, 0)
+
+    def test_failed_regrade_rebuilds_stats_and_resumes(self) -> None:
+        save_chunk = admin_regrade_service._save_chunk
+        calls = []
+
+        def fail_second_chunk(results: list[Any]) -> None:
+            calls.append(results)
+            if len(calls) == 2:
+                raise RuntimeError("db down")
+            save_chunk(results)
+
+        with patch.object(admin_regrade_service, "_save_chunk", side_effect=fail_second_chunk):
+            with self.assertLogs(admin_regrade_service.logger, "ERROR"), self.assertRaises(RuntimeError):
+                regrade_deployment(self.deployment, chunk_size=3)
+
+        # 저장된 첫 chunk 가 통계에 반영됨
+        self.assertEqual(self._scores(), [5, 15, 5, 5])
+        stats = DeploymentStats.objects.get(deployment=self.deployment)
+        self.assertEqual((stats.score_sum, stats.max_score), (30, 15))
+
+        submission_ids = list(ExamSubmission.objects.order_by("id").values_list("id", flat=True))
+        report = regrade_deployment(self.deployment, after_id=submission_ids[2])
+        self.assertEqual((report.scanned, report.changed, report.last_saved_id), (1, 1, submission_ids[3]))
+        self.assertEqual(self._scores(), [5, 15, 5, 15])
+
+    def test_process_pool_matches_inline(self) -> None:
+        inline = regrade_deployment(self.deployment, dry_run=True, chunk_size=3)
+        pooled = regrade_deployment(self.deployment, dry_run=True, chunk_size=3, workers=2)
+
+        self.assertEqual(pooled.samples, inline.samples)
+
+    def test_regrade_command_dry_run(self) -> None:
+        out = StringIO()
+        call_command("regrade_deployment", self.deployment.id, "--dry-run", stdout=out)
+
+        self.assertIn("scanned=4 changed=4", out.getvalue())
+        self.assertEqual(self._scores(), [15, 5, 15, 5])
+
+    def test_regrade_api(self) -> None:
+        url = reverse("exam-deployment-regrade", kwargs={"deployment_id": self.deployment.id})
+
+        self.client.force_authenticate(user=self.student)
+        self.assertEqual(self.client.post(url, {"dry_run": True}, format="json").status_code, 403)
+
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(url, {"dry_run": True}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["changed"], 4)
+        self.assertEqual(response.data["samples"][0]["score"], [15, 5])
@@ -0,0 +1,191 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import DeploymentStats, Exam, ExamDeployment, ExamSubmission
+from apps.exams.models.exam_question import QuestionType
+from apps.exams.services.admin.admin_deployment_service import (
+    create_deployment,
+    get_admin_deployment_detail,
+    list_admin_deployments,
+)
+from apps.exams.services.student.exam_submit_service import create_exam_submission
+from apps.user.models import CohortStudent
+from apps.user.models.user import GenderChoices, RoleChoices, User
+
+"""
+배포 통계(DeploymentStats) 테스트
+
+create_exam_submission: 제출 시 통계 증분 반영 (통계 행 UPDATE 1번 + 문항 행 INSERT(없는 행만) / UPDATE 1번)
+rebuild_deployment_stats 커맨드: 제출 내역으로 재계산 (증분 결과와 동일)
+어드민 배포 목록 / 상세: 통계 컬럼 사용 (GROUP BY 없음), 제출 삭제 시 재계산
+"""
+
+
+class DeploymentStatsTests(IsolatedRedisTestClient):
+    admin_user: User
+    students: list[User]
+    cohort: Cohort
+    exam: Exam
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin_user = User.objects.create_superuser(
+            name="admin",
+            password="password123",
+            email="stats-admin@test.com",
+            phone_number="010-1234-1234",
+            gender=GenderChoices.MALE,
+            birthday=date(2000, 1, 1),
+        )
+        course = Course.objects.create(name="코스")
+        cls.cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=20,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+        )
+        cls.students = [
+            User.objects.create_user(
+                email=f"stats-student{i}@test.com",
+                password="password123",
+                name=f"학생{i}",
+                gender=GenderChoices.MALE,
+                birthday=date(2000, 1, 1),
+                role=RoleChoices.ST,
+            )
+            for i in range(3)
+        ]
+        for student in cls.students:
+            CohortStudent.objects.create(cohort=cls.cohort, user=student)
+        subject = Subject.objects.create(course=course, title="과목", number_of_days=1, number_of_hours=1)
+        cls.exam = Exam.objects.create(subject=subject, title="쪽지시험")
+
+    def _deployment(self, number: int) -> ExamDeployment:
+        cohort = self.cohort
+        if number > 1:
+            cohort = Cohort.objects.create(
+                course=self.cohort.course,
+                number=number,
+                max_student=20,
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=1),
+            )
+        deployment = create_deployment(
+            cohort=cohort,
+            exam=self.exam,
+            duration_time=600,
+            open_at=timezone.now() + timedelta(hours=number),
+            close_at=timezone.now() + timedelta(hours=number + 1),
+        )
+        deployment.questions_snapshot = [
+            {"id": 1, "type": QuestionType.SINGLE_CHOICE, "answer": "A", "point": 60},
+            {"id": 2, "type": QuestionType.OX, "answer": "O", "point": 40},
+        ]
+        deployment.save()
+        return deployment
+
+    def _submit(self, deployment: ExamDeployment, student: User, first: str, second: str) -> ExamSubmission:
+        return create_exam_submission(
+            deployment=deployment,
+            submitter=student,
+            started_at=timezone.now(),
+            cheating_count=0,
+            answers=[
+                {"question_id": 1, "submitted_answer": [first]},
+                {"question_id": 2, "submitted_answer": [second]},
+            ],
+        )
+
+    def _stats_fields(self, stats: DeploymentStats) -> tuple[object, ...]:
+        return (
+            stats.submit_count,
+            stats.submitter_count,
+            stats.avg_score,
+            stats.min_score,
+            stats.max_score,
+            stats.score_histogram,
+            [(q.question_id, q.answered_count, q.correct_count) for q in stats.questions.all()],
+        )
+
+    def test_submission_updates_stats_incrementally(self) -> None:
+        deployment = self._deployment(1)
+        self._submit(deployment, self.students[0], "A", "O")  # 100
+        self._submit(deployment, self.students[0], "B", "O")  # 40
+        self._submit(deployment, self.students[1], "A", "X")  # 60
+
+        stats = DeploymentStats.objects.get(deployment=deployment)
+        self.assertEqual((stats.submit_count, stats.submitter_count), (3, 2))
+        self.assertEqual((stats.avg_score, stats.min_score, stats.max_score), (200 / 3, 40, 100))
+        self.assertEqual(stats.score_histogram, [0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1])
+        self.assertEqual(
+            [(q["question_id"], q["answered_count"], q["correct_count"]) for q in stats.question_correct_rates],
+            [(1, 3, 2), (2, 3, 2)],
+        )
+
+        # 재계산 결과가 증분 결과와 같음
+        incremental = self._stats_fields(stats)
+        DeploymentStats.objects.filter(deployment=deployment).update(submit_count=0, score_bucket_4=0)
+        stats.questions.all().delete()
+        call_command("rebuild_deployment_stats", deployment.id, stdout=StringIO())
+        self.assertEqual(self._stats_fields(DeploymentStats.objects.get(deployment=deployment)), incremental)
+
+    def test_submission_updates_stats_without_reading_stats_row(self) -> None:
+        deployment = self._deployment(1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self._submit(deployment, self.students[0], "A", "O")
+
+        stats_queries = [q["sql"] for q in queries.captured_queries if "exam_deployment_stats" in q["sql"]]
+        self.assertEqual(len(stats_queries), 1)
+        self.assertTrue(stats_queries[0].startswith("UPDATE"))
+        # 문항 행: 없는 행만 INSERT + UPDATE 1번 (SELECT 없음)
+        question_queries = [q["sql"] for q in queries.captured_queries if "exam_deployment_question_stats" in q["sql"]]
+        self.assertEqual([sql.split()[0] for sql in question_queries], ["INSERT", "UPDATE"])
+
+    def test_admin_list_reads_stats_without_aggregation(self) -> None:
+        low = self._deployment(1)
+        high = self._deployment(2)
+        self._submit(low, self.students[0], "B", "X")
+        self._submit(high, self.students[1], "A", "O")
+        self._submit(high, self.students[2], "A", "X")
+
+        queryset = list_admin_deployments(sort="avg_score", order="desc")
+
+        self.assertNotIn("GROUP BY", str(queryset.query))
+        self.assertEqual(
+            [(d.id, getattr(d, "submit_count"), getattr(d, "avg_score")) for d in queryset],
+            [(high.id, 2, 80.0), (low.id, 1, 0.0)],
+        )
+
+    def test_admin_detail_counts_and_delete_rebuilds(self) -> None:
+        deployment = self._deployment(1)
+        self._submit(deployment, self.students[0], "A", "O")
+        submission = self._submit(deployment, self.students[0], "A", "X")
+
+        detail = get_admin_deployment_detail(deployment_id=deployment.id)
+        counts = [getattr(detail, name) for name in ("submit_count", "total_target_count", "not_submitted_count")]
+        self.assertEqual(counts, [1, 3, 2])
+
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(reverse("exam-deployment-detail", kwargs={"deployment_id": deployment.id}))
+        stats = response.data["deployment"]["stats"]
+        self.assertEqual((stats["submit_count"], stats["max_score"]), (2, 100))
+        self.assertEqual(stats["question_correct_rates"][1]["correct_rate"], 0.5)
+
+        response = self.client.delete(reverse("exam_submission_detail", kwargs={"submission_id": submission.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        stats_row = DeploymentStats.objects.get(deployment=deployment)
+        self.assertEqual((stats_row.submit_count, stats_row.min_score), (1, 100))
+        self.assertEqual(stats_row.score_histogram[6], 0)
+        self.assertEqual([q.correct_count for q in stats_row.questions.all()], [1, 1])
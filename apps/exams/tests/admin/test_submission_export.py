@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import csv
+import io
+import secrets
+import zipfile
+from datetime import date, timedelta
+from xml.etree import ElementTree
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.core.utils.export_stream import stream_csv, stream_xlsx
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import Exam, ExamDeployment, ExamSubmission
+from apps.exams.models.exam_question import QuestionType
+from apps.user.models import User
+from apps.user.models.user import RoleChoices
+
+"""
+쪽지시험 응시 내역 내보내기 테스트
+
+CSV: 헤더 + 행, 문항별 정답 여부 컬럼 (배포별로 다른 문항은 빈 칸), 수식으로 시작하는 문자열 셀은 ' 로 시작
+XLSX: zip 안의 sheet1.xml 을 파싱해서 행 / 셀 확인
+필터 없음 / 잘못된 형식: 400, 학생: 403
+"""
+
+_SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def _read_xlsx_rows(content: bytes) -> list[list[str]]:
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    rows = []
+    for row in sheet.iter(f"{_SHEET_NS}row"):
+        rows.append([cell.findtext(f".//{_SHEET_NS}t") or cell.findtext(f"{_SHEET_NS}v") or "" for cell in row])
+    return rows
+
+
+class AdminSubmissionExportTest(APITestCase):
+    admin: User
+    student: User
+    cohort: Cohort
+    exam: Exam
+    first_submission: ExamSubmission
+    second_submission: ExamSubmission
+    url: str
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_user(
+            email="export-admin@test.com",
+            password="pass1234!",
+            name="관리자",
+            birthday=date(2000, 1, 1),
+            role=RoleChoices.AD,
+        )
+        cls.student = User.objects.create_user(
+            email="export-st@test.com",
+            password="pass1234!",
+            name="한율",
+            nickname="한율_회장",
+            birthday=date(2000, 1, 1),
+            role=RoleChoices.ST,
+        )
+        course = Course.objects.create(name="백엔드 부트캠프")
+        cls.cohort = Cohort.objects.create(
+            course=course,
+            number=3,
+            max_student=20,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=30),
+        )
+        subject = Subject.objects.create(course=course, title="Python", number_of_days=1, number_of_hours=1)
+        cls.exam = Exam.objects.create(subject=subject, title="기본 문법")
+
+        first = ExamDeployment.objects.create(
+            exam=cls.exam,
+            cohort=cls.cohort,
+            duration_time=60,
+            access_code="EXP001",
+            open_at=timezone.now() - timedelta(days=2),
+            close_at=timezone.now() + timedelta(days=1),
+            questions_snapshot=[
+                {"id": 11, "type": QuestionType.OX, "answer": "O", "point": 10},
+                {"id": 12, "type": QuestionType.OX, "answer": "X", "point": 10},
+            ],
+        )
+        second = ExamDeployment.objects.create(
+            exam=cls.exam,
+            cohort=cls.cohort,
+            duration_time=60,
+            access_code="EXP002",
+            open_at=timezone.now() - timedelta(days=1),
+            close_at=timezone.now() + timedelta(days=1),
+            questions_snapshot=[{"id": 13, "type": QuestionType.OX, "answer": "O", "point": 10}],
+        )
+        cls.first_submission = ExamSubmission.objects.create(
+            submitter=cls.student,
+            deployment=first,
+            started_at=timezone.now() - timedelta(hours=1),
+            answers=[
+                {"question_id": 11, "submitted_answer": ["O"], "is_correct": True},
+                {"question_id": 12, "submitted_answer": ["O"], "is_correct": False},
+            ],
+            score=10,
+            correct_answer_count=1,
+        )
+        cls.second_submission = ExamSubmission.objects.create(
+            submitter=cls.student,
+            deployment=second,
+            started_at=timezone.now() - timedelta(hours=1),
+            cheating_count=2,
+            answers=[{"question_id": 13, "submitted_answer": ["O"], "is_correct": True}],
+            score=10,
+            correct_answer_count=1,
+        )
+        cls.url = reverse("exam-submission-export")
+
+    def test_csv_export_flattens_answers(self) -> None:
+        self.client.force_authenticate(self.admin)
+
+        res = self.client.get(self.url, {"exam_id": str(self.exam.id), "sort": "started_at", "order": "asc"})
+
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.streaming)
+        self.assertEqual(res["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn(f"exam_submissions_exam{self.exam.id}_", res["Content-Disposition"])
+        content = b"".join(res.streaming_content).decode("utf-8-sig")  # type: ignore[attr-defined]
+        header, *rows = list(csv.reader(io.StringIO(content)))
+
+        self.assertEqual(header[0], "응시 ID")
+        self.assertEqual(header[-3:], ["문항 11", "문항 12", "문항 13"])
+        self.assertEqual(len(rows), 2)
+        by_id = {row[0]: row for row in rows}
+        self.assertEqual(by_id[str(self.first_submission.id)][-3:], ["1", "0", ""])
+        self.assertEqual(by_id[str(self.second_submission.id)][-3:], ["", "", "1"])
+        self.assertEqual(by_id[str(self.second_submission.id)][1:5], ["한율", "한율_회장", "백엔드 부트캠프", "3"])
+
+    def test_xlsx_export(self) -> None:
+        self.client.force_authenticate(self.admin)
+
+        res = self.client.get(self.url, {"cohort_id": str(self.cohort.id), "file_format": "xlsx"})
+
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res["Content-Disposition"].endswith('.xlsx"'))
+        rows = _read_xlsx_rows(b"".join(res.streaming_content))  # type: ignore[attr-defined]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][-1], "문항 13")
+        self.assertIn(str(self.first_submission.id), {row[0] for row in rows[1:]})
+
+    def test_xlsx_writer_streams_in_chunks(self) -> None:
+        # 압축되지 않도록 임의 문자열 포함
+        rows = (["<행>", index, None, "a\x01b", secrets.token_hex(16)] for index in range(5000))
+
+        chunks = list(stream_xlsx(rows, chunk_size=1024))
+
+        self.assertGreater(len(chunks), 2)
+        parsed = _read_xlsx_rows(b"".join(chunks))
+        self.assertEqual(len(parsed), 5000)
+        self.assertEqual(parsed[4999][:4], ["<행>", "4999", "", "ab"])
+
+    def test_csv_writer_escapes_formula_cells(self) -> None:
+        rows = [['=HYPERLINK("x")', "+1", "-2", "@SUM(A1)", "\tx", "\rx", "정상", -3, None]]
+
+        content = b"".join(stream_csv(rows)).decode("utf-8-sig")
+
+        self.assertEqual(
+            next(csv.reader(io.StringIO(content, newline=""))),
+            ['\'=HYPERLINK("x")', "'+1", "'-2", "'@SUM(A1)", "'\tx", "'\rx", "정상", "-3", ""],
+        )
+
+    def test_400_without_scope_or_invalid_format(self) -> None:
+        self.client.force_authenticate(self.admin)
+
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(
+            self.client.get(self.url, {"exam_id": str(self.exam.id), "file_format": "pdf"}).status_code, 400
+        )
+
+    def test_403_when_student(self) -> None:
+        self.client.force_authenticate(self.student)
+
+        self.assertEqual(self.client.get(self.url, {"exam_id": self.exam.id}).status_code, 403)
@@ -3,8 +3,8 @@ from datetime import date, timedelta
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
 
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
 from apps.courses.models import Cohort, Course, Subject
 from apps.exams.models import Exam, ExamDeployment
 from apps.user.models import User
@@ -14,7 +14,7 @@ DEFAULT_DURATION_TIME = 60
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
-class ExamAccessCodeVerifyAPITest(APITestCase):
+class ExamAccessCodeVerifyAPITest(IsolatedRedisTestClient):
     """
     쪽지시험 참가 코드 검증 API 테스트
     """
@@ -0,0 +1,212 @@
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import (
+    AttemptStatus,
+    Exam,
+    ExamAttempt,
+    ExamDeployment,
+    ExamSubmission,
+)
+from apps.exams.models.exam_question import QuestionType
+from apps.exams.services.student import exam_attempt_service
+from apps.exams.services.student.exam_attempt_service import flush_attempt_checkpoints
+from apps.exams.services.student.exam_submit_queue_service import (
+    process_submission_intake,
+)
+from apps.user.models.user import GenderChoices, RoleChoices, User
+
+"""
+응시 세션(ExamAttempt) 자동 저장 테스트
+
+참가 코드 검증: 세션 생성 (started_at 서버 기록, 재검증 시 유지)
+PATCH attempt: 변경분만 Redis 에 반영 (DB 쓰기 없음), 잘못된 문항 400, 세션 없으면 404
+flush_attempt_checkpoints: DB 일괄 저장, Redis 유실 시 체크포인트로 복원
+최종 제출: 마지막 변경분만 보내도 작성 중 답안과 합쳐서 채점, 세션 종료 (대기열 제출 모드는 워커 채점 완료 후 종료)
+"""
+
+
+class ExamAttemptTests(IsolatedRedisTestClient):
+    student: User
+    deployment: ExamDeployment
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.student = User.objects.create_user(
+            email="attempt-student@test.com",
+            password="password123",
+            name="학생",
+            gender=GenderChoices.MALE,
+            birthday=date(2000, 1, 1),
+            role=RoleChoices.ST,
+        )
+        course = Course.objects.create(name="코스")
+        cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=20,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+        )
+        subject = Subject.objects.create(course=course, title="과목", number_of_days=1, number_of_hours=1)
+        exam = Exam.objects.create(subject=subject, title="쪽지시험")
+        cls.deployment = ExamDeployment.objects.create(
+            exam=exam,
+            cohort=cohort,
+            open_at=timezone.now() - timedelta(minutes=30),
+            close_at=timezone.now() + timedelta(minutes=30),
+            duration_time=600,
+            access_code="ATT123",
+            questions_snapshot=[
+                {"id": 1, "type": QuestionType.SINGLE_CHOICE, "question": "1", "answer": "A", "point": 10},
+                {"id": 2, "type": QuestionType.OX, "question": "2", "answer": "O", "point": 10},
+                {"id": 3, "type": QuestionType.SHORT_ANSWER, "question": "3", "answer": ["django"], "point": 10},
+            ],
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.force_authenticate(user=self.student)
+        self.attempt_url = reverse("exam_attempt", kwargs={"deployment_id": self.deployment.id})
+
+    def _verify_code(self) -> ExamAttempt:
+        url = reverse("exam_check_code", kwargs={"deployment_id": self.deployment.id})
+        response = self.client.post(url, data={"code": "ATT123"})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        return ExamAttempt.objects.get(deployment=self.deployment, submitter=self.student)
+
+    def _patch(self, answers: list[dict[str, object]], cheating_count_delta: int = 0) -> dict[str, object]:
+        response = self.client.patch(
+            self.attempt_url,
+            data={"answers": answers, "cheating_count_delta": cheating_count_delta},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data: dict[str, object] = response.data
+        return data
+
+    def test_verify_code_starts_attempt_once(self) -> None:
+        attempt = self._verify_code()
+        again = self._verify_code()
+
+        self.assertEqual(attempt.id, again.id)
+        self.assertEqual(attempt.started_at, again.started_at)
+        self.assertEqual(attempt.status, AttemptStatus.IN_PROGRESS)
+
+    def test_patch_accumulates_in_redis_without_db_write(self) -> None:
+        attempt = self._verify_code()
+
+        self._patch([{"question_id": 1, "submitted_answer": ["B"]}])
+        data = self._patch(
+            [{"question_id": 1, "submitted_answer": ["A"]}, {"question_id": 2, "submitted_answer": ["O"]}],
+            cheating_count_delta=1,
+        )
+
+        self.assertEqual((data["version"], data["cheating_count"]), (2, 1))
+        self.assertEqual(
+            data["answers"],
+            [{"question_id": 1, "submitted_answer": ["A"]}, {"question_id": 2, "submitted_answer": ["O"]}],
+        )
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.version, attempt.answers), (0, {}))
+
+        # 문항 화면의 경과 시간 / 부정행위 횟수도 세션 기준
+        response = self.client.get(reverse("exam_taking", kwargs={"deployment_id": self.deployment.id}))
+        self.assertEqual(response.json()["cheating_count"], 1)
+
+    def test_patch_validation(self) -> None:
+        response = self.client.patch(
+            self.attempt_url, data={"answers": [{"question_id": 1, "submitted_answer": ["A"]}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self._verify_code()
+        response = self.client.patch(
+            self.attempt_url, data={"answers": [{"question_id": 99, "submitted_answer": ["A"]}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_flush_checkpoints_and_restore(self) -> None:
+        attempt = self._verify_code()
+        self._patch([{"question_id": 3, "submitted_answer": ["Django"]}], cheating_count_delta=2)
+
+        self.assertEqual(flush_attempt_checkpoints(), 1)
+        self.assertEqual(flush_attempt_checkpoints(), 0)
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.version, attempt.cheating_count), (1, 2))
+        self.assertEqual(attempt.answers, {"3": ["Django"]})
+
+        # Redis 상태가 유실돼도 체크포인트에서 이어서 저장
+        exam_attempt_service._redis().delete(exam_attempt_service._state_key(attempt.id))
+        self.assertEqual(self.client.get(self.attempt_url).data["answers"][0]["submitted_answer"], ["Django"])
+        data = self._patch([{"question_id": 1, "submitted_answer": ["A"]}])
+        self.assertEqual(data["version"], 2)
+        self.assertEqual(len(data["answers"]), 2)  # type: ignore[arg-type]
+
+    def test_submit_promotes_attempt_with_last_patch(self) -> None:
+        attempt = self._verify_code()
+        self._patch(
+            [{"question_id": 1, "submitted_answer": ["A"]}, {"question_id": 2, "submitted_answer": ["X"]}],
+            cheating_count_delta=1,
+        )
+
+        # 마지막 변경분만 전송 (started_at 생략)
+        response = self.client.post(
+            reverse("exam_submit"),
+            data={"deployment": self.deployment.id, "answers": [{"question_id": 2, "submitted_answer": ["O"]}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        submission = ExamSubmission.objects.get(pk=response["Location"].split("/")[-1])
+        self.assertEqual((submission.score, submission.cheating_count), (20, 1))
+        self.assertEqual(submission.started_at, attempt.started_at)
+        self.assertEqual([a["question_id"] for a in submission.answers], [1, 2])
+
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.status, attempt.submission_id), (AttemptStatus.SUBMITTED, submission.id))
+        self.assertEqual(self.client.get(self.attempt_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(EXAM_SUBMISSION_QUEUE_ENABLED=True)
+    @patch("apps.exams.tasks.grade_submission_intake.delay")
+    def test_queued_submit_closes_attempt_after_grading(self, mock_delay: MagicMock) -> None:
+        attempt = self._verify_code()
+        self._patch([{"question_id": 1, "submitted_answer": ["A"]}])
+
+        response = self.client.post(
+            reverse("exam_submit"),
+            data={"deployment": self.deployment.id, "answers": [{"question_id": 2, "submitted_answer": ["O"]}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        # 채점 전에는 세션 유지
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.status, AttemptStatus.IN_PROGRESS)
+        self.assertEqual(self.client.get(self.attempt_url).status_code, status.HTTP_200_OK)
+
+        intake = process_submission_intake(response.data["intake_id"])
+
+        assert intake is not None and intake.submission is not None  # mypy용
+        self.assertEqual(intake.submission.score, 20)
+        attempt.refresh_from_db()
+        self.assertEqual(
+            (attempt.status, attempt.submission_id, attempt.version), (AttemptStatus.SUBMITTED, intake.submission.id, 1)
+        )
+        self.assertEqual(self.client.get(self.attempt_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_submit_without_attempt_requires_started_at(self) -> None:
+        response = self.client.post(
+            reverse("exam_submit"),
+            data={"deployment": self.deployment.id, "answers": [{"question_id": 1, "submitted_answer": ["A"]}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
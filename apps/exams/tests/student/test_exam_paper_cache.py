@@ -0,0 +1,120 @@
+import json
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import Exam, ExamDeployment
+from apps.exams.models.exam_question import QuestionType
+from apps.exams.services.admin.admin_deployment_service import update_deployment
+from apps.exams.services.student import exam_paper_cache
+from apps.exams.services.student.exam_paper_cache import render_exam_paper
+from apps.user.models.user import RoleChoices, User
+
+"""
+수강생용 시험지 캐시 테스트
+
+render_exam_paper: 번호 / answer_input 부여, 정답·해설 제외, 스냅샷 원본 유지
+GET exam_taking: 배포당 한 번만 렌더링, 배포 수정 시 다시 렌더링
+"""
+
+
+class ExamPaperCacheTests(IsolatedRedisTestClient):
+    student: User
+    deployment: ExamDeployment
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.student = User.objects.create_user(
+            email="paper-student@test.com",
+            name="수강생",
+            password="password123",
+            role=RoleChoices.ST,
+            birthday=date(2000, 1, 1),
+        )
+        course = Course.objects.create(name="코스")
+        cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=20,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+        )
+        subject = Subject.objects.create(course=course, title="과목", number_of_days=1, number_of_hours=1)
+        exam = Exam.objects.create(subject=subject, title="쪽지시험")
+        cls.deployment = ExamDeployment.objects.create(
+            exam=exam,
+            cohort=cohort,
+            open_at=timezone.now() - timedelta(hours=1),
+            close_at=timezone.now() + timedelta(hours=1),
+            duration_time=30,
+            access_code="paper",
+            questions_snapshot=[
+                {
+                    "id": 1,
+                    "type": QuestionType.MULTIPLE_CHOICE,
+                    "question": "복수 선택",
+                    "point": 10,
+                    "options": ["A", "B"],
+                    "answer": ["A"],
+                    "explanation": "해설",
+                },
+                {
+                    "id": 2,
+                    "type": QuestionType.FILL_BLANK,
+                    "question": "빈칸",
+                    "point": 10,
+                    "blank_count": 2,
+                    "answer": ["x", "y"],
+                },
+            ],
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        exam_paper_cache._local_papers.clear()
+        self.client.force_authenticate(user=self.student)
+        self.url = reverse("exam_taking", kwargs={"deployment_id": self.deployment.id})
+
+    def test_render_strips_answers(self) -> None:
+        snapshot = self.deployment.questions_snapshot
+        questions = json.loads(render_exam_paper(snapshot))
+
+        self.assertEqual([q["number"] for q in questions], [1, 2])
+        self.assertEqual([q["answer_input"] for q in questions], [[], ["", ""]])
+        self.assertNotIn("answer", questions[0])
+        self.assertNotIn("explanation", questions[0])
+        self.assertNotIn("number", snapshot[0])
+
+    def test_rendered_once_per_deployment(self) -> None:
+        with patch.object(exam_paper_cache, "render_exam_paper", wraps=render_exam_paper) as mock_render:
+            first = self.client.get(self.url)
+            exam_paper_cache._local_papers.clear()  # 다른 워커 → Redis 캐시 사용
+            second = self.client.get(self.url)
+
+        self.assertEqual(mock_render.call_count, 1)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(first.json()["exam_name"], "쪽지시험")
+
+    def test_rerendered_after_update(self) -> None:
+        self.client.get(self.url)
+
+        # 시작 전 배포만 수정 가능 → 수정하면서 다시 응시 가능 시간으로 변경
+        deployment = ExamDeployment.objects.get(id=self.deployment.id)
+        deployment.open_at = timezone.now() + timedelta(minutes=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            update_deployment(
+                deployment=deployment,
+                data={
+                    "open_at": timezone.now() - timedelta(minutes=1),
+                    "questions_snapshot": deployment.questions_snapshot[:1],
+                },
+            )
+
+        self.assertNotIn(deployment.id, exam_paper_cache._local_papers)
+        self.assertEqual(len(self.client.get(self.url).json()["questions"]), 1)
@@ -125,7 +125,7 @@ class ExamQuestionViewTestCase(APITestCase):
         self.client.force_authenticate(user=self.student_user)
         url = reverse("exam_taking", kwargs={"deployment_id": self.deployment.id})
         response = self.client.get(url)
-        data: Dict[str, Any] = response.data
+        data: Dict[str, Any] = response.json()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["exam_id"], self.exam.id)
@@ -170,8 +170,8 @@ class ExamQuestionViewTestCase(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(response.data["elapsed_time"], 300)  # 5분 = 300초
-        self.assertEqual(response.data["cheating_count"], 2)
+        self.assertGreaterEqual(response.json()["elapsed_time"], 300)  # 5분 = 300초
+        self.assertEqual(response.json()["cheating_count"], 2)
 
     def test_get_exam_questions_forbidden_not_student(self) -> None:
         """
@@ -257,7 +257,7 @@ class ExamQuestionViewTestCase(APITestCase):
         url = reverse("exam_taking", kwargs={"deployment_id": self.deployment.id})
         response = self.client.get(url)
 
-        questions = response.data["questions"]
+        questions = response.json()["questions"]
         numbers = [q["number"] for q in questions]
 
         # 번호가 1부터 시작하고 순서대로 정렬되어 있는지 확인
@@ -276,7 +276,7 @@ class ExamQuestionViewTestCase(APITestCase):
         url = reverse("exam_taking", kwargs={"deployment_id": self.deployment.id})
         response = self.client.get(url)
 
-        questions = response.data["questions"]
+        questions = response.json()["questions"]
         # 스냅샷의 원래 내용이 반환되어야 함
         self.assertEqual(questions[0]["question"], "단일 선택 문제")
         self.assertNotEqual(questions[0]["question"], "변경된 문제")
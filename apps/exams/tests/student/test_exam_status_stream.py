@@ -0,0 +1,156 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from datetime import date, timedelta
+from typing import Any
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import Exam, ExamDeployment
+from apps.exams.models.exam_deployment import DeploymentStatus
+from apps.exams.services.admin.admin_deployment_service import set_deployment_status
+from apps.exams.services.student import exam_status_channel
+from apps.exams.services.student.exam_status_channel import (
+    publish_exam_status,
+    stream_exam_status,
+)
+from apps.user.models.user import RoleChoices, User
+
+"""
+시험 상태 푸시 채널 테스트
+
+stream_exam_status: 구독 후 다시 조회한 현재 상태 → 관리자 비활성화 시 force_submit 푸시 / close_at 도달 시 서버 타이머로 force_submit
+set_deployment_status: 커밋 후 상태 푸시
+GET status/stream: (WSGI) 현재 상태 한 번 + retry
+"""
+
+IN_MEMORY_CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+
+
+def _payload(event: str) -> dict[str, Any]:
+    data = next(line for line in event.splitlines() if line.startswith("data: "))
+    result: dict[str, Any] = json.loads(data.removeprefix("data: "))
+    return result
+
+
+async def _read_events(stream: AsyncGenerator[str, None]) -> list[str]:
+    return [event async for event in stream]
+
+
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_CHANNEL_LAYERS)
+class ExamStatusStreamTests(IsolatedRedisTestClient):
+    student: User
+    cohort: Cohort
+    exam: Exam
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.student = User.objects.create_user(
+            email="stream-student@test.com",
+            name="수강생",
+            password="password123",
+            role=RoleChoices.ST,
+            birthday=date(2000, 1, 1),
+        )
+        course = Course.objects.create(name="코스")
+        cls.cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=20,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+        )
+        subject = Subject.objects.create(course=course, title="과목", number_of_days=1, number_of_hours=1)
+        cls.exam = Exam.objects.create(subject=subject, title="쪽지시험")
+
+    def _deployment(self, close_in: timedelta) -> ExamDeployment:
+        return ExamDeployment.objects.create(
+            exam=self.exam,
+            cohort=self.cohort,
+            open_at=timezone.now() - timedelta(minutes=10),
+            close_at=timezone.now() + close_in,
+            duration_time=30,
+            access_code=f"stream{close_in.total_seconds()}",
+            questions_snapshot=[],
+        )
+
+    def test_push_force_submit_on_deactivate(self) -> None:
+        deployment = self._deployment(timedelta(hours=1))
+
+        async def deactivate() -> None:
+            # 구독(group_add) 이후에 비활성화
+            await asyncio.sleep(0.05)
+            closed = ExamDeployment(id=deployment.id, status=DeploymentStatus.DEACTIVATED, close_at=timezone.now())
+            await sync_to_async(publish_exam_status)(closed)
+
+        async def run() -> list[str]:
+            stream = stream_exam_status(deployment)
+            task = asyncio.ensure_future(_read_events(stream))
+            await deactivate()
+            return await asyncio.wait_for(task, timeout=5)
+
+        events = async_to_sync(run)()
+
+        self.assertFalse(_payload(events[0])["force_submit"])
+        self.assertTrue(events[0].startswith("retry: "))
+        self.assertEqual(_payload(events[-1])["exam_status"], DeploymentStatus.DEACTIVATED)
+        self.assertTrue(_payload(events[-1])["force_submit"])
+
+    def test_initial_status_is_read_after_subscribing(self) -> None:
+        deployment = self._deployment(timedelta(hours=1))
+        # 요청에서 조회한 뒤 구독 전에 비활성화된 경우
+        ExamDeployment.objects.filter(id=deployment.id).update(status=DeploymentStatus.DEACTIVATED)
+
+        events = async_to_sync(_read_events)(stream_exam_status(deployment))
+
+        self.assertEqual(len(events), 1)
+        self.assertTrue(_payload(events[0])["force_submit"])
+
+    def test_server_timer_at_close_at(self) -> None:
+        deployment = self._deployment(timedelta(milliseconds=300))
+
+        events = async_to_sync(_read_events)(stream_exam_status(deployment))
+
+        self.assertEqual(len(events), 2)
+        self.assertTrue(_payload(events[1])["force_submit"])
+
+    def test_closed_exam_ends_immediately(self) -> None:
+        deployment = self._deployment(timedelta(seconds=-1))
+
+        events = async_to_sync(_read_events)(stream_exam_status(deployment))
+
+        self.assertEqual(len(events), 1)
+        self.assertTrue(_payload(events[0])["force_submit"])
+
+    def test_set_deployment_status_publishes_after_commit(self) -> None:
+        deployment = self._deployment(timedelta(hours=1))
+
+        with patch.object(exam_status_channel, "async_to_sync") as mock_async_to_sync:
+            with self.captureOnCommitCallbacks(execute=True):
+                set_deployment_status(deployment=deployment, status=DeploymentStatus.DEACTIVATED)
+
+        group, message = mock_async_to_sync.return_value.call_args.args
+        self.assertEqual(group, f"exam_status.{deployment.id}")
+        self.assertTrue(message["payload"]["force_submit"])
+
+    def test_stream_view_wsgi_fallback(self) -> None:
+        deployment = self._deployment(timedelta(hours=1))
+        self.client.force_authenticate(user=self.student)
+
+        response = self.client.get(reverse("exam_status_stream", kwargs={"deployment_id": deployment.id}))
+        body = b"".join(response.streaming_content).decode()  # type: ignore[attr-defined]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream; charset=utf-8")
+        self.assertTrue(body.startswith("retry: 5000\n"))
+        self.assertFalse(_payload(body)["force_submit"])
+
+        missing = self.client.get(reverse("exam_status_stream", kwargs={"deployment_id": 0}))
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
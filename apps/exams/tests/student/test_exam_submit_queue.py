@@ -0,0 +1,177 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import (
+    Exam,
+    ExamDeployment,
+    ExamSubmission,
+    ExamSubmissionIntake,
+    SubmissionIntakeStatus,
+)
+from apps.exams.models.exam_question import QuestionType
+from apps.exams.services.student.exam_submit_queue_service import (
+    process_submission_intake,
+    requeue_stale_intakes,
+)
+from apps.user.models.user import GenderChoices, RoleChoices, User
+
+"""
+대기열 제출 모드 테스트
+
+POST submissions: intake 저장 + 202 (채점 작업은 커밋 후 등록), Redis 카운터로 3회째 제출 거부
+process_submission_intake: 채점 + ExamSubmission 생성, 중복 메세지 무시, DB 기준 제출 횟수 재검증
+GET submissions/intakes/<id>: 본인 intake 만 조회
+"""
+
+
+@override_settings(EXAM_SUBMISSION_QUEUE_ENABLED=True)
+@patch("apps.exams.tasks.grade_submission_intake.delay")
+class ExamSubmissionQueueTests(IsolatedRedisTestClient):
+    student: User
+    other_student: User
+    deployment: ExamDeployment
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.student = User.objects.create_user(
+            email="queue-student@test.com",
+            password="password123",
+            name="학생",
+            gender=GenderChoices.MALE,
+            birthday=timezone.now(),
+            role=RoleChoices.ST,
+        )
+        cls.other_student = User.objects.create_user(
+            email="queue-other@test.com",
+            password="password123",
+            name="다른학생",
+            gender=GenderChoices.MALE,
+            birthday=timezone.now(),
+            role=RoleChoices.ST,
+        )
+        course = Course.objects.create(name="코스")
+        cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=20,
+            start_date=timezone.now() - timedelta(days=1),
+            end_date=timezone.now() + timedelta(days=1),
+        )
+        subject = Subject.objects.create(course=course, title="과목", number_of_days=1, number_of_hours=1)
+        exam = Exam.objects.create(subject=subject, title="쪽지시험")
+        cls.deployment = ExamDeployment.objects.create(
+            exam=exam,
+            cohort=cohort,
+            open_at=timezone.now() - timedelta(minutes=30),
+            close_at=timezone.now() + timedelta(minutes=30),
+            duration_time=600,
+            questions_snapshot=[
+                {"id": 1, "type": QuestionType.SINGLE_CHOICE, "answer": "A", "point": 10},
+                {"id": 2, "type": QuestionType.OX, "answer": "O", "point": 10},
+            ],
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.force_authenticate(user=self.student)
+        self.url = reverse("exam_submit")
+        self.payload = {
+            "deployment": self.deployment.id,
+            "started_at": (timezone.now() - timedelta(minutes=3)).isoformat(),
+            "cheating_count": 0,
+            "answers": [
+                {"question_id": 1, "submitted_answer": ["A"]},
+                {"question_id": 2, "submitted_answer": ["X"]},
+            ],
+        }
+
+    def _submit(self) -> ExamSubmissionIntake:
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, data=self.payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], SubmissionIntakeStatus.PENDING)
+        self.assertTrue(response.data["status_url"].endswith(f"/submissions/intakes/{response.data['intake_id']}"))
+        return ExamSubmissionIntake.objects.get(id=response.data["intake_id"])
+
+    def test_submit_enqueues_intake_and_worker_grades(self, mock_delay: MagicMock) -> None:
+        intake = self._submit()
+
+        mock_delay.assert_called_once_with(intake.id)
+        self.assertFalse(ExamSubmission.objects.exists())
+
+        process_submission_intake(intake.id)
+
+        intake.refresh_from_db()
+        self.assertEqual(intake.status, SubmissionIntakeStatus.GRADED)
+        assert intake.submission is not None  # mypy용
+        self.assertEqual((intake.submission.score, intake.submission.correct_answer_count), (10, 1))
+
+        # 같은 메세지가 다시 전달되어도 제출 내역은 하나
+        process_submission_intake(intake.id)
+        self.assertEqual(ExamSubmission.objects.count(), 1)
+
+        response = self.client.get(reverse("exam_submission_intake", kwargs={"intake_id": intake.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["submission_id"], intake.submission.id)
+
+    def test_third_submission_rejected_by_counter(self, mock_delay: MagicMock) -> None:
+        self._submit()
+        self._submit()
+
+        response = self.client.post(self.url, data=self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ExamSubmissionIntake.objects.count(), 2)
+
+    def test_worker_rejects_when_db_limit_reached(self, mock_delay: MagicMock) -> None:
+        for _ in range(2):
+            ExamSubmission.objects.create(
+                submitter=self.student,
+                deployment=self.deployment,
+                started_at=timezone.now(),
+                answers=[],
+                score=0,
+                correct_answer_count=0,
+            )
+        intake = ExamSubmissionIntake.objects.create(
+            submitter=self.student,
+            deployment=self.deployment,
+            started_at=timezone.now(),
+            answers=[],
+        )
+
+        process_submission_intake(intake.id)
+
+        intake.refresh_from_db()
+        self.assertEqual(intake.status, SubmissionIntakeStatus.REJECTED)
+        self.assertEqual(ExamSubmission.objects.count(), 2)
+
+    def test_requeue_stale_intakes(self, mock_delay: MagicMock) -> None:
+        intake = ExamSubmissionIntake.objects.create(
+            submitter=self.student,
+            deployment=self.deployment,
+            started_at=timezone.now(),
+            answers=[],
+        )
+        ExamSubmissionIntake.objects.filter(id=intake.id).update(updated_at=timezone.now() - timedelta(minutes=5))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(requeue_stale_intakes(), 1)
+        mock_delay.assert_called_once_with(intake.id)
+        # 방금 재등록한 intake 는 다음 주기에 다시 등록하지 않음
+        self.assertEqual(requeue_stale_intakes(), 0)
+
+    def test_intake_status_other_user_not_found(self, mock_delay: MagicMock) -> None:
+        intake = self._submit()
+
+        self.client.force_authenticate(user=self.other_student)
+        response = self.client.get(reverse("exam_submission_intake", kwargs={"intake_id": intake.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
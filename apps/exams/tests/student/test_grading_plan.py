@@ -0,0 +1,111 @@
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from django.utils import timezone
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.courses.models import Cohort, Course, Subject
+from apps.exams.models import Exam, ExamDeployment
+from apps.exams.models.exam_question import QuestionType
+from apps.exams.services import grading_plan
+from apps.exams.services.admin.admin_deployment_service import update_deployment
+from apps.exams.services.grading_plan import compile_grading_plan, get_grading_plan
+from apps.exams.services.student.exam_submit_service import grade_answers
+
+
+class GradingPlanTests(IsolatedRedisTestClient):
+    deployment: ExamDeployment
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        course = Course.objects.create(name="코스")
+        cohort = Cohort.objects.create(
+            course=course,
+            number=1,
+            max_student=20,
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=1),
+        )
+        subject = Subject.objects.create(course=course, title="과목", number_of_days=1, number_of_hours=1)
+        exam = Exam.objects.create(subject=subject, title="쪽지시험")
+        cls.deployment = ExamDeployment.objects.create(
+            exam=exam,
+            cohort=cohort,
+            open_at=timezone.now() + timedelta(hours=1),
+            close_at=timezone.now() + timedelta(hours=2),
+            duration_time=600,
+            access_code="grading",
+            questions_snapshot=[
+                {"id": 1, "type": QuestionType.SINGLE_CHOICE, "answer": "A", "point": 10},
+                {"id": 2, "type": QuestionType.ORDERING, "answer": ["3", "1", "2"], "point": 20},
+                {"id": 3, "type": QuestionType.FILL_BLANK, "answer": ["Django", "ORM"], "point": 30},
+            ],
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        grading_plan._local_plans.clear()
+
+    def _is_correct(self, question: dict[str, Any], submitted: list[str]) -> bool:
+        question = {"id": 1, "point": 1} | question
+        return compile_grading_plan([question])[1].is_correct(submitted)
+
+    def test_type_specific_comparison(self) -> None:
+        ordering = {"type": QuestionType.ORDERING, "answer": ["b", "a", "c"]}
+        self.assertTrue(self._is_correct(ordering, ["b", "a", "c"]))
+        self.assertFalse(self._is_correct(ordering, ["a", "b", "c"]))
+
+        multiple = {"type": QuestionType.MULTIPLE_CHOICE, "answer": ["1", "3"]}
+        self.assertTrue(self._is_correct(multiple, ["3", "1"]))
+        self.assertFalse(self._is_correct(multiple, ["1"]))
+
+        fill_blank = {"type": QuestionType.FILL_BLANK, "answer": ["Django", "ORM"]}
+        self.assertTrue(self._is_correct(fill_blank, [" django ", "orm"]))
+        self.assertFalse(self._is_correct(fill_blank, ["ORM", "Django"]))
+
+        short_answer = {"type": QuestionType.SHORT_ANSWER, "answer": ["select_related", "셀렉트 릴레이티드"]}
+        self.assertTrue(self._is_correct(short_answer, ["셀렉트  릴레이티드"]))
+        self.assertFalse(self._is_correct(short_answer, ["select_related", "셀렉트 릴레이티드"]))
+
+        self.assertTrue(self._is_correct({"type": QuestionType.OX, "answer": "O"}, ["o"]))
+        self.assertTrue(self._is_correct({"type": QuestionType.SINGLE_CHOICE, "answer": "AB"}, ["AB"]))
+        self.assertFalse(self._is_correct({"type": QuestionType.SINGLE_CHOICE, "answer": "A"}, []))
+
+    def test_snapshot_without_type_keeps_set_comparison(self) -> None:
+        self.assertTrue(self._is_correct({"answer": ["1", "2"]}, ["2", "1"]))
+
+    def test_grade_answers(self) -> None:
+        answers = [
+            {"question_id": 1, "submitted_answer": ["A"]},
+            {"question_id": 2, "submitted_answer": ["1", "2", "3"]},
+            {"question_id": 3, "submitted_answer": ["django", "orm"]},
+            {"question_id": 999, "submitted_answer": ["A"]},
+        ]
+
+        graded, score, correct_count = grade_answers(self.deployment, answers)
+
+        self.assertEqual([a["is_correct"] for a in graded], [True, False, True, False])
+        self.assertEqual((score, correct_count), (40, 2))
+
+    def test_plan_is_compiled_once_per_deployment(self) -> None:
+        with patch.object(grading_plan, "compile_grading_plan", wraps=compile_grading_plan) as mock_compile:
+            get_grading_plan(self.deployment)
+            get_grading_plan(self.deployment)
+
+            # 다른 워커 프로세스: 프로세스 내 캐시가 비어 있어도 Redis 에서 조회
+            grading_plan._local_plans.clear()
+            get_grading_plan(self.deployment)
+
+        self.assertEqual(mock_compile.call_count, 1)
+
+    @patch.object(grading_plan, "compile_grading_plan", wraps=compile_grading_plan)
+    def test_update_deployment_invalidates_plan(self, mock_compile: MagicMock) -> None:
+        get_grading_plan(self.deployment)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            update_deployment(deployment=self.deployment, data={"duration_time": 30})
+        self.assertNotIn(self.deployment.id, grading_plan._local_plans)
+
+        get_grading_plan(self.deployment)
+        self.assertEqual(mock_compile.call_count, 2)
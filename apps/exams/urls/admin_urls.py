@@ -8,15 +8,21 @@ from apps.exams.views.admin import (
     ExamAdminQuestionUpdateDestroyAPIView,
     ExamAdminRetrieveUpdateDestroyAPIView,
     ExamAdminSubmissionDetailView,
+    ExamDeploymentItemAnalysisAPIView,
+    ExamDeploymentRegradeAPIView,
     ExamDeploymentStatusAPIView,
 )
-from apps.exams.views.admin.admin_submission_view import AdminSubmissionListAPIView
+from apps.exams.views.admin.admin_submission_view import (
+    AdminSubmissionExportAPIView,
+    AdminSubmissionListAPIView,
+)
 
 urlpatterns: list[URLPattern | URLResolver] = [
     # /api/v1/admin/ 경로에 ExamAdminViewSet을 연결합니다.
     path("exams", ExamAdminListCreateAPIView.as_view(), name="exam"),
     path("exams/deployments", DeploymentListCreateAPIView.as_view(), name="exam-deployments"),
     path("exams/submissions", AdminSubmissionListAPIView.as_view(), name="exam-submission"),
+    path("exams/submissions/export", AdminSubmissionExportAPIView.as_view(), name="exam-submission-export"),
     path(
         "exams/submissions/<int:submission_id>", ExamAdminSubmissionDetailView.as_view(), name="exam_submission_detail"
     ),
@@ -30,6 +36,16 @@ urlpatterns: list[URLPattern | URLResolver] = [
         ExamDeploymentStatusAPIView.as_view(),
         name="exam-deployment-status",
     ),
+    path(
+        "exams/deployments/<int:deployment_id>/regrade",
+        ExamDeploymentRegradeAPIView.as_view(),
+        name="exam-deployment-regrade",
+    ),
+    path(
+        "exams/deployments/<int:deployment_id>/item-analysis",
+        ExamDeploymentItemAnalysisAPIView.as_view(),
+        name="exam-deployment-item-analysis",
+    ),
     path("exams/<int:pk>", ExamAdminRetrieveUpdateDestroyAPIView.as_view(), name="exam-detail"),
     path("exams/<int:exam_id>/questions", ExamAdminQuestionCreateAPIView.as_view(), name="exam-questions"),
     path(
@@ -2,11 +2,14 @@ from django.urls import URLPattern, URLResolver, path
 
 from apps.exams.views.student import (
     ExamAccessCodeVerifyView,
+    ExamAttemptView,
     ExamDeploymentListView,
     ExamDeploymentStatusCheckView,
+    ExamDeploymentStatusStreamView,
     ExamQuestionView,
     ExamResultView,
     ExamSubmissionCreateAPIView,
+    ExamSubmissionIntakeStatusView,
 )
 
 urlpatterns: list[URLPattern | URLResolver] = [
@@ -16,6 +19,12 @@ urlpatterns: list[URLPattern | URLResolver] = [
         ExamSubmissionCreateAPIView.as_view(),
         name="exam_submit",
     ),
+    path(
+        # student/submit (대기열 제출 모드 채점 상태)
+        "submissions/intakes/<int:intake_id>",
+        ExamSubmissionIntakeStatusView.as_view(),
+        name="exam_submission_intake",
+    ),
     path(
         # student/submit
         "deployments",
@@ -33,6 +42,12 @@ urlpatterns: list[URLPattern | URLResolver] = [
         ExamAccessCodeVerifyView.as_view(),
         name="exam_check_code",
     ),
+    path(
+        # 응시 세션 조회 / 작성 중 답안 자동 저장
+        "deployments/<int:deployment_id>/attempt",
+        ExamAttemptView.as_view(),
+        name="exam_attempt",
+    ),
     path(
         "deployments/<int:deployment_id>",
         ExamQuestionView.as_view(),
@@ -41,4 +56,10 @@ urlpatterns: list[URLPattern | URLResolver] = [
     path(
         "deployments/<int:deployment_id>/status", ExamDeploymentStatusCheckView.as_view(), name="exam_checking_status"
     ),
+    path(
+        # 시험 상태 구독 (SSE, 비활성화 / 종료 시 force_submit 푸시)
+        "deployments/<int:deployment_id>/status/stream",
+        ExamDeploymentStatusStreamView.as_view(),
+        name="exam_status_stream",
+    ),
 ]
@@ -1,6 +1,8 @@
 from apps.exams.views.admin.admin_deployment_view import (
     AdminDeploymentDetailUpdateDeleteView,
     DeploymentListCreateAPIView,
+    ExamDeploymentItemAnalysisAPIView,
+    ExamDeploymentRegradeAPIView,
     ExamDeploymentStatusAPIView,
 )
 from apps.exams.views.admin.admin_exam_view import (
@@ -23,6 +25,8 @@ __all__ = [
     "DeploymentListCreateAPIView",
     "AdminDeploymentDetailUpdateDeleteView",
     "ExamDeploymentStatusAPIView",
+    "ExamDeploymentRegradeAPIView",
+    "ExamDeploymentItemAnalysisAPIView",
     "ExamAdminSubmissionDetailView",
     "ExamAdminQuestionCreateAPIView",
     "ExamAdminQuestionUpdateDestroyAPIView",
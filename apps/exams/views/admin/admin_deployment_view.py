@@ -14,9 +14,12 @@ from apps.exams.permissions.admin_permission import AdminUserPermissionView
 from apps.exams.serializers.admin import (
     AdminDeploymentCreateResponseSerializer,
     AdminDeploymentDetailResponseSerializer,
+    AdminDeploymentItemAnalysisResponseSerializer,
     AdminDeploymentListResponseSerializer,
     AdminDeploymentPatchSerializer,
     AdminDeploymentPostSerializer,
+    AdminDeploymentRegradeResponseSerializer,
+    AdminDeploymentRegradeSerializer,
     AdminDeploymentStatusPatchSerializer,
     AdminDeploymentUpdateResponseSerializer,
     DeploymentListItemSerializer,
@@ -29,6 +32,8 @@ from apps.exams.services.admin.admin_deployment_service import (
     set_deployment_status,
     update_deployment,
 )
+from apps.exams.services.admin.admin_item_analysis_service import get_item_analysis
+from apps.exams.services.admin.admin_regrade_service import regrade_deployment
 
 
 class DeploymentListCreateAPIView(AdminUserPermissionView):
@@ -234,3 +239,65 @@ class ExamDeploymentStatusAPIView(AdminUserPermissionView):
         deployment = set_deployment_status(deployment=deployment, status=serializer.validated_data["status"])
 
         return Response({"deployment_id": deployment_id, "status": deployment.status}, status=status.HTTP_200_OK)
+
+
+class ExamDeploymentRegradeAPIView(AdminUserPermissionView):
+    """
+    POST - 쪽지시험 배포 재채점
+    """
+
+    @extend_schema(
+        summary="쪽지시험 배포 재채점 API",
+        description=(
+            "문항 정답/배점 수정 후 배포 스냅샷을 현재 문항 기준으로 갱신하고, 해당 배포의 제출 내역을 다시 채점합니다.\n"
+            "  - dry_run=true 이면 저장하지 않고 변경될 제출 내역만 반환합니다."
+        ),
+        request=AdminDeploymentRegradeSerializer,
+        responses={
+            200: AdminDeploymentRegradeResponseSerializer,
+            400: OpenApiResponse(description="유효하지 않은 재채점 요청입니다."),
+            401: OpenApiResponse(description="자격 인증 데이터가 제공되지 않았습니다."),
+            403: OpenApiResponse(description="쪽지시험 재채점 권한이 없습니다."),
+            404: OpenApiResponse(description="재채점할 배포 정보를 찾을 수 없습니다."),
+        },
+        tags=["쪽지시험 관리"],
+    )
+    def post(self, request: Request, deployment_id: int) -> Response:
+
+        # 없으면 404
+        deployment = get_admin_deployment_detail(deployment_id=deployment_id)
+
+        serializer = AdminDeploymentRegradeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        report = regrade_deployment(deployment, dry_run=serializer.validated_data["dry_run"])
+
+        return Response(AdminDeploymentRegradeResponseSerializer(report).data, status=status.HTTP_200_OK)
+
+
+class ExamDeploymentItemAnalysisAPIView(AdminUserPermissionView):
+    """
+    GET - 쪽지시험 배포 문항 분석
+    """
+
+    @extend_schema(
+        summary="쪽지시험 배포 문항 분석 API",
+        description=(
+            "배포된 쪽지시험의 문항별 정답률(난이도), 상위/하위 27% 정답률 차이(변별도), 선택지별 선택 횟수를 조회합니다.\n"
+            "  - 결과는 새 제출이 들어오기 전까지 캐시됩니다."
+        ),
+        responses={
+            200: AdminDeploymentItemAnalysisResponseSerializer,
+            401: OpenApiResponse(description="자격 인증 데이터가 제공되지 않았습니다."),
+            403: OpenApiResponse(description="쪽지시험 문항 분석 조회 권한이 없습니다."),
+            404: OpenApiResponse(description="해당 배포 정보를 찾을 수 없습니다."),
+        },
+        tags=["쪽지시험 관리"],
+    )
+    def get(self, request: Request, deployment_id: int) -> Response:
+        deployment = ExamDeployment.objects.select_related("stats").filter(pk=deployment_id).first()
+        if deployment is None:
+            raise NotFound({"deployment_id": "해당 배포 정보를 찾을 수 없습니다."})
+
+        data = get_item_analysis(deployment)
+        return Response(AdminDeploymentItemAnalysisResponseSerializer(data).data, status=status.HTTP_200_OK)
@@ -17,6 +17,7 @@ from apps.exams.serializers.admin.admin_submission_detail_serializer import (
 from apps.exams.services.admin.admin_submission_detail_services import (
     get_merged_submission_detail,
 )
+from apps.exams.services.deployment_stats import rebuild_deployment_stats
 
 
 class ExamAdminSubmissionDetailView(AdminUserPermissionView):
@@ -124,6 +125,7 @@ class ExamAdminSubmissionDetailView(AdminUserPermissionView):
         try:
             with transaction.atomic():
                 submission.delete()
+                rebuild_deployment_stats(submission.deployment_id)
         except IntegrityError:
             return Response(
                 {"error_detail": "응시 내역 삭제 처리 중 충돌이 발생했습니다."},
@@ -3,18 +3,30 @@ from __future__ import annotations
 from typing import Any
 
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
+from drf_spectacular.utils import (
+    OpenApiExample,
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+)
 from rest_framework.generics import ListAPIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from apps.core.utils.export_stream import aiter_chunks
 from apps.core.utils.paginations import Pagination
+from apps.core.utils.sse import is_asgi_request
 from apps.exams.models import ExamSubmission
 from apps.exams.permissions.admin_permission import AdminUserPermissionView
 from apps.exams.serializers.admin.admin_submission_serializer import (
     AdminSubmissionListSerializer,
 )
+from apps.exams.services.admin.admin_submission_export_service import (
+    build_submission_export,
+    parse_admin_submission_export_params,
+)
 from apps.exams.services.admin.admin_submission_service import (
     build_admin_submission_query,
     parse_admin_submission_list_params,
@@ -81,3 +93,50 @@ class AdminSubmissionListAPIView(AdminUserPermissionView, ListAPIView):  # type:
     def get_queryset(self) -> QuerySet[ExamSubmission]:
         params = parse_admin_submission_list_params(self.request.query_params)
         return build_admin_submission_query(params)
+
+
+class AdminSubmissionExportAPIView(AdminUserPermissionView):
+    """
+    GET - 쪽지시험 응시 내역 내보내기 (CSV / XLSX)
+    """
+
+    @extend_schema(
+        tags=["쪽지시험 관리"],
+        summary="쪽지시험 응시 내역 내보내기",
+        description=(
+            "기수 또는 쪽지시험의 응시 내역 전체를 CSV / XLSX 파일로 내려받습니다.\n"
+            "  - 필터 / 검색 / 정렬은 목록 조회와 같고, 페이지네이션 없이 전체 행을 스트리밍합니다.\n"
+            "  - 문항별 정답 여부는 `문항 {question_id}` 컬럼(1: 정답, 0: 오답, 빈 칸: 미응답)으로 펼쳐집니다.\n"
+            "  - cohort_id 또는 exam_id 중 하나는 필수입니다."
+        ),
+        parameters=[
+            OpenApiParameter("file_format", type=OpenApiTypes.STR, description="파일 형식 (csv, xlsx)", default="csv"),
+            OpenApiParameter("search_keyword", type=OpenApiTypes.STR, description="검색어 (닉네임, 이름 등)"),
+            OpenApiParameter("cohort_id", type=OpenApiTypes.INT, description="기수 ID 필터"),
+            OpenApiParameter("exam_id", type=OpenApiTypes.INT, description="쪽지시험 ID 필터"),
+            OpenApiParameter("sort", type=OpenApiTypes.STR, description="정렬 기준 (예: score, started_at)"),
+            OpenApiParameter("order", type=OpenApiTypes.STR, description="정렬 순서 (asc, desc)", default="desc"),
+        ],
+        responses={
+            (200, "text/csv"): OpenApiResponse(response=OpenApiTypes.BINARY, description="CSV 파일"),
+            (
+                200,
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            ): OpenApiResponse(response=OpenApiTypes.BINARY, description="XLSX 파일"),
+            400: OpenApiResponse(description="유효하지 않은 내보내기 요청입니다."),
+            401: OpenApiResponse(description="자격 인증 데이터가 제공되지 않았습니다."),
+            403: OpenApiResponse(description="쪽지시험 관리자 권한이 없습니다."),
+        },
+    )
+    def get(self, request: Request) -> StreamingHttpResponse:
+        params = parse_admin_submission_export_params(request.query_params)
+        chunks, content_type, filename = build_submission_export(params)
+
+        # ASGI 는 동기 iterator 를 전부 모은 뒤 보내므로 청크 단위 async iterator 로 전달
+        streaming_content: Any = aiter_chunks(chunks) if is_asgi_request(request) else chunks
+
+        response = StreamingHttpResponse(streaming_content, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
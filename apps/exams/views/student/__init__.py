@@ -1,15 +1,25 @@
 from apps.exams.views.student.exam_access_view import ExamAccessCodeVerifyView
+from apps.exams.views.student.exam_attempt_view import ExamAttemptView
 from apps.exams.views.student.exam_list_view import ExamDeploymentListView
 from apps.exams.views.student.exam_question_view import ExamQuestionView
 from apps.exams.views.student.exam_result_view import ExamResultView
-from apps.exams.views.student.exam_status_view import ExamDeploymentStatusCheckView
-from apps.exams.views.student.exam_submit_view import ExamSubmissionCreateAPIView
+from apps.exams.views.student.exam_status_view import (
+    ExamDeploymentStatusCheckView,
+    ExamDeploymentStatusStreamView,
+)
+from apps.exams.views.student.exam_submit_view import (
+    ExamSubmissionCreateAPIView,
+    ExamSubmissionIntakeStatusView,
+)
 
 __all__ = [
     "ExamSubmissionCreateAPIView",
+    "ExamSubmissionIntakeStatusView",
     "ExamResultView",
     "ExamAccessCodeVerifyView",
+    "ExamAttemptView",
     "ExamDeploymentStatusCheckView",
+    "ExamDeploymentStatusStreamView",
     "ExamQuestionView",
     "ExamDeploymentListView",
 ]
@@ -1,3 +1,5 @@
+from typing import cast
+
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
 from rest_framework import status
 from rest_framework.exceptions import NotFound, ValidationError
@@ -11,6 +13,8 @@ from apps.exams.serializers.student.exam_access_serializer import (
     ExamAccessCodeSerializer,
 )
 from apps.exams.services.student.exam_access_service import ExamAccessCodeService
+from apps.exams.services.student.exam_attempt_service import start_exam_attempt
+from apps.user.models import User
 
 
 class ExamAccessCodeVerifyView(StudentUserPermissionView):
@@ -20,7 +24,7 @@ class ExamAccessCodeVerifyView(StudentUserPermissionView):
 
     @extend_schema(
         summary="쪽지시험 참가 코드 검증 API",
-        description="Base62로 인코딩된 참가 코드를 검증합니다.",
+        description="Base62로 인코딩된 참가 코드를 검증합니다. 검증에 성공하면 응시 세션을 시작합니다. (시작 시간 서버 기록)",
         request=ExamAccessCodeSerializer,
         responses={
             204: OpenApiResponse(description="No Content - 코드 검증 성공"),
@@ -79,4 +83,7 @@ class ExamAccessCodeVerifyView(StudentUserPermissionView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # 응시 세션 시작 (started_at 서버 기록, 이미 응시 중이면 이어서 사용)
+        start_exam_attempt(deployment=deployment, submitter=cast(User, request.user))
+
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,91 @@
+from typing import cast
+
+from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.core.exceptions.exception_messages import EMS
+from apps.exams.models import ExamDeployment
+from apps.exams.permissions.student_permission import StudentUserPermissionView
+from apps.exams.serializers.student.exam_attempt_serializer import (
+    ExamAttemptPatchSerializer,
+    ExamAttemptSerializer,
+)
+from apps.exams.services.student.exam_attempt_service import (
+    apply_attempt_patch,
+    get_attempt_state,
+)
+from apps.exams.services.student.exam_question_service import validate_exam_access
+from apps.user.models import User
+
+_ERROR_RESPONSES = {
+    401: OpenApiResponse(
+        description="인증 필요", examples=[OpenApiExample(name="Unauthorized", value=EMS.E401_NO_AUTH_DATA)]
+    ),
+    403: OpenApiResponse(
+        description="권한 없음",
+        examples=[OpenApiExample(name="Forbidden", value=EMS.E403_QUIZ_PERMISSION_DENIED("학생"))],
+    ),
+    404: OpenApiResponse(
+        description="배포 정보 / 응시 정보 없음 (참가 코드 검증 전)",
+        examples=[OpenApiExample(name="Not Found", value=EMS.E404_NOT_FOUND("응시 정보"))],
+    ),
+}
+
+
+class ExamAttemptView(StudentUserPermissionView):
+    """
+    쪽지시험 응시 세션 (작성 중 답안 자동 저장) API
+    """
+
+    def _get_deployment(self, deployment_id: int) -> ExamDeployment:
+        try:
+            return ExamDeployment.objects.defer("questions_snapshot").get(id=deployment_id)
+        except ExamDeployment.DoesNotExist:
+            raise NotFound(detail=EMS.E404_NOT_FOUND("배포 정보")["error_detail"])
+
+    @extend_schema(
+        summary="쪽지시험 응시 세션 조회 API",
+        description="브라우저 재시작 등으로 페이지를 다시 열었을 때 자동 저장된 답안과 부정행위 횟수를 조회합니다.",
+        responses={200: ExamAttemptSerializer, **_ERROR_RESPONSES},
+        tags=["쪽지시험"],
+    )
+    def get(self, request: Request, deployment_id: int) -> Response:
+        deployment = self._get_deployment(deployment_id)
+        state = get_attempt_state(deployment_id=deployment.id, submitter_id=cast(User, request.user).id)
+        if state is None:
+            raise NotFound(detail=EMS.E404_NOT_FOUND("응시 정보")["error_detail"])
+        return Response(ExamAttemptSerializer(state).data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="쪽지시험 답안 자동 저장 API",
+        description=(
+            "변경된 문항의 답안과 부정행위 증가분만 전송합니다. (문항 단위로 덮어씀)\n"
+            "최종 제출 시에는 자동 저장된 답안과 합쳐서 제출되므로 전체 답안을 다시 보낼 필요가 없습니다."
+        ),
+        request=ExamAttemptPatchSerializer,
+        responses={
+            200: ExamAttemptSerializer,
+            400: OpenApiResponse(description="시험에 없는 문항 / 잘못된 요청"),
+            410: OpenApiResponse(description="시험 종료됨"),
+            423: OpenApiResponse(description="아직 응시 불가"),
+            **_ERROR_RESPONSES,
+        },
+        tags=["쪽지시험"],
+    )
+    def patch(self, request: Request, deployment_id: int) -> Response:
+        deployment = self._get_deployment(deployment_id)
+        validate_exam_access(deployment=deployment, submission=None)
+
+        serializer = ExamAttemptPatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        state = apply_attempt_patch(
+            deployment=deployment,
+            submitter=cast(User, request.user),
+            answers=serializer.validated_data["answers"],
+            cheating_count_delta=serializer.validated_data["cheating_count_delta"],
+        )
+        return Response(ExamAttemptSerializer(state).data, status=status.HTTP_200_OK)
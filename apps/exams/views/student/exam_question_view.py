@@ -1,8 +1,10 @@
+from typing import cast
+
+from django.http import HttpResponse
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
 from rest_framework import status
 from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
-from rest_framework.response import Response
 
 from apps.core.exceptions.exception_messages import EMS
 from apps.exams.models import ExamDeployment, ExamSubmission
@@ -10,10 +12,16 @@ from apps.exams.permissions.student_permission import StudentUserPermissionView
 from apps.exams.serializers.student.exam_question_serializer import (
     ExamQuestionResponseSerializer,
 )
+from apps.exams.services.student.exam_attempt_service import get_attempt_state
+from apps.exams.services.student.exam_paper_cache import (
+    build_exam_paper_body,
+    get_exam_paper,
+)
 from apps.exams.services.student.exam_question_service import (
     calculate_elapsed_time,
     validate_exam_access,
 )
+from apps.user.models import User
 
 
 class ExamQuestionView(StudentUserPermissionView):
@@ -74,10 +82,10 @@ class ExamQuestionView(StudentUserPermissionView):
         },
         tags=["쪽지시험"],
     )
-    def get(self, request: Request, deployment_id: int) -> Response:
-        # 배포 정보 조회
+    def get(self, request: Request, deployment_id: int) -> HttpResponse:
+        # 배포 정보 조회 (문항 스냅샷은 시험지 캐시가 없을 때만 조회)
         try:
-            deployment = ExamDeployment.objects.select_related("exam").get(id=deployment_id)
+            deployment = ExamDeployment.objects.select_related("exam").defer("questions_snapshot").get(id=deployment_id)
         except ExamDeployment.DoesNotExist:
             raise NotFound(detail=EMS.E404_NOT_FOUND("배포 정보")["error_detail"])
 
@@ -87,32 +95,24 @@ class ExamQuestionView(StudentUserPermissionView):
         # 시험 접근 가능 여부 검증 (서비스 레이어)
         validate_exam_access(deployment=deployment, submission=submission)
 
-        # 문제 목록 조회 (스냅샷)
-        questions = deployment.questions_snapshot
+        # 배포별로 한 번 렌더링된 시험지 (번호 / answer_input 포함, 정답·해설 제외)
+        paper = get_exam_paper(deployment)
 
-        # 각 문제에 번호 추가 및 정렬
-        for idx, question in enumerate(questions, start=1):
-            question["number"] = idx
-
-        # 번호 순서대로 정렬
-        questions_sorted = sorted(questions, key=lambda q: q["number"])
+        # 응시 중인 세션이 있으면 세션 기준, 없으면 제출 내역 기준
+        attempt = get_attempt_state(deployment_id=deployment_id, submitter_id=cast(User, request.user).id)
+        progress = attempt or submission
 
         # 경과 시간 계산 (서비스 레이어)
-        elapsed_time = calculate_elapsed_time(submission=submission)
+        elapsed_time = calculate_elapsed_time(submission=progress)
 
         # 부정행위 횟수
-        cheating_count = submission.cheating_count if submission else 0
-
-        # 응답 데이터 구성 (서비스 레이어)
-        response_data = {
-            "exam_id": deployment.exam_id,
-            "exam_name": deployment.exam.title,
-            "duration_time": deployment.duration_time,
-            "elapsed_time": elapsed_time,
-            "cheating_count": cheating_count,
-            "questions": questions_sorted,
-        }
+        cheating_count = progress.cheating_count if progress else 0
 
-        # 직렬화 및 응답
-        serializer = ExamQuestionResponseSerializer(response_data)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 수강생별 필드만 붙여서 응답 (문항 직렬화 생략)
+        body = build_exam_paper_body(
+            deployment=deployment,
+            paper=paper,
+            elapsed_time=elapsed_time,
+            cheating_count=cheating_count,
+        )
+        return HttpResponse(body, status=status.HTTP_200_OK, content_type="application/json")
@@ -1,13 +1,25 @@
+from typing import Any
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
 from rest_framework import status
 from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from apps.core.exceptions.exception_messages import EMS
+from apps.core.utils.sse import ServerSentEventRenderer, is_asgi_request
 from apps.exams.models import ExamDeployment
 from apps.exams.models.exam_deployment import DeploymentStatus
 from apps.exams.permissions.student_permission import StudentUserPermissionView
+from apps.exams.services.student.exam_status_channel import (
+    build_status_payload,
+    encode_status_event,
+    stream_exam_status,
+)
 from apps.exams.services.student.exam_status_service import get_student_exam_status
 
 
@@ -18,7 +30,7 @@ class ExamDeploymentStatusCheckView(StudentUserPermissionView):
 
     @extend_schema(
         summary="쪽지시험 상태 확인 API",
-        description="수강생이 시험 페이지에서 쪽지시험 상태를 주기적으로 확인합니다.",
+        description="수강생이 시험 페이지에서 쪽지시험 상태를 확인합니다. (상태 변경은 status/stream 구독 권장)",
         responses={
             200: OpenApiResponse(
                 description="시험 상태 조회 성공",
@@ -60,3 +72,67 @@ class ExamDeploymentStatusCheckView(StudentUserPermissionView):
 
         status_info = get_student_exam_status(deployment)
         return Response(status_info, status=status.HTTP_200_OK)
+
+
+class ExamDeploymentStatusStreamView(StudentUserPermissionView):
+    """
+    학생용 쪽지시험 상태 구독 API (SSE)
+    """
+
+    renderer_classes = [ServerSentEventRenderer, JSONRenderer]
+
+    @extend_schema(
+        summary="쪽지시험 상태 구독 API (SSE)",
+        description=(
+            "수강생이 시험 페이지에서 쪽지시험 상태 변경을 구독합니다. 연결 직후 현재 상태를 전송하고, "
+            "관리자가 시험을 비활성화하거나 종료 시각(close_at)이 되면 force_submit 이벤트를 전송한 뒤 연결을 종료합니다. "
+            "WSGI 환경에서는 현재 상태만 전송하고 retry 간격 후 재연결합니다."
+        ),
+        responses={
+            (200, "text/event-stream"): OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description="시험 상태 이벤트 스트림",
+                examples=[
+                    OpenApiExample(
+                        name="시험 진행 중 → 관리자 비활성화",
+                        value=(
+                            "retry: 5000\n"
+                            'data: {"exam_status": "pending", "force_submit": false, "close_at": "2025-01-01T10:00:00+09:00"}\n\n'
+                            ": heartbeat\n\n"
+                            'data: {"exam_status": "done", "force_submit": true, "close_at": "2025-01-01T09:30:00+09:00"}\n\n'
+                        ),
+                    ),
+                ],
+            ),
+            401: OpenApiResponse(
+                description="인증 필요", examples=[OpenApiExample(name="Unauthorized", value=EMS.E401_NO_AUTH_DATA)]
+            ),
+            403: OpenApiResponse(
+                description="권한 없음",
+                examples=[OpenApiExample(name="Forbidden", value=EMS.E403_QUIZ_PERMISSION_DENIED("조회"))],
+            ),
+            404: OpenApiResponse(
+                description="시험 정보 없음",
+                examples=[OpenApiExample(name="Not Found", value=EMS.E404_NOT_FOUND("시험"))],
+            ),
+        },
+        tags=["쪽지시험"],
+    )
+    def get(self, request: Request, deployment_id: int) -> StreamingHttpResponse:
+        try:
+            deployment = ExamDeployment.objects.only("id", "status", "open_at", "close_at").get(id=deployment_id)
+        except ExamDeployment.DoesNotExist:
+            raise NotFound(detail=EMS.E404_NOT_FOUND("시험"))
+
+        if is_asgi_request(request):
+            streaming_content: Any = stream_exam_status(deployment)
+        else:
+            # WSGI 는 연결 하나가 워커를 점유하므로 현재 상태만 보내고 retry 후 재연결
+            streaming_content = [
+                encode_status_event(build_status_payload(deployment), retry_ms=settings.EXAM_STATUS_STREAM_RETRY_MS)
+            ]
+
+        response = StreamingHttpResponse(streaming_content, content_type="text/event-stream; charset=utf-8")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
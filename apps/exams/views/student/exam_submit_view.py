@@ -1,16 +1,30 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
 from django.conf import settings
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect
-from drf_spectacular.utils import extend_schema
+from django.urls import reverse
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import status
+from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
+from rest_framework.response import Response
 
+from apps.core.exceptions.exception_messages import EMS
+from apps.exams.models.exam_submission_intake import ExamSubmissionIntake
 from apps.exams.permissions.student_permission import StudentUserPermissionView
 from apps.exams.serializers.student.exam_submit_serializer import (
     ExamSubmissionCreateSerializer,
+    ExamSubmissionIntakeSerializer,
+)
+from apps.exams.services.student.exam_attempt_service import (
+    close_exam_attempt,
+    resolve_submission_payload,
+)
+from apps.exams.services.student.exam_submit_queue_service import (
+    enqueue_exam_submission,
 )
 from apps.exams.services.student.exam_submit_service import (
     create_exam_submission,
@@ -27,21 +41,63 @@ from apps.user.models import User
     description=(
         "수강생이 쪽지시험 문제 풀이를 제출하는 API.\n"
         "제출 시 각 문항별 답안, 부정행위 횟수, 시험 시작 시간이 함께 저장되며 "
-        "자동 채점 후 결과를 반환합니다."
+        "자동 채점 후 결과를 반환합니다.\n"
+        "대기열 제출 모드에서는 답안 접수 후 202 와 채점 상태 조회 URL 을 반환하며, "
+        "채점은 백그라운드에서 진행됩니다.\n"
+        "참가 코드 검증으로 시작된 응시 세션이 있으면 자동 저장된 답안과 합쳐서 제출하므로 "
+        "answers 에는 마지막 변경분만 보내도 되며, started_at 은 서버에 기록된 값을 사용합니다."
     ),
+    responses={
+        302: OpenApiResponse(description="채점 완료, 결과 페이지로 이동"),
+        202: ExamSubmissionIntakeSerializer,
+    },
     operation_id="exam_submit",
 )
 class ExamSubmissionCreateAPIView(StudentUserPermissionView):
-    def post(self, request: Request) -> HttpResponseRedirect:
+    def post(self, request: Request) -> HttpResponseRedirect | Response:
         serializer = ExamSubmissionCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        validate_submission_time_limit(deployment=serializer.validated_data["deployment"])
-        validate_exam_submission_limit(
-            deployment=serializer.validated_data["deployment"], submitter=cast(User, request.user)
-        )
-        validate_exam_total_seconds(
-            deployment=serializer.validated_data["deployment"], started_at=serializer.validated_data["started_at"]
+        submitter = cast(User, request.user)
+        deployment = serializer.validated_data["deployment"]
+
+        # 응시 세션이 있으면 자동 저장된 답안 + 요청 답안(마지막 변경분)으로 제출
+        attempt, payload = resolve_submission_payload(
+            deployment=deployment, submitter=submitter, data=serializer.validated_data
         )
-        instance = create_exam_submission(submitter=cast(User, request.user), **serializer.validated_data)
+        validate_submission_time_limit(deployment=deployment)
+        validate_exam_total_seconds(deployment=deployment, started_at=payload["started_at"])
+
+        if settings.EXAM_SUBMISSION_QUEUE_ENABLED:
+            # 제출 횟수는 Redis 카운터로 선점, 채점 + 응시 세션 종료는 워커에서 처리
+            intake = enqueue_exam_submission(submitter=submitter, attempt=attempt, **payload)
+            data = dict(ExamSubmissionIntakeSerializer(intake).data)
+            data["status_url"] = request.build_absolute_uri(
+                reverse("exam_submission_intake", kwargs={"intake_id": intake.id})
+            )
+            return Response(data, status=status.HTTP_202_ACCEPTED)
+
+        validate_exam_submission_limit(deployment=deployment, submitter=submitter)
+        instance = create_exam_submission(submitter=submitter, **payload)
+        if attempt is not None:
+            close_exam_attempt(state=attempt, submitter=submitter, payload=payload, submission=instance)
 
         return redirect(f"{settings.FRONTEND_DOMAIN}/exams/submissions/{instance.pk}")
+
+
+class ExamSubmissionIntakeStatusView(StudentUserPermissionView):
+    """
+    (대기열 제출 모드) 제출 채점 상태 조회 API
+    """
+
+    @extend_schema(
+        tags=["쪽지시험"],
+        summary="쪽지시험 제출 채점 상태 조회 API",
+        description="status 가 graded 가 되면 submission_id 로 결과를 조회합니다. (rejected / failed 는 error 에 사유)",
+        responses={200: ExamSubmissionIntakeSerializer},
+    )
+    def get(self, request: Request, intake_id: int, *args: Any, **kwargs: Any) -> Response:
+        # 본인이 제출한 intake 만 조회 가능 (타인의 intake 는 404)
+        intake = ExamSubmissionIntake.objects.filter(id=intake_id, submitter_id=request.user.id).first()
+        if intake is None:
+            raise NotFound(detail=EMS.E404_NOT_FOUND("제출 내역"))
+        return Response(ExamSubmissionIntakeSerializer(intake).data, status=status.HTTP_200_OK)
@@ -5,3 +5,6 @@ class QnaConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
 
     name = "apps.qna"
+
+    def ready(self) -> None:
+        from apps.qna import signals  # noqa: F401
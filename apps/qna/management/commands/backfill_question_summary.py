@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.qna.services.question.question_summary_service import (
+    backfill_question_summary,
+)
+
+
+class Command(BaseCommand):
+    help = "질문의 답변 수 / 채택 여부 / 썸네일 컬럼을 답변 / 이미지 테이블 기준으로 재계산합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=5000, help="한 번에 갱신할 질문 id 구간 크기")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = backfill_question_summary(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"질문 요약 컬럼 재계산 완료: {count} 건"))
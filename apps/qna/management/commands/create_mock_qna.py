@@ -31,6 +31,7 @@ class Command(BaseCommand):
                 category=category,
                 title="4번 수강생의 테스트 질문입니다.",
                 content="삭제 테스트를 위해 4번 유저가 작성한 질문 본문입니다.",
+                answer_count=3,  # 아래에서 서비스 없이 직접 생성하는 답변 수
             )
 
             # 3. 첫 번째 답변 생성 (작성자: 6번)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import random
+import statistics
+import time
+import uuid
+from datetime import date
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+
+from apps.qna.models import Question, QuestionCategory
+from apps.qna.services.question.question_list.service import get_question_list
+from apps.qna.services.question.question_search.service import build_search_vector
+from apps.user.models import User
+
+"""
+질문 검색 관련도 / 지연 시간 비교 (PostgreSQL 전용)
+
+하나의 트랜잭션 안에서
+    1. 무작위 기술 용어로 만든 질문 --questions 건 + 검색어별 제목 일치 질문 / 본문에만 언급한 최신 질문 --relevant 건씩 생성
+    2. 같은 검색어로 search_mode=contains (제목 / 본문 icontains + 최신순) 와 search_mode=fulltext 실행
+    3. 검색어별 precision@10 (상위 10건 중 제목 일치 질문 비율) / 첫 페이지 + count 지연 시간 중앙값 출력
+을 실행하고 전부 롤백합니다. (운영 데이터는 변경되지 않음)
+"""
+
+_VOCAB = (
+    "장고 모델 쿼리 인덱스 캐시 레디스 도커 배포 서버 클라이언트 비동기 스레드 프로세스 메모리 리스트 딕셔너리 함수 클래스 상속 예외 "
+    "테스트 로그 요청 응답 세션 쿠키 토큰 인증 권한 리액트 컴포넌트 상태 python django orm sql http git api json"
+).split()
+_QUERIES = {
+    # 검색어 → 제목에 넣을 문구 (어순이 다른 검색어도 같은 문서가 정답)
+    "트랜잭션 격리 수준": "트랜잭션 격리 수준",
+    "격리 수준 트랜잭션": "트랜잭션 격리 수준",
+    "마이그레이션 충돌": "마이그레이션 충돌",
+    "웹소켓": "웹소켓",
+}
+
+
+class Command(BaseCommand):
+    help = "질문 검색(contains / fulltext)의 관련도와 지연 시간을 비교합니다. (PostgreSQL, 데이터는 롤백)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--questions", type=int, default=1_000_000, help="생성할 무작위 질문 수")
+        parser.add_argument("--relevant", type=int, default=30, help="검색어별 제목 일치 / 본문 언급 질문 수")
+        parser.add_argument("--repeat", type=int, default=5, help="검색어별 반복 측정 횟수")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL 에서만 실행할 수 있습니다.")
+
+        with transaction.atomic():
+            relevant_ids = self._seed(options["questions"], options["relevant"])
+            connection.cursor().execute("ANALYZE questions")
+
+            self.stdout.write(f"{'검색어':<16} {'mode':<9} {'count':>7} {'p@10':>5} {'median ms':>10}")
+            for keyword, phrase in _QUERIES.items():
+                for mode in ("contains", "fulltext"):
+                    self._measure(keyword, mode, relevant_ids[phrase], options["repeat"])
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS("완료 (생성한 데이터는 롤백됨)"))
+
+    def _seed(self, questions: int, relevant: int) -> dict[str, set[int]]:
+        run = uuid.uuid4().hex[:6]
+        rng = random.Random(0)
+
+        author = User.objects.create_user(
+            email=f"search-bench-{run}@example.com", password="!", name="bench", birthday=date(2000, 1, 1)
+        )
+        category = QuestionCategory.objects.create(name=f"bench-{run}")
+
+        def build(title: str, content: str) -> Question:
+            return Question(
+                author=author,
+                category=category,
+                title=title[:50],
+                content=content,
+                search_vector=build_search_vector(title, content),
+            )
+
+        def words(k: int) -> str:
+            return " ".join(rng.choices(_VOCAB, k=k))
+
+        batch: list[Question] = []
+        for _ in range(questions):
+            batch.append(build(words(4), f"<p>{words(40)}</p>"))
+            if len(batch) >= 5000:
+                Question.objects.bulk_create(batch)
+                batch = []
+        Question.objects.bulk_create(batch)
+
+        relevant_ids: dict[str, set[int]] = {}
+        for phrase in dict.fromkeys(_QUERIES.values()):
+            # 정답: 제목에 문구가 있는 질문 / 오답: 본문 끝에만 문구가 있는 (더 최신) 질문
+            answers = Question.objects.bulk_create(
+                build(f"{phrase} {words(2)}", f"<p>{words(30)} {phrase}</p>") for _ in range(relevant)
+            )
+            Question.objects.bulk_create(build(words(4), f"<p>{words(60)} {phrase}</p>") for _ in range(relevant))
+            relevant_ids[phrase] = {q.id for q in answers}
+
+        self.stdout.write(f"seeded questions={questions + relevant * 2 * len(relevant_ids)}")
+        return relevant_ids
+
+    def _measure(self, keyword: str, mode: str, relevant_ids: set[int], repeat: int) -> None:
+        timings: list[float] = []
+        top: list[int] = []
+        count = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            qs = get_question_list(search_keyword=keyword, search_mode=mode)
+            top = list(qs.values_list("id", flat=True)[:10])
+            count = qs.count()
+            timings.append((time.perf_counter() - started) * 1000)
+
+        precision = len(relevant_ids.intersection(top)) / 10
+        self.stdout.write(f"{keyword:<16} {mode:<9} {count:>7} {precision:>5.1f} {statistics.median(timings):>10.1f}")
@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.qna.services.question.question_list.category_tree import (
+    rebuild_category_closure,
+)
+
+
+class Command(BaseCommand):
+    help = "질의응답 카테고리 closure table 을 전체 재계산합니다. (시그널 없이 bulk 생성 / 수정한 경우)"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = rebuild_category_closure()
+        self.stdout.write(self.style.SUCCESS(f"카테고리 closure 재계산 완료: {count} 행"))
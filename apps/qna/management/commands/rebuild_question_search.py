@@ -0,0 +1,22 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from apps.qna.services.question.question_search.service import (
+    rebuild_question_search_vectors,
+)
+
+
+class Command(BaseCommand):
+    help = "질문 전문 검색 색인(search_vector)을 전체 재생성합니다. (PostgreSQL)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 갱신할 질문 수")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL 에서만 실행할 수 있습니다.")
+
+        count = rebuild_question_search_vectors(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"질문 검색 색인 재생성 완료: {count} 건"))
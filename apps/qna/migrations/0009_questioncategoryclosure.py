@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_category_closure(apps, schema_editor):
+    # 기존 카테고리의 closure 행 생성 (question_list.category_tree.rebuild_category_closure 와 같은 계산)
+    QuestionCategory = apps.get_model("qna", "QuestionCategory")
+    QuestionCategoryClosure = apps.get_model("qna", "QuestionCategoryClosure")
+
+    parents = dict(QuestionCategory.objects.values_list("id", "parent_id"))
+    rows = []
+    for category_id in parents:
+        ancestor_id, depth = category_id, 0
+        while ancestor_id is not None:
+            rows.append(QuestionCategoryClosure(ancestor_id=ancestor_id, descendant_id=category_id, depth=depth))
+            ancestor_id, depth = parents.get(ancestor_id), depth + 1
+    QuestionCategoryClosure.objects.bulk_create(rows, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("qna", "0008_alter_question_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuestionCategoryClosure",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="qna.questioncategory",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="qna.questioncategory",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "question_category_closure",
+                "indexes": [models.Index(fields=["descendant", "depth"], name="question_ca_descend_402613_idx")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("ancestor", "descendant"), name="uniq_question_category_closure")
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_category_closure, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:34
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Exists, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_question_summary(apps, schema_editor):
+    # 기존 질문의 답변 수 / 채택 여부 / 썸네일 채우기 (question_summary_service.backfill_question_summary 와 같은 계산)
+    Question = apps.get_model("qna", "Question")
+    Answer = apps.get_model("qna", "Answer")
+    QuestionImage = apps.get_model("qna", "QuestionImage")
+
+    answer_count = (
+        Answer.objects.filter(question=OuterRef("pk")).order_by().values("question").annotate(c=Count("id")).values("c")
+    )
+    Question.objects.update(
+        answer_count=Coalesce(Subquery(answer_count, output_field=IntegerField()), 0),
+        has_adopted_answer=Exists(Answer.objects.filter(question=OuterRef("pk"), is_adopted=True)),
+        thumbnail_key=Subquery(
+            QuestionImage.objects.filter(question=OuterRef("pk")).order_by("created_at", "id").values("img_url")[:1]
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("qna", "0009_questioncategoryclosure"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="question",
+            name="answer_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="question",
+            name="has_adopted_answer",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="question",
+            name="thumbnail_key",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(fields=["-created_at", "-id"], name="questions_latest_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                condition=models.Q(("answer_count", 0)), fields=["-created_at", "-id"], name="questions_unanswered_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                condition=models.Q(("answer_count__gt", 0)),
+                fields=["-created_at", "-id"],
+                name="questions_answered_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_question_summary, migrations.RunPython.noop),
+    ]
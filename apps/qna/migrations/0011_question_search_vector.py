@@ -0,0 +1,40 @@
+import django.contrib.postgres.search
+from django.db import migrations
+
+# 질문 전문 검색용 tsvector 컬럼 + GIN 인덱스
+# - 인덱스는 PostgreSQL 에서만 생성 (SQLite 테스트 DB 는 건너뜀)
+# - 운영 테이블 잠금 없이 생성하도록 CONCURRENTLY + 비원자 마이그레이션
+# - 기존 질문 색인은 배포 후 `manage.py rebuild_question_search` 로 채움
+INDEX_NAME = "questions_search_vector_idx"
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON questions USING gin (search_vector)"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("qna", "0010_question_summary_columns"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="question",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
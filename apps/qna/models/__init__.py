@@ -7,6 +7,7 @@ from .question import (
     Question,
     QuestionAIAnswer,
     QuestionCategory,
+    QuestionCategoryClosure,
     QuestionImage,
 )
 
@@ -14,6 +15,7 @@ __all__ = [
     # question models
     "Question",
     "QuestionCategory",
+    "QuestionCategoryClosure",
     "QuestionImage",
     "QuestionAIAnswer",
     # answer models
@@ -1,11 +1,13 @@
 from .question_ai_answer import QuestionAIAnswer
 from .question_base import Question
 from .question_category import QuestionCategory
+from .question_category_closure import QuestionCategoryClosure
 from .question_image import QuestionImage
 
 __all__ = [
     "Question",
     "QuestionCategory",
+    "QuestionCategoryClosure",
     "QuestionImage",
     "QuestionAIAnswer",
 ]
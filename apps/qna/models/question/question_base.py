@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, Protocol
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from apps.core.models import TimeStampedModel
@@ -17,13 +18,32 @@ class Question(TimeStampedModel):
 
     view_count = models.BigIntegerField(default=0)
 
+    # 목록 조회용 비정규화 컬럼 (question_summary_service 에서 답변 / 이미지 변경과 같은 트랜잭션으로 갱신)
+    answer_count = models.PositiveIntegerField(default=0)
+    has_adopted_answer = models.BooleanField(default=False)
+    thumbnail_key = models.CharField(max_length=255, null=True, blank=True)
+
+    # 전문 검색용 tsvector (question_search.service 에서 갱신)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         db_table = "questions"
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="questions_latest_idx"),
+            # 답변 여부 필터 + 최신순 (partial index)
+            models.Index(
+                fields=["-created_at", "-id"], condition=models.Q(answer_count=0), name="questions_unanswered_idx"
+            ),
+            models.Index(
+                fields=["-created_at", "-id"], condition=models.Q(answer_count__gt=0), name="questions_answered_idx"
+            ),
+        ]
+        # search_vector 의 GIN 인덱스는 마이그레이션(0011_question_search_vector)에서 PostgreSQL 에만 생성
         verbose_name = "질의응답"
         verbose_name_plural = "질의응답 목록"
 
     def __str__(self) -> str:
-        return f"{self.title} (답변: {self.answers.count()}건)"
+        return f"{self.title} (답변: {self.answer_count}건)"
 
 
 class QuestionAnnotated(Protocol):
@@ -0,0 +1,27 @@
+from django.db import models
+
+from apps.qna.models.question.question_category import QuestionCategory
+
+
+class QuestionCategoryClosure(models.Model):
+    """
+    카테고리 계층 closure table (모든 조상-자손 쌍, 자기 자신 depth 0 포함)
+    - QuestionCategory 저장 / 삭제 시그널로 갱신 (apps/qna/signals.py)
+    - 삭제는 FK CASCADE 로 함께 정리
+    """
+
+    ancestor = models.ForeignKey(QuestionCategory, on_delete=models.CASCADE, related_name="descendant_links")
+    descendant = models.ForeignKey(QuestionCategory, on_delete=models.CASCADE, related_name="ancestor_links")
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        db_table = "question_category_closure"
+        constraints = [
+            models.UniqueConstraint(fields=["ancestor", "descendant"], name="uniq_question_category_closure"),
+        ]
+        indexes = [
+            models.Index(fields=["descendant", "depth"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
@@ -1,8 +1,5 @@
-import html
-import re
 from typing import Any
 
-from django.utils.html import strip_tags
 from rest_framework import serializers
 
 from apps.qna.models import Question
@@ -11,6 +8,10 @@ from apps.qna.services.question.question_list.category_utils import (
     CategoryInfo,
     build_category_info,
 )
+from apps.qna.services.question.question_search.tokenizer import (
+    build_search_snippet,
+)
+from apps.qna.utils.content_text import clean_content_text
 
 
 class QuestionListSerializer(serializers.ModelSerializer[Question]):
@@ -26,6 +27,9 @@ class QuestionListSerializer(serializers.ModelSerializer[Question]):
         allow_null=True,
     )
 
+    # 전문 검색(search_mode=fulltext) 일 때만 값이 있음
+    search_snippet = serializers.SerializerMethodField()
+
     _category_cache: dict[int, CategoryInfo]
 
     class Meta:
@@ -40,6 +44,7 @@ class QuestionListSerializer(serializers.ModelSerializer[Question]):
             "view_count",
             "created_at",
             "thumbnail_img_url",
+            "search_snippet",
         ]
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -59,10 +64,11 @@ class QuestionListSerializer(serializers.ModelSerializer[Question]):
         content = getattr(obj, "content_preview", None)
         if not content:
             content = obj.content or ""
-        text = strip_tags(content)
-        text = html.unescape(text)
-        text = re.sub(r"[\r\n\t]+", " ", text)
-        text = re.sub(r"([.!?])(?=\S)", r"\1 ", text)
-        text = re.sub(r"\s+", " ", text).strip()
+        return clean_content_text(content)[:100]
 
-        return text[:100]
+    # 검색어 주변 본문 (<mark> 강조, HTML escape 적용)
+    def get_search_snippet(self, obj: Question) -> str | None:
+        keyword = self.context.get("search_keyword")
+        if not keyword:
+            return None
+        return build_search_snippet(obj.content, keyword)
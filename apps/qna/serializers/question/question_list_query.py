@@ -3,6 +3,8 @@ from rest_framework import serializers
 
 class QuestionListQuerySerializer(serializers.Serializer[dict[str, object]]):
     search_keyword = serializers.CharField(required=False, allow_blank=True)
+    # contains: 제목 / 본문 부분 일치 (기존), fulltext: 전문 검색 (관련도 순 + 본문 강조 snippet)
+    search_mode = serializers.ChoiceField(choices=["contains", "fulltext"], required=False, default="contains")
     category_id = serializers.IntegerField(required=False)
 
     answer_status = serializers.CharField(required=False)
@@ -9,6 +9,14 @@ from apps.qna.models.answer.answers import Answer
 from apps.qna.models.answer.comments import AnswerComment
 from apps.qna.models.answer.images import AnswerImage
 from apps.qna.models.question import Question
+from apps.qna.services.question.question_detail.cache import (
+    invalidate_question_detail,
+)
+from apps.qna.services.question.question_summary_service import (
+    decrease_answer_count,
+    increase_answer_count,
+    set_has_adopted_answer,
+)
 
 __all__ = ["AnswerService", "CommentService"]
 
@@ -36,6 +44,8 @@ class AnswerService:
         with transaction.atomic():
             answer = Answer.objects.create(author=real_user, question=question, content=content)
             AnswerService._process_images_for_create(answer, content)
+            increase_answer_count(question.id)
+            invalidate_question_detail(question.id)
             return answer
 
     @staticmethod
@@ -46,13 +56,17 @@ class AnswerService:
             answer.content = content
             answer.save()
             AnswerService._sync_images_for_update(answer, content)
+            invalidate_question_detail(answer.question_id)
             return answer
 
     @staticmethod
     def delete_answer(user: UserType, answer: Answer) -> None:
         if answer.author != user:
             raise ValidationError(EMS.E403_PERMISSION_DENIED("삭제"))
-        answer.delete()
+        with transaction.atomic():
+            answer.delete()
+            decrease_answer_count(answer.question_id, was_adopted=answer.is_adopted)
+            invalidate_question_detail(answer.question_id)
 
     @staticmethod
     def delete_answer_by_admin(user: UserType, question_id: int, answer_id: int) -> Dict[str, int]:
@@ -62,7 +76,10 @@ class AnswerService:
             raise NotFound(EMS.E404_NOT_FOUND("답변"))
         comment_count = answer.comments.count()
         deleted_id = answer.id
-        answer.delete()
+        with transaction.atomic():
+            answer.delete()
+            decrease_answer_count(answer.question_id, was_adopted=answer.is_adopted)
+            invalidate_question_detail(answer.question_id)
         return {"answer_id": deleted_id, "deleted_comment_count": comment_count}
 
     @staticmethod
@@ -85,6 +102,8 @@ class AnswerService:
                     raise ValidationError(EMS.E409_ALREADY_ADOPTED)
                 answer.is_adopted = True
             answer.save()
+            set_has_adopted_answer(question.id, answer.is_adopted)
+            invalidate_question_detail(question.id)
             return answer
 
     @staticmethod
@@ -129,7 +148,9 @@ class CommentService:
         except Answer.DoesNotExist:
             raise NotFound(EMS.E404_NOT_FOUND("답변"))
         real_user = cast(RealUser, user)
-        return AnswerComment.objects.create(author=real_user, answer=answer, content=content)
+        comment = AnswerComment.objects.create(author=real_user, answer=answer, content=content)
+        invalidate_question_detail(answer.question_id)
+        return comment
 
     @staticmethod
     def update_comment(user: UserType, comment: AnswerComment, content: str) -> AnswerComment:
@@ -137,10 +158,13 @@ class CommentService:
             raise ValidationError(EMS.E403_OWNER_ONLY_EDIT("댓글"))
         comment.content = content
         comment.save()
+        invalidate_question_detail(comment.answer.question_id)
         return comment
 
     @staticmethod
     def delete_comment(user: UserType, comment: AnswerComment) -> None:
         if comment.author != user:
             raise ValidationError(EMS.E403_PERMISSION_DENIED("삭제"))
+        question_id = comment.answer.question_id
         comment.delete()
+        invalidate_question_detail(question_id)
@@ -2,6 +2,9 @@ from typing import Any
 
 from apps.qna.models import Question, QuestionCategory
 from apps.qna.services.question.question_image_service import sync_question_images
+from apps.qna.services.question.question_search.service import (
+    refresh_question_search_vector,
+)
 from apps.user.models import User
 
 
@@ -19,5 +22,6 @@ def create_question(
     )
 
     sync_question_images(question, validated_data["content"])
+    refresh_question_search_vector(question)
 
     return question
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.qna.exceptions.question_exceptions import QuestionNotFoundError
+from apps.qna.serializers.question.question_detail import QuestionDetailSerializer
+from apps.qna.services.question.question_detail.selectors import (
+    get_question_detail_queryset,
+)
+
+logger = logging.getLogger(__name__)
+
+"""
+질문 상세 응답(질문 + 이미지 + 답변 / 댓글 트리) 캐시
+
+qna:question_detail:{question_id}: (버전, 직렬화된 응답 dict)
+qna:question_detail:version:{question_id}: 무효화 토큰 (변경 커밋 후 새 값으로 교체)
+    버전 = 무효화 토큰 + 질문 updated_at → 재생성 도중 커밋된 변경 / 같은 id 로 다시 만든 질문도 캐시 미스
+
+get_question_detail_payload: 캐시 → (없거나 버전이 다르면) prefetch 5번 + 직렬화 후 저장
+    view_count 는 캐시 값을 쓰지 않고 호출하는 쪽에서 덮어씀
+invalidate_question_detail: 답변 / 댓글 / 채택 / 질문 수정 / 이미지 변경 시 호출
+    캐시 즉시 삭제 + 커밋 후 토큰 교체 (커밋 전에 다른 요청이 이전 데이터로 다시 저장해도 버전이 달라 사용되지 않음)
+"""
+
+
+def _payload_key(question_id: int) -> str:
+    return f"qna:question_detail:{question_id}"
+
+
+def _version_key(question_id: int) -> str:
+    return f"qna:question_detail:version:{question_id}"
+
+
+def get_question_detail_payload(question_id: int, updated_at: datetime) -> dict[str, Any]:
+    payload_key, version_key = _payload_key(question_id), _version_key(question_id)
+    try:
+        cached = cache.get_many([payload_key, version_key])
+    except Exception as e:
+        logger.warning(f"Question Detail Cache Error: {type(e).__name__}: {e}")
+        cached = {}
+
+    version = f"{cached.get(version_key, '')}:{updated_at.isoformat()}"
+    entry: tuple[str, dict[str, Any]] | None = cached.get(payload_key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    question = get_question_detail_queryset(question_id)
+    if question is None:
+        raise QuestionNotFoundError()
+    payload = dict(QuestionDetailSerializer(question).data)
+
+    try:
+        cache.set(payload_key, (version, payload), settings.QNA_QUESTION_DETAIL_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Question Detail Cache Error: {type(e).__name__}: {e}")
+    return payload
+
+
+def _rotate_version(question_id: int) -> None:
+    try:
+        # 토큰은 캐시보다 오래 유지 (토큰이 먼저 사라지면 이전 버전 캐시가 다시 유효해짐)
+        cache.set(_version_key(question_id), uuid.uuid4().hex, settings.QNA_QUESTION_DETAIL_CACHE_TTL * 2)
+    except Exception as e:
+        logger.warning(f"Question Detail Cache Error: {type(e).__name__}: {e}")
+
+
+def invalidate_question_detail(question_id: int) -> None:
+    try:
+        cache.delete(_payload_key(question_id))
+    except Exception as e:
+        logger.warning(f"Question Detail Cache Error: {type(e).__name__}: {e}")
+    transaction.on_commit(lambda: _rotate_version(question_id))
@@ -1,17 +1,23 @@
+from typing import Any
+
+from apps.core.utils.view_counter import record_view
 from apps.qna.exceptions.question_exceptions import QuestionNotFoundError
 from apps.qna.models import Question
-from apps.qna.services.question.question_detail.selectors import (
-    get_question_detail_queryset,
+from apps.qna.services.question.question_detail.cache import (
+    get_question_detail_payload,
 )
 
 
-def get_question_detail(*, question_id: int) -> Question:
-    question = get_question_detail_queryset(question_id)
+def get_question_detail(*, question_id: int, viewer: str | None = None) -> dict[str, Any]:
+    # 존재 확인 + 캐시 버전 / 조회수만 조회 (답변 트리는 캐시된 응답 사용)
+    row = Question.objects.filter(pk=question_id).values("view_count", "updated_at").first()
 
-    if question is None:
+    if row is None:
         raise QuestionNotFoundError()
 
-    question.view_count += 1
-    question.save(update_fields=["view_count"])
+    payload = get_question_detail_payload(question_id, row["updated_at"])
+
+    # 조회수는 Redis 에만 기록 (DB 반영은 beat 작업), 응답에는 반영 대기분까지 포함
+    payload["view_count"] = row["view_count"] + record_view(Question, question_id, viewer=viewer)
 
-    return question
+    return payload
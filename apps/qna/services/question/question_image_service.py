@@ -2,6 +2,12 @@ from django.db import transaction
 
 from apps.core.utils.s3_client import S3Client
 from apps.qna.models import Question, QuestionImage
+from apps.qna.services.question.question_detail.cache import (
+    invalidate_question_detail,
+)
+from apps.qna.services.question.question_summary_service import (
+    refresh_question_thumbnail,
+)
 from apps.qna.utils.content_image_parser import extract_image_urls_from_content
 from apps.qna.utils.s3_utils import extract_key_from_url, is_valid_s3_url
 
@@ -52,3 +58,8 @@ def sync_question_images(question: Question, content: str) -> None:
 
     if new_images:
         QuestionImage.objects.bulk_create(new_images)
+
+    # 6. 목록 썸네일 컬럼 갱신 (이미지 변경이 있을 때만)
+    if keys_to_delete or keys_to_add:
+        refresh_question_thumbnail(question.id)
+        invalidate_question_detail(question.id)
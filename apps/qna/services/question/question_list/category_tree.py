@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.qna.models import QuestionCategory, QuestionCategoryClosure
+
+logger = logging.getLogger(__name__)
+
+"""
+카테고리 closure table 유지 + 프로세스 로컬 카테고리 트리 캐시
+
+insert_category_closure: 새 카테고리 → 자기 자신(depth 0) + 부모의 조상 링크 복사
+move_category_closure: 부모가 바뀐 카테고리 → 서브트리 전체의 바깥 조상 링크 교체 (부모가 그대로면 조회 1번)
+rebuild_category_closure: 전체 재계산 (시그널 없이 bulk 생성 / 수정한 경우)
+
+get_category_tree: closure table 로 만든 트리를 프로세스에 보관 (캐시 버전이 같으면 DB 조회 없음)
+    descendants: 카테고리 id → 자신 + 모든 자손 id
+    paths: 카테고리 id → 최상위부터 자신까지 이름
+invalidate_category_tree: 로컬 트리 즉시 폐기 + 커밋 후 캐시 버전 갱신 (다른 프로세스는 다음 요청에 재생성)
+"""
+
+VERSION_KEY = "qna:category_tree:version"
+
+
+@dataclass(frozen=True)
+class CategoryTree:
+    version: str
+    descendants: dict[int, list[int]]
+    paths: dict[int, list[str]]
+
+
+_local_tree: CategoryTree | None = None
+
+
+# closure table ------------------------------------------------------------------
+def insert_category_closure(category: QuestionCategory) -> None:
+    rows = [QuestionCategoryClosure(ancestor_id=category.id, descendant_id=category.id, depth=0)]
+    if category.parent_id is not None:
+        parent_links = QuestionCategoryClosure.objects.filter(descendant_id=category.parent_id).values_list(
+            "ancestor_id", "depth"
+        )
+        rows += [
+            QuestionCategoryClosure(ancestor_id=ancestor_id, descendant_id=category.id, depth=depth + 1)
+            for ancestor_id, depth in parent_links
+        ]
+    QuestionCategoryClosure.objects.bulk_create(rows)
+
+
+def move_category_closure(category: QuestionCategory) -> None:
+    links = dict(
+        QuestionCategoryClosure.objects.filter(descendant_id=category.id, depth__lte=1).values_list(
+            "depth", "ancestor_id"
+        )
+    )
+    if 0 in links and links.get(1) == category.parent_id:
+        return
+
+    with transaction.atomic():
+        subtree = dict(
+            QuestionCategoryClosure.objects.filter(ancestor_id=category.id).values_list("descendant_id", "depth")
+        )
+        if not subtree:
+            QuestionCategoryClosure.objects.create(ancestor_id=category.id, descendant_id=category.id, depth=0)
+            subtree = {category.id: 0}
+
+        # 서브트리 밖의 조상 링크 제거 후 새 부모의 조상 링크 연결
+        QuestionCategoryClosure.objects.filter(descendant_id__in=subtree).exclude(ancestor_id__in=subtree).delete()
+        if category.parent_id is None:
+            return
+        parent_links = QuestionCategoryClosure.objects.filter(descendant_id=category.parent_id).values_list(
+            "ancestor_id", "depth"
+        )
+        QuestionCategoryClosure.objects.bulk_create(
+            QuestionCategoryClosure(
+                ancestor_id=ancestor_id, descendant_id=descendant_id, depth=ancestor_depth + depth + 1
+            )
+            for ancestor_id, ancestor_depth in parent_links
+            for descendant_id, depth in subtree.items()
+        )
+
+
+def rebuild_category_closure() -> int:
+    parents: dict[int, int | None] = dict(QuestionCategory.objects.values_list("id", "parent_id"))
+    rows = []
+    for category_id in parents:
+        ancestor_id: int | None = category_id
+        depth = 0
+        while ancestor_id is not None:
+            rows.append(QuestionCategoryClosure(ancestor_id=ancestor_id, descendant_id=category_id, depth=depth))
+            ancestor_id, depth = parents.get(ancestor_id), depth + 1
+
+    with transaction.atomic():
+        QuestionCategoryClosure.objects.all().delete()
+        QuestionCategoryClosure.objects.bulk_create(rows, batch_size=2000)
+    invalidate_category_tree()
+    return len(rows)
+
+
+# 카테고리 트리 캐시 ----------------------------------------------------------------
+def _current_version() -> str:
+    try:
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            cache.add(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+            version = cache.get(VERSION_KEY)
+        return str(version)
+    except Exception as e:
+        # 캐시 장애 시 로컬 트리 유지 (같은 프로세스의 변경은 invalidate 로 반영)
+        logger.warning(f"Category Tree Version Error: {type(e).__name__}: {e}")
+        return _local_tree.version if _local_tree is not None else ""
+
+
+def _load_category_tree(version: str) -> CategoryTree:
+    names = dict(QuestionCategory.objects.values_list("id", "name"))
+    descendants: dict[int, list[int]] = defaultdict(list)
+    ancestors: dict[int, list[int]] = defaultdict(list)
+
+    links = QuestionCategoryClosure.objects.order_by("depth", "ancestor_id", "descendant_id").values_list(
+        "ancestor_id", "descendant_id"
+    )
+    for ancestor_id, descendant_id in links:
+        descendants[ancestor_id].append(descendant_id)
+        # depth 오름차순: 자신 → 부모 → 조부모
+        ancestors[descendant_id].append(ancestor_id)
+
+    paths = {category_id: [names[a] for a in reversed(ids)] for category_id, ids in ancestors.items()}
+    return CategoryTree(version=version, descendants=dict(descendants), paths=paths)
+
+
+def get_category_tree() -> CategoryTree:
+    global _local_tree
+
+    version = _current_version()
+    tree = _local_tree
+    if tree is None or tree.version != version:
+        tree = _load_category_tree(version)
+        _local_tree = tree
+    return tree
+
+
+def _bump_version() -> None:
+    try:
+        cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    except Exception as e:
+        logger.warning(f"Category Tree Version Error: {type(e).__name__}: {e}")
+
+
+def invalidate_category_tree() -> None:
+    global _local_tree
+
+    _local_tree = None
+    transaction.on_commit(_bump_version)
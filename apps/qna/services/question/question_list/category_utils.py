@@ -1,9 +1,16 @@
 from typing import Optional, TypedDict
 
 from apps.qna.models import QuestionCategory
+from apps.qna.services.question.question_list.category_tree import get_category_tree
 
 
 def get_descendant_category_ids(category_id: int) -> list[int]:
+    # closure table 로 만든 트리 캐시 사용 (요청당 DB 조회 없음)
+    descendants = get_category_tree().descendants.get(category_id)
+    if descendants is not None:
+        return list(descendants)
+
+    # closure 에 없는 카테고리 (시그널 없이 생성된 경우) 는 직접 조회
     ids: list[int] = []
 
     def collect_descendants(current_category_id: int) -> None:
@@ -24,15 +31,17 @@ class CategoryInfo(TypedDict):
 
 
 def build_category_info(category: QuestionCategory) -> CategoryInfo:
-    names: list[str] = []
+    path = get_category_tree().paths.get(category.id)
+    names: list[str] = list(path) if path is not None else []
 
-    current: Optional[QuestionCategory] = category
+    if path is None:
+        current: Optional[QuestionCategory] = category
 
-    while current is not None:
-        names.append(current.name)
-        current = current.parent
+        while current is not None:
+            names.append(current.name)
+            current = current.parent
 
-    names.reverse()
+        names.reverse()
 
     return {
         "id": category.id,
@@ -1,7 +1,8 @@
-from django.db.models import Count, OuterRef, QuerySet, Subquery
+from django.db.models import F, QuerySet
 from django.db.models.functions import Substr
 
-from apps.qna.models import Question, QuestionImage
+from apps.qna.models import Question
+from apps.qna.services.question.question_search.service import search_questions
 
 from .filters import (
     filter_by_answered,
@@ -16,13 +17,12 @@ def get_question_list(
     answer_status: str | None = None,
     category_id: int | None = None,
     search_keyword: str | None = None,
+    search_mode: str = "contains",
     sort: str = "latest",
 ) -> QuerySet[Question]:
 
-    # base queryset
-    base_qs = Question.objects.select_related("author", "category").annotate(
-        answer_count=Count("answers", distinct=True)
-    )
+    # base queryset (답변 수 / 썸네일은 questions 테이블의 비정규화 컬럼 사용 → 집계 / 서브쿼리 없음)
+    base_qs = Question.objects.select_related("author", "category").defer("search_vector")
 
     answered = None
     if answer_status == "answered":
@@ -33,13 +33,15 @@ def get_question_list(
     # 필터 단계
     qs = filter_by_answered(base_qs, answered)
     qs = filter_by_category(qs, category_id)
-    qs = filter_by_search(qs, search_keyword)
-    qs = filter_by_sort(qs, sort)
+    if search_mode == "fulltext" and search_keyword:
+        # 전문 검색: 관련도 순 정렬 (sort 무시)
+        qs = search_questions(qs, search_keyword)
+    else:
+        qs = filter_by_search(qs, search_keyword)
+        qs = filter_by_sort(qs, sort)
 
     # annotate 단계 (가짜 컬럼들)
     return qs.annotate(
         content_preview=Substr("content", 1, 100),
-        thumbnail_image_url=Subquery(
-            QuestionImage.objects.filter(question=OuterRef("pk")).order_by("created_at", "id").values("img_url")[:1]
-        ),
+        thumbnail_image_url=F("thumbnail_key"),
     )
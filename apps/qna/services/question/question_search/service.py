@@ -0,0 +1,75 @@
+from functools import reduce
+from operator import and_
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, Q, QuerySet, Value
+from django.db.models.expressions import CombinedExpression
+
+from apps.qna.models import Question
+
+from .tokenizer import build_tsquery, document_tokens, search_words
+
+"""
+질문 전문 검색 (PostgreSQL tsvector + 한글 bigram)
+
+build_search_vector: 제목(가중치 A) + 태그 제거한 본문(가중치 B) 의 bigram 토큰 → tsvector ('simple' 설정, 형태소 처리 없음)
+refresh_question_search_vector: 질문 생성 / 수정 시 해당 질문의 search_vector 갱신
+rebuild_question_search_vectors: 전체 재색인 (마이그레이션 직후 / 토크나이저 변경 시)
+search_questions: search_vector @@ to_tsquery → 관련도(ts_rank) 순 정렬 (GIN 인덱스 questions_search_vector_idx)
+    PostgreSQL 이 아니면(SQLite 테스트) 검색어 단어별 제목 / 본문 icontains AND + 최신순
+"""
+
+SEARCH_CONFIG = "simple"
+# ts_rank normalization 1: 문서 길이(log) 로 나눠 긴 본문이 유리해지지 않도록
+RANK_NORMALIZATION = 1
+
+
+def _is_postgresql() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def build_search_vector(title: str, content: str) -> CombinedExpression:
+    return SearchVector(Value(" ".join(document_tokens(title))), config=SEARCH_CONFIG, weight="A") + SearchVector(
+        Value(" ".join(document_tokens(content))), config=SEARCH_CONFIG, weight="B"
+    )
+
+
+def refresh_question_search_vector(question: Question) -> None:
+    if not _is_postgresql():
+        return
+    Question.objects.filter(pk=question.pk).update(search_vector=build_search_vector(question.title, question.content))
+
+
+def rebuild_question_search_vectors(batch_size: int = 1000) -> int:
+    if not _is_postgresql():
+        return 0
+
+    rows = Question.objects.order_by("id").values_list("id", "title", "content").iterator(chunk_size=batch_size)
+    batch: list[Question] = []
+    updated = 0
+    for question_id, title, content in rows:
+        batch.append(Question(id=question_id, search_vector=build_search_vector(title, content)))
+        if len(batch) >= batch_size:
+            updated += Question.objects.bulk_update(batch, ["search_vector"])
+            batch = []
+    if batch:
+        updated += Question.objects.bulk_update(batch, ["search_vector"])
+    return updated
+
+
+def search_questions(qs: QuerySet[Question], keyword: str) -> QuerySet[Question]:
+    words = search_words(keyword)
+    if not words:
+        return qs.none()
+
+    if not _is_postgresql():
+        condition = reduce(and_, (Q(title__icontains=word) | Q(content__icontains=word) for word in words))
+        return qs.filter(condition).order_by("-created_at", "-id")
+
+    query = SearchQuery(build_tsquery(keyword), search_type="raw", config=SEARCH_CONFIG)
+    return (
+        qs.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query, normalization=Value(RANK_NORMALIZATION)))
+        .order_by("-search_rank", "-created_at", "-id")
+    )
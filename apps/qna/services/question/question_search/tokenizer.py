@@ -0,0 +1,65 @@
+import html
+import re
+
+from apps.qna.utils.content_text import clean_content_text
+
+"""
+질문 검색용 토크나이저 (형태소 분석기 없이 한글 bigram)
+
+search_words: 검색어 / 본문에서 단어 추출 (한글 덩어리 / 영문·숫자 덩어리, 소문자)
+document_tokens: 색인용 토큰 목록 ("트랜잭션" → 트랜 랜잭 잭션, 영문·숫자는 단어 그대로)
+    같은 단어의 bigram 은 연속된 위치에 들어가므로 검색 시 <-> (바로 뒤) 로 단어 단위 일치 확인
+build_tsquery: 검색어 → to_tsquery 문자열 (단어 안은 <->, 단어 사이는 &, 한 글자 한글은 접두어 검색 :*)
+build_search_snippet: 본문에서 검색어 주변을 잘라 <mark> 로 강조 (HTML escape 적용)
+"""
+
+_WORD_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def search_words(text: str) -> list[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def _word_tokens(word: str) -> list[str]:
+    if len(word) < 2 or not _HANGUL_RE.match(word):
+        return [word]
+    return [word[i : i + 2] for i in range(len(word) - 1)]
+
+
+def document_tokens(text: str) -> list[str]:
+    return [token for word in search_words(clean_content_text(text)) for token in _word_tokens(word)]
+
+
+def build_tsquery(keyword: str) -> str:
+    terms: list[str] = []
+    for word in dict.fromkeys(search_words(keyword)):
+        if len(word) == 1 and _HANGUL_RE.match(word):
+            terms.append(f"{word}:*")
+        else:
+            terms.append(" <-> ".join(_word_tokens(word)))
+    return " & ".join(f"({term})" for term in terms)
+
+
+def build_search_snippet(content: str | None, keyword: str, width: int = 80) -> str:
+    text = clean_content_text(content)
+    words = sorted(set(search_words(keyword)), key=len, reverse=True)
+    if not words:
+        return html.escape(text[:width])
+
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+    first = pattern.search(text)
+    start = max(0, first.start() - width // 4) if first else 0
+    end = min(len(text), start + width)
+    window = text[start:end]
+
+    parts: list[str] = ["…"] if start > 0 else []
+    cursor = 0
+    for match in pattern.finditer(window):
+        parts.append(html.escape(window[cursor : match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        cursor = match.end()
+    parts.append(html.escape(window[cursor:]))
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts)
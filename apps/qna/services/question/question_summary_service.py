@@ -0,0 +1,67 @@
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    Max,
+    OuterRef,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.qna.models import Answer, Question, QuestionImage
+
+"""
+질문 목록용 비정규화 컬럼 유지 (questions.answer_count / has_adopted_answer / thumbnail_key)
+
+호출하는 쪽의 트랜잭션 안에서 UPDATE 1번으로 갱신합니다.
+increase_answer_count: 답변 생성 → answer_count + 1
+decrease_answer_count: 답변 삭제 → answer_count - 1 (채택된 답변이었다면 has_adopted_answer 해제)
+set_has_adopted_answer: 채택 / 채택 취소
+refresh_question_thumbnail: 질문 이미지 변경 → 가장 먼저 등록된 이미지 key
+backfill_question_summary: 서비스를 거치지 않은 변경 (admin / cascade 삭제 등) 보정용 전체 재계산
+"""
+
+
+def increase_answer_count(question_id: int) -> None:
+    Question.objects.filter(pk=question_id).update(answer_count=F("answer_count") + 1)
+
+
+def decrease_answer_count(question_id: int, *, was_adopted: bool = False) -> None:
+    fields: dict[str, object] = {"answer_count": Greatest(F("answer_count") - 1, Value(0))}
+    if was_adopted:
+        fields["has_adopted_answer"] = False
+    Question.objects.filter(pk=question_id).update(**fields)
+
+
+def set_has_adopted_answer(question_id: int, adopted: bool) -> None:
+    Question.objects.filter(pk=question_id).update(has_adopted_answer=adopted)
+
+
+def _thumbnail_subquery() -> Subquery:
+    return Subquery(
+        QuestionImage.objects.filter(question=OuterRef("pk")).order_by("created_at", "id").values("img_url")[:1]
+    )
+
+
+def refresh_question_thumbnail(question_id: int) -> None:
+    Question.objects.filter(pk=question_id).update(thumbnail_key=_thumbnail_subquery())
+
+
+def backfill_question_summary(batch_size: int = 5000) -> int:
+    answer_count = (
+        Answer.objects.filter(question=OuterRef("pk")).order_by().values("question").annotate(c=Count("id")).values("c")
+    )
+    summary = {
+        "answer_count": Coalesce(Subquery(answer_count, output_field=IntegerField()), 0),
+        "has_adopted_answer": Exists(Answer.objects.filter(question=OuterRef("pk"), is_adopted=True)),
+        "thumbnail_key": _thumbnail_subquery(),
+    }
+
+    # id 구간별로 나눠서 갱신 (한 번에 전체 행 잠금 방지)
+    max_id = Question.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+    updated = 0
+    for start in range(0, max_id, batch_size):
+        updated += Question.objects.filter(id__gt=start, id__lte=start + batch_size).update(**summary)
+    return updated
@@ -3,7 +3,13 @@ from typing import Any
 from django.db import transaction
 
 from apps.qna.models import Question
+from apps.qna.services.question.question_detail.cache import (
+    invalidate_question_detail,
+)
 from apps.qna.services.question.question_image_service import sync_question_images
+from apps.qna.services.question.question_search.service import (
+    refresh_question_search_vector,
+)
 
 
 @transaction.atomic
@@ -23,7 +29,13 @@ def update_question(
     if update_fields:
         question.save(update_fields=update_fields)
 
+    if "title" in update_fields or "content" in update_fields:
+        refresh_question_search_vector(question)
+
     if new_content is not None:
         sync_question_images(question, new_content)
 
+    if update_fields:
+        invalidate_question_detail(question.id)
+
     return question
@@ -0,0 +1,28 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.qna.models import QuestionCategory
+from apps.qna.services.question.question_list.category_tree import (
+    insert_category_closure,
+    invalidate_category_tree,
+    move_category_closure,
+)
+
+
+@receiver(post_save, sender=QuestionCategory)
+def sync_category_closure(sender: type[QuestionCategory], instance: QuestionCategory, **kwargs: Any) -> None:
+    # loaddata(raw) 는 부모가 아직 없을 수 있으므로 closure 는 rebuild_category_closure 로 재계산
+    if not kwargs.get("raw"):
+        if kwargs.get("created"):
+            insert_category_closure(instance)
+        else:
+            move_category_closure(instance)
+    invalidate_category_tree()
+
+
+@receiver(post_delete, sender=QuestionCategory)
+def drop_category_tree(sender: type[QuestionCategory], instance: QuestionCategory, **kwargs: Any) -> None:
+    # closure 행은 FK CASCADE 로 함께 삭제
+    invalidate_category_tree()
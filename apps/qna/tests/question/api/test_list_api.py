@@ -119,3 +119,33 @@ class QuestionListAPITests(APITestCase):
         self.assertNotIn("<b>", item["content_preview"])
         self.assertNotIn("<br>", item["content_preview"])
         self.assertIn("이것은 굵은 글씨이고", item["content_preview"])
+
+    # 전문 검색 모드 (search_mode=fulltext) → 본문 강조 snippet 포함
+    def test_fulltext_search_mode_returns_snippet(self) -> None:
+        user = User.objects.create_user(
+            email="fulltext@test.com",
+            password="test1234",
+            name="검색 유저",
+            role=RoleChoices.ST,
+            phone_number="010-3333-4444",
+            gender="M",
+            birthday="2000-01-01",
+        )
+        category = QuestionCategory.objects.create(name="Database")
+        Question.objects.create(
+            author=user,
+            category=category,
+            title="격리 수준 질문",
+            content="<p>트랜잭션 <b>격리</b> 수준이 궁금합니다.</p>",
+        )
+
+        response = self.client.get(self.url, {"search_keyword": "격리", "search_mode": "fulltext"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["search_snippet"], "트랜잭션 <mark>격리</mark> 수준이 궁금합니다.")
+
+        # 기본 모드는 snippet 없음 / 잘못된 모드는 400
+        self.assertIsNone(self.client.get(self.url, {"search_keyword": "격리"}).data["results"][0]["search_snippet"])
+        response = self.client.get(self.url, {"search_keyword": "격리", "search_mode": "regex"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
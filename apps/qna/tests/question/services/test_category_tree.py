@@ -0,0 +1,68 @@
+from django.test import TestCase
+
+from apps.qna.models import QuestionCategory, QuestionCategoryClosure
+from apps.qna.services.question.question_list.category_tree import (
+    rebuild_category_closure,
+)
+from apps.qna.services.question.question_list.category_utils import (
+    build_category_info,
+    get_descendant_category_ids,
+)
+
+
+class CategoryTreeTests(TestCase):
+    def setUp(self) -> None:
+        self.backend = QuestionCategory.objects.create(name="백엔드")
+        self.django = QuestionCategory.objects.create(name="Django", type="medium", parent=self.backend)
+        self.orm = QuestionCategory.objects.create(name="ORM", type="small", parent=self.django)
+        self.frontend = QuestionCategory.objects.create(name="프론트엔드")
+
+    def _links(self) -> set[tuple[int, int, int]]:
+        return set(QuestionCategoryClosure.objects.values_list("ancestor_id", "descendant_id", "depth"))
+
+    def test_closure_rows_on_create(self) -> None:
+        self.assertEqual(
+            self._links(),
+            {
+                (self.backend.id, self.backend.id, 0),
+                (self.django.id, self.django.id, 0),
+                (self.orm.id, self.orm.id, 0),
+                (self.frontend.id, self.frontend.id, 0),
+                (self.backend.id, self.django.id, 1),
+                (self.django.id, self.orm.id, 1),
+                (self.backend.id, self.orm.id, 2),
+            },
+        )
+
+    def test_descendants_and_breadcrumb_without_queries(self) -> None:
+        get_descendant_category_ids(self.backend.id)
+
+        with self.assertNumQueries(0):
+            descendants = get_descendant_category_ids(self.backend.id)
+            info = build_category_info(self.orm)
+
+        self.assertCountEqual(descendants, [self.backend.id, self.django.id, self.orm.id])
+        self.assertEqual(info, {"id": self.orm.id, "depth": 2, "names": ["백엔드", "Django", "ORM"]})
+
+    def test_move_rename_and_delete_update_tree(self) -> None:
+        self.django.parent = self.frontend
+        self.django.save()
+        self.frontend.name = "FE"
+        self.frontend.save()
+
+        self.assertEqual(get_descendant_category_ids(self.backend.id), [self.backend.id])
+        self.assertCountEqual(
+            get_descendant_category_ids(self.frontend.id), [self.frontend.id, self.django.id, self.orm.id]
+        )
+        self.assertEqual(build_category_info(self.orm)["names"], ["FE", "Django", "ORM"])
+
+        self.django.delete()
+
+        self.assertEqual(get_descendant_category_ids(self.frontend.id), [self.frontend.id])
+        self.assertFalse(QuestionCategoryClosure.objects.filter(descendant_id=self.orm.id).exists())
+
+    def test_rebuild_matches_signal_maintained_rows(self) -> None:
+        expected = self._links()
+
+        self.assertEqual(rebuild_category_closure(), len(expected))
+        self.assertEqual(self._links(), expected)
@@ -0,0 +1,86 @@
+import datetime
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+from apps.core.utils.isolated_cache_testcase import IsolatedRedisTestClient
+from apps.qna.models import Question, QuestionCategory
+from apps.qna.services.answer.service import AnswerService, CommentService
+from apps.qna.services.question.question_detail.cache import (
+    get_question_detail_payload,
+)
+from apps.qna.services.question.question_update.service import update_question
+from apps.user.models.user import RoleChoices, User
+
+
+class QuestionDetailCacheTests(IsolatedRedisTestClient):
+    def setUp(self) -> None:
+        super().setUp()
+        self.author = User.objects.create_user(
+            email="detail-cache@test.com",
+            password="pw",
+            name="질문자",
+            nickname="질문자닉",
+            role=RoleChoices.ST,
+            birthday=datetime.date(2000, 1, 1),
+        )
+        self.answerer = User.objects.create_user(
+            email="detail-cache-ta@test.com",
+            password="pw",
+            name="조교",
+            nickname="조교닉",
+            role=RoleChoices.TA,
+            birthday=datetime.date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="백엔드")
+        self.question = Question.objects.create(author=self.author, category=category, title="Q", content="C")
+        self.url = reverse("question_detail", kwargs={"question_id": self.question.id})
+
+    @override_settings(VIEW_COUNT_BUFFERED=True)
+    def test_cached_read_skips_prefetch_and_overlays_view_count(self) -> None:
+        AnswerService.create_answer(self.answerer, self.question.id, "답변")
+        self.assertEqual(self.client.get(self.url).data["view_count"], 1)
+
+        # 존재 확인 + 조회수 조회 1번만
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.data["view_count"], 2)
+        self.assertEqual(len(response.data["answers"]), 1)
+
+    def test_answer_comment_and_adoption_invalidate(self) -> None:
+        self.client.get(self.url)
+
+        answer = AnswerService.create_answer(self.answerer, self.question.id, "답변")
+        self.assertEqual(len(self.client.get(self.url).data["answers"]), 1)
+
+        CommentService.create_comment(self.author, self.question.id, answer.id, "댓글")
+        self.assertEqual(self.client.get(self.url).data["answers"][0]["comments"][0]["content"], "댓글")
+
+        AnswerService.toggle_adoption(self.author, self.question.id, answer.id)
+        self.assertTrue(self.client.get(self.url).data["answers"][0]["is_adopted"])
+
+        answer.refresh_from_db()
+        AnswerService.delete_answer(self.answerer, answer)
+        self.assertEqual(self.client.get(self.url).data["answers"], [])
+
+    def test_question_update_invalidates(self) -> None:
+        self.client.get(self.url)
+
+        update_question(question=self.question, validated_data={"title": "수정된 제목"})
+
+        self.assertEqual(self.client.get(self.url).data["title"], "수정된 제목")
+
+    def test_stale_rebuild_is_not_reused_after_commit(self) -> None:
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AnswerService.create_answer(self.answerer, self.question.id, "답변")
+            # 커밋 전에 다른 요청이 이전 데이터(답변 없음)로 캐시를 다시 저장한 경우
+            self.question.refresh_from_db()
+            payload = get_question_detail_payload(self.question.id, self.question.updated_at)
+            version, _ = cache.get(f"qna:question_detail:{self.question.id}")
+            cache.set(f"qna:question_detail:{self.question.id}", (version, {**payload, "answers": []}))
+
+        self.assertEqual(len(self.client.get(self.url).data["answers"]), 1)
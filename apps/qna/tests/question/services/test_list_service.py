@@ -6,7 +6,11 @@ from django.utils import timezone
 
 from apps.qna.models import Question, QuestionCategory, QuestionImage
 from apps.qna.models.question.question_base import QuestionAnnotated
+from apps.qna.services.answer.service import AnswerService
 from apps.qna.services.question.question_list.service import get_question_list
+from apps.qna.services.question.question_summary_service import (
+    refresh_question_thumbnail,
+)
 from apps.user.models.user import RoleChoices, User
 
 
@@ -77,10 +81,7 @@ class QuestionListServiceTests(TestCase):
             category=self.child_category,
         )
 
-        question.answers.create(
-            author=self.user,
-            content="답변",
-        )
+        AnswerService.create_answer(self.user, question.id, "답변")
 
         qs = get_question_list(
             answer_status="answered",
@@ -203,7 +204,7 @@ class QuestionListServiceTests(TestCase):
         questions = list(qs)
         self.assertEqual(questions[0].id, q2.id)
 
-    # thumbnail_image_url 서브쿼리
+    # thumbnail_image_url (questions.thumbnail_key 컬럼)
     def test_thumbnail_image_annotation(self) -> None:
         question = self.create_question(
             title="이미지 질문",
@@ -214,6 +215,7 @@ class QuestionListServiceTests(TestCase):
             question=question,
             img_url="https://example.com/image1.png",
         )
+        refresh_question_thumbnail(question.id)
 
         qs = get_question_list(
             answer_status=None,
@@ -0,0 +1,76 @@
+import datetime
+from unittest.mock import patch
+
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.test import TestCase
+
+from apps.qna.models import Question, QuestionCategory
+from apps.qna.services.question.question_search.service import search_questions
+from apps.qna.services.question.question_search.tokenizer import (
+    build_search_snippet,
+    build_tsquery,
+    document_tokens,
+)
+from apps.user.models.user import RoleChoices, User
+
+
+class QuestionSearchTokenizerTests(TestCase):
+    def test_document_tokens_use_hangul_bigrams_and_strip_tags(self) -> None:
+        tokens = document_tokens("<p>트랜잭션 <b>격리</b></p> Django_ORM 값 3일")
+
+        self.assertEqual(tokens, ["트랜", "랜잭", "잭션", "격리", "django", "orm", "값", "3", "일"])
+
+    def test_build_tsquery(self) -> None:
+        self.assertEqual(build_tsquery("트랜잭션 격리 Django"), "(트랜 <-> 랜잭 <-> 잭션) & (격리) & (django)")
+        # 한 글자 한글은 접두어 검색, 중복 단어 / 특수문자 제거
+        self.assertEqual(build_tsquery("값 값 ' & !"), "(값:*)")
+        self.assertEqual(build_tsquery("!!"), "")
+
+    def test_build_search_snippet_highlights_and_escapes(self) -> None:
+        content = "<p>" + "앞부분 " * 30 + "트랜잭션 <격리> 수준 설명</p>"
+
+        snippet = build_search_snippet(content, "격리 수준", width=40)
+
+        self.assertTrue(snippet.startswith("…"))
+        self.assertIn("&lt;<mark>격리</mark>&gt; <mark>수준</mark>", snippet)
+
+
+class QuestionSearchServiceTests(TestCase):
+    match: Question
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        author = User.objects.create_user(
+            email="search@test.com",
+            password="pw",
+            name="검색",
+            role=RoleChoices.ST,
+            birthday=datetime.date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="백엔드")
+        cls.match = Question.objects.create(
+            author=author, category=category, title="트랜잭션 격리 수준", content="<p>질문</p>"
+        )
+        Question.objects.create(author=author, category=category, title="트랜잭션", content="<p>격리 없음</p>")
+        Question.objects.create(author=author, category=category, title="기타", content="무관")
+
+    def test_fallback_requires_every_word(self) -> None:
+        qs = search_questions(Question.objects.all(), "수준 트랜잭션")
+
+        self.assertEqual(list(qs), [self.match])
+        self.assertFalse(search_questions(Question.objects.all(), "!!").exists())
+
+    def test_postgresql_uses_tsquery_and_rank(self) -> None:
+        # 연결하지 않고 SQL 만 생성
+        pg = DatabaseWrapper(
+            {**connection.settings_dict, "ENGINE": "django.db.backends.postgresql", "NAME": "x"}, alias="pg"
+        )
+        with patch("apps.qna.services.question.question_search.service._is_postgresql", return_value=True):
+            qs = search_questions(Question.objects.all(), "격리 수준")
+
+        sql, params = qs.query.get_compiler(connection=pg).as_sql()
+
+        self.assertIn('"questions"."search_vector" @@ (to_tsquery(%s::regconfig, %s))', sql)
+        self.assertIn("ts_rank", sql)
+        self.assertIn("(격리) & (수준)", params)
@@ -0,0 +1,100 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.qna.models import Answer, Question, QuestionCategory, QuestionImage
+from apps.qna.services.answer.service import AnswerService
+from apps.qna.services.question.question_list.service import get_question_list
+from apps.qna.services.question.question_summary_service import (
+    refresh_question_thumbnail,
+)
+from apps.user.models.user import RoleChoices, User
+
+
+class QuestionSummaryServiceTests(TestCase):
+    author: User
+    answerer: User
+    question: Question
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.author = User.objects.create_user(
+            email="summary-author@test.com",
+            password="pw",
+            name="질문자",
+            nickname="질문자닉",
+            role=RoleChoices.ST,
+            birthday=datetime.date(2000, 1, 1),
+        )
+        cls.answerer = User.objects.create_user(
+            email="summary-answerer@test.com",
+            password="pw",
+            name="답변자",
+            nickname="답변자닉",
+            role=RoleChoices.TA,
+            birthday=datetime.date(2000, 1, 1),
+        )
+        category = QuestionCategory.objects.create(name="백엔드")
+        cls.question = Question.objects.create(author=cls.author, category=category, title="Q", content="C")
+
+    def _refresh(self) -> Question:
+        self.question.refresh_from_db()
+        return self.question
+
+    def test_answer_service_keeps_columns_in_sync(self) -> None:
+        answer = AnswerService.create_answer(self.answerer, self.question.id, "답변1")
+        AnswerService.create_answer(self.answerer, self.question.id, "답변2")
+        self.assertEqual(self._refresh().answer_count, 2)
+
+        AnswerService.toggle_adoption(self.author, self.question.id, answer.id)
+        self.assertTrue(self._refresh().has_adopted_answer)
+
+        AnswerService.toggle_adoption(self.author, self.question.id, answer.id)
+        self.assertFalse(self._refresh().has_adopted_answer)
+
+        AnswerService.toggle_adoption(self.author, self.question.id, answer.id)
+        answer.refresh_from_db()
+        AnswerService.delete_answer(self.answerer, answer)
+        question = self._refresh()
+        self.assertEqual(question.answer_count, 1)
+        self.assertFalse(question.has_adopted_answer)
+
+    def test_refresh_thumbnail_uses_first_image(self) -> None:
+        QuestionImage.objects.create(question=self.question, img_url="question_images/first.png")
+        QuestionImage.objects.create(question=self.question, img_url="question_images/second.png")
+
+        refresh_question_thumbnail(self.question.id)
+        self.assertEqual(self._refresh().thumbnail_key, "question_images/first.png")
+
+        QuestionImage.objects.filter(question=self.question).delete()
+        refresh_question_thumbnail(self.question.id)
+        self.assertIsNone(self._refresh().thumbnail_key)
+
+    def test_backfill_command_recomputes_columns(self) -> None:
+        # 서비스를 거치지 않은 변경
+        Answer.objects.create(author=self.answerer, question=self.question, content="A", is_adopted=True)
+        Answer.objects.create(author=self.answerer, question=self.question, content="B")
+        QuestionImage.objects.create(question=self.question, img_url="question_images/a.png")
+
+        out = StringIO()
+        call_command("backfill_question_summary", "--batch-size", "1", stdout=out)
+
+        question = self._refresh()
+        self.assertEqual(question.answer_count, 2)
+        self.assertTrue(question.has_adopted_answer)
+        self.assertEqual(question.thumbnail_key, "question_images/a.png")
+        self.assertIn("1 건", out.getvalue())
+
+    def test_list_query_reads_columns_without_aggregate(self) -> None:
+        AnswerService.create_answer(self.answerer, self.question.id, "답변")
+
+        qs = get_question_list(answer_status="answered")
+        sql = str(qs.query).upper()
+
+        self.assertNotIn("GROUP BY", sql)
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("QUESTION_IMAGES", sql)
+        self.assertEqual([q.id for q in qs], [self.question.id])
+        self.assertFalse(get_question_list(answer_status="unanswered").exists())
@@ -0,0 +1,16 @@
+import html
+import re
+
+from django.utils.html import strip_tags
+
+
+def clean_content_text(content: str | None) -> str:
+    """
+    본문(HTML / 마크다운)에서 태그를 제거한 한 줄짜리 텍스트
+    목록 미리보기와 검색 색인이 같은 텍스트를 사용합니다.
+    """
+    text = strip_tags(content or "")
+    text = html.unescape(text)
+    text = re.sub(r"[\r\n\t]+", " ", text)
+    text = re.sub(r"([.!?])(?=\S)", r"\1 ", text)
+    return re.sub(r"\s+", " ", text).strip()
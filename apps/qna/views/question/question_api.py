@@ -9,6 +9,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.core.exceptions.exception_messages import EMS
+from apps.core.utils.view_counter import apply_pending_views
+from apps.qna.models import Question
 from apps.qna.pagination import QuestionPageNumberPagination
 from apps.qna.permissions.question.question_create_permission import (
     QuestionCreatePermission,
@@ -57,9 +59,14 @@ class QuestionAPIView(APIView):
         # DRF Pagination 적용
         paginator = QuestionPageNumberPagination()
         page = paginator.paginate_queryset(queryset, request)
-
-        # Serializer
-        serializer = QuestionListSerializer(page, many=True)
+        # 조회수는 Redis 에 쌓인 반영 대기분까지 포함 (상세 조회와 같은 값)
+        apply_pending_views(Question, page or [])
+
+        # Serializer (전문 검색이면 본문 강조 snippet 포함)
+        context = {}
+        if query_serializer.validated_data["search_mode"] == "fulltext":
+            context["search_keyword"] = query_serializer.validated_data.get("search_keyword")
+        serializer = QuestionListSerializer(page, many=True, context=context)
 
         # DRF 표준 응답
         return paginator.get_paginated_response(serializer.data)
@@ -7,6 +7,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.core.exceptions.exception_messages import EMS
+from apps.core.utils.view_counter import viewer_from_request
 from apps.qna.permissions.question.question_update_permission import (
     QuestionUpdatePermission,
 )
@@ -38,15 +39,10 @@ class QuestionDetailAPIView(APIView):
     def get(self, request: Request, question_id: int) -> Response:
         self.validation_error_message = EMS.E400_INVALID_REQUEST("질문 상세 조회")["error_detail"]
 
-        question = get_question_detail(question_id=question_id)
+        # 캐시된 상세 응답 (QuestionDetailSerializer 결과) + 현재 조회수
+        payload = get_question_detail(question_id=question_id, viewer=viewer_from_request(request))
 
-        return Response(
-            QuestionDetailSerializer(
-                question,
-                context={"request": request},
-            ).data,
-            status=status.HTTP_200_OK,
-        )
+        return Response(payload, status=status.HTTP_200_OK)
 
     @extend_schema(
         tags=["질의응답"],
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# 관리자 검색(닉네임 / 이름 부분 일치)용 pg_trgm GIN 인덱스
+# - PostgreSQL 에서만 생성 (SQLite 테스트 DB 는 건너뜀)
+# - 운영 테이블 잠금 없이 생성하도록 CONCURRENTLY + 비원자 마이그레이션
+TRGM_INDEXES = {
+    "users_nickname_trgm_idx": ("users", "nickname"),
+    "users_name_trgm_idx": ("users", "name"),
+}
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, (table, column) in TRGM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table} USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name in TRGM_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("user", "0006_alter_cohortstudent_cohort_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
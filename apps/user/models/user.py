@@ -111,6 +111,7 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
 
     class Meta:
         db_table = "users"
+        # nickname / name 의 pg_trgm GIN 인덱스는 마이그레이션(0007_user_trgm_indexes)에서 PostgreSQL 에만 생성
 
 
 class SocialProvider(models.TextChoices):
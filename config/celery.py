@@ -0,0 +1,13 @@
+import os
+
+from celery import Celery  # type: ignore
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
+
+app = Celery("config")
+
+# settings 의 CELERY_* 설정 사용
+app.config_from_object("django.conf:settings", namespace="CELERY")
+
+# 각 앱의 tasks.py 자동 등록
+app.autodiscover_tasks()
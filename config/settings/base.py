@@ -121,6 +121,28 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Celery Settings
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}/2")
+CELERY_TIMEZONE = "Asia/Seoul"
+# 워커가 작업 도중 죽어도 메세지가 유실되지 않도록 완료 후 ack, 워커당 1개씩 가져감
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_BEAT_SCHEDULE = {
+    "requeue-stale-submission-intakes": {
+        "task": "apps.exams.tasks.requeue_stale_submission_intakes",
+        "schedule": 60.0,
+    },
+    "flush-exam-attempts": {
+        "task": "apps.exams.tasks.flush_exam_attempts",
+        "schedule": float(os.getenv("EXAM_ATTEMPT_FLUSH_INTERVAL", "10")),
+    },
+    "flush-view-counts": {
+        "task": "apps.core.tasks.flush_view_counts",
+        "schedule": float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "30")),
+    },
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -256,3 +278,52 @@ FRONTEND_SOCIAL_REDIRECT_URL = os.getenv("FRONTEND_SOCIAL_REDIRECT_URL", "https:
 
 # withdrawal / account deletion settings
 WITHDRAWAL_GRACE_DAYS = int(os.getenv("WITHDRAWAL_GRACE_DAYS", "14"))
+
+# chatbot settings
+CHATBOT_HISTORY_MAX_MESSAGES = int(os.getenv("CHATBOT_HISTORY_MAX_MESSAGES", "20"))
+CHATBOT_HISTORY_MAX_TOKENS = int(os.getenv("CHATBOT_HISTORY_MAX_TOKENS", "8000"))
+CHATBOT_SUMMARY_MAX_CHARS = int(os.getenv("CHATBOT_SUMMARY_MAX_CHARS", "2000"))
+CHATBOT_HISTORY_CACHE_TTL = int(os.getenv("CHATBOT_HISTORY_CACHE_TTL", "3600"))
+CHATBOT_HISTORY_CACHE_MAX_LENGTH = int(os.getenv("CHATBOT_HISTORY_CACHE_MAX_LENGTH", "50"))
+CHATBOT_STREAM_BUFFER_TTL = int(os.getenv("CHATBOT_STREAM_BUFFER_TTL", "300"))
+CHATBOT_STREAM_REPLAY_TIMEOUT = int(os.getenv("CHATBOT_STREAM_REPLAY_TIMEOUT", "120"))
+CHATBOT_STREAM_REPLAY_POLL_INTERVAL = float(os.getenv("CHATBOT_STREAM_REPLAY_POLL_INTERVAL", "0.2"))
+CHATBOT_STREAM_REPLAY_RETRY_MS = int(os.getenv("CHATBOT_STREAM_REPLAY_RETRY_MS", "1000"))
+CHATBOT_STREAM_DRAIN_WORKERS = int(os.getenv("CHATBOT_STREAM_DRAIN_WORKERS", "20"))
+CHATBOT_PROMPT_CACHE_ENABLED = os.getenv("CHATBOT_PROMPT_CACHE_ENABLED", "false").lower() == "true"
+CHATBOT_PROMPT_CACHE_TTL = int(os.getenv("CHATBOT_PROMPT_CACHE_TTL", "86400"))
+CHATBOT_PROMPT_CACHE_MAX_ENTRIES = int(os.getenv("CHATBOT_PROMPT_CACHE_MAX_ENTRIES", "1000"))
+CHATBOT_PROVIDER_MAX_CONCURRENCY = int(os.getenv("CHATBOT_PROVIDER_MAX_CONCURRENCY", "20"))
+CHATBOT_PROVIDER_MAX_QUEUE_DEPTH = int(os.getenv("CHATBOT_PROVIDER_MAX_QUEUE_DEPTH", "20"))
+CHATBOT_PROVIDER_GLOBAL_CAP = int(os.getenv("CHATBOT_PROVIDER_GLOBAL_CAP", "200"))
+CHATBOT_PROVIDER_QUEUE_TIMEOUT = float(os.getenv("CHATBOT_PROVIDER_QUEUE_TIMEOUT", "10"))
+CHATBOT_PROVIDER_SLOT_TTL = int(os.getenv("CHATBOT_PROVIDER_SLOT_TTL", "300"))
+CHATBOT_FAKE_PROVIDER = os.getenv("CHATBOT_FAKE_PROVIDER", "false").lower() == "true"
+CHATBOT_FAKE_PROVIDER_CHUNKS = int(os.getenv("CHATBOT_FAKE_PROVIDER_CHUNKS", "20"))
+CHATBOT_FAKE_PROVIDER_CHUNK_DELAY = float(os.getenv("CHATBOT_FAKE_PROVIDER_CHUNK_DELAY", "0.05"))
+OPENAI_HTTP_TIMEOUT = float(os.getenv("OPENAI_HTTP_TIMEOUT", "60"))
+GEMINI_HTTP_MAX_CONNECTIONS = int(os.getenv("GEMINI_HTTP_MAX_CONNECTIONS", "100"))
+GEMINI_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("GEMINI_HTTP_KEEPALIVE_EXPIRY", "60"))
+
+# exam settings
+EXAM_GRADING_PLAN_CACHE_TTL = int(os.getenv("EXAM_GRADING_PLAN_CACHE_TTL", "86400"))
+EXAM_GRADING_PLAN_LOCAL_MAX = int(os.getenv("EXAM_GRADING_PLAN_LOCAL_MAX", "256"))
+EXAM_SUBMISSION_QUEUE_ENABLED = os.getenv("EXAM_SUBMISSION_QUEUE_ENABLED", "false").lower() == "true"
+EXAM_SUBMISSION_REQUEUE_AFTER = int(os.getenv("EXAM_SUBMISSION_REQUEUE_AFTER", "60"))
+EXAM_SUBMISSION_COUNT_TTL = int(os.getenv("EXAM_SUBMISSION_COUNT_TTL", "86400"))
+EXAM_ITEM_ANALYSIS_CACHE_TTL = int(os.getenv("EXAM_ITEM_ANALYSIS_CACHE_TTL", "86400"))
+EXAM_PAPER_CACHE_TTL = int(os.getenv("EXAM_PAPER_CACHE_TTL", "86400"))
+EXAM_PAPER_LOCAL_MAX = int(os.getenv("EXAM_PAPER_LOCAL_MAX", "256"))
+EXAM_STATUS_STREAM_HEARTBEAT = int(os.getenv("EXAM_STATUS_STREAM_HEARTBEAT", "25"))
+EXAM_STATUS_STREAM_RETRY_MS = int(os.getenv("EXAM_STATUS_STREAM_RETRY_MS", "5000"))
+EXAM_ATTEMPT_TTL = int(os.getenv("EXAM_ATTEMPT_TTL", "86400"))
+EXAM_ATTEMPT_FLUSH_BATCH = int(os.getenv("EXAM_ATTEMPT_FLUSH_BATCH", "500"))
+EXAM_SUBMISSION_EXPORT_CHUNK_SIZE = int(os.getenv("EXAM_SUBMISSION_EXPORT_CHUNK_SIZE", "2000"))
+
+# 조회수 버퍼링 (apps.core.utils.view_counter)
+# flush-view-counts 를 돌릴 celery worker + beat 가 배포된 환경에서만 켬 (꺼져 있으면 요청마다 DB 에 바로 반영)
+VIEW_COUNT_BUFFERED = os.getenv("VIEW_COUNT_BUFFERED", "false").lower() == "true"
+VIEW_COUNTER_MODELS = ["qna.Question", "community.Post"]
+VIEW_COUNT_DEDUP_SECONDS = int(os.getenv("VIEW_COUNT_DEDUP_SECONDS", "0"))
+VIEW_COUNT_FLUSH_BATCH = int(os.getenv("VIEW_COUNT_FLUSH_BATCH", "500"))
+QNA_QUESTION_DETAIL_CACHE_TTL = int(os.getenv("QNA_QUESTION_DETAIL_CACHE_TTL", "600"))
@@ -53,6 +53,15 @@ LOGGING = {
             "maxBytes": 1024 * 1024 * 10,
             "backupCount": 10,
         },
+        # 챗봇 턴 단위 지연 시간 로그 (chatbot_latency_report 커맨드로 p50/p95/p99 집계)
+        "chatbot_metrics": {
+            "level": "INFO",
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": os.path.join(LOG_ROOT, "chatbot_metrics.log"),
+            "formatter": "verbose",
+            "maxBytes": 1024 * 1024 * 10,
+            "backupCount": 10,
+        },
         "mail_admins": {
             "level": "ERROR",
             "filters": ["require_debug_false"],
@@ -65,5 +74,10 @@ LOGGING = {
             "level": "INFO",
             "propagate": True,
         },
+        "apps.chatbot.metrics": {
+            "handlers": ["chatbot_metrics"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }